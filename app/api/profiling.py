@@ -0,0 +1,263 @@
+# ============================================================================
+# Project Autonomous Alpha v1.8.0
+# Profiling API Endpoints - Live Production Diagnosis
+# ============================================================================
+#
+# Reliability Level: L5 High
+# Purpose: Opt-in, authenticated view into what the process is doing
+#
+# Endpoints:
+#   GET /debug/profile/cpu     - Time-boxed sampling CPU profile (folded stacks)
+#   GET /debug/profile/tasks   - asyncio task dump with current await points
+#   GET /debug/profile/threads - Stacks of all threads (workers, executors)
+#   GET /debug/profile/memory  - Time-boxed tracemalloc top allocators
+#   GET /debug/profile/blocking - Recent loop-blocking call stacks (watchdog)
+#
+# Authentication:
+#   - Disabled unless PROFILING_ENABLED=true (endpoints answer 404)
+#   - Bearer token (PROFILING_TOKEN env var) required on every endpoint
+#
+# Overhead:
+#   - Zero when idle: captures run only for the duration of a request
+#     (see app.observability.profiler)
+#
+# Error Codes:
+#   PRF-001: Profiling disabled
+#   PRF-002: PROFILING_TOKEN not configured
+#   PRF-003: Invalid or missing auth token
+#   PRF-004: Capture of the same kind already running
+#   PRF-005: Duration / interval out of bounds
+#
+# ============================================================================
+
+import asyncio
+import hmac
+import logging
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.observability.loop_watchdog import get_loop_watchdog
+from app.observability.profiler import (
+    DEFAULT_SAMPLE_INTERVAL_MS,
+    MAX_PROFILE_SECONDS,
+    ProfilerArgumentError,
+    ProfilerBusyError,
+    allocation_snapshot,
+    cpu_profile,
+    dump_asyncio_tasks,
+    dump_thread_stacks,
+)
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# Router
+# ============================================================================
+
+router = APIRouter()
+
+
+# ============================================================================
+# Authentication
+# ============================================================================
+
+def profiling_enabled() -> bool:
+    """Profiling is opt-in per deployment."""
+    return os.environ.get("PROFILING_ENABLED", "false").lower() == "true"
+
+
+def require_profiler_access(
+    authorization: Optional[str] = Header(None, description="Bearer token")
+) -> None:
+    """
+    Gate every profiling endpoint.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Bearer token matching PROFILING_TOKEN
+    Side Effects: None
+    """
+    if not profiling_enabled():
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error_code": "PRF-001",
+                "message": "Profiling disabled. Set PROFILING_ENABLED=true.",
+            }
+        )
+
+    expected_token = os.environ.get("PROFILING_TOKEN", "")
+    if not expected_token:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error_code": "PRF-002",
+                "message": "Profiling not configured. Set PROFILING_TOKEN.",
+            }
+        )
+
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "error_code": "PRF-003",
+                "message": "Authorization header required. Use: Bearer <token>",
+            }
+        )
+
+    if not hmac.compare_digest(authorization[7:], expected_token):
+        logger.warning("[PRF-003] Profiling request with invalid token rejected")
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error_code": "PRF-003",
+                "message": "Invalid authorization token.",
+            }
+        )
+
+
+def _capture_error(e: Exception) -> HTTPException:
+    """Map profiler exceptions to HTTP errors."""
+    status_code = 409 if isinstance(e, ProfilerBusyError) else 400
+    return HTTPException(
+        status_code=status_code,
+        detail={"error_code": e.error_code, "message": e.message}
+    )
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+@router.get(
+    "/cpu",
+    summary="Sampling CPU Profile",
+    description=(
+        "Sample every thread's stack for a bounded window.\n\n"
+        "**format=collapsed** (default) returns folded stacks for "
+        "flamegraph.pl / speedscope; **format=json** adds sample counts and "
+        "the top leaf functions."
+    ),
+    dependencies=[Depends(require_profiler_access)],
+)
+async def profile_cpu(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(DEFAULT_SAMPLE_INTERVAL_MS),
+    format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+    include_idle: bool = Query(False),
+):
+    """
+    Time-boxed CPU profile.
+
+    Reliability Level: L5 High
+    Input Constraints: seconds <= MAX_PROFILE_SECONDS
+    Side Effects: Sampler thread (executor) for the window only
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        profile = await loop.run_in_executor(
+            None, cpu_profile, seconds, interval_ms, include_idle
+        )
+    except (ProfilerBusyError, ProfilerArgumentError) as e:
+        raise _capture_error(e)
+
+    if format == "collapsed":
+        return PlainTextResponse(profile["collapsed"] + "\n")
+    return profile
+
+
+@router.get(
+    "/tasks",
+    summary="asyncio Task Dump",
+    description="Every task on the event loop with the await point it is suspended in.",
+    dependencies=[Depends(require_profiler_access)],
+)
+async def profile_tasks():
+    """
+    Reliability Level: STANDARD
+    Input Constraints: None
+    Side Effects: None
+    """
+    tasks = dump_asyncio_tasks()
+    return {"count": len(tasks), "tasks": tasks}
+
+
+@router.get(
+    "/threads",
+    summary="Thread Stacks",
+    description="Current stack of every thread (Discord engine, listeners, executors).",
+    dependencies=[Depends(require_profiler_access)],
+)
+async def profile_threads():
+    """
+    Reliability Level: STANDARD
+    Input Constraints: None
+    Side Effects: None
+    """
+    threads = dump_thread_stacks()
+    return {"count": len(threads), "threads": threads}
+
+
+@router.get(
+    "/memory",
+    summary="tracemalloc Top Allocators",
+    description=(
+        "Trace allocations for a bounded window and return the top "
+        "allocation sites and the sites that grew during the window."
+    ),
+    dependencies=[Depends(require_profiler_access)],
+)
+async def profile_memory(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS),
+    limit: int = Query(25, ge=1, le=200),
+):
+    """
+    Time-boxed allocation snapshot.
+
+    Reliability Level: L5 High
+    Input Constraints: seconds <= MAX_PROFILE_SECONDS
+    Side Effects: tracemalloc active for the window only
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, allocation_snapshot, seconds, limit)
+    except (ProfilerBusyError, ProfilerArgumentError) as e:
+        raise _capture_error(e)
+
+
+@router.get(
+    "/blocking",
+    summary="Loop-Blocking Calls",
+    description=(
+        "Event loop lag summary and the most recent stacks captured by the "
+        "loop watchdog while a callback was blocking the loop."
+    ),
+    dependencies=[Depends(require_profiler_access)],
+)
+async def profile_blocking():
+    """
+    Reliability Level: STANDARD
+    Input Constraints: None
+    Side Effects: None
+    """
+    watchdog = get_loop_watchdog()
+    return {
+        "watchdog": watchdog.status(),
+        "captures": watchdog.recent_captures(),
+    }
+
+
+# ============================================================================
+# 95% CONFIDENCE AUDIT
+# ============================================================================
+#
+# [Reliability Audit]
+# Authentication: [Verified - opt-in flag + constant-time Bearer check]
+# Event Loop Safety: [Verified - captures run in the default executor]
+# Decimal Integrity: [N/A - diagnostics only]
+# Error Handling: [PRF-001 through PRF-005]
+# Confidence Score: [92/100]
+#
+# ============================================================================
@@ -33,10 +33,18 @@ HOT PATH FLOW:
 9. Persist Risk Assessment
 10. AI Council Debate (Cold Path)
 11. Persist AI Debate
-12. Calculate processing time
+12. Calculate processing time (total and per stage)
 13. Determine final trade status
 14. Return correlation_id for tracing
 
+STAGE TIMINGS:
+    The response carries stage_ms, the wall-clock milliseconds spent in
+    each step (hmac, parse, insert, gating, risk, risk_persist, debate,
+    debate_persist, notify), so tools.market_replay can report per-stage
+    latency percentiles without scraping logs. Each step is also observed
+    as hot_path_latency_seconds{component="webhook"} with the
+    correlation_id as exemplar.
+
 ============================================================================
 """
 
@@ -59,8 +67,12 @@ from app.logic.risk_manager import calculate_position_size, RiskProfile
 from app.logic.ai_council import AICouncil, DebateResult, ModelVerdict, get_ai_council
 from app.logic.budget_integration import check_trade_allowed, TradeGatingContext
 from app.logic.operational_gating import GatingSignal
-from app.observability.metrics import record_signal_received, record_signal_executed
-from app.observability.discord_notifier import DiscordNotifier, AlertLevel, EmbedColor
+from app.observability.metrics import (
+    StageTimer,
+    record_signal_received,
+    record_signal_executed,
+)
+from app.observability.discord_notifier import get_discord_notifier, AlertLevel, EmbedColor
 
 
 # ============================================================================
@@ -195,6 +207,7 @@ async def receive_tradingview_signal(
         HTTPException: On validation or authentication failure
     """
     start_time = datetime.now(timezone.utc)
+    clock = StageTimer("webhook")
     
     # ========================================================================
     # STEP 1: Get raw bytes (BEFORE any parsing)
@@ -211,6 +224,7 @@ async def receive_tradingview_signal(
             provided_signature=x_tradingview_signature
         )
         hmac_verified = True
+        clock.lap("hmac")
     except HMACVerificationError as e:
         print(f"[{e.error_code}] HMAC verification failed: {e.message}")
         return create_error_response(
@@ -228,6 +242,7 @@ async def receive_tradingview_signal(
         
         # Validate with Pydantic (enforces Decimal, rejects floats)
         signal_in = SignalIn(**payload_dict)
+        clock.lap("parse")
         
     except json.JSONDecodeError as e:
         return create_error_response(
@@ -335,6 +350,8 @@ async def receive_tradingview_signal(
             action=signal_in.side.value if hasattr(signal_in.side, 'value') else str(signal_in.side),
             correlation_id=str(correlation_id)
         )
+        clock.bind(str(correlation_id))
+        clock.lap("insert")
         
     except Exception as e:
         db.rollback()
@@ -411,6 +428,8 @@ async def receive_tradingview_signal(
             reason="Budget gating error (non-blocking fallback)"
         )
     
+    clock.lap("gating")
+    
     # ========================================================================
     # STEP 8: SOVEREIGN BRAIN - Risk Assessment
     # ========================================================================
@@ -439,6 +458,8 @@ async def receive_tradingview_signal(
         risk_rejection_reason = f"Unexpected error: {error_str[:200]}"
         print(f"[RISK-ERR] Unexpected error for {correlation_id}: {error_str}")
     
+    clock.lap("risk")
+    
     # ========================================================================
     # STEP 9: Persist Risk Assessment to Audit Log
     # ========================================================================
@@ -487,6 +508,8 @@ async def receive_tradingview_signal(
         # Log but don't fail - signal is already persisted
         print(f"[DB-501] Risk assessment insert failed: {e}")
     
+    clock.lap("risk_persist")
+    
     # ========================================================================
     # STEP 10: COLD PATH AI - AI Council Debate
     # ========================================================================
@@ -538,6 +561,8 @@ async def receive_tradingview_signal(
         ai_consensus = "SKIPPED"
         ai_rejection_reason = "Budget gating rejected - AI debate skipped"
     
+    clock.lap("debate")
+    
     # ========================================================================
     # STEP 11: Persist AI Debate to Audit Log
     # ========================================================================
@@ -592,6 +617,8 @@ async def receive_tradingview_signal(
             # Log but don't fail - signal and risk are already persisted
             print(f"[DB-502] AI debate insert failed: {e}")
     
+    clock.lap("debate_persist")
+    
     # ========================================================================
     # STEP 12: Calculate processing time
     # ========================================================================
@@ -631,7 +658,8 @@ async def receive_tradingview_signal(
     # STEP 14: Send Discord Notification (Non-Blocking)
     # ========================================================================
     try:
-        notifier = DiscordNotifier()
+        # Shared notifier - one delivery engine for the whole process
+        notifier = get_discord_notifier()
         
         # Get side as string (handle both Enum and str)
         side_str = signal_in.side.value if hasattr(signal_in.side, 'value') else str(signal_in.side)
@@ -678,6 +706,8 @@ async def receive_tradingview_signal(
     except Exception as e:
         # Discord failure should never block trading
         print(f"[DISCORD-ERR] Failed to send notification: {e}")
+    clock.lap("notify")
+    clock.total()
     
     # ========================================================================
     # STEP 15: Return success response with full pipeline status
@@ -689,6 +719,7 @@ async def receive_tradingview_signal(
         "record_id": record_id,
         "timestamp": created_at.isoformat() if created_at else end_time.isoformat(),
         "processing_ms": round(processing_ms, 2),
+        "stage_ms": clock.stages,
         "hmac_verified": hmac_verified,
         "budget_gating": {
             "status": budget_status,
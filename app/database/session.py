@@ -24,6 +24,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
+from app.observability.metrics import instrument_engine
+
 # Load environment variables
 load_dotenv()
 
@@ -174,6 +176,10 @@ def set_timezone(dbapi_connection, connection_record):
     cursor.close()
 
 
+# Per-statement latency (hot_path_latency_seconds{component="db"})
+instrument_engine(engine)
+
+
 # ============================================================================
 # HEALTH CHECK
 # ============================================================================
@@ -9,10 +9,12 @@
 # Components:
 #   - DecimalGateway: Ensures all financial data uses decimal.Decimal
 #   - TokenBucket: Rate limiting for VALR API (600 req/min)
+#   - SharedRateLimiter: Process-wide VALR budget with priority lanes
 #   - VALRSigner: HMAC-SHA512 request signing
 #   - VALRClient: Main API client for market data and orders
 #   - OrderManager: DRY_RUN/LIVE order execution
 #   - ReconciliationEngine: 3-way sync (DB ↔ State ↔ Exchange)
+#   - PositionLedger: Running per-currency DB positions
 #
 # SOVEREIGN MANDATE:
 #   - EXECUTION_MODE=DRY_RUN by default
@@ -23,7 +25,17 @@
 # ============================================================================
 
 from app.exchange.decimal_gateway import DecimalGateway
-from app.exchange.rate_limiter import TokenBucket, PollingMode, ExponentialBackoff
+from app.exchange.rate_limiter import (
+    TokenBucket,
+    PollingMode,
+    ExponentialBackoff,
+    RequestLane,
+    SharedRateLimiter,
+    RateLimitBroker,
+    BrokerRateLimiter,
+    get_shared_rate_limiter,
+    reset_shared_rate_limiter
+)
 from app.exchange.hmac_signer import VALRSigner, MissingCredentialsError
 from app.exchange.valr_client import (
     VALRClient,
@@ -55,6 +67,7 @@ from app.exchange.reconciliation import (
     ReconciliationResult,
     ReconciliationStatus
 )
+from app.exchange.position_ledger import PositionLedger, split_pair
 from app.exchange.rlhf_recorder import (
     RLHFRecorder,
     RLHFRecord,
@@ -68,6 +81,12 @@ __all__ = [
     'TokenBucket',
     'PollingMode',
     'ExponentialBackoff',
+    'RequestLane',
+    'SharedRateLimiter',
+    'RateLimitBroker',
+    'BrokerRateLimiter',
+    'get_shared_rate_limiter',
+    'reset_shared_rate_limiter',
     # HMAC Signer
     'VALRSigner',
     'MissingCredentialsError',
@@ -97,6 +116,9 @@ __all__ = [
     'ReconciliationEngine',
     'ReconciliationResult',
     'ReconciliationStatus',
+    # Position Ledger
+    'PositionLedger',
+    'split_pair',
     # RLHF Recorder
     'RLHFRecorder',
     'RLHFRecord',
@@ -15,17 +15,36 @@
 #   - REST API: 600 requests per minute
 #   - Refill Rate: 10 tokens per second
 #
+# SHARED BUDGET (v1.8.0):
+#   - One SharedRateLimiter per process (get_shared_rate_limiter)
+#   - Priority lanes: ORDER > ACCOUNT > MARKET_DATA
+#   - Cross-process: set VALR_RATE_LIMIT_BROKER_SOCKET and run
+#     `python -m app.exchange.rate_limiter --serve <socket>` once per host
+#
 # Error Codes:
 #   - VALR-RATE-001: Rate limit exceeded
+#   - VALR-RATE-002: Broker unreachable (falling back to local budget)
 #
 # ============================================================================
 
+import asyncio
+import json
+import os
+import socket
+import socketserver
 import time
 import threading
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 from enum import Enum
 
+# Prometheus metrics (optional - graceful degradation if not available)
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -335,6 +354,688 @@ class ExponentialBackoff:
         self._attempt = 0
 
 
+# ============================================================================
+# Priority Lanes - Shared VALR Budget
+# ============================================================================
+
+class RequestLane(Enum):
+    """
+    Request priority lane (lower priority value preempts higher).
+    
+    Generalises PollingMode.ESSENTIAL: each lane must leave a reserve
+    in the bucket for the lanes above it.
+    """
+    ORDER = "ORDER"              # Order placement / cancellation
+    ACCOUNT = "ACCOUNT"          # Balances, open orders, reconciliation
+    MARKET_DATA = "MARKET_DATA"  # Ticker / order book polling
+
+
+LANE_PRIORITY: Dict[RequestLane, int] = {
+    RequestLane.ORDER: 0,
+    RequestLane.ACCOUNT: 1,
+    RequestLane.MARKET_DATA: 2,
+}
+
+# Fraction of capacity a lane must leave for higher lanes.
+# MARKET_DATA stops at the Essential threshold (ESSENTIAL = account only);
+# ACCOUNT stops at 2% so orders always have headroom.
+LANE_RESERVE_FRACTION: Dict[RequestLane, float] = {
+    RequestLane.ORDER: 0.0,
+    RequestLane.ACCOUNT: 0.02,
+    RequestLane.MARKET_DATA: TokenBucket.ESSENTIAL_THRESHOLD,
+}
+
+# Default maximum wait per lane (0 = fail fast, caller retries next poll)
+LANE_MAX_WAIT_SECONDS: Dict[RequestLane, float] = {
+    RequestLane.ORDER: 5.0,
+    RequestLane.ACCOUNT: 2.0,
+    RequestLane.MARKET_DATA: 0.0,
+}
+
+# Wait-time histogram buckets (seconds)
+LANE_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Async waiters re-check the bucket at most this often
+ASYNC_POLL_SECONDS = 0.01
+
+# While the broker is down, VALR-RATE-002 is logged at most this often
+BROKER_FAILURE_LOG_INTERVAL_SECONDS = 30.0
+
+# Environment variable selecting the cross-process broker socket
+BROKER_SOCKET_ENV = "VALR_RATE_LIMIT_BROKER_SOCKET"
+
+
+if PROMETHEUS_AVAILABLE:
+    VALR_RATE_LIMIT_WAIT_SECONDS = Histogram(
+        'valr_rate_limit_wait_seconds',
+        'Time spent waiting for a VALR rate-limit token, per priority lane',
+        ['lane'],
+        buckets=LANE_WAIT_BUCKETS
+    )
+    
+    VALR_RATE_LIMIT_DENIED_TOTAL = Counter(
+        'valr_rate_limit_denied_total',
+        'VALR requests denied by the shared rate limiter, per priority lane',
+        ['lane']
+    )
+
+
+class _LaneStats:
+    """Per-lane acquisition statistics (called within limiter lock)."""
+    
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.denied = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.bucket_counts = [0] * (len(LANE_WAIT_BUCKETS) + 1)
+    
+    def observe(self, waited: float, granted: bool) -> None:
+        if granted:
+            self.acquired += 1
+        else:
+            self.denied += 1
+        self.wait_sum += waited
+        self.wait_max = max(self.wait_max, waited)
+        for index, bound in enumerate(LANE_WAIT_BUCKETS):
+            if waited <= bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+    
+    def to_dict(self, waiting: int) -> Dict[str, Any]:
+        total = self.acquired + self.denied
+        buckets = {str(bound): count for bound, count in zip(LANE_WAIT_BUCKETS, self.bucket_counts)}
+        buckets["+Inf"] = self.bucket_counts[-1]
+        return {
+            'acquired': self.acquired,
+            'denied': self.denied,
+            'waiting': waiting,
+            'wait_avg_seconds': (self.wait_sum / total) if total else 0.0,
+            'wait_max_seconds': self.wait_max,
+            'wait_buckets': buckets,
+        }
+
+
+class SharedRateLimiter(TokenBucket):
+    """
+    Process-wide VALR rate limiter with priority lanes - VALR-003 Compliance.
+    
+    Every VALRClient / VALRLink in the process draws from this one bucket,
+    so market data polling, balance checks and order placement can never
+    jointly exceed the real exchange allowance.
+    
+    Reliability Level: SOVEREIGN TIER
+    Thread Safety: Condition variable on the TokenBucket mutex
+    
+    PRIORITY RULES
+    --------------
+    1. A lane may only take tokens if it leaves its reserve
+       (LANE_RESERVE_FRACTION) in the bucket for higher lanes.
+    2. While a higher-priority request is waiting, lower lanes wait too.
+    3. After an HTTP 429, ACCOUNT and MARKET_DATA lanes pause for the
+       backoff window; ORDER keeps its own retry/backoff.
+    """
+    
+    def __init__(
+        self,
+        capacity: int = TokenBucket.DEFAULT_CAPACITY,
+        refill_rate: float = TokenBucket.DEFAULT_REFILL_RATE,
+        essential_threshold: float = TokenBucket.ESSENTIAL_THRESHOLD,
+        lane_reserve_fraction: Optional[Dict[RequestLane, float]] = None
+    ):
+        """
+        Initialize SharedRateLimiter.
+        
+        Args:
+            capacity: Maximum tokens in bucket (default: 600)
+            refill_rate: Tokens added per second (default: 10.0)
+            essential_threshold: Fraction triggering Essential Mode (default: 0.10)
+            lane_reserve_fraction: Per-lane reserve overrides
+        """
+        super().__init__(
+            capacity=capacity,
+            refill_rate=refill_rate,
+            essential_threshold=essential_threshold
+        )
+        self._reserve = dict(LANE_RESERVE_FRACTION)
+        self._reserve[RequestLane.MARKET_DATA] = essential_threshold
+        if lane_reserve_fraction:
+            self._reserve.update(lane_reserve_fraction)
+        
+        self._cond = threading.Condition(self._lock)
+        self._waiting: Dict[RequestLane, int] = {lane: 0 for lane in RequestLane}
+        self._lane_stats: Dict[RequestLane, _LaneStats] = {
+            lane: _LaneStats() for lane in RequestLane
+        }
+        self._paused_until = 0.0
+    
+    # ------------------------------------------------------------------
+    # Internal (called within lock)
+    # ------------------------------------------------------------------
+    
+    def _higher_lane_waiting(self, lane: RequestLane) -> bool:
+        priority = LANE_PRIORITY[lane]
+        return any(
+            count > 0 for other, count in self._waiting.items()
+            if LANE_PRIORITY[other] < priority
+        )
+    
+    def _seconds_until_available(self, lane: RequestLane, tokens: int) -> Optional[float]:
+        """
+        Seconds until the lane may take tokens, 0 if it may take them now,
+        None if it must wait for a higher lane (woken by notify).
+        """
+        self._refill()
+        if self._higher_lane_waiting(lane):
+            return None
+        
+        pause = 0.0
+        if lane != RequestLane.ORDER:
+            pause = max(0.0, self._paused_until - time.monotonic())
+        
+        floor = self._reserve[lane] * self.capacity
+        shortfall = (floor + tokens) - self._tokens
+        refill_wait = shortfall / self.refill_rate if shortfall > 0 else 0.0
+        return max(pause, refill_wait)
+    
+    def _take(self, lane: RequestLane, tokens: int, waited: float) -> None:
+        self._tokens -= tokens
+        self._consecutive_failures = 0
+        self._lane_stats[lane].observe(waited, granted=True)
+        if PROMETHEUS_AVAILABLE:
+            VALR_RATE_LIMIT_WAIT_SECONDS.labels(lane=lane.value).observe(waited)
+    
+    def _deny(self, lane: RequestLane, tokens: int, waited: float, correlation_id: Optional[str]) -> None:
+        self._consecutive_failures += 1
+        self._lane_stats[lane].observe(waited, granted=False)
+        if PROMETHEUS_AVAILABLE:
+            VALR_RATE_LIMIT_DENIED_TOTAL.labels(lane=lane.value).inc()
+        logger.warning(
+            f"[VALR-RATE-001] Rate limit - lane denied | "
+            f"lane={lane.value} | requested={tokens} | "
+            f"available={self._tokens:.1f} | waited={waited:.3f}s | "
+            f"backoff_delay={self._get_backoff_delay_unlocked():.1f}s | "
+            f"correlation_id={correlation_id}"
+        )
+    
+    # ------------------------------------------------------------------
+    # Acquisition
+    # ------------------------------------------------------------------
+    
+    def acquire(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Take tokens for a lane, waiting up to timeout (thread-safe).
+        
+        Reliability Level: SOVEREIGN TIER
+        Thread Safety: Protected by mutex lock
+        Side Effects: Records per-lane wait time; logs VALR-RATE-001 on denial
+        
+        Args:
+            lane: Priority lane of the request
+            tokens: Number of tokens to consume (default: 1)
+            timeout: Max wait in seconds (default: LANE_MAX_WAIT_SECONDS[lane])
+            correlation_id: Audit trail identifier
+            
+        Returns:
+            True if tokens were taken, False on timeout
+        """
+        if timeout is None:
+            timeout = LANE_MAX_WAIT_SECONDS[lane]
+        
+        started = time.monotonic()
+        deadline = started + timeout
+        
+        with self._cond:
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    # Do not count ourselves as a blocker for our own lane
+                    self._waiting[lane] -= 1
+                    wait = self._seconds_until_available(lane, tokens)
+                    self._waiting[lane] += 1
+                    
+                    if wait == 0.0:
+                        self._take(lane, tokens, time.monotonic() - started)
+                        return True
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._deny(lane, tokens, time.monotonic() - started, correlation_id)
+                        return False
+                    
+                    self._cond.wait(timeout=remaining if wait is None else min(wait, remaining))
+            finally:
+                self._waiting[lane] -= 1
+                # Lower lanes may proceed now that this waiter is gone
+                self._cond.notify_all()
+    
+    def try_acquire(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """Take tokens for a lane without waiting."""
+        return self.acquire(lane, tokens=tokens, timeout=0.0, correlation_id=correlation_id)
+    
+    async def acquire_async(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Async variant of acquire() - never blocks the event loop.
+        
+        The request is registered as a waiter for its whole wait so it
+        still preempts lower lanes in other threads.
+        """
+        if timeout is None:
+            timeout = LANE_MAX_WAIT_SECONDS[lane]
+        
+        started = time.monotonic()
+        deadline = started + timeout
+        
+        with self._cond:
+            self._waiting[lane] += 1
+        try:
+            while True:
+                with self._cond:
+                    self._waiting[lane] -= 1
+                    wait = self._seconds_until_available(lane, tokens)
+                    self._waiting[lane] += 1
+                    
+                    if wait == 0.0:
+                        self._take(lane, tokens, time.monotonic() - started)
+                        return True
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._deny(lane, tokens, time.monotonic() - started, correlation_id)
+                        return False
+                
+                step = ASYNC_POLL_SECONDS if wait is None else min(wait, ASYNC_POLL_SECONDS * 10)
+                await asyncio.sleep(min(step, remaining))
+        finally:
+            with self._cond:
+                self._waiting[lane] -= 1
+                self._cond.notify_all()
+    
+    def consume(
+        self,
+        tokens: int = 1,
+        correlation_id: Optional[str] = None,
+        lane: RequestLane = RequestLane.MARKET_DATA
+    ) -> bool:
+        """
+        TokenBucket-compatible non-blocking consume.
+        
+        Untagged callers are treated as MARKET_DATA (lowest priority)
+        so they can never eat into the order reserve.
+        """
+        return self.try_acquire(lane, tokens=tokens, correlation_id=correlation_id)
+    
+    def record_rate_limited(self, backoff_seconds: float) -> None:
+        """
+        Record an HTTP 429 from VALR (thread-safe).
+        
+        Drains the bucket and pauses ACCOUNT/MARKET_DATA lanes for the
+        backoff window, so the whole process backs off together.
+        
+        Args:
+            backoff_seconds: Pause applied to non-order lanes
+        """
+        with self._cond:
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
+            self._paused_until = max(self._paused_until, time.monotonic() + backoff_seconds)
+            self._consecutive_failures += 1
+            self._cond.notify_all()
+        
+        logger.warning(
+            f"[VALR-RATE-001] HTTP 429 recorded - shared budget drained | "
+            f"pause={backoff_seconds:.1f}s"
+        )
+    
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    
+    def is_lane_open(self, lane: RequestLane, tokens: int = 1) -> bool:
+        """Check if a lane could take tokens right now (no side effects)."""
+        with self._lock:
+            return self._seconds_until_available(lane, tokens) == 0.0
+    
+    def get_lane_statistics(self) -> Dict[str, Any]:
+        """
+        Get per-lane acquisition and wait-time statistics.
+        
+        Returns:
+            Dict keyed by lane name with counts and wait histogram
+        """
+        with self._lock:
+            return {
+                lane.value: self._lane_stats[lane].to_dict(self._waiting[lane])
+                for lane in RequestLane
+            }
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get bucket and lane status (used by the broker STATUS command)."""
+        with self._lock:
+            self._refill()
+            status = {
+                'available_tokens': self._tokens,
+                'capacity': self.capacity,
+                'capacity_pct': (self._tokens / self.capacity) * 100,
+                'mode': self._get_polling_mode_unlocked().value,
+                'backoff_delay': self._get_backoff_delay_unlocked(),
+            }
+        status['lanes'] = self.get_lane_statistics()
+        return status
+
+
+# ============================================================================
+# Cross-Process Broker (Unix Socket)
+# ============================================================================
+#
+# Line protocol (one request per line, one reply per line):
+#   ACQUIRE <lane> <tokens> <timeout>  ->  OK | DENY <backoff>
+#   RATE_LIMITED <seconds>              ->  OK
+#   STATUS                              ->  <json>
+#
+# ============================================================================
+
+class _BrokerHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection (one thread per connection)."""
+    
+    def handle(self) -> None:
+        limiter: SharedRateLimiter = self.server.limiter  # type: ignore[attr-defined]
+        for raw in self.rfile:
+            parts = raw.decode("utf-8").split()
+            if not parts:
+                continue
+            try:
+                command = parts[0].upper()
+                if command == "ACQUIRE":
+                    lane = RequestLane(parts[1])
+                    granted = limiter.acquire(
+                        lane,
+                        tokens=int(parts[2]),
+                        timeout=float(parts[3])
+                    )
+                    reply = "OK" if granted else f"DENY {limiter.get_backoff_delay():.3f}"
+                elif command == "RATE_LIMITED":
+                    limiter.record_rate_limited(float(parts[1]))
+                    reply = "OK"
+                elif command == "STATUS":
+                    reply = json.dumps(limiter.get_status())
+                else:
+                    reply = "ERR unknown command"
+            except (IndexError, ValueError) as e:
+                reply = f"ERR {e}"
+            self.wfile.write((reply + "\n").encode("utf-8"))
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class RateLimitBroker:
+    """
+    Unix-socket broker owning the host-wide SharedRateLimiter.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: Binds a Unix socket, serves in a daemon thread
+    
+    Run one broker per host; every worker process then uses
+    BrokerRateLimiter (selected via VALR_RATE_LIMIT_BROKER_SOCKET).
+    """
+    
+    def __init__(self, socket_path: str, limiter: Optional[SharedRateLimiter] = None):
+        self.socket_path = socket_path
+        self.limiter = limiter or SharedRateLimiter()
+        self._server: Optional[_ThreadingUnixServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Bind the socket and serve in a background thread."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = _ThreadingUnixServer(self.socket_path, _BrokerHandler)
+        self._server.limiter = self.limiter  # type: ignore[attr-defined]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="valr-rate-broker",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[VALR-RATE] Broker serving | socket={self.socket_path}")
+    
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class BrokerRateLimiter:
+    """
+    Worker-process client for RateLimitBroker.
+    
+    Reliability Level: SOVEREIGN TIER
+    Thread Safety: One socket per thread
+    
+    Exposes the SharedRateLimiter interface used by VALRClient/VALRLink.
+    If the broker is unreachable, falls back to a process-local
+    SharedRateLimiter (VALR-RATE-002) rather than blocking trading.
+    """
+    
+    def __init__(self, socket_path: str, fallback: Optional[SharedRateLimiter] = None):
+        self.socket_path = socket_path
+        self._fallback = fallback or SharedRateLimiter()
+        self._local = threading.local()
+        self.capacity = self._fallback.capacity
+        # Rate-limits the VALR-RATE-002 warning while the broker is down
+        self._failure_log_lock = threading.Lock()
+        self._last_failure_log = None  # type: Optional[float]
+        self._suppressed_failures = 0
+    
+    def _request(self, line: str, timeout: float) -> str:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.connect(self.socket_path)
+            self._local.conn = conn
+            self._local.reader = conn.makefile("r", encoding="utf-8")
+        try:
+            conn.settimeout(timeout + 5.0)
+            conn.sendall((line + "\n").encode("utf-8"))
+            reply = self._local.reader.readline()
+            if not reply:
+                raise ConnectionError("broker closed connection")
+            return reply.strip()
+        except Exception:
+            self._local.conn = None
+            try:
+                conn.close()
+            except Exception:
+                pass
+            raise
+    
+    def _broker_failed(self, e: Exception) -> None:
+        """Log broker loss at most once per BROKER_FAILURE_LOG_INTERVAL_SECONDS."""
+        now = time.monotonic()
+        with self._failure_log_lock:
+            if (
+                self._last_failure_log is not None and
+                now - self._last_failure_log < BROKER_FAILURE_LOG_INTERVAL_SECONDS
+            ):
+                self._suppressed_failures += 1
+                return
+            suppressed = self._suppressed_failures
+            self._suppressed_failures = 0
+            self._last_failure_log = now
+        logger.warning(
+            f"[VALR-RATE-002] Rate limit broker unreachable - using local budget | "
+            f"socket={self.socket_path} | suppressed={suppressed} | error={e}"
+        )
+    
+    def acquire(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """Take tokens from the host-wide budget (see SharedRateLimiter.acquire)."""
+        if timeout is None:
+            timeout = LANE_MAX_WAIT_SECONDS[lane]
+        try:
+            reply = self._request(f"ACQUIRE {lane.value} {tokens} {timeout}", timeout)
+        except Exception as e:
+            self._broker_failed(e)
+            return self._fallback.acquire(lane, tokens, timeout, correlation_id)
+        
+        if reply == "OK":
+            return True
+        logger.warning(
+            f"[VALR-RATE-001] Rate limit - lane denied by broker | "
+            f"lane={lane.value} | reply={reply} | correlation_id={correlation_id}"
+        )
+        return False
+    
+    def try_acquire(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        return self.acquire(lane, tokens=tokens, timeout=0.0, correlation_id=correlation_id)
+    
+    async def acquire_async(
+        self,
+        lane: RequestLane,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.acquire, lane, tokens, timeout, correlation_id
+        )
+    
+    def consume(
+        self,
+        tokens: int = 1,
+        correlation_id: Optional[str] = None,
+        lane: RequestLane = RequestLane.MARKET_DATA
+    ) -> bool:
+        return self.try_acquire(lane, tokens=tokens, correlation_id=correlation_id)
+    
+    def record_rate_limited(self, backoff_seconds: float) -> None:
+        try:
+            self._request(f"RATE_LIMITED {backoff_seconds}", 0.0)
+        except Exception as e:
+            self._broker_failed(e)
+            self._fallback.record_rate_limited(backoff_seconds)
+    
+    def get_status(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self._request("STATUS", 0.0))
+        except Exception as e:
+            self._broker_failed(e)
+            return self._fallback.get_status()
+    
+    def get_backoff_delay(self) -> float:
+        return float(self.get_status()['backoff_delay'])
+    
+    def get_available_tokens(self) -> float:
+        return float(self.get_status()['available_tokens'])
+    
+    def get_capacity_percentage(self) -> float:
+        return float(self.get_status()['capacity_pct'])
+    
+    def get_polling_mode(self) -> PollingMode:
+        return PollingMode(self.get_status()['mode'])
+    
+    def is_essential_only(self) -> bool:
+        return self.get_polling_mode() == PollingMode.ESSENTIAL
+    
+    def get_lane_statistics(self) -> Dict[str, Any]:
+        return self.get_status()['lanes']
+
+
+# ============================================================================
+# Process-Wide Singleton
+# ============================================================================
+
+_shared_limiter: Optional[Any] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> Any:
+    """
+    Get the process-wide VALR rate limiter.
+    
+    Returns a BrokerRateLimiter when VALR_RATE_LIMIT_BROKER_SOCKET is set,
+    otherwise a process-local SharedRateLimiter.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: Creates singleton on first call
+    """
+    global _shared_limiter
+    
+    if _shared_limiter is None:
+        with _shared_limiter_lock:
+            if _shared_limiter is None:
+                socket_path = os.getenv(BROKER_SOCKET_ENV)
+                if socket_path:
+                    _shared_limiter = BrokerRateLimiter(socket_path)
+                else:
+                    _shared_limiter = SharedRateLimiter()
+    return _shared_limiter
+
+
+def reset_shared_rate_limiter() -> None:
+    """Discard the process-wide limiter (testing only)."""
+    global _shared_limiter
+    
+    with _shared_limiter_lock:
+        _shared_limiter = None
+
+
+def serve_broker(socket_path: str) -> None:
+    """Run a RateLimitBroker in the foreground until interrupted."""
+    broker = RateLimitBroker(socket_path)
+    broker.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="VALR shared rate-limit broker")
+    parser.add_argument("--serve", required=True, help="Unix socket path to bind")
+    serve_broker(parser.parse_args().serve)
+
+
 # ============================================================================
 # Sovereign Reliability Audit
 # ============================================================================
@@ -344,6 +1045,7 @@ class ExponentialBackoff:
 # Rate Limiting: [Verified - 600/min capacity, 10/s refill]
 # Exponential Backoff: [Verified - 1s base, 2x multiplier, 60s max]
 # Essential Mode: [Verified - Triggers at 10% capacity]
+# Priority Lanes: [Verified - ORDER > ACCOUNT > MARKET_DATA, shared budget]
 # Error Handling: [VALR-RATE-001 logged on limit breach]
 # Confidence Score: [99/100]
 #
@@ -16,12 +16,16 @@
 #   - VALR-CLI-001: API request failed
 #   - VALR-CLI-002: Invalid response format
 #   - VALR-CLI-003: Connection timeout
+#   - VALR-CLI-004: Base URL override is not a loopback host
 #
 # ============================================================================
 
+import os
 import time
+import ipaddress
 import logging
 from decimal import Decimal
+from urllib.parse import urlsplit
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -30,7 +34,11 @@ import requests
 from requests.exceptions import Timeout, ConnectionError as RequestsConnectionError
 
 from app.exchange.decimal_gateway import DecimalGateway
-from app.exchange.rate_limiter import TokenBucket, ExponentialBackoff
+from app.exchange.rate_limiter import (
+    ExponentialBackoff,
+    RequestLane,
+    get_shared_rate_limiter
+)
 from app.exchange.hmac_signer import VALRSigner, MissingCredentialsError
 
 logger = logging.getLogger(__name__)
@@ -84,6 +92,43 @@ class APIError(VALRClientError):
     pass
 
 
+# ============================================================================
+# Base URL
+# ============================================================================
+
+VALR_API_BASE_URL = "https://api.valr.com"
+
+
+def resolve_valr_base_url(base_url: Optional[str] = None) -> str:
+    """
+    Resolve the VALR base URL for a signing client.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Override (argument, else VALR_BASE_URL env var read
+                       at call time) must point at a loopback host
+    Side Effects: None
+
+    Signed requests carry the live API key, so the only permitted
+    override is a local stand-in (tools/market_replay.py); anything else
+    is refused rather than silently replaced with production.
+
+    Raises:
+        ValueError: Override is not a loopback host (VALR-CLI-004)
+    """
+    override = base_url or os.getenv("VALR_BASE_URL")
+    if not override:
+        return VALR_API_BASE_URL
+    host = urlsplit(override).hostname or ""
+    try:
+        loopback = host == "localhost" or ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        logger.error(f"[VALR-CLI-004] Refusing non-loopback VALR base URL | url={override}")
+        raise ValueError(f"[VALR-CLI-004] VALR base URL override must be loopback: {override}")
+    return override.rstrip("/")
+
+
 # ============================================================================
 # VALR API Client
 # ============================================================================
@@ -108,7 +153,6 @@ class VALRClient:
         print(f"BTC/ZAR: R {ticker.last_price}")
     """
     
-    BASE_URL = "https://api.valr.com"
     DEFAULT_TIMEOUT = 30.0
     MAX_RETRIES = 3
     
@@ -116,7 +160,9 @@ class VALRClient:
         self,
         correlation_id: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT,
-        skip_auth: bool = False
+        skip_auth: bool = False,
+        rate_limiter: Optional[Any] = None,
+        base_url: Optional[str] = None
     ):
         """
         Initialize VALR API Client.
@@ -128,14 +174,18 @@ class VALRClient:
             correlation_id: Audit trail identifier
             timeout: HTTP request timeout in seconds
             skip_auth: Skip authentication (for public endpoints only)
+            rate_limiter: Limiter override (default: process-wide shared budget)
+            base_url: Loopback stand-in URL (default: VALR_BASE_URL env var
+                      if loopback, else production VALR)
         """
         self.correlation_id = correlation_id
         self.timeout = timeout
         self.skip_auth = skip_auth
+        self.base_url = resolve_valr_base_url(base_url)
         
         # Initialize components
         self.gateway = DecimalGateway()
-        self.rate_limiter = TokenBucket()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
         self.backoff = ExponentialBackoff()
         
         # Initialize signer (may raise MissingCredentialsError)
@@ -184,15 +234,7 @@ class VALRClient:
             APIError: If API request fails
         """
         # Rate limit check
-        if not self.rate_limiter.consume(correlation_id=self.correlation_id):
-            backoff_delay = self.rate_limiter.get_backoff_delay()
-            logger.warning(
-                f"[VALR-RATE-001] Rate limit exceeded | "
-                f"backoff={backoff_delay:.1f}s | correlation_id={self.correlation_id}"
-            )
-            raise RateLimitError(
-                f"VALR-RATE-001: Rate limit exceeded. Retry after {backoff_delay:.1f}s"
-            )
+        self._acquire(RequestLane.MARKET_DATA)
         
         path = f"/v1/public/{pair}/marketsummary"
         
@@ -294,8 +336,7 @@ class VALRClient:
         Returns:
             Dict with 'bids' and 'asks' lists
         """
-        if not self.rate_limiter.consume(correlation_id=self.correlation_id):
-            raise RateLimitError("VALR-RATE-001: Rate limit exceeded")
+        self._acquire(RequestLane.MARKET_DATA)
         
         path = f"/v1/public/{pair}/orderbook"
         
@@ -370,8 +411,7 @@ class VALRClient:
                 "VALR-CLI-002: Authentication required for get_balances()"
             )
         
-        if not self.rate_limiter.consume(correlation_id=self.correlation_id):
-            raise RateLimitError("VALR-RATE-001: Rate limit exceeded")
+        self._acquire(RequestLane.ACCOUNT)
         
         path = "/v1/account/balances"
         
@@ -453,8 +493,7 @@ class VALRClient:
                 "VALR-CLI-002: Authentication required for get_open_orders()"
             )
         
-        if not self.rate_limiter.consume(correlation_id=self.correlation_id):
-            raise RateLimitError("VALR-RATE-001: Rate limit exceeded")
+        self._acquire(RequestLane.ACCOUNT)
         
         path = "/v1/orders/open"
         
@@ -510,6 +549,30 @@ class VALRClient:
     # Internal Methods
     # ========================================================================
     
+    def _acquire(self, lane: RequestLane) -> None:
+        """
+        Take one token from the shared budget for the given lane.
+        
+        Fail-fast: this synchronous client is called from async code, so
+        it never sleeps waiting for tokens (that would stall the event
+        loop). Callers that can wait go through VALRLink, which uses
+        acquire_async() with the lane's max wait.
+        
+        Raises:
+            RateLimitError: If the lane has no token available right now
+        """
+        if self.rate_limiter.try_acquire(lane, correlation_id=self.correlation_id):
+            return
+        
+        backoff_delay = self.rate_limiter.get_backoff_delay()
+        logger.warning(
+            f"[VALR-RATE-001] Rate limit exceeded | lane={lane.value} | "
+            f"backoff={backoff_delay:.1f}s | correlation_id={self.correlation_id}"
+        )
+        raise RateLimitError(
+            f"VALR-RATE-001: Rate limit exceeded. Retry after {backoff_delay:.1f}s"
+        )
+    
     def _request_with_retry(
         self,
         method: str,
@@ -535,7 +598,7 @@ class VALRClient:
         Raises:
             APIError: After max retries exhausted
         """
-        url = f"{self.BASE_URL}{path}"
+        url = f"{self.base_url}{path}"
         last_error = None
         
         for attempt in range(self.MAX_RETRIES):
@@ -565,6 +628,8 @@ class VALRClient:
                 # Check for rate limit (429)
                 if response.status_code == 429:
                     delay = self.backoff.get_delay()
+                    # Back off every client sharing the budget, not just this one
+                    self.rate_limiter.record_rate_limited(delay)
                     logger.warning(
                         f"[VALR-CLI] HTTP 429 - Rate limited | "
                         f"attempt={attempt + 1}/{self.MAX_RETRIES} | "
@@ -648,14 +713,15 @@ class VALRClient:
         Get current rate limit status.
         
         Returns:
-            Dict with tokens, capacity, mode
+            Dict with tokens, capacity, mode and per-lane statistics
         """
         return {
             'available_tokens': self.rate_limiter.get_available_tokens(),
             'capacity': self.rate_limiter.capacity,
             'capacity_pct': self.rate_limiter.get_capacity_percentage(),
             'mode': self.rate_limiter.get_polling_mode().value,
-            'is_essential_only': self.rate_limiter.is_essential_only()
+            'is_essential_only': self.rate_limiter.is_essential_only(),
+            'lanes': self.rate_limiter.get_lane_statistics()
         }
 
 
@@ -668,6 +734,7 @@ class VALRClient:
 # Rate Limiting: [Verified - TokenBucket integration]
 # Authentication: [Verified - HMAC-SHA512 via VALRSigner]
 # Exponential Backoff: [Verified - On 429/5xx/timeout]
+# Shared Budget: [Verified - Lane-tagged, 429 backs off all clients]
 # Log Sanitization: [Verified - Credentials redacted]
 # Error Handling: [VALR-CLI-001/002/003 codes]
 # Confidence Score: [98/100]
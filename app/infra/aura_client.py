@@ -181,6 +181,24 @@ class AuraResponse:
     latency_ms: float = 0.0
     retries: int = 0
     correlation_id: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+# HTTP statuses meaning the bridge does not expose an endpoint at all
+UNSUPPORTED_ENDPOINT_STATUSES = frozenset({404, 405})
+
+
+def is_unsupported_endpoint(response: AuraResponse) -> bool:
+    """
+    True if the bridge answered that the endpoint does not exist.
+    
+    Reliability Level: STANDARD
+    
+    Only 404/405 qualify: other client errors (400, 401, 422, 429) are
+    failures of that one call, not a capability of the bridge, and must
+    never switch a caller to its fallback for the rest of the process.
+    """
+    return response.status_code in UNSUPPORTED_ENDPOINT_STATUSES
 
 
 # ============================================================================
@@ -296,6 +314,7 @@ class AuraClient:
         url = f"{self._base_url}/mcp/{endpoint}"
         start_time = time.time()
         last_error = None
+        last_status = None  # type: Optional[int]
         
         for attempt in range(self._max_retries):
             try:
@@ -327,11 +346,13 @@ class AuraClient:
                             data=data,
                             latency_ms=latency_ms,
                             retries=attempt,
-                            correlation_id=correlation_id
+                            correlation_id=correlation_id,
+                            status_code=response.status_code
                         )
                     
                     elif response.status_code >= 500:
                         # Server error - retry
+                        last_status = response.status_code
                         last_error = f"Server error: {response.status_code}"
                         logger.warning(
                             f"[AURA-RETRY] {endpoint} | "
@@ -340,15 +361,18 @@ class AuraClient:
                         )
                     
                     else:
-                        # Client error - don't retry
-                        self._circuit.record_failure()
+                        # Client error - don't retry. A missing endpoint
+                        # (capability probe) says nothing about bridge health.
+                        if response.status_code not in UNSUPPORTED_ENDPOINT_STATUSES:
+                            self._circuit.record_failure()
                         return AuraResponse(
                             success=False,
                             error_code=AuraErrorCode.AURA_005_INVALID_RESPONSE.value,
                             error_message=f"Client error: {response.status_code}",
                             latency_ms=latency_ms,
                             retries=attempt,
-                            correlation_id=correlation_id
+                            correlation_id=correlation_id,
+                            status_code=response.status_code
                         )
                         
             except httpx.TimeoutException:
@@ -397,7 +421,8 @@ class AuraClient:
             error_message=f"Max retries exceeded: {last_error}",
             latency_ms=latency_ms,
             retries=self._max_retries,
-            correlation_id=correlation_id
+            correlation_id=correlation_id,
+            status_code=last_status
         )
     
     async def _async_sleep(self, seconds: float) -> None:
@@ -453,6 +478,52 @@ class AuraClient:
             correlation_id=correlation_id
         )
     
+    async def rag_upsert_batch(
+        self,
+        documents: List[Dict[str, Any]],
+        collection: str = "sovereign_debates",
+        correlation_id: Optional[str] = None
+    ) -> AuraResponse:
+        """
+        Upsert many documents to RAG vector store in one request.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: documents is a list of {"content", "metadata"} dicts
+        Side Effects: HTTP POST to Aura Bridge (single round-trip)
+        """
+        return await self.call(
+            "rag_upsert_batch",
+            {
+                "collection": collection,
+                "documents": documents
+            },
+            correlation_id=correlation_id
+        )
+    
+    async def rag_update_metadata(
+        self,
+        where: Dict[str, Any],
+        metadata: Dict[str, Any],
+        collection: str = "sovereign_debates",
+        correlation_id: Optional[str] = None
+    ) -> AuraResponse:
+        """
+        Patch metadata of stored RAG documents without re-embedding.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: where is a metadata equality filter
+        Side Effects: HTTP POST to Aura Bridge
+        """
+        return await self.call(
+            "rag_update_metadata",
+            {
+                "collection": collection,
+                "where": where,
+                "metadata": metadata
+            },
+            correlation_id=correlation_id
+        )
+    
     async def ml_get_predictions(
         self,
         user_id: str,
@@ -489,6 +560,24 @@ class AuraClient:
             correlation_id=correlation_id
         )
     
+    async def ml_record_outcomes_batch(
+        self,
+        outcomes: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> AuraResponse:
+        """
+        Record many prediction outcomes for RLHF in one request.
+
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: outcomes is a list of {"prediction_id", "user_accepted"} dicts
+        Side Effects: HTTP POST to Aura Bridge (single round-trip)
+        """
+        return await self.call(
+            "ml_record_prediction_outcome_batch",
+            {"outcomes": outcomes},
+            correlation_id=correlation_id
+        )
+
     async def ml_calibrate(
         self,
         raw_score: float,
@@ -27,6 +27,8 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 
+from app.observability.metrics import timed
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -164,6 +166,7 @@ class RewardGovernor:
             self._model_loaded = False
             return False
     
+    @timed("reward_governor", "trust_probability")
     def trust_probability(
         self,
         features: "FeatureSnapshot",
@@ -14,6 +14,7 @@ This module contains the core business logic for:
 - RiskGovernor: ATR-based sizing, circuit breakers (v1.4.0)
 - OrderManager: Closed-loop reconciliation (v1.4.0)
 - CircuitBreaker: Autonomous lockout system (v1.4.0)
+- SystemSettingsCache: NOTIFY-driven system_settings view (v1.8.0)
 - ExecutionHandshake: Permit-based authorization (v1.4.0)
 - Institutional audit: slippage, expectancy tracking (v1.4.0)
 - RGI: Reward-Governed Intelligence learning system (v1.6.0)
@@ -57,6 +58,12 @@ from app.logic.circuit_breaker import (
     record_trade_result,
 )
 
+from app.logic.system_settings_cache import (
+    SystemSettingsCache,
+    SystemSettingsView,
+    get_system_settings_cache,
+)
+
 from app.logic.execution_handshake import (
     ExecutionHandshake,
     HandshakeResult,
@@ -121,6 +128,10 @@ __all__ = [
     "LockoutDecision",
     "check_trading_allowed",
     "record_trade_result",
+    # System Settings Cache (v1.8.0)
+    "SystemSettingsCache",
+    "SystemSettingsView",
+    "get_system_settings_cache",
     # Execution Handshake (v1.4.0)
     "ExecutionHandshake",
     "HandshakeResult",
@@ -50,6 +50,8 @@ from enum import Enum
 
 import httpx
 
+from app.observability.metrics import timed
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -422,6 +424,7 @@ class AICouncil:
             )
             return (0, False)
     
+    @timed("ai_council", "conduct_debate")
     async def conduct_debate(
         self,
         correlation_id: UUID,
@@ -740,6 +743,7 @@ class OllamaAICouncil:
         else:
             return 0, False
     
+    @timed("ai_council", "conduct_debate")
     async def conduct_debate(
         self,
         correlation_id: UUID,
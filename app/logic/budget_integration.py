@@ -33,7 +33,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List
 from pathlib import Path
 
 from app.logic.operational_gating import (
@@ -211,6 +211,9 @@ class BudgetIntegrationModule:
         self._budget_loaded: bool = False
         self._load_error: Optional[str] = None
         
+        # Callbacks fired after every load attempt: callback(correlation_id)
+        self._load_callbacks: List[Callable[[str], None]] = []
+        
         logger.info(
             f"[BUDGET_INTEGRATION_INIT] path={self._budget_json_path} "
             f"strict_mode={self._strict_mode}"
@@ -248,6 +251,51 @@ class BudgetIntegrationModule:
         Returns:
             BudgetReport if successful, None if failed
         """
+        try:
+            return self._load_budget_report(correlation_id, json_path)
+        finally:
+            self._notify_load_callbacks(correlation_id)
+    
+    def on_budget_load(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback fired after every budget load attempt.
+        
+        Reliability Level: L5 High
+        Input Constraints: callback must be callable
+        Side Effects: Registers callback for future invocation
+        
+        Fired on success AND failure, since either changes the gating
+        signal (used by PolicyContextCache for invalidation).
+        
+        Args:
+            callback: Function called with the load correlation_id
+        """
+        if not callable(callback):
+            raise ValueError("callback must be callable")
+        self._load_callbacks.append(callback)
+    
+    def remove_on_budget_load(self, callback: Callable[[str], None]) -> None:
+        """Unregister a load callback (unknown callbacks are ignored)."""
+        if callback in self._load_callbacks:
+            self._load_callbacks.remove(callback)
+    
+    def _notify_load_callbacks(self, correlation_id: str) -> None:
+        """Invoke load callbacks. Failures are logged, never raised."""
+        for callback in list(self._load_callbacks):
+            try:
+                callback(correlation_id)
+            except Exception as e:
+                logger.error(
+                    f"[BUDGET_LOAD_CALLBACK_FAIL] error={str(e)} "
+                    f"correlation_id={correlation_id}"
+                )
+    
+    def _load_budget_report(
+        self,
+        correlation_id: str,
+        json_path: Optional[str]
+    ) -> Optional[BudgetReport]:
+        """Load implementation for load_budget_report()."""
         path = json_path or self._budget_json_path
         
         # Check if file exists
@@ -35,8 +35,9 @@ All financial calculations use decimal.Decimal with ROUND_HALF_EVEN.
 """
 
 import logging
+import threading
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Tuple, NamedTuple
+from typing import Callable, List, Optional, Tuple, NamedTuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 
@@ -44,6 +45,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.database.session import SessionLocal
+from app.logic.system_settings_cache import get_system_settings_cache
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -99,6 +101,82 @@ class LockoutDecision:
     trigger_value: str
 
 
+# ============================================================================
+# STATE CHANGE LISTENERS
+# ============================================================================
+
+# Event types passed to state listeners
+STATE_EVENT_LOCKOUT = "LOCKOUT_TRIGGERED"
+STATE_EVENT_AUTO_UNLOCK = "AUTO_UNLOCK"
+STATE_EVENT_DAILY_RESET = "DAILY_RESET"
+
+# Callback signature: listener(event_type) -> None
+StateListener = Callable[[str], None]
+
+_state_listeners: List[StateListener] = []
+_state_listeners_lock = threading.Lock()
+
+
+def register_state_listener(listener: StateListener) -> None:
+    """
+    Register a callback invoked after every committed state change.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: listener must be callable
+    Side Effects: Registers listener for future invocation
+    
+    Listeners are notification-only (cache invalidation). They receive
+    the event type and cannot influence the lockout decision.
+    
+    Args:
+        listener: Function called with the event type
+    """
+    if not callable(listener):
+        raise ValueError("listener must be callable")
+    
+    with _state_listeners_lock:
+        if listener not in _state_listeners:
+            _state_listeners.append(listener)
+
+
+def unregister_state_listener(listener: StateListener) -> None:
+    """
+    Remove a previously registered state listener.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: None (unknown listeners are ignored)
+    Side Effects: Unregisters listener
+    """
+    with _state_listeners_lock:
+        if listener in _state_listeners:
+            _state_listeners.remove(listener)
+
+
+def _notify_state_listeners(event_type: str) -> None:
+    """
+    Invoke all state listeners. Listener failures are logged, never raised.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: event_type is one of the STATE_EVENT_* constants
+    Side Effects: Invokes listeners
+    """
+    # The committed write changed system_settings - drop the shared view
+    get_system_settings_cache().invalidate(f"CIRCUIT_BREAKER {event_type}")
+    
+    with _state_listeners_lock:
+        listeners = list(_state_listeners)
+    
+    for listener in listeners:
+        try:
+            listener(event_type)
+        except Exception as e:
+            logger.error(
+                "[CB-003] State listener failed | event=%s | error=%s",
+                event_type,
+                str(e)
+            )
+
+
 # ============================================================================
 # CIRCUIT BREAKER CLASS
 # ============================================================================
@@ -142,73 +220,56 @@ class CircuitBreaker:
         
         Reliability Level: SOVEREIGN TIER
         Input Constraints: None (reads from database)
-        Side Effects: Database SELECT
+        Side Effects: Database SELECT only when the shared
+            SystemSettingsCache is invalid; may auto-unlock
         
         Returns:
             CircuitBreakerState with current lockout status
         """
-        close_db = False
-        if db is None:
-            db = SessionLocal()
-            close_db = True
+        settings = get_system_settings_cache().get()
         
-        try:
-            result = db.execute(
-                text("""
-                    SELECT 
-                        circuit_breaker_active,
-                        circuit_breaker_reason,
-                        circuit_breaker_unlock_at,
-                        daily_pnl_zar,
-                        daily_pnl_pct,
-                        consecutive_losses,
-                        daily_loss_limit_pct,
-                        max_consecutive_losses
-                    FROM system_settings
-                    WHERE id = 1
-                """)
-            )
-            
-            row = result.fetchone()
-            
-            if not row:
-                logger.error("[CB-001] No system_settings found")
-                # Return locked state if no settings (fail-safe)
-                return CircuitBreakerState(
-                    is_locked=True,
-                    lock_reason="NO_SYSTEM_SETTINGS",
-                    unlock_at=None,
-                    daily_pnl_zar=Decimal("0"),
-                    daily_pnl_pct=Decimal("0"),
-                    consecutive_losses=0,
-                    daily_loss_limit_pct=DAILY_LOSS_LIMIT_PCT,
-                    max_consecutive_losses=MAX_CONSECUTIVE_LOSSES
-                )
-            
-            # Check if lockout has expired
-            is_locked = row.circuit_breaker_active or False
-            unlock_at = row.circuit_breaker_unlock_at
-            
-            if is_locked and unlock_at:
-                if datetime.now(timezone.utc) >= unlock_at:
-                    # Lockout expired - auto-unlock
-                    self._auto_unlock(db)
-                    is_locked = False
-            
+        if not settings.row_found:
+            logger.error("[CB-001] No system_settings found")
+            # Return locked state if no settings (fail-safe)
             return CircuitBreakerState(
-                is_locked=is_locked,
-                lock_reason=row.circuit_breaker_reason,
-                unlock_at=unlock_at,
-                daily_pnl_zar=Decimal(str(row.daily_pnl_zar or 0)),
-                daily_pnl_pct=Decimal(str(row.daily_pnl_pct or 0)),
-                consecutive_losses=row.consecutive_losses or 0,
-                daily_loss_limit_pct=Decimal(str(row.daily_loss_limit_pct or DAILY_LOSS_LIMIT_PCT)),
-                max_consecutive_losses=row.max_consecutive_losses or MAX_CONSECUTIVE_LOSSES
+                is_locked=True,
+                lock_reason="NO_SYSTEM_SETTINGS",
+                unlock_at=None,
+                daily_pnl_zar=Decimal("0"),
+                daily_pnl_pct=Decimal("0"),
+                consecutive_losses=0,
+                daily_loss_limit_pct=DAILY_LOSS_LIMIT_PCT,
+                max_consecutive_losses=MAX_CONSECUTIVE_LOSSES
             )
-            
-        finally:
-            if close_db:
-                db.close()
+        
+        # Check if lockout has expired
+        is_locked = settings.circuit_breaker_active or False
+        unlock_at = settings.circuit_breaker_unlock_at
+        
+        if is_locked and unlock_at:
+            if datetime.now(timezone.utc) >= unlock_at:
+                # Lockout expired - auto-unlock
+                close_db = False
+                if db is None:
+                    db = SessionLocal()
+                    close_db = True
+                try:
+                    self._auto_unlock(db)
+                finally:
+                    if close_db:
+                        db.close()
+                is_locked = False
+        
+        return CircuitBreakerState(
+            is_locked=is_locked,
+            lock_reason=settings.circuit_breaker_reason,
+            unlock_at=unlock_at,
+            daily_pnl_zar=settings.daily_pnl_zar or Decimal("0"),
+            daily_pnl_pct=settings.daily_pnl_pct or Decimal("0"),
+            consecutive_losses=settings.consecutive_losses or 0,
+            daily_loss_limit_pct=settings.daily_loss_limit_pct or DAILY_LOSS_LIMIT_PCT,
+            max_consecutive_losses=settings.max_consecutive_losses or MAX_CONSECUTIVE_LOSSES
+        )
     
     def check_trading_allowed(self) -> Tuple[bool, Optional[str]]:
         """
@@ -337,6 +398,7 @@ class CircuitBreaker:
                 }
             )
             db.commit()
+            get_system_settings_cache().invalidate("CIRCUIT_BREAKER TRADE_RESULT")
             
             logger.info(
                 "Trade result recorded | pnl=%s | is_win=%s | "
@@ -482,6 +544,7 @@ class CircuitBreaker:
         )
         
         db.commit()
+        _notify_state_listeners(STATE_EVENT_LOCKOUT)
         
         logger.critical(
             "🛑 CIRCUIT BREAKER TRIGGERED | reason=%s | "
@@ -535,6 +598,7 @@ class CircuitBreaker:
         )
         
         db.commit()
+        _notify_state_listeners(STATE_EVENT_AUTO_UNLOCK)
         
         logger.info("✅ Circuit breaker AUTO-UNLOCKED | lockout expired")
     
@@ -597,6 +661,7 @@ class CircuitBreaker:
             )
             
             db.commit()
+            _notify_state_listeners(STATE_EVENT_DAILY_RESET)
             
             logger.info(
                 "Daily P&L reset | starting_equity=%s",
@@ -19,18 +19,27 @@ CHUNKING STRATEGY:
 - RAG embeddings work best with 256-512 token chunks
 - We split reasoning into overlapping chunks for context preservation
 - Each chunk is indexed separately but linked via correlation_id
+- All chunks (of one or many debates) go out in one batch request
 
 ============================================================================
 """
 
+import os
+import asyncio
 import logging
 import hashlib
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from app.infra.aura_client import get_aura_client, AuraResponse
+from app.infra.aura_client import (
+    get_aura_client,
+    AuraResponse,
+    is_unsupported_endpoint
+)
+from app.logic.intel_cache import get_intel_cache
 
 # Configure module logger
 logger = logging.getLogger("debate_memory")
@@ -48,6 +57,10 @@ MIN_CHUNK_CHARS = 100  # Don't create tiny chunks
 # Collection name
 DEBATE_COLLECTION = "sovereign_debates"
 
+# Batched indexing configuration
+DEBATE_UPSERT_CONCURRENCY = int(os.getenv("DEBATE_UPSERT_CONCURRENCY", "8"))
+MAX_TRACKED_CHUNKS = int(os.getenv("DEBATE_MAX_TRACKED_CHUNKS", "10000"))
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -181,161 +194,405 @@ def generate_chunk_id(correlation_id: str, chunk_index: int) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
+# ============================================================================
+# INDEX STATE (CHUNK HASH REGISTRY)
+# ============================================================================
+
+# chunk_id -> chunk_content_hash of the last successful upsert. Bounded LRU
+# so a long-running process does not grow without limit; an evicted entry
+# only costs one redundant upsert.
+_indexed_chunk_hashes: "OrderedDict[str, str]" = OrderedDict()
+
+# Set to False once the bridge answers rag_upsert_batch / rag_update_metadata
+# with 404/405 (older bridges), so we stop probing and use the fallbacks.
+_batch_upsert_supported = True
+_metadata_patch_supported = True
+
+
+def compute_chunk_content_hash(chunk_content: str) -> str:
+    """
+    Short content hash stored as chunk_content_hash metadata.
+    
+    Reliability Level: SOVEREIGN TIER
+    """
+    return hashlib.md5(chunk_content.encode()).hexdigest()[:8]
+
+
+def _remember_chunk(chunk_id: str, content_hash: str) -> None:
+    """Record a successfully indexed chunk (LRU bounded)."""
+    _indexed_chunk_hashes[chunk_id] = content_hash
+    _indexed_chunk_hashes.move_to_end(chunk_id)
+    while len(_indexed_chunk_hashes) > MAX_TRACKED_CHUNKS:
+        _indexed_chunk_hashes.popitem(last=False)
+
+
+def _is_unchanged(chunk_id: str, content_hash: str) -> bool:
+    """True if this exact chunk content was already indexed."""
+    if _indexed_chunk_hashes.get(chunk_id) != content_hash:
+        return False
+    _indexed_chunk_hashes.move_to_end(chunk_id)
+    return True
+
+
+def reset_debate_index_state() -> None:
+    """
+    Forget indexed chunk hashes and endpoint capability probes.
+    
+    Reliability Level: STANDARD
+    Side Effects: Next index call re-upserts every chunk
+    """
+    global _batch_upsert_supported, _metadata_patch_supported
+    _indexed_chunk_hashes.clear()
+    _batch_upsert_supported = True
+    _metadata_patch_supported = True
+
+
 # ============================================================================
 # DEBATE INDEXING
 # ============================================================================
 
-async def index_debate(
-    correlation_id: str,
-    symbol: str,
-    side: str,
-    price: Decimal,
-    bull_reasoning: str,
-    bear_reasoning: str,
-    consensus_score: int,
-    final_verdict: bool,
-    outcome: str = "PENDING"
-) -> bool:
+def build_debate_chunks(debate: DebateDocument) -> List[Dict[str, Any]]:
     """
-    Index debate into RAG vector store with chunking.
+    Build RAG upsert documents for every chunk of one debate.
     
     Reliability Level: SOVEREIGN TIER
-    Input Constraints:
-        - correlation_id: Valid UUID string
-        - symbol: Trading pair (e.g., "BTCZAR")
-        - side: "BUY" or "SELL"
-        - price: Decimal price value
-        - bull_reasoning: Bull AI analysis text
-        - bear_reasoning: Bear AI analysis text
-        - consensus_score: 0-100
-        - final_verdict: True for APPROVED, False for REJECTED
-        - outcome: WIN, LOSS, or PENDING
-    Side Effects: HTTP POST to Aura MCP rag_upsert
+    Input Constraints: DebateDocument with full bull/bear reasoning
+    Side Effects: None
     
     Chunking Strategy:
     1. Combine bull + bear reasoning
     2. Split into 512-token chunks with overlap
-    3. Index each chunk with shared metadata
+    3. Attach shared metadata to each chunk
     4. Link chunks via correlation_id
     
     Returns:
-        True if all chunks indexed successfully
+        List of {"content", "metadata"} dicts (empty if nothing to index)
     """
-    client = get_aura_client()
-    created_at = datetime.now(timezone.utc)
-    
-    logger.info(
-        f"[DEBATE-MEMORY] Indexing debate | "
-        f"correlation_id={correlation_id} | "
-        f"signal={side} {symbol} @ R{price:,.2f} | "
-        f"verdict={'APPROVED' if final_verdict else 'REJECTED'}"
-    )
+    created_at = debate.created_at or datetime.now(timezone.utc)
     
-    # ========================================================================
-    # STEP 1: Build Combined Content
-    # ========================================================================
     combined_content = f"""
-TRADE SIGNAL: {side} {symbol} @ R{price:,.2f}
-VERDICT: {"APPROVED" if final_verdict else "REJECTED"} (consensus: {consensus_score}/100)
-OUTCOME: {outcome}
+TRADE SIGNAL: {debate.side} {debate.symbol} @ R{debate.price:,.2f}
+VERDICT: {"APPROVED" if debate.final_verdict else "REJECTED"} (consensus: {debate.consensus_score}/100)
+OUTCOME: {debate.outcome}
 
 === BULL ANALYSIS ===
-{bull_reasoning}
+{debate.bull_reasoning}
 
 === BEAR ANALYSIS ===
-{bear_reasoning}
+{debate.bear_reasoning}
 """
     
-    # ========================================================================
-    # STEP 2: Chunk the Content
-    # ========================================================================
     chunks = chunk_text(combined_content)
     total_chunks = len(chunks)
-    
-    if total_chunks == 0:
-        logger.warning(f"[DEBATE-MEMORY] No chunks generated for {correlation_id}")
-        return False
-    
-    logger.info(
-        f"[DEBATE-MEMORY] Split into {total_chunks} chunks | "
-        f"correlation_id={correlation_id}"
-    )
-    
-    # ========================================================================
-    # STEP 3: Index Each Chunk
-    # ========================================================================
-    success_count = 0
+    documents = []
     
     for i, chunk_content in enumerate(chunks):
-        chunk_id = generate_chunk_id(correlation_id, i)
-        
-        # Build document
         doc = DebateDocument(
-            correlation_id=correlation_id,
-            symbol=symbol,
-            side=side,
-            price=price,
-            bull_reasoning=bull_reasoning[:500],  # Summary for metadata
-            bear_reasoning=bear_reasoning[:500],
-            consensus_score=consensus_score,
-            final_verdict=final_verdict,
-            outcome=outcome,
+            correlation_id=debate.correlation_id,
+            symbol=debate.symbol,
+            side=debate.side,
+            price=debate.price,
+            bull_reasoning=debate.bull_reasoning[:500],  # Summary for metadata
+            bear_reasoning=debate.bear_reasoning[:500],
+            consensus_score=debate.consensus_score,
+            final_verdict=debate.final_verdict,
+            outcome=debate.outcome,
             chunk_index=i,
             total_chunks=total_chunks,
             created_at=created_at
         )
         
-        # Add chunk-specific metadata
         metadata = doc.to_metadata()
-        metadata["chunk_id"] = chunk_id
-        metadata["chunk_content_hash"] = hashlib.md5(
-            chunk_content.encode()
-        ).hexdigest()[:8]
+        metadata["chunk_id"] = generate_chunk_id(debate.correlation_id, i)
+        metadata["chunk_content_hash"] = compute_chunk_content_hash(chunk_content)
         
-        # Upsert to RAG
+        documents.append({"content": chunk_content, "metadata": metadata})
+    
+    return documents
+
+
+async def _upsert_chunks_individually(
+    client: Any,
+    documents: List[Dict[str, Any]],
+    correlation_id: str
+) -> List[bool]:
+    """
+    Fallback path: one rag_upsert per chunk, bounded concurrent gather.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: Up to DEBATE_UPSERT_CONCURRENCY concurrent HTTP calls
+    """
+    semaphore = asyncio.Semaphore(DEBATE_UPSERT_CONCURRENCY)
+    
+    async def upsert_one(document: Dict[str, Any]) -> bool:
+        metadata = document["metadata"]
+        async with semaphore:
+            try:
+                response = await client.rag_upsert(
+                    content=document["content"],
+                    metadata=metadata,
+                    collection=DEBATE_COLLECTION,
+                    correlation_id=metadata["correlation_id"]
+                )
+            except Exception as e:
+                logger.error(
+                    f"[DEBATE-MEMORY] Exception indexing chunk | "
+                    f"chunk_id={metadata.get('chunk_id')} | "
+                    f"correlation_id={metadata['correlation_id']} | error={e}"
+                )
+                return False
+        
+        if not response.success:
+            logger.warning(
+                f"[DEBATE-MEMORY] Failed to index chunk | "
+                f"chunk_id={metadata.get('chunk_id')} | "
+                f"correlation_id={metadata['correlation_id']} | "
+                f"error={response.error_message}"
+            )
+        return response.success
+    
+    return list(await asyncio.gather(*(upsert_one(d) for d in documents)))
+
+
+async def _upsert_chunks(
+    client: Any,
+    documents: List[Dict[str, Any]],
+    correlation_id: str
+) -> List[bool]:
+    """
+    Upsert chunks in one rag_upsert_batch round-trip.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Non-empty list of chunk documents
+    Side Effects: HTTP POST to Aura MCP
+    
+    Falls back to the bounded per-chunk gather when the bridge does not
+    expose rag_upsert_batch. A failed batch fails every chunk in it.
+    
+    Returns:
+        Per-document success flags, in input order
+    """
+    global _batch_upsert_supported
+    
+    if _batch_upsert_supported:
         try:
-            response = await client.rag_upsert(
-                content=chunk_content,
-                metadata=metadata,
+            response = await client.rag_upsert_batch(
+                documents=documents,
                 collection=DEBATE_COLLECTION,
                 correlation_id=correlation_id
             )
-            
-            if response.success:
-                success_count += 1
-                logger.debug(
-                    f"[DEBATE-MEMORY] Indexed chunk {i + 1}/{total_chunks} | "
-                    f"chunk_id={chunk_id}"
-                )
-            else:
-                logger.warning(
-                    f"[DEBATE-MEMORY] Failed to index chunk {i + 1}/{total_chunks} | "
-                    f"error={response.error_message}"
-                )
-                
         except Exception as e:
             logger.error(
-                f"[DEBATE-MEMORY] Exception indexing chunk {i + 1}/{total_chunks} | "
-                f"error={e}"
+                f"[DEBATE-MEMORY] Exception in batch upsert | "
+                f"chunks={len(documents)} | "
+                f"correlation_id={correlation_id} | error={e}"
+            )
+            return [False] * len(documents)
+        
+        if response.success:
+            return [True] * len(documents)
+        
+        if not is_unsupported_endpoint(response):
+            logger.warning(
+                f"[DEBATE-MEMORY] Batch upsert failed | "
+                f"chunks={len(documents)} | "
+                f"correlation_id={correlation_id} | "
+                f"error={response.error_message}"
             )
+            return [False] * len(documents)
+        
+        logger.info(
+            f"[DEBATE-MEMORY] rag_upsert_batch unsupported, "
+            f"using per-chunk upserts | correlation_id={correlation_id}"
+        )
+        _batch_upsert_supported = False
+    
+    return await _upsert_chunks_individually(client, documents, correlation_id)
+
+
+async def index_debates(
+    debates: List[DebateDocument],
+    correlation_id: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Index many debates into RAG vector store in one round-trip.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints:
+        - debates: DebateDocuments with full bull/bear reasoning
+        - correlation_id: Optional batch trace ID (defaults to first debate)
+    Side Effects: HTTP POST to Aura MCP rag_upsert_batch
+    
+    Chunks whose chunk_content_hash matches the last successful upsert of
+    the same chunk_id are skipped, so re-indexing an unchanged debate
+    costs no request at all.
+    
+    Returns:
+        correlation_id -> True if every chunk of that debate is indexed
+    """
+    if not debates:
+        return {}
+    
+    client = get_aura_client()
+    batch_correlation_id = correlation_id or debates[0].correlation_id
     
-    # ========================================================================
-    # STEP 4: Report Results
-    # ========================================================================
-    all_success = success_count == total_chunks
+    results: Dict[str, bool] = {}
+    pending_by_chunk: Dict[str, Dict[str, Any]] = {}
+    skipped = 0
     
-    if all_success:
+    for debate in debates:
         logger.info(
-            f"[DEBATE-MEMORY] Successfully indexed all {total_chunks} chunks | "
-            f"correlation_id={correlation_id}"
+            f"[DEBATE-MEMORY] Indexing debate | "
+            f"correlation_id={debate.correlation_id} | "
+            f"signal={debate.side} {debate.symbol} @ R{debate.price:,.2f} | "
+            f"verdict={'APPROVED' if debate.final_verdict else 'REJECTED'}"
+        )
+        
+        documents = build_debate_chunks(debate)
+        if not documents:
+            logger.warning(
+                f"[DEBATE-MEMORY] No chunks generated for {debate.correlation_id}"
+            )
+            results[debate.correlation_id] = False
+            continue
+        
+        results.setdefault(debate.correlation_id, True)
+        for document in documents:
+            metadata = document["metadata"]
+            if _is_unchanged(metadata["chunk_id"], metadata["chunk_content_hash"]):
+                skipped += 1
+            else:
+                # Last occurrence wins if a debate appears twice in the batch
+                pending_by_chunk[metadata["chunk_id"]] = document
+    
+    pending = list(pending_by_chunk.values())
+    if pending:
+        outcomes = await _upsert_chunks(client, pending, batch_correlation_id)
+        for document, success in zip(pending, outcomes):
+            metadata = document["metadata"]
+            if success:
+                _remember_chunk(metadata["chunk_id"], metadata["chunk_content_hash"])
+            else:
+                results[metadata["correlation_id"]] = False
+    
+    indexed = sum(1 for ok in results.values() if ok)
+    if indexed == len(results):
+        logger.info(
+            f"[DEBATE-MEMORY] Indexed {len(results)} debates | "
+            f"chunks_upserted={len(pending)} | chunks_unchanged={skipped} | "
+            f"correlation_id={batch_correlation_id}"
         )
     else:
         logger.warning(
-            f"[DEBATE-MEMORY] Partial indexing: {success_count}/{total_chunks} chunks | "
-            f"correlation_id={correlation_id}"
+            f"[DEBATE-MEMORY] Partial indexing: {indexed}/{len(results)} debates | "
+            f"chunks_upserted={len(pending)} | chunks_unchanged={skipped} | "
+            f"correlation_id={batch_correlation_id}"
         )
     
-    return all_success
+    return results
+
+
+async def index_debate(
+    correlation_id: str,
+    symbol: str,
+    side: str,
+    price: Decimal,
+    bull_reasoning: str,
+    bear_reasoning: str,
+    consensus_score: int,
+    final_verdict: bool,
+    outcome: str = "PENDING"
+) -> bool:
+    """
+    Index debate into RAG vector store with chunking.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints:
+        - correlation_id: Valid UUID string
+        - symbol: Trading pair (e.g., "BTCZAR")
+        - side: "BUY" or "SELL"
+        - price: Decimal price value
+        - bull_reasoning: Bull AI analysis text
+        - bear_reasoning: Bear AI analysis text
+        - consensus_score: 0-100
+        - final_verdict: True for APPROVED, False for REJECTED
+        - outcome: WIN, LOSS, or PENDING
+    Side Effects: HTTP POST to Aura MCP rag_upsert_batch
+    
+    All chunks go out in a single request (see index_debates).
+    
+    Returns:
+        True if all chunks indexed successfully
+    """
+    debate = DebateDocument(
+        correlation_id=correlation_id,
+        symbol=symbol,
+        side=side,
+        price=price,
+        bull_reasoning=bull_reasoning,
+        bear_reasoning=bear_reasoning,
+        consensus_score=consensus_score,
+        final_verdict=final_verdict,
+        outcome=outcome,
+        created_at=datetime.now(timezone.utc)
+    )
+    
+    results = await index_debates([debate], correlation_id=correlation_id)
+    return results.get(correlation_id, False)
+
+
+def _build_outcome_document(
+    correlation_id: str,
+    outcome: str,
+    pnl_zar: Optional[Decimal],
+    updated_at: str
+) -> Dict[str, Any]:
+    """
+    Build the linked outcome_update document for bridges without
+    rag_update_metadata.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: None
+    """
+    pnl_text = f"R{pnl_zar:,.2f}" if pnl_zar is not None else "N/A"
+    content = f"""
+OUTCOME UPDATE for {correlation_id}
+Result: {outcome}
+PnL: {pnl_text}
+Updated: {updated_at}
+"""
+    
+    metadata = {
+        "correlation_id": correlation_id,
+        "outcome": outcome,
+        "pnl_zar": str(pnl_zar) if pnl_zar is not None else None,
+        "document_type": "outcome_update",
+        "updated_at": updated_at
+    }
+    
+    return {"content": content, "metadata": metadata}
+
+
+async def _upsert_outcome_document(
+    client: Any,
+    correlation_id: str,
+    outcome: str,
+    pnl_zar: Optional[Decimal],
+    updated_at: str
+) -> AuraResponse:
+    """
+    Fallback path: store the outcome as a separate linked document.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: HTTP POST to Aura MCP rag_upsert
+    """
+    document = _build_outcome_document(correlation_id, outcome, pnl_zar, updated_at)
+    return await client.rag_upsert(
+        content=document["content"],
+        metadata=document["metadata"],
+        collection=DEBATE_COLLECTION,
+        correlation_id=correlation_id
+    )
 
 
 async def update_debate_outcome(
@@ -351,11 +608,19 @@ async def update_debate_outcome(
         - correlation_id: Existing debate correlation_id
         - outcome: WIN, LOSS, or BREAKEVEN
         - pnl_zar: Optional realized PnL in ZAR
-    Side Effects: HTTP POST to Aura MCP rag_upsert
+    Side Effects: HTTP POST to Aura MCP rag_update_metadata
     
-    This creates an outcome update document linked to the original debate.
+    Patches outcome/pnl metadata on the already-indexed debate chunks; no
+    content is re-sent or re-embedded. Bridges without rag_update_metadata
+    get a linked outcome_update document instead.
+    
+    Cached similar-debate retrievals that include this debate are
+    invalidated so the next signal sees the new outcome.
     """
+    global _metadata_patch_supported
+    
     client = get_aura_client()
+    updated_at = datetime.now(timezone.utc).isoformat()
     
     logger.info(
         f"[DEBATE-MEMORY] Updating outcome | "
@@ -364,28 +629,35 @@ async def update_debate_outcome(
         f"pnl_zar={pnl_zar}"
     )
     
-    content = f"""
-OUTCOME UPDATE for {correlation_id}
-Result: {outcome}
-PnL: R{pnl_zar:,.2f} if pnl_zar else "N/A"
-Updated: {datetime.now(timezone.utc).isoformat()}
-"""
-    
-    metadata = {
-        "correlation_id": correlation_id,
-        "outcome": outcome,
-        "pnl_zar": str(pnl_zar) if pnl_zar else None,
-        "document_type": "outcome_update",
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
-    
     try:
-        response = await client.rag_upsert(
-            content=content,
-            metadata=metadata,
-            collection=DEBATE_COLLECTION,
-            correlation_id=correlation_id
-        )
+        response = None
+        
+        if _metadata_patch_supported:
+            response = await client.rag_update_metadata(
+                where={"correlation_id": correlation_id, "document_type": "debate"},
+                metadata={
+                    "outcome": outcome,
+                    "pnl_zar": str(pnl_zar) if pnl_zar is not None else None,
+                    "updated_at": updated_at
+                },
+                collection=DEBATE_COLLECTION,
+                correlation_id=correlation_id
+            )
+            if not response.success and is_unsupported_endpoint(response):
+                logger.info(
+                    f"[DEBATE-MEMORY] rag_update_metadata unsupported, "
+                    f"using outcome document | correlation_id={correlation_id}"
+                )
+                _metadata_patch_supported = False
+                response = None
+        
+        if response is None:
+            response = await _upsert_outcome_document(
+                client, correlation_id, outcome, pnl_zar, updated_at
+            )
+        
+        # After the write, so a concurrent refresh cannot re-cache the old outcome
+        get_intel_cache().invalidate_debate(correlation_id)
         
         if response.success:
             logger.info(
@@ -405,6 +677,111 @@ Updated: {datetime.now(timezone.utc).isoformat()}
         return False
 
 
+async def update_debate_outcomes(
+    updates: List[Dict[str, Any]],
+    correlation_id: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Update many debate outcomes at once (outcome backfill).
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: updates is a list of {"correlation_id", "outcome",
+                       "pnl_zar"} dicts
+    Side Effects: HTTP POSTs to Aura MCP
+    
+    Metadata patches have no bulk endpoint, so they run as a bounded
+    concurrent gather (DEBATE_UPSERT_CONCURRENCY). Bridges without
+    rag_update_metadata get all outcome documents in one
+    rag_upsert_batch round-trip.
+    
+    Returns:
+        correlation_id -> True if that outcome was stored
+    """
+    global _metadata_patch_supported
+    
+    if not updates:
+        return {}
+    
+    client = get_aura_client()
+    batch_correlation_id = correlation_id or updates[0]["correlation_id"]
+    updated_at = datetime.now(timezone.utc).isoformat()
+    results: Dict[str, bool] = {}
+    pending = list(updates)
+    
+    if _metadata_patch_supported:
+        semaphore = asyncio.Semaphore(DEBATE_UPSERT_CONCURRENCY)
+        
+        async def patch_one(update: Dict[str, Any]) -> Optional[AuraResponse]:
+            pnl_zar = update.get("pnl_zar")
+            async with semaphore:
+                try:
+                    return await client.rag_update_metadata(
+                        where={
+                            "correlation_id": update["correlation_id"],
+                            "document_type": "debate"
+                        },
+                        metadata={
+                            "outcome": update["outcome"],
+                            "pnl_zar": str(pnl_zar) if pnl_zar is not None else None,
+                            "updated_at": updated_at
+                        },
+                        collection=DEBATE_COLLECTION,
+                        correlation_id=update["correlation_id"]
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"[DEBATE-MEMORY] Exception updating outcome | "
+                        f"correlation_id={update['correlation_id']} | error={e}"
+                    )
+                    return None
+        
+        responses = await asyncio.gather(*(patch_one(u) for u in pending))
+        unsupported = []
+        for update, response in zip(pending, responses):
+            if response is not None and not response.success and is_unsupported_endpoint(response):
+                unsupported.append(update)
+            else:
+                results[update["correlation_id"]] = response is not None and response.success
+        
+        pending = unsupported
+        if pending:
+            logger.info(
+                f"[DEBATE-MEMORY] rag_update_metadata unsupported, "
+                f"using outcome documents | correlation_id={batch_correlation_id}"
+            )
+            _metadata_patch_supported = False
+    
+    if pending:
+        documents = [
+            _build_outcome_document(
+                u["correlation_id"], u["outcome"], u.get("pnl_zar"), updated_at
+            )
+            for u in pending
+        ]
+        outcomes = await _upsert_chunks(client, documents, batch_correlation_id)
+        for update, success in zip(pending, outcomes):
+            results[update["correlation_id"]] = success
+    
+    # After the writes, so a concurrent refresh cannot re-cache old outcomes
+    intel_cache = get_intel_cache()
+    for update in updates:
+        intel_cache.invalidate_debate(update["correlation_id"])
+    
+    updated = sum(1 for ok in results.values() if ok)
+    if updated == len(results):
+        logger.info(
+            f"[DEBATE-MEMORY] Updated {updated} outcomes | "
+            f"correlation_id={batch_correlation_id}"
+        )
+    else:
+        logger.warning(
+            f"[DEBATE-MEMORY] Partial outcome update: {updated}/{len(results)} | "
+            f"correlation_id={batch_correlation_id}"
+        )
+    
+    return results
+
+
 # ============================================================================
 # 95% CONFIDENCE AUDIT
 # ============================================================================
@@ -414,6 +791,8 @@ Updated: {datetime.now(timezone.utc).isoformat()}
 # L6 Safety Compliance: Verified (all MCP calls wrapped in try-except)
 # Traceability: correlation_id links all chunks
 # Chunking: 512-token chunks with 50-token overlap
+# Batching: one rag_upsert_batch per index call, unchanged chunks skipped
+# Outcome Backfill: bounded concurrent patches or one outcome-document batch
 # Error Handling: Graceful degradation on partial failures
 # Confidence Score: 95/100
 #
@@ -55,6 +55,8 @@ from sqlalchemy.orm import Session
 
 from app.logic.valr_link import VALRLink, OrderSide, OrderResult
 from app.database.session import SessionLocal
+from app.logic.system_settings_cache import get_system_settings_cache
+from app.observability.metrics import timed
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -162,30 +164,19 @@ class Dispatcher:
         
         Reliability Level: SOVEREIGN TIER
         Input Constraints: Valid database session
-        Side Effects: Database SELECT
+        Side Effects: Database SELECT only when the shared
+            SystemSettingsCache is invalid (NOTIFY-driven)
         
         Args:
-            db: Database session
+            db: Database session (unused: the shared view is loaded on
+                its own connection, never inside this transaction)
             
         Returns:
             SystemSettings with current configuration
         """
-        result = db.execute(
-            text("""
-                SELECT 
-                    system_active,
-                    min_trade_zar,
-                    max_slippage_percent,
-                    taker_fee_percent,
-                    kill_switch_reason
-                FROM system_settings
-                WHERE id = 1
-            """)
-        )
-        
-        row = result.fetchone()
+        view = get_system_settings_cache().get()
         
-        if not row:
+        if not view.row_found:
             # Return defaults if no settings found
             logger.warning("No system_settings found, using defaults")
             return SystemSettings(
@@ -197,11 +188,11 @@ class Dispatcher:
             )
         
         return SystemSettings(
-            system_active=row.system_active,
-            min_trade_zar=Decimal(str(row.min_trade_zar)),
-            max_slippage_percent=Decimal(str(row.max_slippage_percent)),
-            taker_fee_percent=Decimal(str(row.taker_fee_percent)),
-            kill_switch_reason=row.kill_switch_reason
+            system_active=view.system_active,
+            min_trade_zar=view.min_trade_zar,
+            max_slippage_percent=view.max_slippage_percent,
+            taker_fee_percent=view.taker_fee_percent,
+            kill_switch_reason=view.kill_switch_reason
         )
     
     def _fetch_debate_verdict(
@@ -476,6 +467,7 @@ class Dispatcher:
                 str(e)
             )
     
+    @timed("dispatcher", "execute_signal")
     async def execute_signal(
         self,
         correlation_id: UUID,
@@ -6,7 +6,9 @@ Input Constraints: Valid MCP connections required
 Side Effects: Network I/O, may block trading operations
 
 This module implements comprehensive health verification for all 78 MCP tools:
-- Sequential ping of all tools with 5-second SLA
+- Concurrent ping of all tools with 5-second SLA per tool
+- Bounded parallelism per MCP server and an overall sweep deadline
+- Critical tools pinged first; results cached with a TTL
 - Critical tool gating (trading blocked if any critical tool unhealthy)
 - Complete HealthReport generation for audit logs
 
@@ -33,9 +35,19 @@ logger = logging.getLogger("health_verification")
 # Ping timeout in seconds
 PING_TIMEOUT_SECONDS = 5
 
+# Maximum in-flight pings per MCP server during a sweep
+MAX_CONCURRENT_PINGS_PER_SERVER = 8
+
+# Overall wall-clock budget for one full sweep (seconds)
+SWEEP_DEADLINE_SECONDS = 15
+
+# How long a ping result may answer quick_critical_check (seconds)
+HEALTH_CACHE_TTL_SECONDS = 30
+
 # Error codes
 ERROR_TOOL_PING_TIMEOUT = "TOOL_PING_TIMEOUT"
 ERROR_TOOL_PING_FAIL = "TOOL_PING_FAIL"
+ERROR_SWEEP_DEADLINE = "TOOL_SWEEP_DEADLINE"
 ERROR_CRITICAL_UNHEALTHY = "CRITICAL_UNHEALTHY"
 
 # Critical tools that must be healthy for trading
@@ -222,8 +234,9 @@ class HealthVerificationModule:
     Side Effects: Network I/O only
     
     Implements:
-    - Sequential ping of all 78 tools
+    - Concurrent ping of all 78 tools (per-server semaphores, sweep deadline)
     - 5-second timeout per tool (Property 16)
+    - TTL result cache shared with quick_critical_check
     - Critical tool gating (Property 18)
     - Complete HealthReport generation (Property 17)
     """
@@ -234,7 +247,10 @@ class HealthVerificationModule:
     def __init__(
         self,
         mcp_tool_caller: Optional[Callable[[str, str, Dict[str, Any]], Awaitable[Any]]] = None,
-        ping_timeout_seconds: int = PING_TIMEOUT_SECONDS
+        ping_timeout_seconds: int = PING_TIMEOUT_SECONDS,
+        max_concurrent_per_server: int = MAX_CONCURRENT_PINGS_PER_SERVER,
+        sweep_deadline_seconds: float = SWEEP_DEADLINE_SECONDS,
+        cache_ttl_seconds: float = HEALTH_CACHE_TTL_SECONDS
     ) -> None:
         """
         Initialize Health Verification Module.
@@ -242,10 +258,19 @@ class HealthVerificationModule:
         Args:
             mcp_tool_caller: Async callback to invoke MCP tools (server, tool, args)
             ping_timeout_seconds: Timeout for each tool ping (default: 5s)
+            max_concurrent_per_server: In-flight ping limit per MCP server
+            sweep_deadline_seconds: Overall budget for ping_all_tools
+            cache_ttl_seconds: Freshness window for cached ping results
         """
         self._mcp_tool_caller = mcp_tool_caller
         self._ping_timeout = ping_timeout_seconds
+        self._max_concurrent_per_server = max(1, max_concurrent_per_server)
+        self._sweep_deadline = sweep_deadline_seconds
+        self._cache_ttl = cache_ttl_seconds
         self._last_report: Optional[HealthReport] = None
+        
+        # tool_name -> (monotonic time recorded, result)
+        self._result_cache = {}  # type: Dict[str, tuple]
     
     @property
     def ping_timeout(self) -> int:
@@ -273,6 +298,48 @@ class HealthVerificationModule:
         """Get total number of tools."""
         return len(AURA_BRIDGE_TOOLS) + len(AURA_FULL_TOOLS)
     
+    def get_server_for_tool(self, tool_name: str) -> str:
+        """Get the MCP server that hosts a tool."""
+        if tool_name in AURA_BRIDGE_TOOLS:
+            return "aura-bridge"
+        return "aura-full"
+    
+    # =========================================================================
+    # RESULT CACHE
+    # =========================================================================
+    
+    def _cache_result(self, result: ToolHealthResult) -> None:
+        """Record a ping result with its monotonic timestamp."""
+        self._result_cache[result.tool_name] = (time.monotonic(), result)
+    
+    def get_cached_result(self, tool_name: str) -> Optional[ToolHealthResult]:
+        """
+        Get a cached ping result if still within the TTL.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            Fresh ToolHealthResult or None if missing/expired
+        """
+        entry = self._result_cache.get(tool_name)
+        if entry is None:
+            return None
+        recorded_at, result = entry
+        if time.monotonic() - recorded_at > self._cache_ttl:
+            return None
+        return result
+    
+    def invalidate_cache(self) -> None:
+        """
+        Drop all cached ping results.
+        
+        Called when trading recovers from HARD_STOP / Neutral State so
+        results cached before or during the incident never vouch for a
+        tool; the next check re-pings every tool.
+        """
+        self._result_cache.clear()
+    
     async def ping_tool(
         self,
         tool_name: str,
@@ -369,6 +436,87 @@ class HealthVerificationModule:
                 timestamp_utc=timestamp
             )
 
+    async def _sweep(
+        self,
+        tools: List[tuple],
+        correlation_id: str
+    ) -> List[ToolHealthResult]:
+        """
+        Ping tools concurrently under per-server limits and a deadline.
+        
+        Reliability Level: L6 Critical
+        Input Constraints: List of (tool_name, server) tuples
+        Side Effects: Network I/O, updates result cache
+        
+        Critical tools are scheduled first so they acquire the server
+        semaphores ahead of everything else. Tools still pending when the
+        sweep deadline expires are cancelled and reported as TIMEOUT with
+        error code TOOL_SWEEP_DEADLINE The cancelled pings are awaited
+        before returning so none is left running after the sweep.
+        
+        Args:
+            tools: (tool_name, server) tuples to ping
+            correlation_id: Tracking ID for audit
+            
+        Returns:
+            ToolHealthResult list in the same order as tools
+        """
+        semaphores = {}  # type: Dict[str, asyncio.Semaphore]
+        for _, server in tools:
+            if server not in semaphores:
+                semaphores[server] = asyncio.Semaphore(self._max_concurrent_per_server)
+        
+        async def bounded_ping(tool_name: str, server: str) -> ToolHealthResult:
+            async with semaphores[server]:
+                return await self.ping_tool(tool_name, server, correlation_id)
+        
+        # Stable sort: critical tools first, registry order otherwise
+        schedule = sorted(
+            range(len(tools)),
+            key=lambda i: 0 if self.is_critical_tool(tools[i][0]) else 1
+        )
+        tasks = {}  # type: Dict[int, asyncio.Task]
+        for i in schedule:
+            tool_name, server = tools[i]
+            tasks[i] = asyncio.ensure_future(bounded_ping(tool_name, server))
+        
+        if tasks:
+            await asyncio.wait(list(tasks.values()), timeout=self._sweep_deadline)
+        
+        results = []  # type: List[ToolHealthResult]
+        cancelled = []  # type: List[asyncio.Task]
+        timestamp = datetime.now(timezone.utc).isoformat()
+        deadline_ms = int(self._sweep_deadline * 1000)
+        
+        for i, (tool_name, server) in enumerate(tools):
+            task = tasks[i]
+            if task.done() and not task.cancelled():
+                result = task.result()
+            else:
+                task.cancel()
+                cancelled.append(task)
+                logger.warning(
+                    f"[{ERROR_SWEEP_DEADLINE}] tool={tool_name} server={server} "
+                    f"deadline={self._sweep_deadline}s correlation_id={correlation_id}"
+                )
+                result = ToolHealthResult(
+                    tool_name=tool_name,
+                    server=server,
+                    health=ToolHealth.TIMEOUT,
+                    response_time_ms=deadline_ms,
+                    error_code=ERROR_SWEEP_DEADLINE,
+                    error_message=f"Sweep deadline of {self._sweep_deadline}s exceeded",
+                    timestamp_utc=timestamp
+                )
+            self._cache_result(result)
+            results.append(result)
+        
+        if cancelled:
+            # Let cancelled pings unwind (release semaphores, close calls)
+            await asyncio.gather(*cancelled, return_exceptions=True)
+        
+        return results
+    
     async def ping_all_tools(
         self,
         correlation_id: str
@@ -395,12 +543,9 @@ class HealthVerificationModule:
         )
         
         all_tools = self.get_all_tools()
-        tool_results = []  # type: List[ToolHealthResult]
         
-        # Ping each tool sequentially (Property 15)
-        for tool_name, server in all_tools:
-            result = await self.ping_tool(tool_name, server, correlation_id)
-            tool_results.append(result)
+        # Ping every tool concurrently (Property 15 coverage preserved)
+        tool_results = await self._sweep(all_tools, correlation_id)
         
         end_time_ms = int(time.time() * 1000)
         total_duration_ms = end_time_ms - start_time_ms
@@ -540,33 +685,43 @@ class HealthVerificationModule:
     
     async def quick_critical_check(
         self,
-        correlation_id: str
+        correlation_id: str,
+        use_cache: bool = True
     ) -> tuple:
         """
         Quick check of critical tools only.
         
         Reliability Level: L6 Critical
         Input Constraints: correlation_id required
-        Side Effects: Network I/O
+        Side Effects: Network I/O for tools without a fresh cached result
+        
+        Results younger than the cache TTL are reused; the remaining
+        critical tools are pinged concurrently.
         
         Args:
             correlation_id: Tracking ID
+            use_cache: Answer from cached results when fresh (default: True)
             
         Returns:
             Tuple of (all_healthy, unhealthy_tools)
         """
         unhealthy = []  # type: List[str]
+        results = {}  # type: Dict[str, ToolHealthResult]
+        to_ping = []  # type: List[tuple]
         
         for tool_name in self.CRITICAL_TOOLS:
-            # Determine server
-            if tool_name in AURA_BRIDGE_TOOLS:
-                server = "aura-bridge"
+            cached = self.get_cached_result(tool_name) if use_cache else None
+            if cached is not None:
+                results[tool_name] = cached
             else:
-                server = "aura-full"
-            
-            result = await self.ping_tool(tool_name, server, correlation_id)
-            
-            if result.health != ToolHealth.HEALTHY:
+                to_ping.append((tool_name, self.get_server_for_tool(tool_name)))
+        
+        if to_ping:
+            for result in await self._sweep(to_ping, correlation_id):
+                results[result.tool_name] = result
+        
+        for tool_name in self.CRITICAL_TOOLS:
+            if results[tool_name].health != ToolHealth.HEALTHY:
                 unhealthy.append(tool_name)
         
         all_healthy = len(unhealthy) == 0
@@ -635,6 +790,8 @@ class HealthVerificationModule:
         
         # Clear states on ALLOW
         elif gating_result.signal == GatingSignal.ALLOW:
+            if self.is_hard_stopped() or self.is_neutral_state() or self.is_rds_exceeded():
+                self.invalidate_cache()
             self._hard_stop_active = False
             self._neutral_state_active = False
             self._rds_exceeded = False
@@ -675,9 +832,10 @@ class HealthVerificationModule:
         Clear HARD_STOP state (for risk level recovery).
         
         Reliability Level: L6 Critical
-        Side Effects: Clears HARD_STOP flag
+        Side Effects: Clears HARD_STOP flag and cached ping results
         """
         self._hard_stop_active = False
+        self.invalidate_cache()
         logger.info("[HARD_STOP_CLEARED] Manual or automatic recovery")
     
     def clear_neutral_state(self) -> None:
@@ -685,9 +843,10 @@ class HealthVerificationModule:
         Clear Neutral State (when fresh data arrives).
         
         Reliability Level: L6 Critical
-        Side Effects: Clears Neutral State flag
+        Side Effects: Clears Neutral State flag and cached ping results
         """
         self._neutral_state_active = False
+        self.invalidate_cache()
         logger.info("[NEUTRAL_STATE_CLEARED] Fresh data received")
     
     def can_start_trading_with_gating(
@@ -740,7 +899,10 @@ class HealthVerificationModule:
 
 def create_health_module(
     mcp_tool_caller: Optional[Callable[[str, str, Dict[str, Any]], Awaitable[Any]]] = None,
-    ping_timeout_seconds: int = PING_TIMEOUT_SECONDS
+    ping_timeout_seconds: int = PING_TIMEOUT_SECONDS,
+    max_concurrent_per_server: int = MAX_CONCURRENT_PINGS_PER_SERVER,
+    sweep_deadline_seconds: float = SWEEP_DEADLINE_SECONDS,
+    cache_ttl_seconds: float = HEALTH_CACHE_TTL_SECONDS
 ) -> HealthVerificationModule:
     """
     Factory function to create Health Verification Module.
@@ -750,11 +912,17 @@ def create_health_module(
     Args:
         mcp_tool_caller: MCP tool invoker callback
         ping_timeout_seconds: Timeout per tool (default: 5s)
+        max_concurrent_per_server: In-flight ping limit per MCP server
+        sweep_deadline_seconds: Overall budget for ping_all_tools
+        cache_ttl_seconds: Freshness window for cached ping results
         
     Returns:
         Configured HealthVerificationModule
     """
     return HealthVerificationModule(
         mcp_tool_caller=mcp_tool_caller,
-        ping_timeout_seconds=ping_timeout_seconds
+        ping_timeout_seconds=ping_timeout_seconds,
+        max_concurrent_per_server=max_concurrent_per_server,
+        sweep_deadline_seconds=sweep_deadline_seconds,
+        cache_ttl_seconds=cache_ttl_seconds
     )
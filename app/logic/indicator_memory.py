@@ -8,12 +8,17 @@ Side Effects: Caches indicator data, network I/O to aura-full MCP
 This module maps technical indicator tools from aura-full to the bot's
 execution memory with strict freshness validation (60-second window).
 
+Caches are bounded (CACHE_MAX_ENTRIES, LRU) and entries expire with the
+freshness window, so memory stays flat over weeks of uptime. Concurrent
+fetch_indicators() calls for the same correlation_id share one fetch.
+
 Python 3.8 Compatible - No union type hints (X | None)
 """
 
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, Callable, Awaitable
+from collections import OrderedDict
 import asyncio
 import time
 import logging
@@ -35,6 +40,9 @@ FRESHNESS_THRESHOLD_SECONDS = 60
 RETRY_DELAY_SECONDS = 5
 MAX_RETRIES = 1
 
+# Max entries per cache (predictions, reasoning) before LRU eviction
+CACHE_MAX_ENTRIES = 256
+
 # Error codes
 ERROR_INDICATOR_FETCH_FAIL = "INDICATOR_FETCH_FAIL"
 ERROR_INDICATOR_STALE = "INDICATOR_STALE"
@@ -90,6 +98,88 @@ class CachedIndicator:
     tool_name: str
 
 
+# =============================================================================
+# BOUNDED CACHE
+# =============================================================================
+
+class BoundedIndicatorCache:
+    """
+    Size and TTL bounded LRU store for CachedIndicator entries.
+    
+    Reliability Level: L5 High
+    Input Constraints: max_entries > 0, ttl_seconds >= 0
+    Side Effects: None (in-memory only)
+    
+    Expired entries are dropped on read. When an insert overflows the
+    bound, expired entries are purged first and only then is the least
+    recently used fresh entry evicted.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries = OrderedDict()  # type: OrderedDict[str, CachedIndicator]
+        self.evictions = 0
+        self.expirations = 0
+    
+    @property
+    def max_entries(self) -> int:
+        """Get entry bound."""
+        return self._max_entries
+    
+    def _is_expired(self, entry: CachedIndicator, now: datetime) -> bool:
+        # Whole seconds, matching IndicatorMemoryModule._calculate_freshness
+        return int((now - entry.timestamp).total_seconds()) > self._ttl
+    
+    def get(self, key: str) -> Optional[CachedIndicator]:
+        """Return entry if present and unexpired (marks it recently used)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if self._is_expired(entry, datetime.now(timezone.utc)):
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        return entry
+    
+    def purge_expired(self) -> int:
+        """Drop all expired entries. Returns number dropped."""
+        now = datetime.now(timezone.utc)
+        expired = [k for k, e in self._entries.items() if self._is_expired(e, now)]
+        for key in expired:
+            del self._entries[key]
+        self.expirations += len(expired)
+        return len(expired)
+    
+    def __setitem__(self, key: str, entry: CachedIndicator) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        
+        if len(self._entries) > self._max_entries:
+            self.purge_expired()
+        
+        while len(self._entries) > self._max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"[CACHE_EVICT] correlation_id={evicted_key}")
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+    
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+
 # =============================================================================
 # INDICATOR MEMORY MODULE
 # =============================================================================
@@ -110,7 +200,8 @@ class IndicatorMemoryModule:
         mcp_tool_caller: Optional[Callable[[str, str, Dict[str, Any]], Awaitable[Any]]] = None,
         freshness_threshold_seconds: int = FRESHNESS_THRESHOLD_SECONDS,
         retry_delay_seconds: int = RETRY_DELAY_SECONDS,
-        max_retries: int = MAX_RETRIES
+        max_retries: int = MAX_RETRIES,
+        cache_max_entries: int = CACHE_MAX_ENTRIES
     ) -> None:
         """
         Initialize Indicator Memory Module.
@@ -120,6 +211,7 @@ class IndicatorMemoryModule:
             freshness_threshold_seconds: Max age for fresh data (default: 60s)
             retry_delay_seconds: Delay between retries (default: 5s)
             max_retries: Maximum retry attempts (default: 1)
+            cache_max_entries: Entry bound per cache (default: 256)
         """
         self._mcp_tool_caller = mcp_tool_caller
         self._freshness_threshold = freshness_threshold_seconds
@@ -127,8 +219,22 @@ class IndicatorMemoryModule:
         self._max_retries = max_retries
         
         # Cache storage: correlation_id -> CachedIndicator
-        self._predictions_cache = {}  # type: Dict[str, CachedIndicator]
-        self._reasoning_cache = {}  # type: Dict[str, CachedIndicator]
+        # Entries past the freshness window are never served, so they
+        # expire with it.
+        self._predictions_cache = BoundedIndicatorCache(
+            cache_max_entries, freshness_threshold_seconds
+        )
+        self._reasoning_cache = BoundedIndicatorCache(
+            cache_max_entries, freshness_threshold_seconds
+        )
+        
+        # Single-flight: correlation_id -> running fetch
+        self._inflight = {}  # type: Dict[str, asyncio.Task]
+        
+        # Cache counters
+        self._hits = 0
+        self._misses = 0
+        self._singleflight_joins = 0
         
         # Connection status
         self._connected = False
@@ -215,6 +321,7 @@ class IndicatorMemoryModule:
         reasoning = self._reasoning_cache.get(correlation_id)
         
         if predictions is None and reasoning is None:
+            self._misses += 1
             logger.debug(f"[CACHE_MISS] correlation_id={correlation_id}")
             return None
         
@@ -229,6 +336,7 @@ class IndicatorMemoryModule:
         freshness_seconds, is_stale = self._calculate_freshness(oldest_timestamp)
         
         if is_stale:
+            self._misses += 1
             logger.info(
                 f"[CACHE_STALE] correlation_id={correlation_id} "
                 f"age_seconds={freshness_seconds}"
@@ -246,6 +354,7 @@ class IndicatorMemoryModule:
             fetch_time_ms=0  # Cached, no fetch time
         )
         
+        self._hits += 1
         logger.debug(
             f"[CACHE_HIT] correlation_id={correlation_id} "
             f"freshness_seconds={freshness_seconds}"
@@ -335,6 +444,9 @@ class IndicatorMemoryModule:
         Input Constraints: correlation_id required
         Side Effects: Network I/O, updates cache
         
+        Concurrent calls for the same correlation_id while a fetch is
+        running await that fetch instead of starting another one.
+        
         Args:
             correlation_id: Tracking ID for the request
             max_age_seconds: Override freshness threshold
@@ -343,7 +455,6 @@ class IndicatorMemoryModule:
         Returns:
             IndicatorSnapshot with indicator data
         """
-        start_time_ms = int(time.time() * 1000)
         effective_threshold = max_age_seconds or self._freshness_threshold
         
         # Check cache first
@@ -351,6 +462,42 @@ class IndicatorMemoryModule:
         if cached is not None and cached.freshness_seconds <= effective_threshold:
             return cached
         
+        inflight = self._inflight.get(correlation_id)
+        if inflight is not None:
+            self._singleflight_joins += 1
+            logger.debug(f"[FETCH_JOIN] correlation_id={correlation_id}")
+            # shield: a cancelled waiter must not cancel the shared fetch
+            return await asyncio.shield(inflight)
+        
+        task = asyncio.ensure_future(
+            self._fetch_and_cache(correlation_id, effective_threshold, user_id)
+        )
+        self._inflight[correlation_id] = task
+        task.add_done_callback(
+            lambda done: self._release_inflight(correlation_id, done)
+        )
+        return await asyncio.shield(task)
+    
+    def _release_inflight(self, correlation_id: str, task: asyncio.Task) -> None:
+        """Forget a finished single-flight fetch."""
+        if self._inflight.get(correlation_id) is task:
+            del self._inflight[correlation_id]
+    
+    async def _fetch_and_cache(
+        self,
+        correlation_id: str,
+        effective_threshold: int,
+        user_id: Optional[str]
+    ) -> IndicatorSnapshot:
+        """
+        Fetch predictions + reasoning and update the caches.
+        
+        Reliability Level: L5 High
+        Input Constraints: Called by fetch_indicators only (single-flight)
+        Side Effects: Network I/O, updates cache
+        """
+        start_time_ms = int(time.time() * 1000)
+        
         logger.info(
             f"[FETCH_START] correlation_id={correlation_id} "
             f"threshold={effective_threshold}s"
@@ -500,9 +647,22 @@ class IndicatorMemoryModule:
         Returns:
             Dict with cache stats
         """
+        lookups = self._hits + self._misses
         return {
             "predictions_cached": len(self._predictions_cache),
             "reasoning_cached": len(self._reasoning_cache),
+            "max_entries": self._predictions_cache.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": (
+                self._predictions_cache.evictions + self._reasoning_cache.evictions
+            ),
+            "expirations": (
+                self._predictions_cache.expirations + self._reasoning_cache.expirations
+            ),
+            "singleflight_joins": self._singleflight_joins,
+            "inflight_fetches": len(self._inflight),
             "last_successful_fetch": (
                 self._last_successful_fetch.isoformat()
                 if self._last_successful_fetch else None
@@ -0,0 +1,603 @@
+"""
+============================================================================
+Project Autonomous Alpha v1.8.0
+Order Events - Push-Based Order Status Tracking
+============================================================================
+
+Reliability Level: SOVEREIGN TIER (Mission-Critical)
+Input Constraints: VALR API credentials for the account WebSocket
+Side Effects: Holds a WebSocket connection to VALR, resolves order futures
+
+PURPOSE
+-------
+Replaces fixed-interval status polling in the OrderManager with the VALR
+authenticated account WebSocket. Order and fill updates are pushed to an
+OrderEventHub, which resolves per-order futures the moment a terminal
+update arrives, so fill-to-ledger latency is bounded by the network
+rather than by the poll interval.
+
+COMPONENTS
+----------
+- OrderEvent: Normalized order update (Decimal quantities)
+- OrderEventHub: Per-order futures, latest-event buffer, stream state
+- OrderEventStream: Authenticated account WebSocket feeding a hub,
+  reconnecting with exponential backoff
+
+FALLBACK
+--------
+While the stream is down the hub reports connected=False and any
+waiter is released; the OrderManager then falls back to adaptive-backoff
+polling until the stream is back.
+
+THREADING
+---------
+The hub is not thread-safe: publish, wait and state changes must all run
+on the event loop that owns the stream.
+
+OWNERSHIP
+---------
+The stream is started by the process that runs OrderManager, on the same
+event loop as its reconciliation (OrderEventStream(hub, link).start()).
+The API process does not start one: nothing there waits on the hub.
+
+ZERO-FLOAT MANDATE
+------------------
+All quantities and prices are parsed to decimal.Decimal.
+
+============================================================================
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from app.exchange.rate_limiter import ExponentialBackoff
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# VALR authenticated account stream
+VALR_ACCOUNT_WS_URL = os.getenv("VALR_ACCOUNT_WS_URL", "wss://api.valr.com/ws/account")
+VALR_ACCOUNT_WS_PATH = "/ws/account"
+
+# Reconnect backoff (seconds)
+STREAM_RECONNECT_BASE_SECONDS = 1.0
+STREAM_RECONNECT_MAX_SECONDS = 30.0
+
+# Keep-alive ping interval (seconds)
+STREAM_PING_INTERVAL_SECONDS = 30
+
+# Latest-event buffer bound (covers fills that arrive before the waiter)
+MAX_BUFFERED_ORDERS = 1024
+
+# VALR account message carrying order state
+ORDER_STATUS_UPDATE = "ORDER_STATUS_UPDATE"
+
+
+# ============================================================================
+# ERROR CODES
+# ============================================================================
+
+class OrderEventErrorCode:
+    """Order event error codes for audit logging."""
+    WS_CONNECT_FAIL = "ORD-EVT-001"
+    PARSE_FAIL = "ORD-EVT-002"
+    STREAM_DOWN = "ORD-EVT-003"
+
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+class OrderEventStatus(str, Enum):
+    """Normalized order state from the account stream."""
+    PLACED = "PLACED"
+    PARTIAL = "PARTIAL"
+    FILLED = "FILLED"
+    CANCELLED = "CANCELLED"
+    FAILED = "FAILED"
+
+
+TERMINAL_STATUSES = frozenset({
+    OrderEventStatus.FILLED,
+    OrderEventStatus.CANCELLED,
+    OrderEventStatus.FAILED,
+})
+
+# VALR orderStatusType -> normalized status
+VALR_STATUS_MAP = {
+    "placed": OrderEventStatus.PLACED,
+    "active": OrderEventStatus.PLACED,
+    "partially filled": OrderEventStatus.PARTIAL,
+    "filled": OrderEventStatus.FILLED,
+    "cancelled": OrderEventStatus.CANCELLED,
+    "canceled": OrderEventStatus.CANCELLED,
+    "expired": OrderEventStatus.CANCELLED,
+    "failed": OrderEventStatus.FAILED,
+}
+
+# Normalized status -> status string understood by OrderManager._finalize
+STATUS_DICT_VALUES = {
+    OrderEventStatus.PLACED: "open",
+    OrderEventStatus.PARTIAL: "open",
+    OrderEventStatus.FILLED: "closed",
+    OrderEventStatus.CANCELLED: "cancelled",
+    OrderEventStatus.FAILED: "failed",
+}
+
+
+@dataclass(frozen=True)
+class OrderEvent:
+    """
+    Normalized order update.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Quantities and price must be Decimal
+    Side Effects: None (immutable dataclass)
+
+    Attributes:
+        order_id: Exchange order ID
+        status: Normalized order state
+        filled: Executed quantity so far
+        remaining: Unfilled quantity
+        average_price: Average execution price (0 if unknown)
+        received_at: time.monotonic() when the update was received
+    """
+    order_id: str
+    status: OrderEventStatus
+    filled: Decimal
+    remaining: Decimal
+    average_price: Decimal
+    received_at: float
+
+    @property
+    def is_terminal(self) -> bool:
+        """True if no further updates are expected for this order."""
+        return self.status in TERMINAL_STATUSES
+
+    def to_status_dict(self) -> Dict[str, Any]:
+        """Render as the status dict returned by order status polling."""
+        return {
+            "id": self.order_id,
+            "status": STATUS_DICT_VALUES[self.status],
+            "filled": str(self.filled),
+            "remaining": str(self.remaining),
+            "average": str(self.average_price),
+        }
+
+
+def _decimal_field(data: Dict[str, Any], *names: str) -> Optional[Decimal]:
+    """First present field among names, parsed as Decimal."""
+    for name in names:
+        value = data.get(name)
+        if value is not None and value != "":
+            return Decimal(str(value))
+    return None
+
+
+def parse_valr_account_message(
+    message: Dict[str, Any],
+    received_at: Optional[float] = None
+) -> Optional[OrderEvent]:
+    """
+    Parse a VALR account stream message into an OrderEvent.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Decoded JSON message
+    Side Effects: None
+
+    Only ORDER_STATUS_UPDATE messages carry order state; everything else
+    (balance updates, pings, trade prints) returns None.
+
+    Args:
+        message: Decoded account stream message
+        received_at: Receive time (defaults to time.monotonic())
+
+    Returns:
+        OrderEvent, or None for non-order messages
+
+    Raises:
+        ValueError: If an order update is malformed
+    """
+    if message.get("type") != ORDER_STATUS_UPDATE:
+        return None
+
+    data = message.get("data") or {}
+    order_id = data.get("orderId")
+    status_text = str(data.get("orderStatusType", "")).strip().lower()
+    status = VALR_STATUS_MAP.get(status_text)
+
+    if not order_id or status is None:
+        raise ValueError(
+            f"Unrecognized order update: orderId={order_id} "
+            f"orderStatusType={data.get('orderStatusType')}"
+        )
+
+    try:
+        original = _decimal_field(data, "originalQuantity") or Decimal("0")
+        remaining = _decimal_field(data, "remainingQuantity")
+        filled = _decimal_field(data, "executedQuantity")
+
+        if remaining is None:
+            remaining = Decimal("0") if status == OrderEventStatus.FILLED else original
+        if filled is None:
+            filled = max(original - remaining, Decimal("0"))
+
+        average_price = _decimal_field(
+            data, "averagePrice", "executedPrice", "originalPrice"
+        ) or Decimal("0")
+        if filled == Decimal("0"):
+            average_price = Decimal("0")
+    except InvalidOperation as e:
+        raise ValueError(f"Non-numeric order update field: {str(e)}")
+
+    return OrderEvent(
+        order_id=str(order_id),
+        status=status,
+        filled=filled,
+        remaining=remaining,
+        average_price=average_price,
+        received_at=time.monotonic() if received_at is None else received_at,
+    )
+
+
+# ============================================================================
+# ORDER EVENT HUB
+# ============================================================================
+
+class OrderEventHub:
+    """
+    Routes order updates to waiters.
+
+    Reliability Level: SOVEREIGN TIER (Mission-Critical)
+    Input Constraints: Single event loop (see module THREADING note)
+    Side Effects: Resolves asyncio futures
+
+    The latest event per order is kept in a bounded buffer so a fill that
+    arrives before the OrderManager starts waiting (the submit response
+    can lag the stream) is still seen.
+    """
+
+    def __init__(self, max_buffered_orders: int = MAX_BUFFERED_ORDERS) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            max_buffered_orders: Latest-event buffer bound
+        """
+        self._max_buffered_orders = max_buffered_orders
+        self._latest = OrderedDict()  # type: OrderedDict[str, OrderEvent]
+        self._waiters = {}  # type: Dict[str, List[asyncio.Future]]
+        self._down_waiters = []  # type: List[asyncio.Future]
+        self._connected = False
+
+        self._events_received = 0
+        self._waiters_resolved = 0
+        self._disconnects = 0
+
+    @property
+    def connected(self) -> bool:
+        """True while the feeding stream is connected."""
+        return self._connected
+
+    def set_connected(self, connected: bool) -> None:
+        """
+        Record stream state; going down releases every waiter.
+
+        Args:
+            connected: New stream state
+        """
+        if connected == self._connected:
+            return
+
+        self._connected = connected
+        if connected:
+            return
+
+        self._disconnects += 1
+        for future in self._down_waiters:
+            if not future.done():
+                future.set_result(None)
+        self._down_waiters = []
+
+    def publish(self, event: OrderEvent) -> None:
+        """
+        Record an order update and resolve waiters if it is terminal.
+
+        Args:
+            event: Parsed order update
+        """
+        self._events_received += 1
+
+        previous = self._latest.get(event.order_id)
+        if previous is not None and previous.is_terminal:
+            # Terminal state is final; ignore late or replayed updates
+            return
+
+        self._latest[event.order_id] = event
+        self._latest.move_to_end(event.order_id)
+        while len(self._latest) > self._max_buffered_orders:
+            self._latest.popitem(last=False)
+
+        if event.is_terminal:
+            for future in self._waiters.pop(event.order_id, []):
+                if not future.done():
+                    future.set_result(event)
+                    self._waiters_resolved += 1
+
+    def latest(self, order_id: str) -> Optional[OrderEvent]:
+        """Get the most recent update seen for an order."""
+        return self._latest.get(order_id)
+
+    def forget(self, order_id: str) -> None:
+        """Drop buffered state for a reconciled order."""
+        self._latest.pop(order_id, None)
+
+    async def wait_for_terminal(
+        self,
+        order_id: str,
+        timeout: float
+    ) -> Optional[OrderEvent]:
+        """
+        Wait for an order to reach a terminal state.
+
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: timeout > 0
+        Side Effects: None
+
+        Args:
+            order_id: Exchange order ID
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Terminal OrderEvent, or None on timeout or if the stream drops
+        """
+        latest = self._latest.get(order_id)
+        if latest is not None and latest.is_terminal:
+            return latest
+
+        if not self._connected:
+            return None
+
+        loop = asyncio.get_running_loop()
+        fill = loop.create_future()
+        down = loop.create_future()
+        self._waiters.setdefault(order_id, []).append(fill)
+        self._down_waiters.append(down)
+
+        try:
+            await asyncio.wait(
+                [fill, down],
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiters = self._waiters.get(order_id)
+            if waiters is not None and fill in waiters:
+                waiters.remove(fill)
+                if not waiters:
+                    del self._waiters[order_id]
+            if down in self._down_waiters:
+                self._down_waiters.remove(down)
+            fill.cancel()
+            down.cancel()
+
+        if fill.done() and not fill.cancelled():
+            return fill.result()
+        return None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get hub statistics.
+
+        Returns:
+            Dict with connection state and event counters
+        """
+        return {
+            "connected": self._connected,
+            "buffered_orders": len(self._latest),
+            "watched_orders": len(self._waiters),
+            "events_received": self._events_received,
+            "waiters_resolved": self._waiters_resolved,
+            "disconnects": self._disconnects,
+        }
+
+
+# ============================================================================
+# ACCOUNT STREAM
+# ============================================================================
+
+class OrderEventStream:
+    """
+    VALR authenticated account WebSocket feeding an OrderEventHub.
+
+    Reliability Level: SOVEREIGN TIER (Mission-Critical)
+    Input Constraints: Live-mode VALRLink (API key and secret)
+    Side Effects: Network connection; publishes to the hub
+
+    Connects with the same HMAC-SHA512 headers as REST calls (signed over
+    GET /ws/account), publishes every order update and reconnects with
+    exponential backoff. The hub is marked connected only while a socket
+    is open.
+    """
+
+    def __init__(
+        self,
+        hub: OrderEventHub,
+        exchange: Any,
+        url: str = VALR_ACCOUNT_WS_URL,
+        reconnect_base_seconds: float = STREAM_RECONNECT_BASE_SECONDS,
+        reconnect_max_seconds: float = STREAM_RECONNECT_MAX_SECONDS
+    ) -> None:
+        """
+        Initialize the stream.
+
+        Args:
+            hub: Hub receiving order updates
+            exchange: VALRLink used to sign the connection request
+            url: Account WebSocket URL
+            reconnect_base_seconds: First reconnect delay
+            reconnect_max_seconds: Reconnect delay cap
+        """
+        self.hub = hub
+        self.exchange = exchange
+        self.url = url
+        self._backoff = ExponentialBackoff(
+            base_delay=reconnect_base_seconds,
+            max_delay=reconnect_max_seconds,
+        )
+        self._task = None  # type: Optional[asyncio.Task]
+        self._ws = None  # type: Any
+        self._connects = 0
+        self._parse_errors = 0
+
+    @property
+    def running(self) -> bool:
+        """True while the connection task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the connection task on the running loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the socket and stop reconnecting."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.hub.set_connected(False)
+
+    async def _run(self) -> None:
+        """Connect, consume, reconnect with backoff until cancelled."""
+        try:
+            import websockets
+        except ImportError:
+            logger.error(
+                f"[{OrderEventErrorCode.WS_CONNECT_FAIL}] websockets library not installed | "
+                f"Run: pip install websockets | order status falls back to polling"
+            )
+            return
+
+        while True:
+            try:
+                headers = self.exchange._get_headers("GET", VALR_ACCOUNT_WS_PATH)
+                async with websockets.connect(
+                    self.url,
+                    extra_headers=headers,
+                    ping_interval=STREAM_PING_INTERVAL_SECONDS,
+                ) as ws:
+                    self._ws = ws
+                    self._connects += 1
+                    self._backoff.reset()
+                    self.hub.set_connected(True)
+                    logger.info(
+                        f"OrderEventStream connected | url={self.url} | "
+                        f"connects={self._connects}"
+                    )
+                    async for raw in ws:
+                        self._handle_message(raw)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"[{OrderEventErrorCode.WS_CONNECT_FAIL}] Account stream error: {str(e)} | "
+                    f"url={self.url}"
+                )
+            finally:
+                self._ws = None
+                self.hub.set_connected(False)
+
+            delay = self._backoff.get_delay()
+            logger.warning(
+                f"[{OrderEventErrorCode.STREAM_DOWN}] Account stream down, "
+                f"polling fallback active | reconnect_in={delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _handle_message(self, raw: Any) -> None:
+        """Parse one frame and publish it if it is an order update."""
+        received_at = time.monotonic()
+        try:
+            event = parse_valr_account_message(json.loads(raw), received_at)
+        except (ValueError, TypeError) as e:
+            self._parse_errors += 1
+            logger.warning(
+                f"[{OrderEventErrorCode.PARSE_FAIL}] Discarding account message: {str(e)}"
+            )
+            return
+
+        if event is not None:
+            self.hub.publish(event)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get stream statistics.
+
+        Returns:
+            Dict with connection and parse counters
+        """
+        return {
+            "running": self.running,
+            "connected": self.hub.connected,
+            "connects": self._connects,
+            "parse_errors": self._parse_errors,
+        }
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_hub_instance = None  # type: Optional[OrderEventHub]
+
+
+def get_order_event_hub() -> OrderEventHub:
+    """
+    Get the process-wide OrderEventHub.
+
+    Until an OrderEventStream is started against it the hub stays
+    disconnected and OrderManager polls as before.
+    """
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = OrderEventHub()
+    return _hub_instance
+
+
+def reset_order_event_hub() -> None:
+    """Reset the singleton instance (for testing)."""
+    global _hub_instance
+    _hub_instance = None
+
+
+# ============================================================================
+# 95% CONFIDENCE AUDIT
+# ============================================================================
+#
+# [Reliability Audit]
+# Decimal Integrity: Verified (all quantities and prices parsed to Decimal)
+# L6 Safety Compliance: Verified (stream loss releases waiters to polling)
+# Traceability: order_id on every event
+# Error Codes: ORD-EVT-001 through ORD-EVT-003
+# Confidence Score: 94/100
+#
+# ============================================================================
@@ -21,7 +21,8 @@ EXECUTION FLOW
 --------------
 1. Submit limit order based on ExecutionPermit
 2. Enter reconciliation loop (30s timeout)
-3. Poll order status every 3 seconds
+3. Wait for the fill on the account stream (app.logic.order_events);
+   while the stream is down, poll with adaptive backoff (0.5s -> 3s)
 4. On timeout: Cancel order and fetch final state
 5. Return standardized OrderReconciliation result
 
@@ -37,11 +38,13 @@ import asyncio
 import logging
 import time
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
+from app.exchange.rate_limiter import ExponentialBackoff
+from app.logic.order_events import OrderEventHub, get_order_event_hub
 from app.logic.risk_governor import ExecutionPermit
 from app.logic.valr_link import VALRLink, OrderSide, OrderResult
 from app.observability.metrics import record_slippage
@@ -56,6 +59,7 @@ logger = logging.getLogger(__name__)
 
 # Reconciliation loop settings
 DEFAULT_POLL_INTERVAL_SECONDS = 3
+DEFAULT_MIN_POLL_INTERVAL_SECONDS = 0.5
 DEFAULT_TIMEOUT_SECONDS = 30
 
 # Decimal precision
@@ -137,20 +141,26 @@ class OrderManager:
     RECONCILIATION LOOP
     -------------------
     1. Submit limit order
-    2. Poll every 3 seconds for 30 seconds
-    3. If filled or cancelled: Return immediately
-    4. If timeout: Cancel and fetch final state
-    5. Return standardized OrderReconciliation
+    2. Wait up to 30 seconds for a terminal update on the account stream
+    3. If the stream is down: poll with backoff from min_poll_interval
+       up to poll_interval, resetting whenever the fill progresses
+    4. If filled or cancelled: Return immediately
+    5. If timeout: Cancel and fetch final state
+    6. Return standardized OrderReconciliation
     
     Attributes:
         exchange: VALRLink instance for exchange connectivity
-        poll_interval: Seconds between status polls (default: 3)
+        poll_interval: Maximum seconds between fallback polls (default: 3)
+        min_poll_interval: First fallback poll delay (default: 0.5)
+        order_events: Hub fed by the account stream
     """
     
     def __init__(
         self,
         exchange: Optional[VALRLink] = None,
-        poll_interval: int = DEFAULT_POLL_INTERVAL_SECONDS
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        order_events: Optional[OrderEventHub] = None,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL_SECONDS
     ) -> None:
         """
         Initialize the Order Manager.
@@ -161,15 +171,21 @@ class OrderManager:
         
         Args:
             exchange: VALRLink instance (creates new if None)
-            poll_interval: Seconds between status polls
+            poll_interval: Maximum seconds between fallback polls
+            order_events: Order event hub (default: process-wide hub)
+            min_poll_interval: First fallback poll delay
         """
         self.exchange = exchange or VALRLink()
         self.poll_interval = poll_interval
+        self.min_poll_interval = min(min_poll_interval, poll_interval)
+        self.order_events = order_events or get_order_event_hub()
         
         logger.info(
-            "OrderManager initialized | mock_mode=%s | poll_interval=%ds",
+            "OrderManager initialized | mock_mode=%s | poll_interval=%ss | "
+            "order_stream_connected=%s",
             self.exchange.mock_mode,
-            self.poll_interval
+            self.poll_interval,
+            self.order_events.connected
         )
     
     async def execute_with_reconciliation(
@@ -190,14 +206,15 @@ class OrderManager:
             - correlation_id: Optional tracking ID
         Side Effects:
             - Places order on exchange
-            - Polls order status
+            - Waits on the account stream, polls status while it is down
             - Cancels on timeout
         
         RECONCILIATION FLOW
         -------------------
         1. Submit limit order at permit.entry_price
         2. Enter reconciliation loop (permit.timeout_seconds)
-        3. Poll status every poll_interval seconds
+        3. Wait for a pushed terminal update; poll with adaptive
+           backoff only while the stream is down
         4. On 'closed' or 'cancelled': Return immediately
         5. On timeout: Cancel order and fetch final state
         6. Return standardized OrderReconciliation
@@ -290,68 +307,75 @@ class OrderManager:
         # RECONCILIATION LOOP
         # ====================================================================
         
-        timeout = permit.timeout_seconds
-        elapsed = 0
-        
-        while elapsed < timeout:
-            try:
-                status = await self._fetch_order_status(order_id, symbol)
-                
-                order_status = status.get("status", "").lower()
-                
-                # Check for terminal states
-                if order_status == "closed" or order_status == "filled":
-                    logger.info(
-                        "Order FILLED | order_id=%s | correlation_id=%s",
-                        order_id, correlation_id
-                    )
-                    return self._finalize(
-                        status, permit, start_time_ms,
-                        ReconciliationStatus.FILLED,
-                        symbol=symbol,
-                        side=side.value,
-                        correlation_id=correlation_id
+        deadline = time.monotonic() + permit.timeout_seconds
+        backoff = ExponentialBackoff(
+            base_delay=self.min_poll_interval,
+            max_delay=self.poll_interval,
+            jitter=0
+        )
+        last_filled = Decimal("0")
+        polling = False
+        
+        while time.monotonic() < deadline:
+            if self.order_events.connected:
+                if polling:
+                    # Stream is back: one poll covers fills missed while down
+                    polling = False
+                    status, last_filled = await self._poll_order_status(
+                        order_id, symbol, permit, last_filled, correlation_id
                     )
+                    if status is not None:
+                        return self._finalize_terminal(
+                            status, permit, start_time_ms, symbol, side,
+                            order_id, correlation_id
+                        )
+                    continue
                 
-                if order_status == "cancelled" or order_status == "canceled":
+                event = await self.order_events.wait_for_terminal(
+                    order_id, deadline - time.monotonic()
+                )
+                if event is not None:
                     logger.info(
-                        "Order CANCELLED | order_id=%s | correlation_id=%s",
-                        order_id, correlation_id
-                    )
-                    return self._finalize(
-                        status, permit, start_time_ms,
-                        ReconciliationStatus.CANCELLED,
-                        symbol=symbol,
-                        side=side.value,
-                        correlation_id=correlation_id
+                        "Order update pushed | order_id=%s | status=%s | "
+                        "event_lag_ms=%d | correlation_id=%s",
+                        order_id, event.status.value,
+                        int((time.monotonic() - event.received_at) * 1000),
+                        correlation_id
                     )
-                
-                # Check for partial fill
-                filled = Decimal(str(status.get("filled", "0")))
-                if filled > Decimal("0") and filled < permit.approved_qty:
-                    logger.info(
-                        "Partial fill detected | filled=%s | total=%s | "
-                        "correlation_id=%s",
-                        str(filled), str(permit.approved_qty), correlation_id
+                    self.order_events.forget(order_id)
+                    return self._finalize_terminal(
+                        event.to_status_dict(), permit, start_time_ms,
+                        symbol, side, order_id, correlation_id
                     )
-                
-            except Exception as e:
-                logger.warning(
-                    "[ORD-MGR-002] Status fetch failed | error=%s | "
-                    "correlation_id=%s",
-                    str(e), correlation_id
+                continue
+            
+            # Stream down (or never started): adaptive-backoff polling
+            polling = True
+            previous_filled = last_filled
+            status, last_filled = await self._poll_order_status(
+                order_id, symbol, permit, last_filled, correlation_id
+            )
+            if status is not None:
+                return self._finalize_terminal(
+                    status, permit, start_time_ms, symbol, side,
+                    order_id, correlation_id
                 )
+            if last_filled > previous_filled:
+                backoff.reset()
             
             # Wait before next poll
-            await asyncio.sleep(self.poll_interval)
-            elapsed += self.poll_interval
+            await asyncio.sleep(
+                max(0.0, min(backoff.get_delay(), deadline - time.monotonic()))
+            )
+        
+        elapsed = int(time.time() * 1000) - start_time_ms
         
         # ====================================================================
         # TIMEOUT: Cancel and fetch final state
         # ====================================================================
         
         logger.warning(
-            "Order TIMEOUT | order_id=%s | elapsed=%ds | correlation_id=%s",
+            "Order TIMEOUT | order_id=%s | elapsed=%dms | correlation_id=%s",
             order_id, elapsed, correlation_id
         )
         
@@ -394,6 +418,104 @@ class OrderManager:
                 execution_time_ms=execution_time_ms
             )
     
+    async def _poll_order_status(
+        self,
+        order_id: str,
+        symbol: str,
+        permit: ExecutionPermit,
+        last_filled: Decimal,
+        correlation_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Decimal]:
+        """
+        Poll order status once.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: Valid order_id
+        Side Effects: API call to exchange (one rate-limit token)
+        
+        Args:
+            order_id: Exchange order ID
+            symbol: Trading pair
+            permit: Original ExecutionPermit
+            last_filled: Filled quantity seen so far
+            correlation_id: Tracking ID
+            
+        Returns:
+            (status dict if terminal else None, filled quantity)
+        """
+        try:
+            status = await self._fetch_order_status(order_id, symbol)
+            
+            order_status = status.get("status", "").lower()
+            
+            # Check for terminal states
+            if order_status in ("closed", "filled", "cancelled", "canceled"):
+                return status, last_filled
+            
+            # Check for partial fill
+            filled = Decimal(str(status.get("filled", "0")))
+            if filled > Decimal("0") and filled < permit.approved_qty:
+                logger.info(
+                    "Partial fill detected | filled=%s | total=%s | "
+                    "correlation_id=%s",
+                    str(filled), str(permit.approved_qty), correlation_id
+                )
+            return None, max(filled, last_filled)
+            
+        except Exception as e:
+            logger.warning(
+                "[ORD-MGR-002] Status fetch failed | error=%s | "
+                "correlation_id=%s",
+                str(e), correlation_id
+            )
+            return None, last_filled
+    
+    def _finalize_terminal(
+        self,
+        status: Dict[str, Any],
+        permit: ExecutionPermit,
+        start_time_ms: int,
+        symbol: str,
+        side: OrderSide,
+        order_id: str,
+        correlation_id: Optional[str] = None
+    ) -> OrderReconciliation:
+        """
+        Finalize a terminal status from the stream or a poll.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: status['status'] is a terminal state
+        Side Effects: Records slippage metric
+        """
+        order_status = status.get("status", "").lower()
+        
+        if order_status in ("closed", "filled"):
+            logger.info(
+                "Order FILLED | order_id=%s | correlation_id=%s",
+                order_id, correlation_id
+            )
+            reconciliation_status = ReconciliationStatus.FILLED
+        elif order_status == "failed":
+            logger.warning(
+                "Order FAILED | order_id=%s | correlation_id=%s",
+                order_id, correlation_id
+            )
+            reconciliation_status = ReconciliationStatus.FAILED
+        else:
+            logger.info(
+                "Order CANCELLED | order_id=%s | correlation_id=%s",
+                order_id, correlation_id
+            )
+            reconciliation_status = ReconciliationStatus.CANCELLED
+        
+        return self._finalize(
+            status, permit, start_time_ms,
+            reconciliation_status,
+            symbol=symbol,
+            side=side.value,
+            correlation_id=correlation_id
+        )
+    
     async def _submit_limit_order(
         self,
         symbol: str,
@@ -592,7 +714,7 @@ async def execute_with_reconciliation(
 # L6 Safety Compliance: Verified (timeout, cancellation, reconciliation)
 # Traceability: correlation_id supported throughout
 # Error Codes: ORD-MGR-000 through ORD-MGR-004
-# Reconciliation Loop: 30s timeout with 3s polling
+# Reconciliation Loop: 30s timeout, pushed fills, 0.5s-3s backoff polling
 # Confidence Score: 96/100
 #
 # Note: _fetch_order_status and _cancel_order are placeholders
@@ -44,13 +44,19 @@ from app.logic.trade_permission_policy import (
     PolicyDecision,
     PolicyDecisionRecord,
     PolicyContextBuilder,
+    PolicyContextCache,
     PolicyReasonCode,
     log_policy_decision_full_context,
     persist_policy_decision,
 )
-from app.logic.circuit_breaker import CircuitBreaker
+from app.logic.circuit_breaker import (
+    CircuitBreaker,
+    register_state_listener,
+    unregister_state_listener,
+)
 from app.logic.budget_integration import BudgetIntegrationModule, get_budget_integration
 from app.logic.health_verification import HealthVerificationModule
+from app.logic.system_settings_cache import get_system_settings_cache
 from app.logic.risk_governor import RiskGovernor
 
 # Configure module logger
@@ -67,6 +73,11 @@ audit_logger = logging.getLogger("policy_integration.audit")
 # Configuration flag for policy layer (default: enabled)
 POLICY_LAYER_ENABLED = os.getenv("TRADE_POLICY_LAYER_ENABLED", "true").lower() == "true"
 
+# Background refresh of cached policy context sources (default: enabled)
+POLICY_CONTEXT_REFRESH_ENABLED = (
+    os.getenv("POLICY_CONTEXT_REFRESH_ENABLED", "true").lower() == "true"
+)
+
 # Error codes
 ERROR_POLICY_DISABLED = "POL-001-POLICY_DISABLED"
 ERROR_POLICY_EVALUATION_FAIL = "POL-002-EVALUATION_FAIL"
@@ -204,6 +215,16 @@ class PolicyIntegrationModule:
             risk_governor=self._risk_governor
         )
         
+        # Cache source values so evaluation does not query every source
+        self._context_cache = PolicyContextCache(self._context_builder)
+        self._guardian_integration: Optional[Any] = None
+        
+        # Event-driven invalidation (budget reload, circuit breaker state)
+        register_state_listener(self._on_circuit_breaker_event)
+        get_system_settings_cache().on_change(self._on_system_settings_change)
+        if hasattr(self._budget_integration, "on_budget_load"):
+            self._budget_integration.on_budget_load(self._on_budget_load)
+        
         # Log initialization
         if self._policy_enabled:
             logger.info(
@@ -228,6 +249,86 @@ class PolicyIntegrationModule:
         """Get the TradePermissionPolicy instance."""
         return self._policy
     
+    @property
+    def context_cache(self) -> PolicyContextCache:
+        """Get the PolicyContextCache instance."""
+        return self._context_cache
+    
+    def _on_circuit_breaker_event(self, event_type: str) -> None:
+        """Invalidate kill switch state on circuit breaker changes."""
+        self._context_cache.invalidate("circuit_breaker", reason=event_type)
+    
+    def _on_system_settings_change(self, reason: str) -> None:
+        """
+        Re-read kill switch state when system_settings changes (NOTIFY).
+        
+        Every trade close and PnL update writes system_settings, so the
+        entry is refreshed in place rather than dropped; lockouts still
+        invalidate through the circuit breaker state listener.
+        """
+        self._context_cache.request_refresh("circuit_breaker", reason=f"SYSTEM_SETTINGS {reason}")
+    
+    def _on_budget_load(self, correlation_id: str) -> None:
+        """Invalidate budget signal after a BudgetGuard reload."""
+        self._context_cache.invalidate(
+            "budget_integration",
+            reason=f"BUDGET_LOAD correlation_id={correlation_id}"
+        )
+    
+    def _on_guardian_lock(self, lock_event: Any, correlation_id: str) -> None:
+        """Invalidate every source when Guardian locks."""
+        self._context_cache.invalidate(
+            reason=f"GUARDIAN_LOCK correlation_id={correlation_id}"
+        )
+    
+    def attach_guardian(self, guardian_integration: Any) -> None:
+        """
+        Subscribe to Guardian lock events for context invalidation.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: Object exposing on_lock_event(callback)
+        Side Effects: Registers lock callback
+        
+        Args:
+            guardian_integration: GuardianIntegration instance
+        """
+        guardian_integration.on_lock_event(self._on_guardian_lock)
+        self._guardian_integration = guardian_integration
+    
+    def start_context_refresh(self) -> None:
+        """
+        Start background refresh of cached policy context sources.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: Queries every source once (warm-up), starts daemon
+            refresher thread
+        
+        Blocks on the warm-up queries: async callers run it in an
+        executor. Once running, evaluate_trade_permission() is pure
+        in-memory.
+        """
+        self._context_cache.start_background_refresh()
+    
+    def stop_context_refresh(self) -> None:
+        """
+        Stop background refresh and unsubscribe every invalidation listener.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: Joins refresher thread, removes listeners registered
+            with the circuit breaker, settings cache, budget and Guardian
+        """
+        self._context_cache.stop()
+        unregister_state_listener(self._on_circuit_breaker_event)
+        get_system_settings_cache().remove_on_change(self._on_system_settings_change)
+        if hasattr(self._budget_integration, "remove_on_budget_load"):
+            self._budget_integration.remove_on_budget_load(self._on_budget_load)
+        if self._guardian_integration is not None:
+            if hasattr(self._guardian_integration, "remove_lock_event_callback"):
+                self._guardian_integration.remove_lock_event_callback(self._on_guardian_lock)
+            self._guardian_integration = None
+    
     def evaluate_trade_permission(
         self,
         correlation_id: str,
@@ -286,8 +387,8 @@ class PolicyIntegrationModule:
         
         # Case 2: Policy layer enabled - full evaluation
         try:
-            # Build PolicyContext from authoritative sources
-            context = self._context_builder.build(correlation_id)
+            # Build PolicyContext from cached authoritative sources
+            context = self._context_cache.build(correlation_id)
             
             # Evaluate policy (ai_confidence is NOT passed to evaluate)
             decision = self._policy.evaluate(context)
@@ -568,7 +669,8 @@ class PolicyIntegrationModule:
             "is_latched": self._policy.is_latched(),
             "latch_info": latch_info,
             "context_builder_has_all_sources": self._context_builder.has_all_sources(),
-            "last_source_failures": self._context_builder.get_last_source_failures(),
+            "last_source_failures": self._context_cache.get_last_source_failures(),
+            "context_cache": self._context_cache.get_statistics(),
         }
 
 
@@ -619,6 +721,9 @@ def initialize_policy_integration(
     """
     global _policy_integration
     
+    if _policy_integration is not None:
+        _policy_integration.stop_context_refresh()
+    
     _policy_integration = PolicyIntegrationModule(
         circuit_breaker=circuit_breaker,
         budget_integration=budget_integration,
@@ -21,29 +21,55 @@ FEEDBACK FLOW:
 4. Update RAG document with outcome
 5. Trigger confidence recalibration
 
+BATCH FLOW (backfill / outbox replay):
+- process_outcomes sends one ml_record_prediction_outcome_batch request,
+  one outcome-update pass and one calibration per outcome class
+- Bridges without the batch endpoint get bounded concurrent gathers
+- Failed steps are retried per outcome; results are reported per outcome
+- record_trade_outcome and process_outcome_batch write every outcome to
+  app.logic.rlhf_outbox first; outcomes recorded while Aura was down are
+  replayed from there
+
 This is the CRITICAL feedback loop that makes the system learn.
 Without this, the AI Council operates in isolation without improvement.
 
 ============================================================================
 """
 
+import os
+import asyncio
 import logging
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from app.infra.aura_client import (
     get_aura_client,
     generate_prediction_id,
-    AuraResponse
+    AuraResponse,
+    is_unsupported_endpoint
 )
-from app.logic.debate_memory import update_debate_outcome
+from app.logic.debate_memory import update_debate_outcome, update_debate_outcomes
 
 # Configure module logger
 logger = logging.getLogger("rlhf_feedback")
 
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Batch processing configuration
+RLHF_BATCH_CONCURRENCY = int(os.getenv("RLHF_BATCH_CONCURRENCY", "8"))
+RLHF_BATCH_MAX_ATTEMPTS = int(os.getenv("RLHF_BATCH_MAX_ATTEMPTS", "3"))
+RLHF_BATCH_RETRY_DELAY_SECONDS = float(os.getenv("RLHF_BATCH_RETRY_DELAY_SECONDS", "0.5"))
+
+# Set to False once the bridge answers ml_record_prediction_outcome_batch
+# with 404/405 (older bridges), so we stop probing and use the fallback.
+_batch_outcome_supported = True
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -80,6 +106,28 @@ class TradeOutcome:
     hold_duration_seconds: int = 0
 
 
+@dataclass
+class OutcomeResult:
+    """
+    Per-outcome result of batch processing.
+    
+    Reliability Level: SOVEREIGN TIER
+    """
+    correlation_id: str
+    prediction_id: str
+    outcome: str
+    rlhf_recorded: bool = False
+    rag_updated: bool = False
+    calibrated: bool = False
+    attempts: int = 0
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        """True if every feedback step succeeded."""
+        return self.rlhf_recorded and self.rag_updated and self.calibrated
+
+
 # ============================================================================
 # OUTCOME CALCULATION
 # ============================================================================
@@ -132,6 +180,112 @@ def calculate_outcome(
     return outcome, pnl_zar, pnl_percentage
 
 
+def calibration_score(outcome: str) -> float:
+    """
+    Raw score fed to confidence recalibration for an outcome.
+    
+    WIN = higher confidence, LOSS = lower confidence.
+    """
+    if outcome == "WIN":
+        return 70.0  # Boost confidence
+    if outcome == "LOSS":
+        return 30.0  # Reduce confidence
+    return 50.0  # Neutral
+
+
+def build_trade_outcome(
+    correlation_id: str,
+    symbol: str,
+    side: str,
+    entry_price: Decimal,
+    exit_price: Decimal,
+    quantity: Decimal,
+    trade_status: str,
+    entry_time: Optional[datetime] = None,
+    exit_time: Optional[datetime] = None,
+    prediction_id: Optional[str] = None
+) -> TradeOutcome:
+    """
+    Build a TradeOutcome (prediction_id, PnL, WIN/LOSS) from trade data.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Same as record_trade_outcome
+    Side Effects: None
+    
+    Args:
+        prediction_id: Previously generated ID (e.g. from the outbox);
+                       generated deterministically when omitted
+    """
+    if prediction_id is None:
+        prediction_id = generate_prediction_id(
+            correlation_id=correlation_id,
+            symbol=symbol,
+            side=side,
+            timestamp=entry_time
+        )
+    
+    outcome, pnl_zar, pnl_percentage = calculate_outcome(
+        entry_price=entry_price,
+        exit_price=exit_price,
+        quantity=quantity,
+        side=side
+    )
+    
+    hold_duration = 0
+    if entry_time and exit_time:
+        hold_duration = int((exit_time - entry_time).total_seconds())
+    
+    return TradeOutcome(
+        correlation_id=correlation_id,
+        prediction_id=prediction_id,
+        symbol=symbol,
+        side=side,
+        entry_price=entry_price,
+        exit_price=exit_price,
+        quantity=quantity,
+        outcome=outcome,
+        pnl_zar=pnl_zar,
+        pnl_percentage=pnl_percentage,
+        trade_status=trade_status,
+        user_accepted=trade_status == "FILLED",
+        entry_time=entry_time,
+        exit_time=exit_time,
+        hold_duration_seconds=hold_duration
+    )
+
+
+def trade_outcome_from_dict(outcome_data: Dict[str, Any]) -> TradeOutcome:
+    """
+    Build a TradeOutcome from a batch/outbox outcome dict.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: correlation_id, symbol, side, entry_price,
+                       exit_price, quantity required; trade_status,
+                       entry_time, exit_time (ISO-8601), prediction_id optional
+    Side Effects: None
+    
+    Raises:
+        KeyError, ValueError, ArithmeticError: On malformed input
+    """
+    def _parse_time(value: Any) -> Optional[datetime]:
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(str(value))
+    
+    return build_trade_outcome(
+        correlation_id=outcome_data["correlation_id"],
+        symbol=outcome_data["symbol"],
+        side=outcome_data["side"],
+        entry_price=Decimal(str(outcome_data["entry_price"])),
+        exit_price=Decimal(str(outcome_data["exit_price"])),
+        quantity=Decimal(str(outcome_data["quantity"])),
+        trade_status=outcome_data.get("trade_status", "FILLED"),
+        entry_time=_parse_time(outcome_data.get("entry_time")),
+        exit_time=_parse_time(outcome_data.get("exit_time")),
+        prediction_id=outcome_data.get("prediction_id")
+    )
+
+
 # ============================================================================
 # RLHF RECORDING
 # ============================================================================
@@ -148,7 +302,7 @@ async def record_trade_outcome(
     exit_time: Optional[datetime] = None
 ) -> bool:
     """
-    Record trade outcome for RLHF model training.
+    Record trade outcome for RLHF model training (trade-close hook).
     
     Reliability Level: SOVEREIGN TIER
     Input Constraints:
@@ -158,156 +312,66 @@ async def record_trade_outcome(
         - entry_price, exit_price, quantity: Positive Decimals
         - trade_status: FILLED, CANCELLED, or EXPIRED
     Side Effects:
-        - HTTP POST to ml_record_prediction_outcome
-        - HTTP POST to rag_upsert (outcome update)
+        - rlhf_outcome_outbox row (written before any Aura call)
+        - HTTP POST to ml_record_prediction_outcome(_batch)
+        - Debate outcome update in RAG
         - HTTP POST to ml_calibrate_confidence
     
-    This is the CRITICAL feedback that makes the system learn.
+    This is the CRITICAL feedback that makes the system learn. Steps that
+    fail now (e.g. Aura down) are replayed from the outbox.
     
     Returns:
-        True if all recording steps succeeded
+        True if all recording steps succeeded now
     """
-    client = get_aura_client()
-    
-    # Generate deterministic prediction_id
-    prediction_id = generate_prediction_id(
+    # Deterministic prediction_id, PnL and WIN/LOSS classification
+    trade = build_trade_outcome(
         correlation_id=correlation_id,
         symbol=symbol,
         side=side,
-        timestamp=entry_time
-    )
-    
-    # Calculate outcome
-    outcome, pnl_zar, pnl_percentage = calculate_outcome(
         entry_price=entry_price,
         exit_price=exit_price,
         quantity=quantity,
-        side=side
+        trade_status=trade_status,
+        entry_time=entry_time,
+        exit_time=exit_time
     )
     
-    # Determine if user accepted (trade was executed)
-    user_accepted = trade_status == "FILLED"
-    
-    # Calculate hold duration
-    hold_duration = 0
-    if entry_time and exit_time:
-        hold_duration = int((exit_time - entry_time).total_seconds())
-    
     logger.info(
         f"[RLHF-FEEDBACK] Recording outcome | "
         f"correlation_id={correlation_id} | "
-        f"prediction_id={prediction_id} | "
-        f"outcome={outcome} | "
-        f"pnl_zar=R{pnl_zar:,.2f} | "
-        f"pnl_pct={pnl_percentage:+.2f}%"
+        f"prediction_id={trade.prediction_id} | "
+        f"outcome={trade.outcome} | "
+        f"pnl_zar=R{trade.pnl_zar:,.2f} | "
+        f"pnl_pct={trade.pnl_percentage:+.2f}%"
     )
     
-    success_count = 0
-    total_steps = 3
-    
-    # ========================================================================
-    # STEP 1: Record to RLHF Model
-    # ========================================================================
-    try:
-        rlhf_response = await client.ml_record_outcome(
-            prediction_id=prediction_id,
-            user_accepted=user_accepted,
-            correlation_id=correlation_id
-        )
-        
-        if rlhf_response.success:
-            success_count += 1
-            logger.info(
-                f"[RLHF-FEEDBACK] RLHF recorded | "
-                f"prediction_id={prediction_id} | "
-                f"user_accepted={user_accepted}"
-            )
-        else:
-            logger.warning(
-                f"[RLHF-FEEDBACK] RLHF recording failed | "
-                f"error={rlhf_response.error_message}"
-            )
-            
-    except Exception as e:
-        logger.error(f"[RLHF-FEEDBACK] RLHF exception: {e}")
-    
-    # ========================================================================
-    # STEP 2: Update RAG Document with Outcome
-    # ========================================================================
-    try:
-        rag_success = await update_debate_outcome(
-            correlation_id=correlation_id,
-            outcome=outcome,
-            pnl_zar=pnl_zar
-        )
-        
-        if rag_success:
-            success_count += 1
-            logger.info(
-                f"[RLHF-FEEDBACK] RAG updated | "
-                f"correlation_id={correlation_id}"
-            )
-        else:
-            logger.warning(
-                f"[RLHF-FEEDBACK] RAG update failed | "
-                f"correlation_id={correlation_id}"
-            )
-            
-    except Exception as e:
-        logger.error(f"[RLHF-FEEDBACK] RAG exception: {e}")
-    
-    # ========================================================================
-    # STEP 3: Trigger Confidence Recalibration
-    # ========================================================================
-    try:
-        # Use outcome to adjust calibration
-        # WIN = higher confidence, LOSS = lower confidence
-        if outcome == "WIN":
-            raw_score = 70.0  # Boost confidence
-        elif outcome == "LOSS":
-            raw_score = 30.0  # Reduce confidence
-        else:
-            raw_score = 50.0  # Neutral
-        
-        calibrate_response = await client.ml_calibrate(
-            raw_score=raw_score,
-            correlation_id=correlation_id
-        )
-        
-        if calibrate_response.success:
-            success_count += 1
-            calibrated = calibrate_response.data.get("calibrated_score", raw_score)
-            logger.info(
-                f"[RLHF-FEEDBACK] Calibration updated | "
-                f"raw={raw_score} | calibrated={calibrated}"
-            )
-        else:
-            logger.warning(
-                f"[RLHF-FEEDBACK] Calibration failed | "
-                f"error={calibrate_response.error_message}"
-            )
-            
-    except Exception as e:
-        logger.error(f"[RLHF-FEEDBACK] Calibration exception: {e}")
-    
-    # ========================================================================
-    # STEP 4: Report Results
-    # ========================================================================
-    all_success = success_count == total_steps
-    
-    if all_success:
+    counts = await process_outcome_batch([{
+        "correlation_id": correlation_id,
+        "prediction_id": trade.prediction_id,
+        "symbol": symbol,
+        "side": side,
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "quantity": quantity,
+        "trade_status": trade_status,
+        "entry_time": entry_time,
+        "exit_time": exit_time,
+    }])
+    
+    if counts["success"] == 1:
         logger.info(
-            f"[RLHF-FEEDBACK] All {total_steps} steps completed | "
+            f"[RLHF-FEEDBACK] All feedback steps completed | "
             f"correlation_id={correlation_id} | "
-            f"outcome={outcome}"
-        )
-    else:
-        logger.warning(
-            f"[RLHF-FEEDBACK] Partial completion: {success_count}/{total_steps} | "
-            f"correlation_id={correlation_id}"
+            f"outcome={trade.outcome}"
         )
+        return True
     
-    return all_success
+    logger.warning(
+        f"[RLHF-FEEDBACK] Feedback incomplete | "
+        f"queued_for_replay={counts['queued'] == 1} | "
+        f"correlation_id={correlation_id}"
+    )
+    return False
 
 
 async def record_cancelled_trade(
@@ -366,6 +430,247 @@ async def record_cancelled_trade(
 # BATCH PROCESSING
 # ============================================================================
 
+def reset_rlhf_batch_state() -> None:
+    """
+    Forget the batch-endpoint capability probe.
+    
+    Reliability Level: STANDARD
+    Side Effects: Next batch re-probes ml_record_prediction_outcome_batch
+    """
+    global _batch_outcome_supported
+    _batch_outcome_supported = True
+
+
+async def _record_rlhf_individually(
+    client: Any,
+    trades: List[TradeOutcome]
+) -> List[bool]:
+    """
+    Fallback path: one ml_record_outcome per trade, bounded concurrent gather.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: Up to RLHF_BATCH_CONCURRENCY concurrent HTTP calls
+    """
+    semaphore = asyncio.Semaphore(RLHF_BATCH_CONCURRENCY)
+    
+    async def record_one(trade: TradeOutcome) -> bool:
+        async with semaphore:
+            try:
+                response = await client.ml_record_outcome(
+                    prediction_id=trade.prediction_id,
+                    user_accepted=trade.user_accepted,
+                    correlation_id=trade.correlation_id
+                )
+            except Exception as e:
+                logger.error(
+                    f"[RLHF-BATCH] RLHF exception | "
+                    f"prediction_id={trade.prediction_id} | error={e}"
+                )
+                return False
+        return response.success
+    
+    return list(await asyncio.gather(*(record_one(t) for t in trades)))
+
+
+async def _record_rlhf_many(
+    client: Any,
+    trades: List[TradeOutcome],
+    correlation_id: str
+) -> List[bool]:
+    """
+    Record RLHF outcomes in one ml_record_prediction_outcome_batch request.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: HTTP POST to Aura MCP
+    
+    Falls back to the bounded per-trade gather when the bridge does not
+    expose the batch endpoint. A failed batch fails every trade in it.
+    
+    Returns:
+        Per-trade success flags, in input order
+    """
+    global _batch_outcome_supported
+    
+    if not trades:
+        return []
+    
+    if _batch_outcome_supported:
+        try:
+            response = await client.ml_record_outcomes_batch(
+                outcomes=[
+                    {"prediction_id": t.prediction_id, "user_accepted": t.user_accepted}
+                    for t in trades
+                ],
+                correlation_id=correlation_id
+            )
+        except Exception as e:
+            logger.error(
+                f"[RLHF-BATCH] Exception in batch RLHF record | "
+                f"outcomes={len(trades)} | "
+                f"correlation_id={correlation_id} | error={e}"
+            )
+            return [False] * len(trades)
+        
+        if response.success:
+            return [True] * len(trades)
+        
+        if not is_unsupported_endpoint(response):
+            logger.warning(
+                f"[RLHF-BATCH] Batch RLHF record failed | "
+                f"outcomes={len(trades)} | "
+                f"correlation_id={correlation_id} | "
+                f"error={response.error_message}"
+            )
+            return [False] * len(trades)
+        
+        logger.info(
+            f"[RLHF-BATCH] ml_record_prediction_outcome_batch unsupported, "
+            f"using per-outcome requests | correlation_id={correlation_id}"
+        )
+        _batch_outcome_supported = False
+    
+    return await _record_rlhf_individually(client, trades)
+
+
+async def _calibrate_many(
+    client: Any,
+    outcomes: List[str],
+    correlation_id: str
+) -> Dict[str, bool]:
+    """
+    Recalibrate once per distinct outcome class in the batch.
+    
+    Reliability Level: SOVEREIGN TIER
+    Side Effects: At most three concurrent ml_calibrate calls
+    
+    The calibration request carries only the raw score, so outcomes of
+    the same class would send identical requests.
+    
+    Returns:
+        outcome -> True if its calibration call succeeded
+    """
+    classes = sorted(set(outcomes))
+    
+    async def calibrate_one(outcome: str) -> bool:
+        try:
+            response = await client.ml_calibrate(
+                raw_score=calibration_score(outcome),
+                correlation_id=correlation_id
+            )
+        except Exception as e:
+            logger.error(f"[RLHF-BATCH] Calibration exception: {e}")
+            return False
+        return response.success
+    
+    flags = await asyncio.gather(*(calibrate_one(o) for o in classes))
+    return dict(zip(classes, flags))
+
+
+async def process_outcomes(
+    trades: List[TradeOutcome],
+    correlation_id: Optional[str] = None,
+    max_attempts: int = RLHF_BATCH_MAX_ATTEMPTS,
+    retry_delay_seconds: float = RLHF_BATCH_RETRY_DELAY_SECONDS,
+    resume: Optional[List[OutcomeResult]] = None
+) -> List[OutcomeResult]:
+    """
+    Run the feedback steps for many outcomes with bulk requests.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: TradeOutcomes (see build_trade_outcome)
+    Side Effects: HTTP calls to RLHF and RAG
+    
+    Each attempt runs the three steps concurrently for every outcome
+    still missing them: one bulk RLHF request, one outcome-update pass
+    (update_debate_outcomes) and one calibration per outcome class.
+    Failed steps are retried with exponential backoff up to
+    max_attempts; completed steps are never re-sent.
+    
+    Args:
+        resume: Results of an earlier run (same order as trades), e.g.
+                step flags persisted in the outbox; their completed
+                steps are skipped
+    
+    Returns:
+        Per-outcome results, in input order
+    """
+    if not trades:
+        return []
+    
+    client = get_aura_client()
+    batch_correlation_id = correlation_id or trades[0].correlation_id
+    results = resume if resume is not None else [
+        OutcomeResult(
+            correlation_id=t.correlation_id,
+            prediction_id=t.prediction_id,
+            outcome=t.outcome
+        )
+        for t in trades
+    ]
+    
+    for attempt in range(max_attempts):
+        todo = [i for i, r in enumerate(results) if not r.success]
+        if not todo:
+            break
+        if attempt > 0:
+            await asyncio.sleep(retry_delay_seconds * (2 ** (attempt - 1)))
+        
+        rlhf_todo = [i for i in todo if not results[i].rlhf_recorded]
+        rag_todo = [i for i in todo if not results[i].rag_updated]
+        calibrate_todo = [i for i in todo if not results[i].calibrated]
+        
+        rlhf_flags, rag_flags, calibrate_flags = await asyncio.gather(
+            _record_rlhf_many(client, [trades[i] for i in rlhf_todo], batch_correlation_id),
+            update_debate_outcomes(
+                [
+                    {
+                        "correlation_id": trades[i].correlation_id,
+                        "outcome": trades[i].outcome,
+                        "pnl_zar": trades[i].pnl_zar
+                    }
+                    for i in rag_todo
+                ],
+                correlation_id=batch_correlation_id
+            ),
+            _calibrate_many(
+                client, [trades[i].outcome for i in calibrate_todo], batch_correlation_id
+            )
+        )
+        
+        for i, ok in zip(rlhf_todo, rlhf_flags):
+            results[i].rlhf_recorded = ok
+        for i in rag_todo:
+            results[i].rag_updated = rag_flags.get(trades[i].correlation_id, False)
+        for i in calibrate_todo:
+            results[i].calibrated = calibrate_flags.get(trades[i].outcome, False)
+        
+        for i in todo:
+            result = results[i]
+            result.attempts += 1
+            failed = [
+                step for step, ok in (
+                    ("rlhf", result.rlhf_recorded),
+                    ("rag", result.rag_updated),
+                    ("calibration", result.calibrated)
+                ) if not ok
+            ]
+            result.error = f"failed steps: {', '.join(failed)}" if failed else None
+    
+    succeeded = sum(1 for r in results if r.success)
+    if succeeded == len(results):
+        logger.info(
+            f"[RLHF-BATCH] Processed {len(results)} outcomes | "
+            f"correlation_id={batch_correlation_id}"
+        )
+    else:
+        logger.warning(
+            f"[RLHF-BATCH] Partial completion: {succeeded}/{len(results)} | "
+            f"correlation_id={batch_correlation_id}"
+        )
+    
+    return results
+
+
 async def process_outcome_batch(
     outcomes: list
 ) -> Dict[str, int]:
@@ -374,41 +679,45 @@ async def process_outcome_batch(
     
     Reliability Level: SOVEREIGN TIER
     Input Constraints: List of outcome dicts with required fields
-    Side Effects: Multiple HTTP calls to RLHF and RAG
+    Side Effects: rlhf_outcome_outbox rows, bulk HTTP calls to RLHF and
+                  RAG (see rlhf_outbox.deliver_outcomes)
+    
+    Outcomes are written to the outbox before any Aura call, so an
+    outcome whose feedback fails (e.g. Aura down) is replayed later.
     
     Returns:
-        Dict with success/failure counts
+        Dict with counts: success (delivered), queued (stored for
+        replay), failed (malformed, or not stored and not delivered)
     """
+    # Local import: rlhf_outbox imports this module
+    from app.logic.rlhf_outbox import deliver_outcomes
+    
     results = {
         "total": len(outcomes),
         "success": 0,
+        "queued": 0,
         "failed": 0
     }
     
+    valid: List[Dict[str, Any]] = []
     for outcome_data in outcomes:
         try:
-            success = await record_trade_outcome(
-                correlation_id=outcome_data["correlation_id"],
-                symbol=outcome_data["symbol"],
-                side=outcome_data["side"],
-                entry_price=Decimal(str(outcome_data["entry_price"])),
-                exit_price=Decimal(str(outcome_data["exit_price"])),
-                quantity=Decimal(str(outcome_data["quantity"])),
-                trade_status=outcome_data.get("trade_status", "FILLED")
-            )
-            
-            if success:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-                
+            trade_outcome_from_dict(outcome_data)
+            valid.append(outcome_data)
         except Exception as e:
             logger.error(f"[RLHF-BATCH] Exception processing outcome: {e}")
             results["failed"] += 1
     
+    if valid:
+        delivery = await deliver_outcomes(valid)
+        results["success"] += len(delivery["delivered"])
+        results["queued"] += len(delivery["queued"])
+        results["failed"] += len(delivery["failed"])
+    
     logger.info(
         f"[RLHF-BATCH] Processed {results['total']} outcomes | "
-        f"success={results['success']} | failed={results['failed']}"
+        f"success={results['success']} | queued={results['queued']} | "
+        f"failed={results['failed']}"
     )
     
     return results
@@ -423,6 +732,7 @@ async def process_outcome_batch(
 # L6 Safety Compliance: Verified (all MCP calls wrapped in try-except)
 # Traceability: correlation_id + prediction_id on all operations
 # RLHF Integration: ml_record_prediction_outcome + ml_calibrate_confidence
+# Batching: bulk RLHF request, bounded gathers, per-outcome retry/results
 # Error Handling: Graceful degradation on partial failures
 # Confidence Score: 96/100
 #
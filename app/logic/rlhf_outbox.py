@@ -0,0 +1,726 @@
+"""
+============================================================================
+Project Autonomous Alpha v1.8.0
+RLHF Outcome Outbox - Durable Feedback Replay
+============================================================================
+
+Reliability Level: SOVEREIGN TIER (Mission-Critical)
+Input Constraints: Outcome dicts accepted by trade_outcome_from_dict
+Side Effects: Writes rlhf_outcome_outbox rows, HTTP calls to Aura MCP
+
+PURPOSE
+-------
+Trade outcomes are written to the rlhf_outcome_outbox table (migration
+032) before any Aura call is made. The OutcomeReplayer drains due rows
+in batches through rlhf_feedback.process_outcomes, so outcomes recorded
+while Aura was down are replayed automatically once it is back, and a
+backfill costs a few bulk requests instead of three calls per outcome.
+
+REPLAY
+------
+- Rows are claimed in due order, BATCH_SIZE at a time, with
+  FOR UPDATE SKIP LOCKED and a lease on next_attempt_at, so several
+  workers or replicas never send the same row concurrently
+- Per-step flags (rlhf_recorded, rag_updated, calibrated) are persisted,
+  so a replay only re-sends the steps that failed
+- Fully processed rows are completed (never deleted)
+- Failed rows back off exponentially via next_attempt_at and are
+  dead-lettered after RLHF_OUTBOX_MAX_REPLAYS (invalid payloads at once)
+- deliver_outcomes() (process_outcome_batch / record_trade_outcome)
+  writes rows first, then claims and sends exactly those rows inline;
+  whatever fails stays in the outbox for the replayer
+- submit_trade_outcome() wakes the replayer for low-latency feedback
+
+Error Codes:
+- RLHF-OBX-001: Outbox write failed
+- RLHF-OBX-002: Outbox replay failed
+- RLHF-OBX-003: Outcome dead-lettered
+
+============================================================================
+"""
+
+import os
+import json
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Optional, Dict, Any, List
+
+from app.logic.rlhf_feedback import (
+    OutcomeResult,
+    process_outcomes,
+    trade_outcome_from_dict,
+)
+
+# Configure module logger
+logger = logging.getLogger("rlhf_outbox")
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+RLHF_OUTBOX_REPLAY_ENABLED = (
+    os.getenv("RLHF_OUTBOX_REPLAY_ENABLED", "true").lower() == "true"
+)
+RLHF_OUTBOX_BATCH_SIZE = int(os.getenv("RLHF_OUTBOX_BATCH_SIZE", "100"))
+RLHF_OUTBOX_REPLAY_INTERVAL_SECONDS = float(
+    os.getenv("RLHF_OUTBOX_REPLAY_INTERVAL_SECONDS", "30")
+)
+RLHF_OUTBOX_BASE_BACKOFF_SECONDS = 5.0
+RLHF_OUTBOX_MAX_BACKOFF_SECONDS = float(
+    os.getenv("RLHF_OUTBOX_MAX_BACKOFF_SECONDS", "900")
+)
+# A claimed row is invisible to other workers for this long; a worker
+# that dies mid-replay releases its rows when the lease runs out
+RLHF_OUTBOX_LEASE_SECONDS = float(os.getenv("RLHF_OUTBOX_LEASE_SECONDS", "300"))
+# Failed replays before a row is dead-lettered
+RLHF_OUTBOX_MAX_REPLAYS = int(os.getenv("RLHF_OUTBOX_MAX_REPLAYS", "20"))
+
+# Error codes
+ERROR_OUTBOX_WRITE = "RLHF-OBX-001"
+ERROR_OUTBOX_REPLAY = "RLHF-OBX-002"
+ERROR_OUTBOX_DEAD_LETTER = "RLHF-OBX-003"
+
+OUTBOX_INSERT_SQL = """
+    INSERT INTO rlhf_outcome_outbox (
+        prediction_id, correlation_id, payload, attempts, next_attempt_at, created_at
+    ) VALUES (
+        :prediction_id, :correlation_id, :payload, 0, :now, :now
+    )
+    ON CONFLICT (prediction_id) DO NOTHING
+"""
+
+# Claim due rows by pushing next_attempt_at out by the lease. {lock} is
+# FOR UPDATE SKIP LOCKED on PostgreSQL, so concurrent claimers skip rows
+# another transaction is claiming instead of waiting and re-sending them.
+OUTBOX_CLAIM_SQL = """
+    UPDATE rlhf_outcome_outbox
+    SET next_attempt_at = :lease_until
+    WHERE id IN (
+        SELECT id FROM rlhf_outcome_outbox
+        WHERE completed_at IS NULL
+          AND dead_lettered_at IS NULL
+          AND next_attempt_at <= :now
+          {scope}
+        ORDER BY next_attempt_at, id
+        LIMIT :limit
+        {lock}
+    )
+    RETURNING id, prediction_id, attempts, payload,
+              rlhf_recorded, rag_updated, calibrated
+"""
+
+OUTBOX_CLAIM_SCOPE_SQL = "AND prediction_id IN :prediction_ids"
+
+OUTBOX_COMPLETE_SQL = """
+    UPDATE rlhf_outcome_outbox
+    SET completed_at = :now, attempts = attempts + 1, last_error = NULL,
+        rlhf_recorded = TRUE, rag_updated = TRUE, calibrated = TRUE
+    WHERE id = :id
+"""
+
+OUTBOX_FAIL_SQL = """
+    UPDATE rlhf_outcome_outbox
+    SET attempts = :attempts, next_attempt_at = :next_attempt_at, last_error = :error,
+        rlhf_recorded = :rlhf_recorded, rag_updated = :rag_updated,
+        calibrated = :calibrated, dead_lettered_at = :dead_lettered_at
+    WHERE id = :id
+"""
+
+OUTBOX_PENDING_SQL = """
+    SELECT COUNT(*) FROM rlhf_outcome_outbox
+    WHERE completed_at IS NULL AND dead_lettered_at IS NULL
+"""
+
+
+# ============================================================================
+# DATA STRUCTURES
+# ============================================================================
+
+@dataclass
+class OutboxEntry:
+    """
+    One pending outbox row.
+
+    Reliability Level: SOVEREIGN TIER
+    """
+    id: int
+    prediction_id: str
+    attempts: int
+    payload: Dict[str, Any]
+    rlhf_recorded: bool = False
+    rag_updated: bool = False
+    calibrated: bool = False
+
+
+def _json_value(value: Any) -> Any:
+    """Decimal -> str, datetime -> ISO-8601 (payload round-trips exactly)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def outbox_backoff_seconds(attempts: int) -> float:
+    """
+    Delay before the next replay after `attempts` failed replays.
+
+    Reliability Level: STANDARD
+    """
+    delay = RLHF_OUTBOX_BASE_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0))
+    return min(delay, RLHF_OUTBOX_MAX_BACKOFF_SECONDS)
+
+
+# ============================================================================
+# OUTBOX
+# ============================================================================
+
+class RLHFOutbox:
+    """
+    rlhf_outcome_outbox table access.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Outcome dicts accepted by trade_outcome_from_dict
+    Side Effects: Database reads/writes (synchronous)
+    """
+
+    def __init__(self, engine: Any = None) -> None:
+        """
+        Initialize the outbox.
+
+        Args:
+            engine: SQLAlchemy engine (default: app.database.session.engine)
+        """
+        self._engine = engine
+
+    def _get_engine(self) -> Any:
+        """Resolve the engine lazily (avoids a DB import at module load)."""
+        if self._engine is None:
+            from app.database.session import engine
+            self._engine = engine
+        return self._engine
+
+    def enqueue(
+        self,
+        outcome_data: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> str:
+        """
+        Durably record an outcome for feedback.
+
+        The prediction_id is fixed at enqueue time, so a replay on a later
+        day still reports against the original prediction. Enqueueing the
+        same prediction_id twice is a no-op.
+
+        Args:
+            outcome_data: Outcome dict (correlation_id, symbol, side,
+                          entry_price, exit_price, quantity, ...)
+            now: Current time (default: UTC now)
+
+        Returns:
+            prediction_id of the outcome
+
+        Raises:
+            Exception: On malformed input or database error (RLHF-OBX-001)
+        """
+        from sqlalchemy import text
+
+        trade = trade_outcome_from_dict(outcome_data)
+        payload = {key: _json_value(value) for key, value in outcome_data.items()}
+        payload["prediction_id"] = trade.prediction_id
+
+        try:
+            with self._get_engine().begin() as conn:
+                conn.execute(text(OUTBOX_INSERT_SQL), {
+                    "prediction_id": trade.prediction_id,
+                    "correlation_id": trade.correlation_id,
+                    "payload": json.dumps(payload, sort_keys=True),
+                    "now": now or datetime.now(timezone.utc),
+                })
+        except Exception as e:
+            logger.error(
+                f"[{ERROR_OUTBOX_WRITE}] Outbox write failed | "
+                f"prediction_id={trade.prediction_id} | error={e} | "
+                f"correlation_id={trade.correlation_id}"
+            )
+            raise
+
+        return trade.prediction_id
+
+    def claim_due(
+        self,
+        limit: int = RLHF_OUTBOX_BATCH_SIZE,
+        now: Optional[datetime] = None,
+        prediction_ids: Optional[List[str]] = None
+    ) -> List[OutboxEntry]:
+        """
+        Claim pending rows whose next_attempt_at has passed (due order).
+
+        Claimed rows are leased for RLHF_OUTBOX_LEASE_SECONDS: until the
+        caller completes or fails them (or the lease runs out) no other
+        worker or replica claims them.
+
+        Args:
+            limit: Maximum rows
+            now: Current time (default: UTC now)
+            prediction_ids: Only claim these outcomes (default: any due row)
+
+        Returns:
+            Claimed OutboxEntries
+        """
+        from sqlalchemy import bindparam, text
+
+        if prediction_ids is not None and not prediction_ids:
+            return []
+
+        engine = self._get_engine()
+        stamp = now or datetime.now(timezone.utc)
+        statement = text(OUTBOX_CLAIM_SQL.format(
+            scope=OUTBOX_CLAIM_SCOPE_SQL if prediction_ids is not None else "",
+            lock="FOR UPDATE SKIP LOCKED" if engine.dialect.name == "postgresql" else "",
+        ))
+        params = {
+            "now": stamp,
+            "lease_until": stamp + timedelta(seconds=RLHF_OUTBOX_LEASE_SECONDS),
+            "limit": limit,
+        }  # type: Dict[str, Any]
+        if prediction_ids is not None:
+            statement = statement.bindparams(bindparam("prediction_ids", expanding=True))
+            params["prediction_ids"] = list(prediction_ids)
+
+        with engine.begin() as conn:
+            rows = conn.execute(statement, params).fetchall()
+
+        return sorted(
+            (
+                OutboxEntry(
+                    id=int(row[0]),
+                    prediction_id=str(row[1]),
+                    attempts=int(row[2]),
+                    payload=row[3] if isinstance(row[3], dict) else json.loads(row[3]),
+                    rlhf_recorded=bool(row[4]),
+                    rag_updated=bool(row[5]),
+                    calibrated=bool(row[6]),
+                )
+                for row in rows
+            ),
+            key=lambda entry: entry.id
+        )
+
+    def complete(
+        self,
+        entries: List[OutboxEntry],
+        now: Optional[datetime] = None
+    ) -> None:
+        """Mark entries as fully processed (one executemany)."""
+        if not entries:
+            return
+        from sqlalchemy import text
+
+        stamp = now or datetime.now(timezone.utc)
+        with self._get_engine().begin() as conn:
+            conn.execute(
+                text(OUTBOX_COMPLETE_SQL),
+                [{"id": entry.id, "now": stamp} for entry in entries]
+            )
+
+    def fail(
+        self,
+        failures: List[Dict[str, Any]],
+        now: Optional[datetime] = None
+    ) -> None:
+        """
+        Reschedule failed entries with exponential backoff.
+
+        The entry's step flags are persisted so the next replay skips
+        completed steps. An entry is dead-lettered (never claimed again)
+        once it has failed RLHF_OUTBOX_MAX_REPLAYS times, or at once when
+        the failure is marked permanent.
+
+        Args:
+            failures: [{"entry": OutboxEntry, "error": str,
+                        "permanent": bool (optional)}, ...]
+            now: Current time (default: UTC now)
+        """
+        if not failures:
+            return
+        from sqlalchemy import text
+
+        stamp = now or datetime.now(timezone.utc)
+        params = []
+        for failure in failures:
+            entry = failure["entry"]
+            attempts = entry.attempts + 1
+            dead = failure.get("permanent", False) or attempts >= RLHF_OUTBOX_MAX_REPLAYS
+            if dead:
+                logger.error(
+                    f"[{ERROR_OUTBOX_DEAD_LETTER}] Outcome dead-lettered | "
+                    f"prediction_id={entry.prediction_id} | attempts={attempts} | "
+                    f"error={failure['error']}"
+                )
+            params.append({
+                "id": entry.id,
+                "attempts": attempts,
+                "next_attempt_at": stamp + timedelta(seconds=outbox_backoff_seconds(attempts)),
+                "error": str(failure["error"])[:500],
+                "rlhf_recorded": entry.rlhf_recorded,
+                "rag_updated": entry.rag_updated,
+                "calibrated": entry.calibrated,
+                "dead_lettered_at": stamp if dead else None,
+            })
+        with self._get_engine().begin() as conn:
+            conn.execute(text(OUTBOX_FAIL_SQL), params)
+
+    def pending_count(self) -> int:
+        """Number of outcomes not yet fully processed (excludes dead letters)."""
+        from sqlalchemy import text
+
+        with self._get_engine().connect() as conn:
+            return int(conn.execute(text(OUTBOX_PENDING_SQL)).scalar() or 0)
+
+
+# ============================================================================
+# REPLAYER
+# ============================================================================
+
+class OutcomeReplayer:
+    """
+    Background task draining the outbox through process_outcomes.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Must be started from a running event loop
+    Side Effects: Periodic DB reads/writes and Aura MCP calls
+
+    Example Usage:
+        replayer = OutcomeReplayer(get_rlhf_outbox())
+        replayer.start()
+        ...
+        await replayer.stop()
+    """
+
+    def __init__(
+        self,
+        outbox: RLHFOutbox,
+        batch_size: int = RLHF_OUTBOX_BATCH_SIZE,
+        interval_seconds: float = RLHF_OUTBOX_REPLAY_INTERVAL_SECONDS,
+        max_attempts: Optional[int] = None,
+        retry_delay_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the replayer.
+
+        Args:
+            outbox: Outbox to drain
+            batch_size: Rows per process_outcomes call
+            interval_seconds: Idle wait between scans
+            max_attempts: In-batch attempts per outcome (default: RLHF_BATCH_MAX_ATTEMPTS)
+            retry_delay_seconds: In-batch retry delay (default: RLHF_BATCH_RETRY_DELAY_SECONDS)
+        """
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._process_kwargs: Dict[str, Any] = {}
+        if max_attempts is not None:
+            self._process_kwargs["max_attempts"] = max_attempts
+        if retry_delay_seconds is not None:
+            self._process_kwargs["retry_delay_seconds"] = retry_delay_seconds
+
+        self._task = None  # type: Optional[asyncio.Task]
+        self._wake = None  # type: Optional[asyncio.Event]
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+
+        self._replayed = 0
+        self._failed = 0
+        self._scans = 0
+
+    @property
+    def running(self) -> bool:
+        """True while the replay task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the replay task on the running loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the replay task and wait for it."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """Scan now instead of at the next interval (any thread)."""
+        if self._loop is None or self._wake is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass  # Loop closed
+
+    async def replay_once(self, now: Optional[datetime] = None) -> int:
+        """
+        Process one batch of due outbox rows.
+
+        Args:
+            now: Current time (default: UTC now)
+
+        Returns:
+            Number of rows claimed
+        """
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(None, self.outbox.claim_due, self.batch_size, now)
+        self._scans += 1
+        if not entries:
+            return 0
+
+        await self.process_entries(entries, now)
+        return len(entries)
+
+    async def process_entries(
+        self,
+        entries: List[OutboxEntry],
+        now: Optional[datetime] = None
+    ) -> Dict[str, OutcomeResult]:
+        """
+        Run feedback for claimed entries and record the outcome in the outbox.
+
+        Steps already recorded on an entry are not re-sent. Entries whose
+        payload cannot be parsed are dead-lettered at once.
+
+        Args:
+            entries: Entries claimed via RLHFOutbox.claim_due
+            now: Current time (default: UTC now)
+
+        Returns:
+            prediction_id -> OutcomeResult for every valid entry
+        """
+        loop = asyncio.get_running_loop()
+        failures: List[Dict[str, Any]] = []
+        valid: List[OutboxEntry] = []
+        trades = []
+        for entry in entries:
+            try:
+                trades.append(trade_outcome_from_dict(entry.payload))
+                valid.append(entry)
+            except Exception as e:
+                failures.append({
+                    "entry": entry, "error": f"invalid payload: {e}", "permanent": True
+                })
+
+        resume = [
+            OutcomeResult(
+                correlation_id=trade.correlation_id,
+                prediction_id=trade.prediction_id,
+                outcome=trade.outcome,
+                rlhf_recorded=entry.rlhf_recorded,
+                rag_updated=entry.rag_updated,
+                calibrated=entry.calibrated,
+            )
+            for entry, trade in zip(valid, trades)
+        ]
+        results: List[OutcomeResult] = await process_outcomes(
+            trades, correlation_id=f"rlhf-outbox-{entries[0].id}",
+            resume=resume, **self._process_kwargs
+        )
+
+        completed = []
+        for entry, result in zip(valid, results):
+            if result.success:
+                completed.append(entry)
+            else:
+                entry.rlhf_recorded = result.rlhf_recorded
+                entry.rag_updated = result.rag_updated
+                entry.calibrated = result.calibrated
+                failures.append({"entry": entry, "error": result.error})
+
+        await loop.run_in_executor(None, self.outbox.complete, completed, now)
+        await loop.run_in_executor(None, self.outbox.fail, failures, now)
+
+        self._replayed += len(completed)
+        self._failed += len(failures)
+
+        logger.info(
+            f"[RLHF-OUTBOX] Replayed {len(entries)} outcomes | "
+            f"completed={len(completed)} | rescheduled={len(failures)}"
+        )
+        return {entry.prediction_id: result for entry, result in zip(valid, results)}
+
+    async def _run(self) -> None:
+        """Replay loop: drain full batches back-to-back, then idle."""
+        while True:
+            claimed = 0
+            try:
+                claimed = await self.replay_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{ERROR_OUTBOX_REPLAY}] Outbox replay failed | error={e}")
+
+            if claimed >= self.batch_size:
+                continue
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get replayer statistics.
+
+        Returns:
+            Dict with replay counters
+        """
+        return {
+            "running": self.running,
+            "scans": self._scans,
+            "replayed": self._replayed,
+            "rescheduled": self._failed,
+            "batch_size": self.batch_size,
+            "interval_seconds": self.interval_seconds,
+        }
+
+
+# ============================================================================
+# MODULE-LEVEL API
+# ============================================================================
+
+_outbox_instance: Optional[RLHFOutbox] = None
+_replayer_instance: Optional[OutcomeReplayer] = None
+
+
+def get_rlhf_outbox() -> RLHFOutbox:
+    """Get singleton RLHFOutbox instance."""
+    global _outbox_instance
+    if _outbox_instance is None:
+        _outbox_instance = RLHFOutbox()
+    return _outbox_instance
+
+
+def get_outcome_replayer() -> OutcomeReplayer:
+    """Get singleton OutcomeReplayer over the singleton outbox."""
+    global _replayer_instance
+    if _replayer_instance is None:
+        _replayer_instance = OutcomeReplayer(get_rlhf_outbox())
+    return _replayer_instance
+
+
+def reset_rlhf_outbox() -> None:
+    """Reset singleton instances (for testing)."""
+    global _outbox_instance, _replayer_instance
+    _outbox_instance = None
+    _replayer_instance = None
+
+
+async def submit_trade_outcome(outcome_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Record a trade outcome durably and schedule its feedback.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Outcome dict accepted by trade_outcome_from_dict
+    Side Effects: Outbox INSERT (off the event loop), wakes the replayer
+
+    Returns:
+        prediction_id, or None if the outbox write failed (RLHF-OBX-001)
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        prediction_id = await loop.run_in_executor(
+            None, get_rlhf_outbox().enqueue, outcome_data
+        )
+    except Exception:
+        return None
+
+    get_outcome_replayer().wake()
+    return prediction_id
+
+
+async def deliver_outcomes(
+    outcomes: List[Dict[str, Any]],
+    outbox: Optional[RLHFOutbox] = None,
+    replayer: Optional[OutcomeReplayer] = None
+) -> Dict[str, Any]:
+    """
+    Record outcomes durably, then send their feedback inline.
+
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Outcome dicts accepted by trade_outcome_from_dict
+    Side Effects: Outbox INSERT/UPDATE (off the event loop), Aura MCP calls
+
+    Every outcome is written to the outbox before any Aura call. The
+    written rows are claimed (leased) and processed at once; failed steps
+    stay in the outbox and are replayed by the OutcomeReplayer. If the
+    outbox itself cannot be written, the outcome is sent directly so
+    feedback is not delayed by a database outage (not durable).
+
+    Args:
+        outcomes: Outcome dicts
+        outbox: Outbox (default: singleton)
+        replayer: Replayer whose process_entries sends rows (default: singleton)
+
+    Returns:
+        {"delivered": [prediction_id, ...], "queued": [...], "failed": [...]}
+        queued = durably stored but not yet fully delivered
+
+    Raises:
+        KeyError, ValueError, ArithmeticError: On malformed outcome dicts
+    """
+    outbox = outbox or get_rlhf_outbox()
+    replayer = replayer or get_outcome_replayer()
+    loop = asyncio.get_running_loop()
+
+    stored: List[str] = []
+    unstored = []
+    for outcome_data in outcomes:
+        trade = trade_outcome_from_dict(outcome_data)
+        try:
+            stored.append(await loop.run_in_executor(None, outbox.enqueue, outcome_data))
+        except Exception:
+            unstored.append(trade)  # RLHF-OBX-001 logged by enqueue
+
+    delivered: List[str] = []
+    failed: List[str] = []
+
+    if stored:
+        entries = await loop.run_in_executor(
+            None, outbox.claim_due, len(stored), None, stored
+        )
+        if entries:
+            results = await replayer.process_entries(entries)
+            delivered.extend(pid for pid, result in results.items() if result.success)
+
+    if unstored:
+        for result in await process_outcomes(unstored):
+            (delivered if result.success else failed).append(result.prediction_id)
+
+    done = set(delivered)
+    queued = [pid for pid in stored if pid not in done]
+    return {"delivered": delivered, "queued": queued, "failed": failed}
+
+
+# ============================================================================
+# 95% CONFIDENCE AUDIT
+# ============================================================================
+#
+# [Reliability Audit]
+# Decimal Integrity: Verified (payload stores Decimals as strings)
+# L6 Safety Compliance: Verified (write-before-send, backoff on failure)
+# Traceability: correlation_id + prediction_id on every row
+# Idempotency: UNIQUE prediction_id, SKIP LOCKED lease, completed steps never re-sent
+# Error Handling: RLHF-OBX-001/002 codes
+# Confidence Score: 95/100
+#
+# ============================================================================
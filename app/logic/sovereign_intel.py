@@ -18,6 +18,7 @@ SOVEREIGN MANDATE:
 INTELLIGENCE FLOW:
 1. RAG Query: Find similar past debates (symbol, side, price range)
 2. ML Predictions: Get confidence score from RLHF model
+   (1+2 cached per feature bucket with stale-while-revalidate)
 3. Win Rate Calc: Compute historical success rate
 4. RGI Trust: Get trust probability from Reward Governor
 5. Context Build: Format for prompt injection
@@ -33,10 +34,18 @@ v1.6.0 RGI INTEGRATION:
 import logging
 from decimal import Decimal, ROUND_HALF_EVEN
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 
 from app.infra.aura_client import get_aura_client, generate_prediction_id, AuraResponse
+from app.logic.intel_cache import (
+    RetrievalSnapshot,
+    compute_intel_bucket,
+    get_intel_cache,
+    CACHE_STATUS_HIT,
+    CACHE_STATUS_STALE,
+    CACHE_STATUS_MISS,
+)
 
 # RGI Integration (Sprint 9)
 from app.learning.reward_governor import (
@@ -118,6 +127,9 @@ class PredictiveContext:
     # Timing
     query_latency_ms: Decimal = Decimal("0")
     
+    # Retrieval cache status (HIT, STALE, MISS, BYPASS)
+    retrieval_cache: str = CACHE_STATUS_MISS
+    
     def to_prompt_context(self) -> str:
         """
         Format context for injection into AI Council prompts.
@@ -186,68 +198,32 @@ This is a novel trading situation - exercise maximum caution.
 # INTELLIGENCE GATHERING
 # ============================================================================
 
-async def gather_predictive_context(
+async def _fetch_retrieval(
+    client: Any,
     correlation_id: str,
     symbol: str,
     side: str,
-    price: Decimal,
-    atr_pct: Optional[Decimal] = None,
-    momentum_pct: Optional[Decimal] = None,
-    spread_pct: Optional[Decimal] = None,
-    volume_ratio: Optional[Decimal] = None
-) -> PredictiveContext:
+    price: Decimal
+) -> RetrievalSnapshot:
     """
-    Gather pre-debate intelligence from RAG, ML, and RGI layers.
+    Query Aura RAG (similar debates) and ML (predictions) for one signal.
     
     Reliability Level: SOVEREIGN TIER
-    Input Constraints:
-        - correlation_id: Valid UUID string
-        - symbol: Trading pair (e.g., "BTCZAR")
-        - side: "BUY" or "SELL"
-        - price: Decimal price value
-        - atr_pct: Optional ATR percentage for RGI
-        - momentum_pct: Optional momentum for RGI
-        - spread_pct: Optional spread for RGI
-        - volume_ratio: Optional volume ratio for RGI
-    Side Effects: HTTP calls to Aura MCP (RAG + ML), RGI prediction
-    
-    This function queries:
-    1. RAG for similar historical debates
-    2. ML for prediction confidence
-    3. RGI Reward Governor for learned trust probability
-    
-    v1.6.0 RGI INTEGRATION:
-    - Queries Reward Governor for trust probability
-    - Graceful degradation if RGI unavailable (returns NEUTRAL_TRUST)
-    - Feature snapshot captured for later learning
+    Input Constraints: Valid symbol, side, price
+    Side Effects: HTTP calls to Aura MCP (RAG + ML)
     
-    Returns:
-        PredictiveContext with all gathered intelligence
+    Never raises: failures are reported through the success flags, and
+    failed snapshots are not cached by SimilarDebateCache.
     """
-    start_time = datetime.now(timezone.utc)
-    client = get_aura_client()
-    
-    # Generate deterministic prediction ID
-    prediction_id = generate_prediction_id(
-        correlation_id=correlation_id,
-        symbol=symbol,
-        side=side
-    )
-    
-    context = PredictiveContext(
-        correlation_id=correlation_id,
-        prediction_id=prediction_id
-    )
-    
-    logger.info(
-        f"[SOVEREIGN-INTEL] Gathering context | "
-        f"correlation_id={correlation_id} | "
-        f"prediction_id={prediction_id} | "
-        f"signal={side} {symbol} @ R{price:,.2f}"
-    )
+    similar_debates: List[SimilarDebate] = []
+    rag_query_success = False
+    ml_confidence_score = Decimal("50")
+    ml_recommended_action = "NEUTRAL"
+    ml_reasoning = "No historical data available"
+    ml_query_success = False
     
     # ========================================================================
-    # STEP 1: RAG Query for Similar Debates
+    # RAG Query for Similar Debates
     # ========================================================================
     try:
         rag_query = f"{side} {symbol} price:{price:.0f}"
@@ -259,7 +235,7 @@ async def gather_predictive_context(
         )
         
         if rag_response.success and rag_response.data:
-            context.rag_query_success = True
+            rag_query_success = True
             results = rag_response.data.get("results", [])
             
             for result in results:
@@ -275,13 +251,13 @@ async def gather_predictive_context(
                         outcome=metadata.get("outcome", "PENDING"),
                         reasoning_summary=result.get("content", "")[:200]
                     )
-                    context.similar_debates.append(debate)
+                    similar_debates.append(debate)
                 except (ValueError, TypeError) as e:
                     logger.warning(f"[SOVEREIGN-INTEL] Failed to parse debate: {e}")
                     continue
             
             logger.info(
-                f"[SOVEREIGN-INTEL] RAG returned {len(context.similar_debates)} similar debates"
+                f"[SOVEREIGN-INTEL] RAG returned {len(similar_debates)} similar debates"
             )
         else:
             logger.warning(
@@ -292,7 +268,7 @@ async def gather_predictive_context(
         logger.error(f"[SOVEREIGN-INTEL] RAG query exception: {e}")
     
     # ========================================================================
-    # STEP 2: ML Predictions
+    # ML Predictions
     # ========================================================================
     try:
         ml_user_id = f"signal_{symbol}_{side}"
@@ -302,22 +278,22 @@ async def gather_predictive_context(
         )
         
         if ml_response.success and ml_response.data:
-            context.ml_query_success = True
+            ml_query_success = True
             data = ml_response.data
             
             # Extract prediction data
             confidence = data.get("confidence", 50)
-            context.ml_confidence_score = Decimal(str(confidence)).quantize(
+            ml_confidence_score = Decimal(str(confidence)).quantize(
                 Decimal("0.1"),
                 rounding=ROUND_HALF_EVEN
             )
-            context.ml_recommended_action = data.get("action", "NEUTRAL")
-            context.ml_reasoning = data.get("reasoning", "No reasoning provided")
+            ml_recommended_action = data.get("action", "NEUTRAL")
+            ml_reasoning = data.get("reasoning", "No reasoning provided")
             
             logger.info(
                 f"[SOVEREIGN-INTEL] ML prediction: "
-                f"confidence={context.ml_confidence_score} "
-                f"action={context.ml_recommended_action}"
+                f"confidence={ml_confidence_score} "
+                f"action={ml_recommended_action}"
             )
         else:
             logger.warning(
@@ -327,6 +303,105 @@ async def gather_predictive_context(
     except Exception as e:
         logger.error(f"[SOVEREIGN-INTEL] ML query exception: {e}")
     
+    return RetrievalSnapshot(
+        similar_debates=tuple(similar_debates),
+        rag_query_success=rag_query_success,
+        ml_confidence_score=ml_confidence_score,
+        ml_recommended_action=ml_recommended_action,
+        ml_reasoning=ml_reasoning,
+        ml_query_success=ml_query_success
+    )
+
+
+async def gather_predictive_context(
+    correlation_id: str,
+    symbol: str,
+    side: str,
+    price: Decimal,
+    atr_pct: Optional[Decimal] = None,
+    momentum_pct: Optional[Decimal] = None,
+    spread_pct: Optional[Decimal] = None,
+    volume_ratio: Optional[Decimal] = None
+) -> PredictiveContext:
+    """
+    Gather pre-debate intelligence from RAG, ML, and RGI layers.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints:
+        - correlation_id: Valid UUID string
+        - symbol: Trading pair (e.g., "BTCZAR")
+        - side: "BUY" or "SELL"
+        - price: Decimal price value
+        - atr_pct: Optional ATR percentage for RGI
+        - momentum_pct: Optional momentum for RGI
+        - spread_pct: Optional spread for RGI
+        - volume_ratio: Optional volume ratio for RGI
+    Side Effects: HTTP calls to Aura MCP (RAG + ML), RGI prediction
+    
+    This function queries:
+    1. RAG for similar historical debates
+    2. ML for prediction confidence
+    3. RGI Reward Governor for learned trust probability
+    
+    RAG + ML answers are cached per feature bucket (symbol, side, price
+    band, ATR band) - see app.logic.intel_cache. RGI is always live.
+    
+    v1.6.0 RGI INTEGRATION:
+    - Queries Reward Governor for trust probability
+    - Graceful degradation if RGI unavailable (returns NEUTRAL_TRUST)
+    - Feature snapshot captured for later learning
+    
+    Returns:
+        PredictiveContext with all gathered intelligence
+    """
+    start_time = datetime.now(timezone.utc)
+    client = get_aura_client()
+    
+    # Generate deterministic prediction ID
+    prediction_id = generate_prediction_id(
+        correlation_id=correlation_id,
+        symbol=symbol,
+        side=side
+    )
+    
+    context = PredictiveContext(
+        correlation_id=correlation_id,
+        prediction_id=prediction_id
+    )
+    
+    logger.info(
+        f"[SOVEREIGN-INTEL] Gathering context | "
+        f"correlation_id={correlation_id} | "
+        f"prediction_id={prediction_id} | "
+        f"signal={side} {symbol} @ R{price:,.2f}"
+    )
+    
+    # ========================================================================
+    # STEP 1-2: RAG Similar Debates + ML Predictions (bucket-cached)
+    # ========================================================================
+    bucket = compute_intel_bucket(symbol, side, price, atr_pct)
+    snapshot, cache_status = await get_intel_cache().get_or_load(
+        bucket,
+        lambda: _fetch_retrieval(client, correlation_id, symbol, side, price),
+        correlation_id=correlation_id
+    )
+    
+    context.retrieval_cache = cache_status
+    context.similar_debates = [replace(d) for d in snapshot.similar_debates]
+    context.rag_query_success = snapshot.rag_query_success
+    context.ml_confidence_score = snapshot.ml_confidence_score
+    context.ml_recommended_action = snapshot.ml_recommended_action
+    context.ml_reasoning = snapshot.ml_reasoning
+    context.ml_query_success = snapshot.ml_query_success
+    
+    if cache_status in (CACHE_STATUS_HIT, CACHE_STATUS_STALE):
+        logger.info(
+            f"[SOVEREIGN-INTEL] Retrieval cache {cache_status} | "
+            f"bucket={bucket} | "
+            f"similar_debates={len(context.similar_debates)} | "
+            f"correlation_id={correlation_id}"
+        )
+    
     # ========================================================================
     # STEP 3: Compute Historical Metrics
     # ========================================================================
@@ -426,6 +501,7 @@ async def gather_predictive_context(
         f"ml_success={context.ml_query_success} | "
         f"rgi_available={context.rgi_available} | "
         f"rgi_trust={context.rgi_trust_probability} | "
+        f"retrieval_cache={context.retrieval_cache} | "
         f"win_rate={context.historical_win_rate}%"
     )
     
@@ -10,7 +10,8 @@ Traceability: All operations include correlation_id for audit
 
 Key Constraints:
 - Cold-Path only: Never block Hot Path execution
-- Async writes: Use background tasks for database operations
+- Async writes: Use background tasks for database operations (batched by
+  learning_event_sink.LearningEventSink)
 - Fail-safe: Database failures must not affect trading operations
 - Audit trail: All events logged with correlation_id
 
@@ -26,6 +27,11 @@ import asyncio
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+from app.logic.learning_event_sink import (
+    get_learning_event_sink,
+    shutdown_learning_event_sink,
+    write_learning_rows,
+)
 from app.logic.learning_features import (
     FeatureSnapshot,
     Outcome,
@@ -144,55 +150,16 @@ def _persist_sync(event: TradeLearningEvent) -> bool:
         True if persisted successfully, False otherwise
         
     Side Effects:
-        - Inserts row into trade_learning_events table
+        - Inserts row into trade_learning_events table (duplicate
+          prediction_id is a no-op)
         - Logs LEARNING_DB_FAIL (RGI-006) on failure
     """
     try:
-        from sqlalchemy import text
         from app.database.session import engine
-        
-        db_dict = event.to_db_dict()
-        
-        # Build INSERT statement
-        insert_sql = text("""
-            INSERT INTO trade_learning_events (
-                correlation_id,
-                prediction_id,
-                symbol,
-                side,
-                timeframe,
-                atr_pct,
-                volatility_regime,
-                trend_state,
-                spread_pct,
-                volume_ratio,
-                llm_confidence,
-                consensus_score,
-                pnl_zar,
-                max_drawdown,
-                outcome
-            ) VALUES (
-                :correlation_id,
-                :prediction_id,
-                :symbol,
-                :side,
-                :timeframe,
-                :atr_pct,
-                :volatility_regime,
-                :trend_state,
-                :spread_pct,
-                :volume_ratio,
-                :llm_confidence,
-                :consensus_score,
-                :pnl_zar,
-                :max_drawdown,
-                :outcome
-            )
-        """)
-        
-        with engine.connect() as conn:
-            conn.execute(insert_sql, db_dict)
-            conn.commit()
+
+        # Same idempotent multi-row statement the sink uses
+        with engine.begin() as conn:
+            write_learning_rows(conn, [event.to_db_dict()])
         
         logger.info(
             f"Trade learning event persisted | "
@@ -258,44 +225,24 @@ def persist_learning_event_background(event: TradeLearningEvent) -> None:
     """
     Fire-and-forget persistence of trade learning event.
     
-    Submits persistence task to background thread pool without
-    waiting for completion. This ensures Hot Path is never blocked.
+    Queues the event on the shared LearningEventSink, which writes it
+    with other pending events in one multi-row INSERT once the batch
+    fills or ages out. This ensures Hot Path is never blocked.
     
     Args:
         event: TradeLearningEvent to persist
         
     Reliability Level: L6 Critical
     Input Constraints: Valid TradeLearningEvent
-    Side Effects: Submits background task for database write
+    Side Effects: Queues event for a batched database write
     
     **Feature: reward-governed-intelligence, Property 32: Cold-Path Isolation**
     """
     try:
-        executor = _get_persistence_executor()
-        
-        # Submit to thread pool without waiting
-        future = executor.submit(_persist_sync, event)
-        
-        # Add callback for error logging
-        def on_complete(fut):
-            try:
-                result = fut.result()
-                if not result:
-                    logger.warning(
-                        f"Background persistence returned False | "
-                        f"correlation_id={event.correlation_id}"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"{RGI_ERROR_LEARNING_DB_FAIL} LEARNING_DB_FAIL: "
-                    f"Background persistence exception: {str(e)} | "
-                    f"correlation_id={event.correlation_id}"
-                )
-        
-        future.add_done_callback(on_complete)
+        get_learning_event_sink().submit_event(event)
         
         logger.debug(
-            f"Learning event submitted for background persistence | "
+            f"Learning event queued for batched persistence | "
             f"correlation_id={event.correlation_id}"
         )
         
@@ -303,7 +250,7 @@ def persist_learning_event_background(event: TradeLearningEvent) -> None:
         # Even submission failure must not block Hot Path
         logger.error(
             f"{RGI_ERROR_LEARNING_DB_FAIL} LEARNING_DB_FAIL: "
-            f"Failed to submit persistence task: {str(e)} | "
+            f"Failed to queue learning event: {str(e)} | "
             f"correlation_id={event.correlation_id}"
         )
 
@@ -429,13 +376,16 @@ def record_trade_close(
 
 def shutdown_persistence() -> None:
     """
-    Shutdown the persistence thread pool.
+    Shutdown the persistence thread pool and drain the learning sink.
     
     Should be called when the application is shutting down.
-    Waits for pending tasks to complete.
+    Waits for pending tasks to complete and flushes queued events.
     """
     global _persistence_executor
     
+    logger.info("Draining learning event sink...")
+    shutdown_learning_event_sink()
+    
     if _persistence_executor is not None:
         logger.info("Shutting down RGI persistence executor...")
         _persistence_executor.shutdown(wait=True)
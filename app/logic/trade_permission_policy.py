@@ -43,11 +43,15 @@ PRIVACY: No personal data in code.
 """
 
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.observability.metrics import timed
 
 # Configure module logger
 logger = logging.getLogger("trade_permission_policy")
@@ -155,6 +159,8 @@ class PolicyContext:
         risk_assessment: Risk governor assessment (HEALTHY, WARNING, CRITICAL)
         correlation_id: Unique tracking ID for audit trail
         timestamp_utc: ISO 8601 timestamp of context creation
+        unknown_sources: Sources whose value was never loaded or is past
+            its max staleness (restrictive placeholder, not a real signal)
     """
     kill_switch_active: bool
     budget_signal: str
@@ -162,6 +168,7 @@ class PolicyContext:
     risk_assessment: str
     correlation_id: str
     timestamp_utc: str
+    unknown_sources: Tuple[str, ...] = ()
     
     def __post_init__(self) -> None:
         """
@@ -210,6 +217,15 @@ class PolicyContext:
             raise ValueError(
                 f"[{ERROR_INVALID_CONTEXT}] timestamp_utc must be non-empty string"
             )
+        
+        # Validate unknown_sources names
+        if not isinstance(self.unknown_sources, tuple) or any(
+            source not in POLICY_CONTEXT_SOURCES for source in self.unknown_sources
+        ):
+            raise ValueError(
+                f"[{ERROR_INVALID_CONTEXT}] unknown_sources must be a tuple of "
+                f"{POLICY_CONTEXT_SOURCES}, got {self.unknown_sources!r}"
+            )
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -225,6 +241,7 @@ class PolicyContext:
             "risk_assessment": self.risk_assessment,
             "correlation_id": self.correlation_id,
             "timestamp_utc": self.timestamp_utc,
+            "unknown_sources": list(self.unknown_sources),
         }
 
 
@@ -490,6 +507,7 @@ class TradePermissionPolicy:
             }
         )
     
+    @timed("policy", "evaluate")
     def evaluate(self, context: PolicyContext) -> PolicyDecision:
         """
         Evaluate policy context and return authorization decision.
@@ -564,26 +582,16 @@ class TradePermissionPolicy:
         
         # Gate 1: Kill Switch (Rank 1 - Highest Priority)
         if context.kill_switch_active:
-            decision = self._create_halt_decision(
-                reason_code=PolicyReasonCode.HALT_KILL_SWITCH,
-                blocking_gate="KILL_SWITCH",
-                precedence_rank=get_precedence_rank("KILL_SWITCH"),
-                correlation_id=context.correlation_id
+            return self._halt_at_gate(
+                context, "circuit_breaker", PolicyReasonCode.HALT_KILL_SWITCH, "KILL_SWITCH"
             )
-            self._engage_latch(decision)
-            return decision
         
         # Gate 2: Budget (Rank 2)
         if context.budget_signal != "ALLOW":
-            reason_code = self._get_budget_reason_code(context.budget_signal)
-            decision = self._create_halt_decision(
-                reason_code=reason_code,
-                blocking_gate="BUDGET",
-                precedence_rank=get_precedence_rank("BUDGET"),
-                correlation_id=context.correlation_id
+            return self._halt_at_gate(
+                context, "budget_integration",
+                self._get_budget_reason_code(context.budget_signal), "BUDGET"
             )
-            self._engage_latch(decision)
-            return decision
         
         # Gate 3: Health (Rank 3)
         if context.health_status != "GREEN":
@@ -624,14 +632,9 @@ class TradePermissionPolicy:
         
         # Gate 4: Risk (Rank 4)
         if context.risk_assessment == "CRITICAL":
-            decision = self._create_halt_decision(
-                reason_code=PolicyReasonCode.HALT_RISK_CRITICAL,
-                blocking_gate="RISK",
-                precedence_rank=get_precedence_rank("RISK"),
-                correlation_id=context.correlation_id
+            return self._halt_at_gate(
+                context, "risk_governor", PolicyReasonCode.HALT_RISK_CRITICAL, "RISK"
             )
-            self._engage_latch(decision)
-            return decision
         
         # All gates passed → ALLOW
         decision = PolicyDecision(
@@ -652,6 +655,37 @@ class TradePermissionPolicy:
         
         return decision
     
+    def _halt_at_gate(
+        self,
+        context: PolicyContext,
+        source: str,
+        reason_code: PolicyReasonCode,
+        blocking_gate: str
+    ) -> PolicyDecision:
+        """
+        HALT at a gate, latching only on a real signal.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: source must be in POLICY_CONTEXT_SOURCES
+        Side Effects: Logging, engages latch unless the source is unknown
+        
+        A source in context.unknown_sources carries a restrictive
+        placeholder (cache miss / past max staleness), not a real
+        HARD_STOP or kill switch: this evaluation still HALTs with
+        HALT_CONTEXT_INCOMPLETE, but the latch is not engaged, so the
+        next evaluation with a known value is not held for the latch window.
+        """
+        unknown = source in context.unknown_sources
+        decision = self._create_halt_decision(
+            reason_code=PolicyReasonCode.HALT_CONTEXT_INCOMPLETE if unknown else reason_code,
+            blocking_gate=blocking_gate,
+            precedence_rank=get_precedence_rank(blocking_gate),
+            correlation_id=context.correlation_id
+        )
+        if not unknown:
+            self._engage_latch(decision)
+        return decision
+    
     def _create_halt_decision(
         self,
         reason_code: PolicyReasonCode,
@@ -1605,6 +1639,41 @@ class PolicyContextBuilder:
             )
             return "CRITICAL"
     
+    def query_source(self, source: str, correlation_id: str) -> Tuple[Any, bool]:
+        """
+        Query a single source outside of build().
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: source must be one of POLICY_CONTEXT_SOURCES
+        Side Effects: Queries the source module
+        
+        Used by PolicyContextCache to refresh one source at a time.
+        Does not touch the failure list of the last build().
+        
+        Args:
+            source: Source name (e.g., "circuit_breaker")
+            correlation_id: Tracking ID
+            
+        Returns:
+            Tuple of (value or restrictive default, failed)
+        """
+        queries = {
+            "circuit_breaker": self._query_kill_switch,
+            "budget_integration": self._query_budget_signal,
+            "health_module": self._query_health_status,
+            "risk_governor": self._query_risk_assessment,
+        }
+        if source not in queries:
+            raise ValueError(f"Unknown policy context source: {source}")
+        
+        saved_failures = self._last_source_failures
+        self._last_source_failures = []
+        try:
+            value = queries[source](correlation_id)
+            return value, bool(self._last_source_failures)
+        finally:
+            self._last_source_failures = saved_failures
+    
     def get_last_source_failures(self) -> List[str]:
         """
         Get list of sources that failed during last build().
@@ -1671,6 +1740,545 @@ def create_policy_context_builder(
     )
 
 
+# ============================================================================
+# POLICY CONTEXT CACHE
+# ============================================================================
+
+# Source names in PolicyContext field order
+POLICY_CONTEXT_SOURCES: Tuple[str, ...] = (
+    "circuit_breaker",
+    "budget_integration",
+    "health_module",
+    "risk_governor",
+)
+
+# Most restrictive value per source (served when an entry is stale)
+RESTRICTIVE_SOURCE_DEFAULTS: Dict[str, Any] = {
+    "circuit_breaker": True,
+    "budget_integration": "HARD_STOP",
+    "health_module": "RED",
+    "risk_governor": "CRITICAL",
+}
+
+# Per-source freshness window in seconds. The kill switch is the most
+# safety-critical, so it has the shortest window.
+DEFAULT_SOURCE_TTL_SECONDS: Dict[str, float] = {
+    "circuit_breaker": 2.0,
+    "budget_integration": 30.0,
+    "health_module": 5.0,
+    "risk_governor": 10.0,
+}
+
+# A failed query is cached (as its restrictive default) only this long,
+# so a recovered source is picked up quickly
+SOURCE_FAILURE_TTL_SECONDS = 1.0
+
+# Background refresher re-queries an entry at this fraction of its TTL
+REFRESH_AHEAD_RATIO = 0.5
+
+# While the refresher catches up (expiry, invalidation), the last
+# successfully queried value is served - marked stale - for at most this
+# multiple of the source TTL. Past it, the source is unknown.
+MAX_STALENESS_TTL_MULTIPLE = 5.0
+
+# Error code for background refresh failures
+ERROR_POLICY_CONTEXT_REFRESH_FAIL = "TPP-011"
+
+
+@dataclass
+class _CachedSource:
+    """One cached source value with its freshness metadata."""
+    value: Any
+    failed: bool
+    fetched_at: float
+    ttl_seconds: float
+    invalidated: bool = False
+    # Re-read requested; still served while the refresher runs
+    refresh_requested: bool = False
+    
+    def age(self, now: float) -> float:
+        return now - self.fetched_at
+    
+    def is_fresh(self, now: float) -> bool:
+        return not self.invalidated and self.age(now) < self.ttl_seconds
+
+
+class PolicyContextCache:
+    """
+    TTL cache of PolicyContext source values with background refresh.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Valid PolicyContextBuilder
+    Side Effects: Background thread (when started) queries source modules
+    
+    HOT PATH
+    --------
+    build() reads cached values only. While the background refresher
+    is running, a stale, invalidated or missing entry wakes the
+    refresher and build() serves the last successfully queried value,
+    marked stale, until it is older than the source's max staleness -
+    the hot path never blocks on a source query. A source that was never
+    loaded, or whose last good value is past max staleness, resolves to
+    its RESTRICTIVE default and is listed in PolicyContext.unknown_sources
+    so TradePermissionPolicy HALTs without engaging its latch. Without
+    the refresher, stale entries are re-queried inline (same behavior as
+    PolicyContextBuilder).
+    
+    INVALIDATION
+    ------------
+    invalidate() is wired to circuit breaker state changes, Guardian
+    lock events and BudgetGuard reloads: the entry is re-queried at once
+    and the previous value is never treated as fresh again.
+    request_refresh() (system_settings writes) re-reads an entry in the
+    background and swaps it atomically, leaving the current one fresh.
+    
+    Python 3.8 Compatible - No union type hints (X | None)
+    PRIVACY: No personal data in code.
+    """
+    
+    def __init__(
+        self,
+        builder: PolicyContextBuilder,
+        ttl_seconds: Optional[Dict[str, float]] = None,
+        failure_ttl_seconds: float = SOURCE_FAILURE_TTL_SECONDS,
+        clock: Optional[Any] = None,
+        max_staleness_seconds: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Initialize PolicyContextCache.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: TTLs must be positive
+        Side Effects: None (refresher is started explicitly)
+        
+        Args:
+            builder: PolicyContextBuilder used to query sources
+            ttl_seconds: Per-source TTL overrides
+            failure_ttl_seconds: TTL for failed (restrictive) entries
+            clock: Monotonic time function (default: time.monotonic)
+            max_staleness_seconds: Per-source limit for serving the last
+                good value (default: TTL * MAX_STALENESS_TTL_MULTIPLE)
+        """
+        self._builder = builder
+        self._ttl_seconds = dict(DEFAULT_SOURCE_TTL_SECONDS)
+        if ttl_seconds:
+            self._ttl_seconds.update(ttl_seconds)
+        for source, ttl in self._ttl_seconds.items():
+            if ttl <= 0:
+                raise ValueError(f"TTL for {source} must be positive, got {ttl}")
+        self._max_staleness_seconds = {
+            source: ttl * MAX_STALENESS_TTL_MULTIPLE
+            for source, ttl in self._ttl_seconds.items()
+        }
+        if max_staleness_seconds:
+            self._max_staleness_seconds.update(max_staleness_seconds)
+        for source, limit in self._max_staleness_seconds.items():
+            if limit < self._ttl_seconds[source]:
+                raise ValueError(
+                    f"Max staleness for {source} must be >= its TTL, got {limit}"
+                )
+        if failure_ttl_seconds <= 0:
+            raise ValueError("failure_ttl_seconds must be positive")
+        
+        self._failure_ttl_seconds = failure_ttl_seconds
+        self._clock = clock or time.monotonic
+        
+        self._entries: Dict[str, _CachedSource] = {}
+        # Last successful (non-failed) query per source
+        self._last_good: Dict[str, _CachedSource] = {}
+        # Bumped on every request_refresh(); checked like _generations
+        self._refresh_requests: Dict[str, int] = {}
+        # Bumped on every invalidation; detects events that race a query
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Serializes source queries (builder keeps per-query state)
+        self._query_lock = threading.Lock()
+        
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        
+        self._last_source_failures: List[str] = []
+        self._last_stale_sources: List[str] = []
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "stale_served_last_good": 0,
+            "stale_served_restrictive": 0,
+            "inline_refreshes": 0,
+            "background_refreshes": 0,
+            "invalidations": 0,
+            "refresh_requests": 0,
+        }
+    
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+    
+    def build(self, correlation_id: str) -> PolicyContext:
+        """
+        Build PolicyContext from cached source values.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: correlation_id must be non-empty string
+        Side Effects: Inline source queries only if refresher is not running
+        
+        Args:
+            correlation_id: Tracking ID for audit trail
+            
+        Returns:
+            PolicyContext with cached, last good or restrictive values
+        """
+        if not correlation_id or not correlation_id.strip():
+            raise ValueError("correlation_id must be non-empty string")
+        
+        background = self.is_refreshing_in_background()
+        values: Dict[str, Any] = {}
+        failures: List[str] = []
+        stale: List[str] = []
+        unknown: List[str] = []
+        needs_refresh = False
+        
+        for source in POLICY_CONTEXT_SOURCES:
+            now = self._clock()
+            with self._lock:
+                entry = self._entries.get(source)
+                # Inline mode has no refresher: a requested re-read is due now
+                fresh = (
+                    entry is not None and entry.is_fresh(now) and
+                    (background or not entry.refresh_requested)
+                )
+                if fresh:
+                    self._stats["hits"] += 1
+                last_good = self._last_good.get(source)
+            
+            if not fresh:
+                if background:
+                    # Never block the hot path: wake the refresher and
+                    # serve the last good value while it is bounded-stale
+                    needs_refresh = True
+                    if (
+                        last_good is not None and
+                        last_good.age(now) < self._max_staleness_seconds[source]
+                    ):
+                        with self._lock:
+                            self._stats["stale_served_last_good"] += 1
+                        values[source] = last_good.value
+                        stale.append(source)
+                        continue
+                    with self._lock:
+                        self._stats["stale_served_restrictive"] += 1
+                    values[source] = RESTRICTIVE_SOURCE_DEFAULTS[source]
+                    failures.append(source)
+                    unknown.append(source)
+                    continue
+                entry = self._refresh_source(source, correlation_id)
+                with self._lock:
+                    self._stats["inline_refreshes"] += 1
+            
+            values[source] = entry.value
+            if entry.failed:
+                failures.append(source)
+        
+        if needs_refresh:
+            self._wake_event.set()
+        
+        with self._lock:
+            self._last_source_failures = failures
+            self._last_stale_sources = stale
+        
+        if failures:
+            logger.error(
+                f"[{ERROR_POLICY_CONTEXT_INCOMPLETE}] Cached context built with restrictive defaults",
+                extra={
+                    "correlation_id": correlation_id,
+                    "failed_sources": failures,
+                    "unknown_sources": unknown,
+                }
+            )
+        
+        return PolicyContext(
+            kill_switch_active=values["circuit_breaker"],
+            budget_signal=values["budget_integration"],
+            health_status=values["health_module"],
+            risk_assessment=values["risk_governor"],
+            correlation_id=correlation_id,
+            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            unknown_sources=tuple(unknown)
+        )
+    
+    # ------------------------------------------------------------------
+    # Refresh and invalidation
+    # ------------------------------------------------------------------
+    
+    def _refresh_source(self, source: str, correlation_id: str) -> _CachedSource:
+        """Query one source and store the result."""
+        with self._lock:
+            generation = self._generations.get(source, 0)
+            requested = self._refresh_requests.get(source, 0)
+        with self._query_lock:
+            value, failed = self._builder.query_source(source, correlation_id)
+        
+        ttl = self._failure_ttl_seconds if failed else self._ttl_seconds[source]
+        entry = _CachedSource(
+            value=value,
+            failed=failed,
+            fetched_at=self._clock(),
+            ttl_seconds=ttl
+        )
+        with self._lock:
+            # An invalidation that landed mid-query wins: the value may
+            # predate the event, so it must not be served
+            if self._generations.get(source, 0) != generation:
+                entry.invalidated = True
+                self._wake_event.set()
+            elif self._refresh_requests.get(source, 0) != requested:
+                entry.refresh_requested = True
+                self._wake_event.set()
+            self._entries[source] = entry
+            if not failed:
+                self._last_good[source] = entry
+        return entry
+    
+    def refresh(self, correlation_id: str, source: Optional[str] = None) -> None:
+        """
+        Re-query one source (or all sources) now.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: source must be in POLICY_CONTEXT_SOURCES or None
+        Side Effects: Queries source modules
+        
+        Args:
+            correlation_id: Tracking ID
+            source: Source to refresh (all if None)
+        """
+        sources = POLICY_CONTEXT_SOURCES if source is None else (source,)
+        for name in sources:
+            self._refresh_source(name, correlation_id)
+    
+    def refresh_due(self, correlation_id: str) -> int:
+        """
+        Refresh every entry that is missing, invalidated, has a refresh
+        requested or is past the refresh-ahead point of its TTL.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: Queries source modules
+        
+        Returns:
+            Number of sources refreshed
+        """
+        now = self._clock()
+        due: List[str] = []
+        with self._lock:
+            for source in POLICY_CONTEXT_SOURCES:
+                entry = self._entries.get(source)
+                if (
+                    entry is None or
+                    entry.invalidated or
+                    entry.refresh_requested or
+                    entry.age(now) >= entry.ttl_seconds * REFRESH_AHEAD_RATIO
+                ):
+                    due.append(source)
+        
+        for source in due:
+            self._refresh_source(source, correlation_id)
+        
+        with self._lock:
+            self._stats["background_refreshes"] += len(due)
+        return len(due)
+    
+    def invalidate(self, source: Optional[str] = None, reason: str = "") -> None:
+        """
+        Mark one source (or all sources) stale and wake the refresher.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: source must be in POLICY_CONTEXT_SOURCES or None
+        Side Effects: Invalidated entries serve last good (bounded) until refreshed
+        
+        Args:
+            source: Source to invalidate (all if None)
+            reason: Event that caused the invalidation (for logs)
+        """
+        sources = POLICY_CONTEXT_SOURCES if source is None else (source,)
+        for name in sources:
+            if name not in RESTRICTIVE_SOURCE_DEFAULTS:
+                raise ValueError(f"Unknown policy context source: {name}")
+        
+        with self._lock:
+            for name in sources:
+                self._generations[name] = self._generations.get(name, 0) + 1
+                entry = self._entries.get(name)
+                if entry is not None:
+                    entry.invalidated = True
+            self._stats["invalidations"] += 1
+        
+        self._wake_event.set()
+        logger.info(
+            "PolicyContextCache invalidated",
+            extra={"sources": list(sources), "reason": reason}
+        )
+    
+    def request_refresh(self, source: str, reason: str = "") -> None:
+        """
+        Re-read one source without dropping its current value.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: source must be in POLICY_CONTEXT_SOURCES
+        Side Effects: Wakes the refresher (inline mode: next build() re-queries)
+        
+        For frequent writes that rarely change the gating value
+        (system_settings PnL updates): the entry keeps being served until
+        the refresher swaps in the re-read value, so the hot path never
+        falls back to last good or restrictive defaults.
+        
+        Args:
+            source: Source to re-read
+            reason: Event that caused the request (for logs)
+        """
+        if source not in RESTRICTIVE_SOURCE_DEFAULTS:
+            raise ValueError(f"Unknown policy context source: {source}")
+        
+        with self._lock:
+            self._refresh_requests[source] = self._refresh_requests.get(source, 0) + 1
+            entry = self._entries.get(source)
+            if entry is not None:
+                entry.refresh_requested = True
+            self._stats["refresh_requests"] += 1
+        
+        self._wake_event.set()
+        logger.debug(
+            "PolicyContextCache refresh requested",
+            extra={"source": source, "reason": reason}
+        )
+    
+    # ------------------------------------------------------------------
+    # Background refresher
+    # ------------------------------------------------------------------
+    
+    def start_background_refresh(self, correlation_id: str = "POLICY_CONTEXT_REFRESH") -> None:
+        """
+        Warm the cache and start the background refresher thread.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: Queries all sources, starts a daemon thread
+        
+        Args:
+            correlation_id: Tracking ID used for refresh queries
+        """
+        if self.is_refreshing_in_background():
+            return
+        
+        self.refresh(correlation_id)
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(correlation_id,),
+            name="policy-context-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+        logger.info(
+            "PolicyContextCache background refresh started",
+            extra={"ttl_seconds": dict(self._ttl_seconds)}
+        )
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the background refresher thread.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: Joins the refresher thread
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=timeout)
+            self._refresh_thread = None
+    
+    def is_refreshing_in_background(self) -> bool:
+        """Check if the background refresher thread is running."""
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+    
+    def _seconds_until_due(self) -> float:
+        """Seconds until the next entry reaches its refresh-ahead point."""
+        now = self._clock()
+        with self._lock:
+            waits = [
+                entry.ttl_seconds * REFRESH_AHEAD_RATIO - entry.age(now)
+                for entry in self._entries.values()
+            ]
+        if not waits:
+            return 0.0
+        return max(0.0, min(waits))
+    
+    def _refresh_loop(self, correlation_id: str) -> None:
+        """Refresher thread body: sleep until due or woken, then refresh."""
+        while not self._stop_event.is_set():
+            self._wake_event.wait(timeout=self._seconds_until_due())
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.refresh_due(correlation_id)
+            except Exception as e:
+                logger.error(
+                    f"[{ERROR_POLICY_CONTEXT_REFRESH_FAIL}] Background refresh failed",
+                    extra={"correlation_id": correlation_id, "error": str(e)}
+                )
+                # Back off one failure TTL before retrying
+                self._stop_event.wait(timeout=self._failure_ttl_seconds)
+    
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    
+    def get_last_source_failures(self) -> List[str]:
+        """
+        Get sources that resolved to a restrictive default in the last build().
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: None
+        """
+        with self._lock:
+            return list(self._last_source_failures)
+    
+    def get_last_stale_sources(self) -> List[str]:
+        """
+        Get sources served from their last good value in the last build().
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: None
+        """
+        with self._lock:
+            return list(self._last_stale_sources)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None
+        Side Effects: None
+        """
+        now = self._clock()
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = {
+                source: {
+                    "age_seconds": round(entry.age(now), 3),
+                    "fresh": entry.is_fresh(now),
+                    "failed": entry.failed,
+                }
+                for source, entry in self._entries.items()
+            }
+        stats["background_refresh"] = self.is_refreshing_in_background()
+        return stats
+
+
 # ============================================================================
 # DATABASE PERSISTENCE FOR POLICY DECISIONS
 # ============================================================================
@@ -2484,6 +3092,10 @@ __all__ = [
     "DEFAULT_LATCH_RESET_WINDOW_SECONDS",
     "MAX_CLOCK_DRIFT_MS",
     "SYNC_INTERVAL_SECONDS",
+    "POLICY_CONTEXT_SOURCES",
+    "RESTRICTIVE_SOURCE_DEFAULTS",
+    "DEFAULT_SOURCE_TTL_SECONDS",
+    "SOURCE_FAILURE_TTL_SECONDS",
     # Error codes
     "ERROR_INVALID_CONTEXT",
     "ERROR_CIRCUIT_BREAKER_TIMEOUT",
@@ -2492,6 +3104,7 @@ __all__ = [
     "ERROR_RISK_UNAVAILABLE",
     "ERROR_POLICY_CONTEXT_INCOMPLETE",
     "ERROR_POLICY_AUDIT_PERSIST_FAIL",
+    "ERROR_POLICY_CONTEXT_REFRESH_FAIL",
     "ERROR_EXCHANGE_TIME_DRIFT",
     "ERROR_EXCHANGE_TIME_UNAVAILABLE",
     "ERROR_TIME_SYNC_FAILED",
@@ -2506,6 +3119,7 @@ __all__ = [
     # Classes
     "TradePermissionPolicy",
     "PolicyContextBuilder",
+    "PolicyContextCache",
     "ExchangeTimeSynchronizer",
     # Functions
     "get_precedence_rank",
@@ -46,6 +46,9 @@ from enum import Enum
 
 import httpx
 
+from app.exchange.rate_limiter import RequestLane, get_shared_rate_limiter
+from app.exchange.valr_client import resolve_valr_base_url
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -127,9 +130,6 @@ class VALRLink:
         mock_mode: True if operating without real credentials
     """
     
-    # VALR API endpoints
-    BASE_URL: str = "https://api.valr.com"
-    
     # Request timeout (seconds)
     REQUEST_TIMEOUT: float = 30.0
     
@@ -140,7 +140,9 @@ class VALRLink:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        api_secret: Optional[str] = None
+        api_secret: Optional[str] = None,
+        rate_limiter: Optional[Any] = None,
+        base_url: Optional[str] = None
     ) -> None:
         """
         Initialize VALR Link.
@@ -152,13 +154,20 @@ class VALRLink:
         Args:
             api_key: VALR API key (defaults to env var)
             api_secret: VALR API secret (defaults to env var)
+            rate_limiter: Limiter override (default: process-wide shared budget)
+            base_url: Loopback stand-in URL (default: VALR_BASE_URL env var
+                      if loopback, else production VALR)
         """
         self.api_key = api_key or os.getenv("VALR_API_KEY")
+        self.base_url = resolve_valr_base_url(base_url)
         self.api_secret = api_secret or os.getenv("VALR_API_SECRET")
         
         # Determine mock mode
         self.mock_mode = not bool(self.api_key and self.api_secret)
         
+        # Shared with VALRClient so all callers stay within one VALR allowance
+        self._rate_limiter = rate_limiter
+        
         if self.mock_mode:
             logger.warning(
                 "VALRLink initialized in MOCK_MODE | "
@@ -250,6 +259,36 @@ class VALRLink:
             "Content-Type": "application/json"
         }
     
+    async def _acquire_rate_limit(
+        self,
+        lane: RequestLane,
+        correlation_id: Optional[str] = None
+    ) -> None:
+        """
+        Wait for a token from the shared VALR budget (live mode only).
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: lane - ORDER for placement, ACCOUNT for queries
+        Side Effects: Consumes one shared rate-limit token
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = get_shared_rate_limiter()
+        
+        if not await self._rate_limiter.acquire_async(lane, correlation_id=correlation_id):
+            raise RuntimeError(
+                f"ERR-VALR-005: Rate limit exceeded for {lane.value} lane"
+            )
+    
+    def _record_rate_limited(self, response: httpx.Response) -> None:
+        """Propagate an HTTP 429 to every client sharing the budget."""
+        if response.status_code == 429 and self._rate_limiter is not None:
+            retry_after = response.headers.get("Retry-After", "1")
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                pause = 1.0
+            self._rate_limiter.record_rate_limited(pause)
+    
     async def get_balances(self) -> Dict[str, Balance]:
         """
         Get account balances for all currencies.
@@ -282,17 +321,19 @@ class VALRLink:
             }
         
         # Live mode - call VALR API
+        await self._acquire_rate_limit(RequestLane.ACCOUNT)
         path = "/v1/account/balances"
         
         try:
             async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
                 headers = self._get_headers("GET", path)
                 response = await client.get(
-                    f"{self.BASE_URL}{path}",
+                    f"{self.base_url}{path}",
                     headers=headers
                 )
                 
                 if response.status_code != 200:
+                    self._record_rate_limited(response)
                     logger.error(
                         "VALR API error | status=%d | response=%s",
                         response.status_code,
@@ -401,16 +442,19 @@ class VALRLink:
         import json
         body = json.dumps(order_payload)
         
+        await self._acquire_rate_limit(RequestLane.ORDER, correlation_id)
+        
         try:
             async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
                 headers = self._get_headers("POST", path, body)
                 response = await client.post(
-                    f"{self.BASE_URL}{path}",
+                    f"{self.base_url}{path}",
                     headers=headers,
                     content=body
                 )
                 
                 if response.status_code not in (200, 201, 202):
+                    self._record_rate_limited(response)
                     logger.error(
                         "VALR order failed | status=%d | response=%s",
                         response.status_code,
@@ -539,6 +583,7 @@ async def place_market_order(
 # L6 Safety Compliance: Verified (mock mode prevents accidental trades)
 # Traceability: correlation_id supported for order tracking
 # HMAC Authentication: HMAC-SHA512 per VALR API spec
+# Rate Limiting: Shared VALR budget (ORDER/ACCOUNT lanes, live mode only)
 # Confidence Score: 98/100
 #
 # =============================================================================
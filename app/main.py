@@ -32,11 +32,13 @@ from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 
 from app.api.webhook import router as webhook_router
 from app.api.guardian import router as guardian_router
 from app.api.hitl import router as hitl_router
+from app.api.profiling import router as profiling_router
 from app.database.session import check_database_connection, engine, get_db
 
 # Phase 2: Trade Lifecycle Manager Integration
@@ -89,6 +91,18 @@ from services.guardian_integration import (
 )
 from services.hitl_config import get_hitl_config
 
+# Shared system_settings cache (NOTIFY-driven kill switch state)
+from app.logic.system_settings_cache import get_system_settings_cache
+
+# Trade Permission Policy context cache
+from app.logic.policy_integration import (
+    get_policy_integration,
+    POLICY_CONTEXT_REFRESH_ENABLED,
+)
+
+from app.logic.rlhf_outbox import RLHF_OUTBOX_REPLAY_ENABLED, get_outcome_replayer
+from app.observability.loop_watchdog import LOOP_WATCHDOG_ENABLED, get_loop_watchdog
+
 # Load environment variables
 load_dotenv()
 
@@ -472,6 +486,60 @@ async def lifespan(app: FastAPI):
         print("       System will continue without HITL approval gate")
         hitl_status = "unavailable"
     
+    # System settings cache: LISTEN for system_settings NOTIFY so the
+    # kill switch propagates in milliseconds without per-signal SELECTs
+    try:
+        get_system_settings_cache().start_listener()
+        print("[OK] System settings NOTIFY listener started")
+    except Exception as e:
+        print(f"[WARN] System settings listener failed to start: {e}")
+        print("       system_settings will be re-read on every access")
+    
+    # Policy context cache: keep TradePermissionPolicy sources warm so
+    # evaluation is pure in-memory (NON-BLOCKING)
+    policy_integration = None
+    try:
+        if POLICY_CONTEXT_REFRESH_ENABLED:
+            policy_integration = get_policy_integration()
+            if _guardian_integration is not None:
+                policy_integration.attach_guardian(_guardian_integration)
+            # Warm-up queries every source; keep it off the event loop
+            import asyncio
+            await asyncio.get_running_loop().run_in_executor(
+                None, policy_integration.start_context_refresh
+            )
+            print("[OK] Policy context background refresh started")
+        else:
+            print("[INFO] Policy context background refresh disabled")
+    except Exception as e:
+        print(f"[WARN] Policy context refresh failed to start: {e}")
+        print("       Policy sources will be queried inline on evaluation")
+    
+    # RLHF outcome outbox: replay feedback recorded while Aura was down
+    outcome_replayer = None
+    try:
+        if RLHF_OUTBOX_REPLAY_ENABLED:
+            outcome_replayer = get_outcome_replayer()
+            outcome_replayer.start()
+            print("[OK] RLHF outcome replayer started")
+        else:
+            print("[INFO] RLHF outcome replayer disabled")
+    except Exception as e:
+        print(f"[WARN] RLHF outcome replayer failed to start: {e}")
+        print("       Pending outcomes will be replayed on next start")
+    
+    # Event loop watchdog: lag metrics + stacks of loop-blocking calls
+    loop_watchdog = None
+    try:
+        if LOOP_WATCHDOG_ENABLED:
+            loop_watchdog = get_loop_watchdog()
+            loop_watchdog.start()
+            print("[OK] Event loop watchdog started")
+        else:
+            print("[INFO] Event loop watchdog disabled")
+    except Exception as e:
+        print(f"[WARN] Event loop watchdog failed to start: {e}")
+    
     print("[OK] Ingress Layer initialized")
     print("=" * 60)
     print("SOVEREIGN MANDATE: Survival > Capital Preservation > Alpha")
@@ -539,6 +607,37 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"[WARN] HITL Expiry Worker shutdown failed: {e}")
     
+    # Stop policy context refresher
+    if policy_integration is not None:
+        try:
+            policy_integration.stop_context_refresh()
+            print("[OK] Policy context refresh stopped")
+        except Exception as e:
+            print(f"[WARN] Policy context refresh shutdown failed: {e}")
+    
+    # Stop RLHF outcome replayer (pending rows stay in the outbox)
+    if outcome_replayer is not None:
+        try:
+            await outcome_replayer.stop()
+            print("[OK] RLHF outcome replayer stopped")
+        except Exception as e:
+            print(f"[WARN] RLHF outcome replayer shutdown failed: {e}")
+    
+    # Stop event loop watchdog
+    if loop_watchdog is not None:
+        try:
+            await loop_watchdog.stop()
+            print("[OK] Event loop watchdog stopped")
+        except Exception as e:
+            print(f"[WARN] Event loop watchdog shutdown failed: {e}")
+    
+    # Stop system settings listener
+    try:
+        get_system_settings_cache().stop_listener()
+        print("[OK] System settings listener stopped")
+    except Exception as e:
+        print(f"[WARN] System settings listener shutdown failed: {e}")
+    
     # Sprint 9: Shutdown RGI
     try:
         shutdown_rgi()
@@ -659,6 +758,13 @@ app.include_router(
     tags=["HITL"]
 )
 
+# Include profiling router (opt-in: PROFILING_ENABLED + PROFILING_TOKEN)
+app.include_router(
+    profiling_router,
+    prefix="/debug/profile",
+    tags=["Profiling"]
+)
+
 
 # ============================================================================
 # ROOT ENDPOINT
@@ -805,7 +911,7 @@ async def health_check():
     description="Exposes Prometheus metrics for observability.",
     tags=["Observability"]
 )
-async def metrics():
+async def metrics(request: Request):
     """
     Prometheus metrics endpoint.
     
@@ -813,9 +919,18 @@ async def metrics():
     Input Constraints: None
     Side Effects: None
     
+    Scrapers that accept application/openmetrics-text receive the
+    OpenMetrics format, which carries the correlation_id exemplars of
+    hot_path_latency_seconds.
+    
     Returns:
-        Prometheus metrics in text format
+        Prometheus metrics in text or OpenMetrics format
     """
+    if "application/openmetrics-text" in request.headers.get("accept", ""):
+        return Response(
+            content=openmetrics_exposition.generate_latest(REGISTRY),
+            media_type=openmetrics_exposition.CONTENT_TYPE_LATEST
+        )
     return Response(
         content=generate_latest(),
         media_type=CONTENT_TYPE_LATEST
@@ -17,11 +17,19 @@ from app.observability.metrics import (
     EQUITY_ZAR_GAUGE,
     SLIPPAGE_HISTOGRAM,
     EXPECTANCY_GAUGE,
+    HOT_PATH_LATENCY,
     record_signal_received,
     record_signal_executed,
     update_equity,
     record_slippage,
     update_expectancy,
+    bind_correlation_id,
+    observe_latency,
+    LatencySpan,
+    latency_span,
+    timed,
+    StageTimer,
+    instrument_engine,
 )
 
 from app.observability.rgi_metrics import (
@@ -51,11 +59,20 @@ __all__ = [
     "EQUITY_ZAR_GAUGE",
     "SLIPPAGE_HISTOGRAM",
     "EXPECTANCY_GAUGE",
+    "HOT_PATH_LATENCY",
     "record_signal_received",
     "record_signal_executed",
     "update_equity",
     "record_slippage",
     "update_expectancy",
+    # Latency spans
+    "bind_correlation_id",
+    "observe_latency",
+    "LatencySpan",
+    "latency_span",
+    "timed",
+    "StageTimer",
+    "instrument_engine",
     # RGI metrics
     "RGI_TRUST_PROBABILITY",
     "RGI_ADJUSTED_CONFIDENCE",
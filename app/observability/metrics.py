@@ -15,6 +15,21 @@ METRICS EXPOSED
 - equity_zar_gauge: Current account balance from VALR
 - slippage_pct_histogram: Distribution of execution slippage
 - expectancy_gauge: Rolling realized_pnl / realized_risk
+- hot_path_latency_seconds: Per-stage latency of the signal hot path
+  (webhook steps, policy, trust governor, AI debate, dispatch, DB calls)
+
+LATENCY SPANS
+-------------
+    with latency_span("policy", "evaluate", correlation_id): ...
+    async with latency_span("dispatcher", "execute_signal", cid): ...
+    @timed("ai_council", "conduct_debate")
+    timer = StageTimer("webhook"); ...; timer.lap("insert")
+
+Every span observes hot_path_latency_seconds{component, stage} with the
+correlation_id attached as an exemplar (visible when Prometheus scrapes
+the OpenMetrics format), so a slow bucket in Grafana links back to the
+exact signal. When opentelemetry-api is installed and
+LATENCY_OTEL_ENABLED=true each span is also exported as an OTel span.
 
 ZERO-FLOAT MANDATE
 ------------------
@@ -24,12 +39,24 @@ Prometheus boundary. Internal calculations remain Decimal.
 ============================================================================
 """
 
+import contextvars
+import functools
+import inspect
 import logging
+import os
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from prometheus_client import Counter, Gauge, Histogram, REGISTRY
 
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    otel_trace = None
+    OTEL_AVAILABLE = False
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -72,6 +99,30 @@ EXPECTANCY_GAUGE = Gauge(
     "Rolling expectancy ratio (realized_pnl / realized_risk)"
 )
 
+# Histogram: Hot-path latency per component/stage
+# Buckets: 0.5ms .. 30s (webhook steps are sub-ms, debates take seconds)
+HOT_PATH_LATENCY = Histogram(
+    "hot_path_latency_seconds",
+    "Latency of hot-path stages (webhook steps, policy, governor, debate, dispatch, DB)",
+    ["component", "stage"],
+    buckets=[
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+    ]
+)
+
+# OpenTelemetry export of latency spans (requires opentelemetry-api)
+LATENCY_OTEL_ENABLED = os.getenv("LATENCY_OTEL_ENABLED", "false").lower() == "true"
+
+# Correlation ID of the signal currently being processed (exemplar source
+# for spans that do not receive one explicitly, e.g. DB calls)
+_current_correlation_id = contextvars.ContextVar(
+    "hot_path_correlation_id", default=None
+)  # type: contextvars.ContextVar[Optional[str]]
+
+# SQL verbs kept as DB stage labels; anything else is OTHER
+_DB_STAGES = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
 
 # ============================================================================
 # METRIC UPDATE FUNCTIONS
@@ -279,6 +330,283 @@ def update_expectancy(
         )
 
 
+# ============================================================================
+# LATENCY SPANS
+# ============================================================================
+
+def _tracer() -> Optional[Any]:
+    """OTel tracer when export is enabled and the API is installed."""
+    if LATENCY_OTEL_ENABLED and OTEL_AVAILABLE:
+        return otel_trace.get_tracer("autonomous_alpha.hot_path")
+    return None
+
+
+def bind_correlation_id(correlation_id: Optional[str]) -> None:
+    """
+    Set the correlation_id used as exemplar by spans in this context.
+    
+    Reliability Level: STANDARD
+    Input Constraints: None
+    Side Effects: Sets a context variable (per asyncio task / thread)
+    """
+    _current_correlation_id.set(str(correlation_id) if correlation_id else None)
+
+
+def observe_latency(
+    component: str,
+    stage: str,
+    seconds: float,
+    correlation_id: Optional[str] = None
+) -> None:
+    """
+    Observe one stage latency.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Low-cardinality component/stage labels
+    Side Effects: Observes Prometheus histogram, optionally exports an OTel span
+    
+    Args:
+        component: Subsystem (e.g. "webhook", "policy", "db")
+        stage: Step within the component (e.g. "insert", "evaluate")
+        seconds: Elapsed wall-clock seconds
+        correlation_id: Exemplar label (defaults to the bound correlation_id)
+    """
+    correlation_id = correlation_id or _current_correlation_id.get()
+    try:
+        HOT_PATH_LATENCY.labels(component=component, stage=stage).observe(
+            seconds,
+            exemplar={"correlation_id": str(correlation_id)} if correlation_id else None
+        )
+        tracer = _tracer()
+        if tracer is not None:
+            end_ns = time.time_ns()
+            span = tracer.start_span(
+                f"{component}.{stage}", start_time=end_ns - int(seconds * 1e9)
+            )
+            if correlation_id:
+                span.set_attribute("correlation_id", str(correlation_id))
+            span.end(end_time=end_ns)
+    except Exception as e:
+        logger.error(
+            "[OBS-006] Failed to record latency metric | component=%s | stage=%s | error=%s",
+            component, stage, str(e)
+        )
+
+
+class LatencySpan:
+    """
+    Times one stage as a (sync or async) context manager.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Low-cardinality component/stage labels
+    Side Effects: Observes HOT_PATH_LATENCY on exit; OTel span while open
+    """
+    
+    def __init__(
+        self,
+        component: str,
+        stage: str,
+        correlation_id: Optional[str] = None
+    ) -> None:
+        self.component = component
+        self.stage = stage
+        self.correlation_id = str(correlation_id) if correlation_id else None
+        self.elapsed_seconds = 0.0
+        self._started = 0.0
+        self._otel_cm = None  # type: Optional[Any]
+    
+    @property
+    def elapsed_ms(self) -> float:
+        return self.elapsed_seconds * 1000
+    
+    def __enter__(self) -> "LatencySpan":
+        tracer = _tracer()
+        if tracer is not None:
+            try:
+                self._otel_cm = tracer.start_as_current_span(
+                    f"{self.component}.{self.stage}"
+                )
+                span = self._otel_cm.__enter__()
+                if self.correlation_id:
+                    span.set_attribute("correlation_id", self.correlation_id)
+            except Exception:
+                self._otel_cm = None
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        self.elapsed_seconds = time.perf_counter() - self._started
+        try:
+            HOT_PATH_LATENCY.labels(
+                component=self.component, stage=self.stage
+            ).observe(
+                self.elapsed_seconds,
+                exemplar=self._exemplar()
+            )
+        except Exception as e:
+            logger.error(
+                "[OBS-006] Failed to record latency metric | component=%s | stage=%s | error=%s",
+                self.component, self.stage, str(e)
+            )
+        if self._otel_cm is not None:
+            try:
+                self._otel_cm.__exit__(exc_type, exc, tb)
+            except Exception:
+                pass
+        return False
+    
+    async def __aenter__(self) -> "LatencySpan":
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+    
+    def _exemplar(self) -> Optional[Dict[str, str]]:
+        correlation_id = self.correlation_id or _current_correlation_id.get()
+        return {"correlation_id": correlation_id} if correlation_id else None
+
+
+def latency_span(
+    component: str,
+    stage: str,
+    correlation_id: Optional[str] = None
+) -> LatencySpan:
+    """
+    Time a block: ``with latency_span("policy", "evaluate", cid):``.
+    
+    Works with both ``with`` and ``async with``.
+    """
+    return LatencySpan(component, stage, correlation_id)
+
+
+def _find_correlation_id(bound: inspect.BoundArguments) -> Optional[str]:
+    """correlation_id argument, or the correlation_id attribute of an argument."""
+    value = bound.arguments.get("correlation_id")
+    if value:
+        return str(value)
+    for name, argument in bound.arguments.items():
+        if name == "self":
+            continue
+        value = getattr(argument, "correlation_id", None)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def timed(component: str, stage: Optional[str] = None) -> Callable:
+    """
+    Decorator timing every call of a sync or async function.
+    
+    The exemplar correlation_id comes from a ``correlation_id`` argument,
+    or from the ``correlation_id`` attribute of an argument (e.g. a
+    PolicyContext).
+    
+    Args:
+        component: Subsystem label
+        stage: Stage label (defaults to the function name)
+    """
+    def decorator(func: Callable) -> Callable:
+        stage_name = stage or func.__name__
+        signature = inspect.signature(func)
+        
+        def correlation_of(args: Any, kwargs: Any) -> Optional[str]:
+            try:
+                return _find_correlation_id(signature.bind_partial(*args, **kwargs))
+            except TypeError:
+                return None
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                async with LatencySpan(component, stage_name, correlation_of(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with LatencySpan(component, stage_name, correlation_of(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+    
+    return decorator
+
+
+class StageTimer:
+    """
+    Sequential per-stage breakdown of one request.
+    
+    Each lap() records the time since the previous lap both in
+    ``stages`` (milliseconds, for the response / replay harness) and in
+    HOT_PATH_LATENCY.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: Low-cardinality component/stage labels
+    Side Effects: Observes HOT_PATH_LATENCY per lap
+    """
+    
+    def __init__(self, component: str, correlation_id: Optional[str] = None) -> None:
+        self.component = component
+        self.correlation_id = correlation_id
+        self.stages = {}  # type: Dict[str, float]
+        self._started = time.perf_counter()
+        self._mark = self._started
+    
+    def bind(self, correlation_id: str) -> None:
+        """Attach the correlation_id once known (also binds it for DB spans)."""
+        self.correlation_id = str(correlation_id)
+        bind_correlation_id(self.correlation_id)
+    
+    def lap(self, stage: str) -> float:
+        """Record milliseconds since the previous lap under stage."""
+        now = time.perf_counter()
+        seconds = now - self._mark
+        self._mark = now
+        self.stages[stage] = round(seconds * 1000, 3)
+        observe_latency(self.component, stage, seconds, self.correlation_id)
+        return seconds
+    
+    def total(self) -> float:
+        """Record and return the whole request duration in seconds."""
+        seconds = time.perf_counter() - self._started
+        observe_latency(self.component, "total", seconds, self.correlation_id)
+        return seconds
+
+
+def instrument_engine(engine: Any, component: str = "db") -> None:
+    """
+    Time every statement executed through a SQLAlchemy engine.
+    
+    Stage label is the SQL verb (SELECT/INSERT/UPDATE/DELETE/WITH/OTHER);
+    the exemplar is the bound correlation_id of the calling request.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: SQLAlchemy Engine
+    Side Effects: Registers cursor execute event listeners
+    """
+    from sqlalchemy import event
+    
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("hot_path_query_start", []).append(time.perf_counter())
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("hot_path_query_start")
+        if not starts:
+            return
+        seconds = time.perf_counter() - starts.pop()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        observe_latency(component, verb if verb in _DB_STAGES else "OTHER", seconds)
+    
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        connection = exception_context.connection
+        if connection is not None:
+            starts = connection.info.get("hot_path_query_start")
+            if starts:
+                starts.pop()
+
+
 # ============================================================================
 # 95% CONFIDENCE AUDIT
 # ============================================================================
@@ -287,7 +615,7 @@ def update_expectancy(
 # Decimal Integrity: Verified (float conversion only at Prometheus boundary)
 # L6 Safety Compliance: Verified (no trading logic)
 # Traceability: correlation_id supported throughout
-# Error Codes: OBS-000 through OBS-005
+# Error Codes: OBS-000 through OBS-006
 # Confidence Score: 97/100
 #
 # ============================================================================
@@ -0,0 +1,428 @@
+"""
+============================================================================
+Project Autonomous Alpha v1.8.0
+Live Process Profiler - On-Demand Production Diagnostics
+============================================================================
+
+Reliability Level: L5 High
+Input Constraints: Bounded durations and sampling intervals
+Side Effects: Samples interpreter frames / traces allocations ONLY while
+              a request is in flight
+
+CAPABILITIES:
+- cpu_profile(): time-boxed wall-clock sampling of every thread via
+  sys._current_frames(), returned as collapsed stacks ("folded" format,
+  loadable by flamegraph.pl, speedscope and Grafana flame graph panels)
+- dump_asyncio_tasks(): every task on the running loop with the chain of
+  await points it is currently suspended in
+- dump_thread_stacks(): stacks of all threads (Discord delivery engine,
+  settings listener, learning sink, rgi_persist / rgi_predict executors...)
+- allocation_snapshot(): time-boxed tracemalloc window, top allocators by
+  size and by growth during the window
+
+ZERO IDLE OVERHEAD:
+Nothing is installed at import time: no signal handlers, no sys.setprofile
+hooks, no background thread. The sampler thread lives only for the
+requested duration and tracemalloc is stopped again afterwards (unless it
+was already tracing). One CPU profile and one allocation window may run at
+a time; concurrent requests get ProfilerBusyError.
+
+Python 3.8 Compatible - No union type hints (X | None)
+============================================================================
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bounds for time-boxed captures
+MAX_PROFILE_SECONDS = 120.0
+MIN_SAMPLE_INTERVAL_MS = 1.0
+MAX_SAMPLE_INTERVAL_MS = 1000.0
+DEFAULT_SAMPLE_INTERVAL_MS = 10.0
+
+# Frames kept per tracemalloc traceback when grouping by traceback
+TRACEMALLOC_FRAMES = 10
+
+# Project root used to shorten file paths in frame labels
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# Error codes
+PRF_BUSY = "PRF-004"
+PRF_INVALID = "PRF-005"
+
+
+# =============================================================================
+# EXCEPTIONS
+# =============================================================================
+
+class ProfilerBusyError(Exception):
+    """Raised when a capture of the same kind is already running."""
+
+    def __init__(self, message: str) -> None:
+        self.error_code = PRF_BUSY
+        self.message = message
+        super().__init__(f"[{PRF_BUSY}] {message}")
+
+
+class ProfilerArgumentError(ValueError):
+    """Raised when a duration or interval is out of bounds."""
+
+    def __init__(self, message: str) -> None:
+        self.error_code = PRF_INVALID
+        self.message = message
+        super().__init__(f"[{PRF_INVALID}] {message}")
+
+
+# One capture of each kind at a time
+_cpu_lock = threading.Lock()
+_memory_lock = threading.Lock()
+
+
+# =============================================================================
+# FRAME FORMATTING
+# =============================================================================
+
+def _short_path(filename: str) -> str:
+    """Project-relative path, or site-packages-relative for libraries."""
+    if filename.startswith(_PROJECT_ROOT + os.sep):
+        return filename[len(_PROJECT_ROOT) + 1:]
+    marker = "site-packages" + os.sep
+    index = filename.rfind(marker)
+    if index >= 0:
+        return filename[index + len(marker):]
+    return os.path.basename(filename)
+
+
+def _frame_label(frame: Any) -> str:
+    """Stable per-function label used as a flame graph node."""
+    code = frame.f_code
+    return "%s (%s:%d)" % (code.co_name, _short_path(code.co_filename), code.co_firstlineno)
+
+
+def _frame_entry(frame: Any) -> Dict[str, Any]:
+    """Location of a frame at its current line."""
+    return {
+        "function": frame.f_code.co_name,
+        "file": _short_path(frame.f_code.co_filename),
+        "line": frame.f_lineno,
+    }
+
+
+def _stack_root_first(frame: Any) -> List[Any]:
+    """Walk f_back links and return the stack outermost-first."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _thread_names() -> Dict[int, str]:
+    return {thread.ident: thread.name for thread in threading.enumerate() if thread.ident}
+
+
+# =============================================================================
+# CPU SAMPLING
+# =============================================================================
+
+def _validate_window(seconds: float, interval_ms: float) -> None:
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise ProfilerArgumentError(
+            f"seconds must be in (0, {MAX_PROFILE_SECONDS:g}], got {seconds}"
+        )
+    if not MIN_SAMPLE_INTERVAL_MS <= interval_ms <= MAX_SAMPLE_INTERVAL_MS:
+        raise ProfilerArgumentError(
+            f"interval_ms must be in [{MIN_SAMPLE_INTERVAL_MS:g}, "
+            f"{MAX_SAMPLE_INTERVAL_MS:g}], got {interval_ms}"
+        )
+
+
+def cpu_profile(
+    seconds: float,
+    interval_ms: float = DEFAULT_SAMPLE_INTERVAL_MS,
+    include_idle: bool = False
+) -> Dict[str, Any]:
+    """
+    Sample all thread stacks for a bounded window.
+
+    Reliability Level: L5 High
+    Input Constraints: 0 < seconds <= MAX_PROFILE_SECONDS
+    Side Effects: Blocks the calling thread for `seconds` (run it in an
+                  executor); briefly holds the GIL once per sample
+
+    Wall-clock sampling: a thread blocked in I/O shows up in its waiting
+    frame, which is what matters when the process "feels slow". Threads
+    parked in known idle waits (selector poll, Condition.wait, queue.get)
+    are dropped unless include_idle is True.
+
+    Args:
+        seconds: Capture window
+        interval_ms: Sampling period
+        include_idle: Keep samples of threads sitting in idle waits
+
+    Returns:
+        Dict with "collapsed" (folded stacks text, one "stack count" per
+        line), sample counts and the top leaf functions
+
+    Raises:
+        ProfilerArgumentError: Bounds violated
+        ProfilerBusyError: Another CPU profile is running
+    """
+    _validate_window(seconds, interval_ms)
+    if not _cpu_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A CPU profile is already running")
+
+    try:
+        own_ident = threading.get_ident()
+        interval = interval_ms / 1000.0
+        stacks = Counter()  # type: Counter
+        leaves = Counter()  # type: Counter
+        samples = 0
+        idle_samples = 0
+        started = time.perf_counter()
+        deadline = started + seconds
+        next_tick = started
+
+        logger.info(
+            "[PRF-000] CPU profile started | seconds=%s | interval_ms=%s",
+            seconds, interval_ms
+        )
+
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_tick:
+                time.sleep(next_tick - now)
+            next_tick += interval
+
+            names = _thread_names()
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                frames = _stack_root_first(frame)
+                if not include_idle and _is_idle(frames[-1]):
+                    idle_samples += 1
+                    continue
+                thread_name = names.get(ident, "thread-%d" % ident)
+                labels = [thread_name] + [_frame_label(f) for f in frames]
+                stacks[";".join(labels)] += 1
+                leaves[labels[-1]] += 1
+            samples += 1
+
+        elapsed = time.perf_counter() - started
+    finally:
+        _cpu_lock.release()
+
+    logger.info(
+        "[PRF-000] CPU profile finished | samples=%d | stacks=%d",
+        samples, len(stacks)
+    )
+
+    return {
+        "seconds": round(elapsed, 3),
+        "interval_ms": interval_ms,
+        "samples": samples,
+        "idle_samples_dropped": idle_samples,
+        "collapsed": "\n".join(
+            "%s %d" % (stack, count) for stack, count in sorted(stacks.items())
+        ),
+        "top_functions": [
+            {"function": label, "samples": count}
+            for label, count in leaves.most_common(25)
+        ],
+    }
+
+
+# Leaf functions that mean "thread is parked, not working"
+_IDLE_LEAVES = frozenset({
+    ("selectors.py", "select"),
+    ("selectors.py", "poll"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("socket.py", "accept"),
+})
+
+
+def _is_idle(frame: Any) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in _IDLE_LEAVES
+
+
+# =============================================================================
+# ASYNCIO TASKS / THREADS
+# =============================================================================
+
+def dump_asyncio_tasks(loop: Optional[asyncio.AbstractEventLoop] = None) -> List[Dict[str, Any]]:
+    """
+    Describe every task on the loop and where it is suspended.
+
+    Reliability Level: STANDARD
+    Input Constraints: Must be called from the loop's thread
+    Side Effects: None
+
+    Returns:
+        One dict per task: name, coroutine, state and the await chain
+        (outermost first; the last entry is the current await point)
+    """
+    loop = loop or asyncio.get_running_loop()
+    current = asyncio.current_task(loop)
+    tasks = []
+
+    for task in asyncio.all_tasks(loop):
+        coro = task.get_coro()
+        stack = [_frame_entry(frame) for frame in task.get_stack()]
+        tasks.append({
+            "name": task.get_name(),
+            "coroutine": getattr(coro, "__qualname__", repr(coro)),
+            "state": "running" if task is current else ("done" if task.done() else "pending"),
+            "await_chain": stack,
+            "awaiting": stack[-1] if stack else None,
+        })
+
+    tasks.sort(key=lambda t: t["name"])
+    return tasks
+
+
+def dump_thread_stacks() -> List[Dict[str, Any]]:
+    """
+    Current stack of every Python thread.
+
+    Reliability Level: STANDARD
+    Input Constraints: None
+    Side Effects: None
+
+    Returns:
+        One dict per thread: name, ident, daemon flag and frames
+        (outermost first)
+    """
+    threads = {thread.ident: thread for thread in threading.enumerate()}
+    result = []
+
+    for ident, frame in sys._current_frames().items():
+        thread = threads.get(ident)
+        result.append({
+            "name": thread.name if thread else "thread-%d" % ident,
+            "ident": ident,
+            "daemon": thread.daemon if thread else None,
+            "frames": [_frame_entry(f) for f in _stack_root_first(frame)],
+        })
+
+    result.sort(key=lambda t: t["name"])
+    return result
+
+
+# =============================================================================
+# ALLOCATIONS
+# =============================================================================
+
+def _stat_entry(stat: Any) -> Dict[str, Any]:
+    frame = stat.traceback[0]
+    return {
+        "file": _short_path(frame.filename),
+        "line": frame.lineno,
+        "size_kib": round(stat.size / 1024, 1),
+        "count": stat.count,
+    }
+
+
+def _diff_entry(stat: Any) -> Dict[str, Any]:
+    entry = _stat_entry(stat)
+    entry["size_diff_kib"] = round(stat.size_diff / 1024, 1)
+    entry["count_diff"] = stat.count_diff
+    return entry
+
+
+def allocation_snapshot(seconds: float, limit: int = 25) -> Dict[str, Any]:
+    """
+    Trace allocations for a bounded window and report the top allocators.
+
+    Reliability Level: L5 High
+    Input Constraints: 0 < seconds <= MAX_PROFILE_SECONDS, limit >= 1
+    Side Effects: Starts tracemalloc for the window (stopped afterwards
+                  unless it was already tracing); blocks the calling
+                  thread for `seconds` (run it in an executor)
+
+    Only allocations made while tracing are visible, so "top" is the
+    live memory allocated during the window and "growth" the net change
+    between its first and last snapshot - the view that finds leaks.
+
+    Raises:
+        ProfilerArgumentError: Bounds violated
+        ProfilerBusyError: Another allocation window is running
+    """
+    _validate_window(seconds, DEFAULT_SAMPLE_INTERVAL_MS)
+    if limit < 1:
+        raise ProfilerArgumentError(f"limit must be >= 1, got {limit}")
+    if not _memory_lock.acquire(blocking=False):
+        raise ProfilerBusyError("An allocation snapshot is already running")
+
+    was_tracing = tracemalloc.is_tracing()
+    try:
+        if not was_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        logger.info("[PRF-000] tracemalloc window started | seconds=%s", seconds)
+
+        first = tracemalloc.take_snapshot()
+        time.sleep(seconds)
+        last = tracemalloc.take_snapshot()
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        _memory_lock.release()
+
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+    first = first.filter_traces(filters)
+    last = last.filter_traces(filters)
+
+    return {
+        "seconds": seconds,
+        "already_tracing": was_tracing,
+        "traced_current_kib": round(traced_current / 1024, 1),
+        "traced_peak_kib": round(traced_peak / 1024, 1),
+        "top": [_stat_entry(s) for s in last.statistics("lineno")[:limit]],
+        "growth": [
+            _diff_entry(s)
+            for s in last.compare_to(first, "lineno")[:limit]
+            if s.size_diff > 0
+        ],
+    }
+
+
+# =============================================================================
+# 95% CONFIDENCE AUDIT
+# =============================================================================
+#
+# [Reliability Audit]
+# Zero Idle Overhead: [Verified - no hooks/threads outside a capture]
+# Bounded Captures: [Verified - MAX_PROFILE_SECONDS, one capture per kind]
+# Decimal Integrity: [N/A - diagnostics only]
+# Error Handling: [PRF-004 busy, PRF-005 invalid bounds]
+# Python 3.8 Compatible: [Verified - typing.Optional/Dict/List]
+# Confidence Score: [91/100]
+#
+# =============================================================================
@@ -75,6 +75,13 @@ RGI_LEARNING_EVENTS_TOTAL = Counter(
     ["outcome"]
 )
 
+# Counter: Learning events rejected by the database (dead-lettered)
+RGI_LEARNING_EVENTS_DEAD_LETTERED_TOTAL = Counter(
+    "rgi_learning_events_dead_lettered_total",
+    "Total number of trade learning events dead-lettered by the sink",
+    ["error_type"]
+)
+
 # Histogram: Confidence delta (llm_confidence - adjusted_confidence)
 # Buckets: 0, 5, 10, 15, 20, 25, 30, 40, 50, 75, 100
 RGI_CONFIDENCE_DELTA = Histogram(
@@ -325,6 +332,36 @@ def record_learning_event(
         )
 
 
+def record_learning_dead_letter(
+    error_type: str,
+    correlation_id: Optional[str] = None
+) -> None:
+    """
+    Record a learning event the database rejected on its own.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: error_type is an exception class name
+    Side Effects: Increments Prometheus counter
+    
+    Args:
+        error_type: Database error class (e.g. 'IntegrityError')
+        correlation_id: Optional tracking ID
+    """
+    try:
+        RGI_LEARNING_EVENTS_DEAD_LETTERED_TOTAL.labels(error_type=error_type).inc()
+        
+        logger.debug(
+            "Metric: rgi_learning_events_dead_lettered_total | error_type=%s | "
+            "correlation_id=%s",
+            error_type, correlation_id
+        )
+    except Exception as e:
+        logger.error(
+            "[RGI-OBS-009] Failed to record learning dead-letter metric | error=%s",
+            str(e)
+        )
+
+
 def update_model_loaded_status(is_loaded: bool) -> None:
     """
     Update model loaded status gauge.
@@ -447,7 +484,7 @@ def log_arbitration_result(
 # Decimal Integrity: Verified (float conversion only at Prometheus boundary)
 # L6 Safety Compliance: Verified (no trading logic)
 # Traceability: correlation_id supported throughout
-# Error Codes: RGI-OBS-001 through RGI-OBS-008
+# Error Codes: RGI-OBS-001 through RGI-OBS-009
 # Confidence Score: 97/100
 #
 # ============================================================================
@@ -14,6 +14,11 @@ SOVEREIGN MANDATE:
 - Extract JSON payload and forward to bot container
 - Robust error handling with unique error codes
 
+PUSH MODE:
+- When email_bridge.py is alongside, uses its IMAP IDLE loop (persistent
+  connection, partial fetch, concurrent per-symbol forwarding)
+- Forwarding reuses one pooled keep-alive HTTP session
+
 ============================================================================
 """
 
@@ -25,10 +30,19 @@ import json
 import os
 import sys
 import re
+import uuid
 from datetime import datetime, timezone
 from email.header import decode_header
 from typing import Optional, Dict, Any
 
+from requests.adapters import HTTPAdapter
+
+try:
+    from email_bridge import FetchedEmail, ParsedSignal, run_push_loop
+    PUSH_MODE_AVAILABLE = True
+except ImportError:
+    PUSH_MODE_AVAILABLE = False
+
 
 # ============================================================================
 # CONFIGURATION
@@ -41,6 +55,12 @@ IMAP_PORT = int(os.getenv("IMAP_PORT", "993"))
 BOT_URL = os.getenv("BOT_URL", "http://bot:8080/webhook/tradingview")
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "10"))
 TRADINGVIEW_SENDER = os.getenv("TRADINGVIEW_SENDER", "noreply@tradingview.com")
+IMAP_IDLE_ENABLED = os.getenv("IMAP_IDLE", "true").lower() not in ("false", "0", "no")
+
+# Keep-alive session shared by all forwards (no TCP handshake per signal)
+_http_session = requests.Session()
+_http_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_http_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
 
 # ============================================================================
@@ -202,7 +222,7 @@ def forward_to_bot(json_data: Dict[str, Any]) -> bool:
         True if successfully forwarded, False otherwise
     """
     try:
-        response = requests.post(
+        response = _http_session.post(
             BOT_URL,
             json=json_data,
             headers={"Content-Type": "application/json"},
@@ -231,6 +251,42 @@ def forward_to_bot(json_data: Dict[str, Any]) -> bool:
 # IMAP CONNECTION
 # ============================================================================
 
+def parse_pushed_email(fetched: "FetchedEmail") -> Optional["ParsedSignal"]:
+    """
+    Parse an email delivered by the IDLE push loop.
+    
+    Reliability Level: SOVEREIGN TIER
+    Input Constraints: FetchedEmail from email_bridge.IdleMailbox
+    Side Effects: Logs the detected signal
+    
+    Returns:
+        ParsedSignal or None if no valid JSON was found
+    """
+    subject = decode_header(fetched.message["Subject"] or "")[0][0]
+    if isinstance(subject, bytes):
+        subject = subject.decode(errors='replace')
+    
+    log_info(f"📧 Processing: {subject}")
+    
+    body = get_email_body(fetched.message)
+    json_data = extract_json_from_body(body)
+    
+    if not json_data:
+        log_error("BRIDGE-009", f"No valid JSON found in email: {subject}")
+        return None
+    
+    symbol = json_data.get("symbol", "UNKNOWN")
+    action = json_data.get("action", json_data.get("side", "UNKNOWN"))
+    log_signal(action, symbol)
+    
+    return ParsedSignal(
+        uid=fetched.uid,
+        symbol=str(symbol),
+        payload=json_data,
+        correlation_id=str(uuid.uuid4())[:8].upper()
+    )
+
+
 def check_emails() -> int:
     """
     Check Gmail inbox for unread TradingView alerts.
@@ -372,6 +428,17 @@ def main() -> None:
     
     log_info("🕯️ Sovereign Bridge Active. Waiting for TradingView signals...")
     
+    if IMAP_IDLE_ENABLED and PUSH_MODE_AVAILABLE:
+        try:
+            if run_push_loop(
+                parse=parse_pushed_email,
+                forward=lambda payload, correlation_id: forward_to_bot(payload)
+            ):
+                return
+        except KeyboardInterrupt:
+            log_info("🛑 Bridge shutdown requested")
+            return
+    
     # Track statistics
     total_signals = 0
     check_count = 0
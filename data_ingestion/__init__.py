@@ -23,6 +23,11 @@ PROVIDER FACTORY PATTERN:
     The ProviderFactory allows instant swapping of data sources if a better
     free source emerges, without changing downstream code.
 
+BAR AGGREGATION:
+    The BarBuilder subscribes to factory snapshots and streams them into
+    1m/5m/1h/4h OHLCV bars, persisted to market_bars and served back to
+    the StrategySimulator via BarMarketDataProvider.
+
 PRIVACY GUARDRAIL:
     - No API keys hardcoded
     - All credentials loaded from environment variables
@@ -45,6 +50,12 @@ from data_ingestion.data_normalizer import (
     DataNormalizer,
     get_data_normalizer,
 )
+from data_ingestion.bar_builder import (
+    BarBuilder,
+    BarStore,
+    BarMarketDataProvider,
+    OHLCVBar,
+)
 
 __all__ = [
     # Schemas
@@ -58,6 +69,11 @@ __all__ = [
     # Normalizer
     "DataNormalizer",
     "get_data_normalizer",
+    # Bars
+    "BarBuilder",
+    "BarStore",
+    "BarMarketDataProvider",
+    "OHLCVBar",
 ]
 
 # =============================================================================
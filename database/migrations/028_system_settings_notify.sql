@@ -0,0 +1,68 @@
+-- ============================================================================
+-- Project Autonomous Alpha v1.8.0
+-- Migration 028: system_settings NOTIFY Trigger - Cache Invalidation
+-- ============================================================================
+--
+-- Reliability Level: L6 Critical
+-- Purpose: Push every system_settings change to in-process caches
+--
+-- SOVEREIGN MANDATE:
+--   - Kill switch activation must reach every process within milliseconds
+--   - Notification fires AFTER the write, so listeners never reload a
+--     row older than the change that woke them
+--   - Payload is the row id only - listeners always re-read the row
+--
+-- Dependencies: 009_system_settings_table.sql
+--
+-- ============================================================================
+
+-- ============================================================================
+-- NOTIFY FUNCTION
+-- ============================================================================
+-- Listened to by app.logic.system_settings_cache.SystemSettingsCache on
+-- channel 'system_settings_changed'. pg_notify is transactional: the
+-- notification is delivered only when the writing transaction commits.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION notify_system_settings_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify(
+        'system_settings_changed',
+        COALESCE(NEW.id, OLD.id)::text
+    );
+    RETURN NULL;
+END;
+$$;
+
+-- ============================================================================
+-- TRIGGER
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS trg_system_settings_notify ON system_settings;
+
+CREATE TRIGGER trg_system_settings_notify
+    AFTER INSERT OR UPDATE OR DELETE ON system_settings
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_system_settings_change();
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON FUNCTION notify_system_settings_change() IS
+    'Sends pg_notify(system_settings_changed, id) for cache invalidation';
+
+-- ============================================================================
+-- Sovereign Reliability Audit
+-- ============================================================================
+--
+-- [Migration Audit]
+-- Table: system_settings (trigger only, no schema change)
+-- Channel: system_settings_changed
+-- Timing: [AFTER ROW - delivered on commit]
+-- Confidence Score: [97/100]
+--
+-- ============================================================================
@@ -0,0 +1,82 @@
+-- ============================================================================
+-- Project Autonomous Alpha v1.8.0
+-- Migration 029: Canonicalization Cache - Content-Addressed DSL Results
+-- ============================================================================
+--
+-- Reliability Level: L6 Critical
+-- Purpose: Skip the MCP llm_parse_to_dsl round-trip for scripts that were
+--          already canonicalized
+--
+-- SOVEREIGN MANDATE:
+--   - cache_key = SHA-256 of (canonicalizer version, title, text, code)
+--   - Only MCP-validated DSL is stored - never fallback parses
+--   - First write wins (INSERT ... ON CONFLICT DO NOTHING); rows are
+--     never updated, a new CANONICALIZER_VERSION produces new keys
+--
+-- Dependencies: None (standalone table)
+--
+-- ============================================================================
+
+-- ============================================================================
+-- CANONICALIZATION CACHE TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS canonicalization_cache (
+    -- Content hash key (services.canonicalization_cache.compute_canonicalization_key)
+    cache_key TEXT PRIMARY KEY,
+
+    -- CANONICALIZER_VERSION that produced the entry
+    canonicalizer_version TEXT NOT NULL,
+
+    -- Strategy identifier at time of canonicalization
+    strategy_id TEXT NOT NULL,
+
+    -- Validated CanonicalDSL JSON (re-validated on read)
+    dsl_json JSONB NOT NULL,
+
+    -- Extraction confidence score (0.0000 - 1.0000)
+    extraction_confidence DECIMAL(5,4) NOT NULL
+        CHECK (extraction_confidence >= 0 AND extraction_confidence <= 1),
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Version index for pruning entries from retired canonicalizer versions
+CREATE INDEX IF NOT EXISTS idx_canonicalization_cache_version
+    ON canonicalization_cache(canonicalizer_version);
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE canonicalization_cache IS
+    'Strategy Ingestion Pipeline: MCP-validated CanonicalDSL keyed by content hash';
+
+COMMENT ON COLUMN canonicalization_cache.cache_key IS
+    'canon_ + SHA-256 of [canonicalizer_version, title, text_snippet, code_snippet]';
+
+COMMENT ON COLUMN canonicalization_cache.canonicalizer_version IS
+    'services.canonicalizer.CANONICALIZER_VERSION - old versions can be pruned';
+
+-- ============================================================================
+-- GRANT PERMISSIONS TO app_trading
+-- ============================================================================
+-- No UPDATE: entries are immutable, first write wins.
+
+GRANT SELECT, INSERT ON canonicalization_cache TO app_trading;
+
+-- ============================================================================
+-- Sovereign Reliability Audit
+-- ============================================================================
+--
+-- [Migration Audit]
+-- Table: canonicalization_cache
+-- Key: [SHA-256 content hash, version-scoped]
+-- Decimal Integrity: [Verified - DECIMAL(5,4) for extraction_confidence]
+-- Confidence Score: [96/100]
+--
+-- ============================================================================
@@ -0,0 +1,220 @@
+-- ============================================================================
+-- Project Autonomous Alpha v1.8.0
+-- Migration 030: Position Balances - Running Per-Currency Ledger
+-- ============================================================================
+--
+-- Reliability Level: SOVEREIGN TIER (Mission-Critical)
+-- Purpose: Give ReconciliationEngine the DB-side net position per currency
+--          without a SUM over trading_orders on every check
+--
+-- SOVEREIGN MANDATE:
+--   - One row per currency, updated in the same transaction as the fill
+--   - Each row is seeded from an exchange balance snapshot (the anchor,
+--     written by ReconciliationEngine); balance = anchor + fills since,
+--     so opening balances, deposits and withdrawals before the anchor
+--     are part of the ledger. Re-anchor after a deposit or withdrawal.
+--   - trading_orders is insert-only (AUD-010/011), so every fill row is
+--     applied exactly once by the AFTER INSERT trigger
+--   - Only real fills count: FILLED / PARTIALLY_FILLED with is_mock = FALSE;
+--     a PARTIALLY_FILLED row counts filled_qty only, never the order quantity
+--   - Base currency moves by +/- filled quantity, quote currency by
+--     -/+ filled quantity x fill price, minus the taker fee
+--     (system_settings.taker_fee_percent of the fill notional)
+--
+-- Dependencies: 008_trading_orders_table.sql, 009_system_settings_table.sql,
+--               010_institutional_audit_columns.sql
+--
+-- ============================================================================
+
+-- ============================================================================
+-- POSITION BALANCES TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS position_balances (
+    -- Currency code (e.g., 'BTC', 'ZAR')
+    currency VARCHAR(10) PRIMARY KEY,
+
+    -- Anchor balance plus all fills applied since the anchor
+    balance DECIMAL(28,10) NOT NULL DEFAULT 0,
+
+    -- Number of fills applied to this currency since the anchor
+    fill_count BIGINT NOT NULL DEFAULT 0,
+
+    -- Last trading_orders.id applied (MAX(id) at anchor time)
+    last_order_row_id BIGINT,
+
+    -- Exchange total balance snapshot the ledger was seeded from
+    anchor_balance DECIMAL(28,10),
+    anchored_at TIMESTAMPTZ,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- PAIR SPLIT
+-- ============================================================================
+-- Mirrors app.exchange.position_ledger.split_pair: the quote currency is
+-- the longest known suffix, separators are ignored.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION position_split_pair(p_pair TEXT)
+RETURNS TEXT[]
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    normalized TEXT;
+    quote TEXT;
+BEGIN
+    normalized := upper(regexp_replace(p_pair, '[^A-Za-z0-9]', '', 'g'));
+
+    FOREACH quote IN ARRAY ARRAY['USDC', 'USDT', 'ZAR', 'BTC', 'USD'] LOOP
+        IF length(normalized) > length(quote) AND right(normalized, length(quote)) = quote THEN
+            RETURN ARRAY[left(normalized, length(normalized) - length(quote)), quote];
+        END IF;
+    END LOOP;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ============================================================================
+-- APPLY FUNCTION
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION position_balances_apply(
+    p_currency TEXT,
+    p_delta DECIMAL,
+    p_row_id BIGINT
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO position_balances (currency, balance, fill_count, last_order_row_id, updated_at)
+    VALUES (p_currency, p_delta, 1, p_row_id, NOW())
+    ON CONFLICT (currency) DO UPDATE SET
+        balance = position_balances.balance + EXCLUDED.balance,
+        fill_count = position_balances.fill_count + 1,
+        last_order_row_id = EXCLUDED.last_order_row_id,
+        updated_at = NOW();
+END;
+$$;
+
+-- ============================================================================
+-- FILL TRIGGER
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION trading_orders_apply_position()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    currencies TEXT[];
+    qty DECIMAL;
+    price DECIMAL;
+    notional DECIMAL;
+    fee_rate DECIMAL;
+    direction DECIMAL;
+BEGIN
+    IF NEW.is_mock OR NEW.status NOT IN ('FILLED', 'PARTIALLY_FILLED') THEN
+        RETURN NULL;
+    END IF;
+
+    currencies := position_split_pair(NEW.pair);
+    IF currencies IS NULL THEN
+        RAISE WARNING 'position_balances: unknown pair % (row %)', NEW.pair, NEW.id;
+        RETURN NULL;
+    END IF;
+
+    -- A partial fill books what was filled, never the order quantity
+    IF NEW.status = 'FILLED' THEN
+        qty := COALESCE(NEW.filled_qty, NEW.quantity);
+    ELSE
+        qty := NEW.filled_qty;
+    END IF;
+    IF qty IS NULL THEN
+        RAISE WARNING 'position_balances: partial fill without filled_qty (row %)', NEW.id;
+        RETURN NULL;
+    END IF;
+
+    price := COALESCE(NEW.avg_fill_price, NEW.execution_price);
+    direction := CASE WHEN NEW.side = 'BUY' THEN 1 ELSE -1 END;
+    fee_rate := COALESCE(
+        (SELECT taker_fee_percent FROM system_settings WHERE id = 1), 0
+    );
+
+    PERFORM position_balances_apply(currencies[1], direction * qty, NEW.id);
+
+    IF price IS NOT NULL THEN
+        notional := qty * price;
+    ELSIF NEW.status = 'FILLED' AND NEW.zar_value IS NOT NULL THEN
+        notional := NEW.zar_value;
+    ELSE
+        notional := NULL;
+    END IF;
+
+    -- Fees are charged in the quote currency
+    IF notional IS NOT NULL THEN
+        PERFORM position_balances_apply(
+            currencies[2], -direction * notional - notional * fee_rate, NEW.id
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_trading_orders_apply_position ON trading_orders;
+
+CREATE TRIGGER trg_trading_orders_apply_position
+    AFTER INSERT ON trading_orders
+    FOR EACH ROW
+    EXECUTE FUNCTION trading_orders_apply_position();
+
+-- ============================================================================
+-- ANCHOR
+-- ============================================================================
+-- No backfill from order history: fills alone have no opening balance,
+-- deposits or withdrawals. ReconciliationEngine seeds each currency from
+-- the exchange total balance (PositionLedger.anchor) on its first pass:
+--
+--   INSERT INTO position_balances (currency, balance, fill_count,
+--       last_order_row_id, anchor_balance, anchored_at, updated_at)
+--   VALUES (:currency, :balance, 0, (SELECT MAX(id) FROM trading_orders),
+--       :balance, :now, :now)
+--   ON CONFLICT (currency) DO UPDATE SET ...
+-- ============================================================================
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+
+COMMENT ON TABLE position_balances IS
+    'Running net position per currency, maintained by trg_trading_orders_apply_position';
+
+COMMENT ON COLUMN position_balances.balance IS
+    'anchor_balance + signed fill deltas (net of fees) since anchored_at';
+
+COMMENT ON COLUMN position_balances.anchor_balance IS
+    'Exchange total balance snapshot the ledger was seeded from';
+
+-- ============================================================================
+-- GRANT PERMISSIONS TO app_trading
+-- ============================================================================
+-- Writes happen through the trigger (runs as the inserting role) and the
+-- anchor upsert from ReconciliationEngine.
+
+GRANT SELECT, INSERT, UPDATE ON position_balances TO app_trading;
+
+-- ============================================================================
+-- Sovereign Reliability Audit
+-- ============================================================================
+--
+-- [Migration Audit]
+-- Table: position_balances
+-- Trigger: trg_trading_orders_apply_position (AFTER INSERT, same transaction)
+-- Decimal Integrity: [Verified - DECIMAL(28,10) balances]
+-- Confidence Score: [95/100]
+--
+-- ============================================================================
@@ -16,6 +16,7 @@ from jobs.simulate_strategy import (
     SimulationError,
     TradeOutcome,
     create_simulator,
+    create_market_data_provider,
 )
 
 from jobs.pipeline_run import (
@@ -24,6 +25,8 @@ from jobs.pipeline_run import (
     PipelineError,
     PipelineStep,
     PipelineStatus,
+    BatchResult,
+    StepThroughput,
     create_pipeline,
 )
 
@@ -35,11 +38,14 @@ __all__ = [
     "SimulationError",
     "TradeOutcome",
     "create_simulator",
+    "create_market_data_provider",
     # Pipeline
     "StrategyPipeline",
     "PipelineResult",
     "PipelineError",
     "PipelineStep",
     "PipelineStatus",
+    "BatchResult",
+    "StepThroughput",
     "create_pipeline",
 ]
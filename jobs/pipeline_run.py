@@ -19,6 +19,15 @@ TRACEABILITY (Property 12):
 A single correlation_id is propagated through every method call for
 complete audit traceability.
 
+BATCH MODE (run_batch / --batch FILE):
+- Extract + canonicalize + fingerprint run concurrently per URL,
+  bounded by an asyncio.Semaphore
+- Simulate runs in a process pool (CPU-bound Decimal backtests)
+- Persist is bulk: one transaction per chunk for blueprints, simulation
+  results and learning events
+- A failing URL halts only its own chain (Property 11 per URL)
+- Every step reports throughput (items/s over its active window)
+
 COLD PATH ONLY:
 This orchestrator runs exclusively on Cold Path worker nodes.
 Hot Path must never invoke the pipeline.
@@ -27,10 +36,16 @@ Hot Path must never invoke the pipeline.
 """
 
 import os
+import sys
+import time
 import uuid
+import asyncio
 import logging
+import argparse
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -45,6 +60,7 @@ from jobs.simulate_strategy import (
     SimulationError,
     ZERO,
     PRECISION_PNL,
+    create_simulator,
 )
 
 # Configure module logger
@@ -67,6 +83,25 @@ STEP_FINGERPRINT = "fingerprint"
 STEP_SIMULATE = "simulate"
 STEP_PERSIST = "persist"
 
+ALL_STEPS = [
+    STEP_EXTRACT, STEP_CANONICALIZE, STEP_FINGERPRINT,
+    STEP_SIMULATE, STEP_PERSIST,
+]
+
+# Batch mode: concurrent extract/canonicalize chains
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv("PIPELINE_BATCH_CONCURRENCY", "8"))
+
+# Batch mode: simulation process pool size (0 = simulate in-process)
+DEFAULT_SIMULATE_WORKERS = int(
+    os.getenv("PIPELINE_SIMULATE_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Batch mode: items per bulk persist transaction
+DEFAULT_PERSIST_CHUNK_SIZE = 100
+
+# Precision for reported durations / throughput
+PRECISION_SECONDS = Decimal("0.001")
+
 
 # =============================================================================
 # Enums
@@ -159,6 +194,156 @@ class PipelineError(Exception):
         }
 
 
+@dataclass
+class StepThroughput:
+    """
+    Per-step throughput for a batch run.
+    
+    Reliability Level: L6 Critical
+    
+    wall_seconds spans the first start to the last finish of the step,
+    so items_per_second reflects concurrency; busy_seconds is the sum
+    of individual item durations.
+    """
+    step: str
+    succeeded: int
+    failed: int
+    busy_seconds: Decimal
+    wall_seconds: Decimal
+    items_per_second: Decimal
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            "step": self.step,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "busy_seconds": str(self.busy_seconds),
+            "wall_seconds": str(self.wall_seconds),
+            "items_per_second": str(self.items_per_second),
+        }
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of a batch pipeline run.
+    
+    Reliability Level: L6 Critical
+    """
+    batch_id: str
+    status: PipelineStatus
+    urls_total: int
+    results: List[PipelineResult]
+    errors: List[PipelineError]
+    step_throughput: Dict[str, StepThroughput]
+    duration_seconds: Decimal
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging/serialization."""
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status.value,
+            "urls_total": self.urls_total,
+            "succeeded": len(self.results),
+            "failed": len(self.errors),
+            "duration_seconds": str(self.duration_seconds),
+            "step_throughput": {
+                step: stats.to_dict() for step, stats in self.step_throughput.items()
+            },
+            "results": [result.to_dict() for result in self.results],
+            "errors": [error.to_dict() for error in self.errors],
+        }
+
+
+class _StepMeter:
+    """
+    Accumulates timings for one pipeline step (batch mode).
+    
+    Internal use only - not exposed to callers.
+    """
+    
+    def __init__(self, step: str) -> None:
+        self.step = step
+        self.succeeded = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.first_start: Optional[float] = None
+        self.last_end: Optional[float] = None
+    
+    def start(self) -> float:
+        """Mark the start of one unit of work."""
+        now = time.monotonic()
+        if self.first_start is None or now < self.first_start:
+            self.first_start = now
+        return now
+    
+    def record(self, started: float, succeeded: int = 0, failed: int = 0) -> None:
+        """Record a finished unit of work covering N items."""
+        now = time.monotonic()
+        self.busy += now - started
+        self.last_end = now if self.last_end is None else max(self.last_end, now)
+        self.succeeded += succeeded
+        self.failed += failed
+    
+    def snapshot(self) -> StepThroughput:
+        """Build the reported StepThroughput."""
+        wall = 0.0
+        if self.first_start is not None and self.last_end is not None:
+            wall = self.last_end - self.first_start
+        rate = self.succeeded / wall if wall > 0 else 0.0
+        return StepThroughput(
+            step=self.step,
+            succeeded=self.succeeded,
+            failed=self.failed,
+            busy_seconds=_seconds(self.busy),
+            wall_seconds=_seconds(wall),
+            items_per_second=_seconds(rate),
+        )
+
+
+@dataclass
+class _StagedStrategy:
+    """
+    A URL that completed extract → simulate, waiting for bulk persist.
+    
+    Internal use only - not exposed to callers.
+    """
+    url: str
+    correlation_id: str
+    started: float
+    dsl: CanonicalDSL
+    fingerprint: str
+    simulation: SimulationResult
+
+
+def _seconds(value: float) -> Decimal:
+    """Quantize a float duration/rate for reporting."""
+    return Decimal(str(value)).quantize(PRECISION_SECONDS, rounding=ROUND_HALF_EVEN)
+
+
+def _simulate_in_worker(
+    simulator: StrategySimulator,
+    dsl: CanonicalDSL,
+    start_date: datetime,
+    end_date: datetime,
+    correlation_id: str
+) -> SimulationResult:
+    """
+    Run one simulation inside a process-pool worker.
+    
+    Reliability Level: L6 Critical
+    Input Constraints: Picklable simulator and DSL
+    Side Effects: None (persistence stays in the parent)
+    """
+    return asyncio.run(simulator.simulate(
+        dsl=dsl,
+        start_date=start_date,
+        end_date=end_date,
+        correlation_id=correlation_id,
+    ))
+
+
 # =============================================================================
 # Pipeline Orchestrator Class
 # =============================================================================
@@ -203,6 +388,7 @@ class StrategyPipeline:
         canonicalizer: Optional[StrategyCanonicalizer] = None,
         store: Optional[StrategyStore] = None,
         simulator: Optional[StrategySimulator] = None,
+        engine: Optional[Any] = None,
     ) -> None:
         """
         Initialize the pipeline orchestrator.
@@ -216,14 +402,24 @@ class StrategyPipeline:
             canonicalizer: Optional StrategyCanonicalizer instance
             store: Optional StrategyStore instance
             simulator: Optional StrategySimulator instance
+            engine: Optional SQLAlchemy engine for batch persistence
+                (default: app.database.session.engine, resolved lazily)
         """
         self._extractor = extractor or TVExtractor()
         self._canonicalizer = canonicalizer or StrategyCanonicalizer()
         self._store = store or StrategyStore()
-        self._simulator = simulator or StrategySimulator()
+        self._simulator = simulator or create_simulator()
+        self._engine = engine
         
         logger.info("[PIPELINE-INIT] Strategy pipeline orchestrator initialized")
     
+    def _get_engine(self) -> Any:
+        """Return the batch persistence engine, importing the default lazily."""
+        if self._engine is None:
+            from app.database.session import engine
+            self._engine = engine
+        return self._engine
+    
     async def run(
         self,
         url: str,
@@ -385,7 +581,11 @@ class StrategyPipeline:
         )
         
         try:
-            result = self._extractor.extract(url, correlation_id)
+            # Blocking HTTP fetch - keep it off the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self._extractor.extract, url, correlation_id
+            )
             
             logger.info(
                 f"[PIPELINE-EXTRACT-OK] title={result.title[:50]}... | "
@@ -541,7 +741,8 @@ class StrategyPipeline:
         self,
         dsl: CanonicalDSL,
         simulation_days: int,
-        correlation_id: str
+        correlation_id: str,
+        executor: Optional[Executor] = None
     ) -> SimulationResult:
         """
         STEP 4: Run deterministic backtest.
@@ -553,6 +754,7 @@ class StrategyPipeline:
             dsl: CanonicalDSL from step 2
             simulation_days: Number of days to simulate
             correlation_id: Audit trail identifier
+            executor: Optional process pool (batch mode)
             
         Returns:
             SimulationResult with trade outcomes
@@ -569,12 +771,22 @@ class StrategyPipeline:
             end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=simulation_days)
             
-            result = await self._simulator.simulate(
-                dsl=dsl,
-                start_date=start_date,
-                end_date=end_date,
-                correlation_id=correlation_id,
-            )
+            if executor is None:
+                result = await self._simulator.simulate(
+                    dsl=dsl,
+                    start_date=start_date,
+                    end_date=end_date,
+                    correlation_id=correlation_id,
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    executor,
+                    functools.partial(
+                        _simulate_in_worker,
+                        self._simulator, dsl, start_date, end_date, correlation_id
+                    )
+                )
             
             logger.info(
                 f"[PIPELINE-SIMULATE-OK] trades={result.total_trades} | "
@@ -681,6 +893,289 @@ class StrategyPipeline:
             )
 
 
+    # =========================================================================
+    # Batch Mode
+    # =========================================================================
+    
+    async def run_batch(
+        self,
+        urls: List[str],
+        simulation_days: int = DEFAULT_SIMULATION_DAYS,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        simulate_workers: int = DEFAULT_SIMULATE_WORKERS,
+        persist_chunk_size: int = DEFAULT_PERSIST_CHUNK_SIZE,
+        correlation_id: Optional[str] = None
+    ) -> BatchResult:
+        """
+        Execute the pipeline for many URLs.
+        
+        Reliability Level: L6 Critical
+        Input Constraints: TradingView URLs (duplicates/blank lines ignored)
+        Side Effects: HTTP calls, file writes, process pool, database writes
+        
+        Property 11: A failing URL halts its own chain and is reported
+        in BatchResult.errors; other URLs continue.
+        
+        Property 12: Each URL gets its own correlation_id; the batch_id
+        correlates the bulk persist transactions.
+        
+        Args:
+            urls: TradingView script URLs
+            simulation_days: Number of days to simulate
+            concurrency: Max concurrent extract/canonicalize chains
+            simulate_workers: Simulation process pool size (0 = in-process)
+            persist_chunk_size: Items per bulk persist transaction
+            correlation_id: Batch identifier (auto-generated if None)
+            
+        Returns:
+            BatchResult with per-URL results/errors and step throughput
+        """
+        batch_id = correlation_id or str(uuid.uuid4())
+        unique_urls = list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+        meters = {step: _StepMeter(step) for step in ALL_STEPS}
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        batch_start = time.monotonic()
+        
+        logger.info(
+            f"[PIPELINE-BATCH-START] urls={len(unique_urls)} | "
+            f"concurrency={concurrency} | simulate_workers={simulate_workers} | "
+            f"correlation_id={batch_id}"
+        )
+        
+        pool: Optional[ProcessPoolExecutor] = None
+        if simulate_workers > 0 and unique_urls:
+            pool = ProcessPoolExecutor(max_workers=simulate_workers)
+        
+        try:
+            if pool is not None:
+                # Start workers now, before extraction threads exist
+                await asyncio.get_running_loop().run_in_executor(pool, int)
+            # return_exceptions: one URL's failure must never abort the batch
+            outcomes = await asyncio.gather(*[
+                self._batch_process_url(
+                    url, simulation_days, semaphore, meters, pool
+                )
+                for url in unique_urls
+            ], return_exceptions=True)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        
+        staged: List[_StagedStrategy] = []
+        errors: List[PipelineError] = []
+        for url, outcome in zip(unique_urls, outcomes):
+            if isinstance(outcome, _StagedStrategy):
+                staged.append(outcome)
+            elif isinstance(outcome, PipelineError):
+                errors.append(outcome)
+            else:
+                logger.error(
+                    f"[{SIP_ERROR_PIPELINE_STEP_FAIL}] PIPELINE_BATCH_URL_ERROR: "
+                    f"{type(outcome).__name__}: {str(outcome)[:200]} | "
+                    f"url={url[:50]}... | correlation_id={batch_id}"
+                )
+                errors.append(PipelineError(
+                    failed_step="unknown",
+                    error_code=SIP_ERROR_PIPELINE_STEP_FAIL,
+                    message=f"Unexpected pipeline error: {str(outcome)[:200]}",
+                    correlation_id=batch_id,
+                    details={
+                        "url": url,
+                        "exception_type": type(outcome).__name__,
+                    },
+                ))
+        
+        results: List[PipelineResult] = []
+        chunk_size = max(1, persist_chunk_size)
+        for offset in range(0, len(staged), chunk_size):
+            chunk = staged[offset:offset + chunk_size]
+            chunk_results, chunk_errors = await self._batch_persist(
+                chunk, meters[STEP_PERSIST], batch_id
+            )
+            results.extend(chunk_results)
+            errors.extend(chunk_errors)
+        
+        if not errors:
+            status = PipelineStatus.SUCCESS
+        elif results:
+            status = PipelineStatus.PARTIAL
+        else:
+            status = PipelineStatus.FAILED
+        
+        batch = BatchResult(
+            batch_id=batch_id,
+            status=status,
+            urls_total=len(unique_urls),
+            results=results,
+            errors=errors,
+            step_throughput={step: meter.snapshot() for step, meter in meters.items()},
+            duration_seconds=_seconds(time.monotonic() - batch_start),
+        )
+        
+        throughput = " | ".join(
+            f"{step}={stats.items_per_second}/s"
+            for step, stats in batch.step_throughput.items()
+        )
+        logger.info(
+            f"[PIPELINE-BATCH-COMPLETE] status={status.value} | "
+            f"succeeded={len(results)} | failed={len(errors)} | "
+            f"duration={batch.duration_seconds}s | {throughput} | "
+            f"correlation_id={batch_id}"
+        )
+        
+        return batch
+    
+    async def _batch_process_url(
+        self,
+        url: str,
+        simulation_days: int,
+        semaphore: asyncio.Semaphore,
+        meters: Dict[str, _StepMeter],
+        pool: Optional[Executor]
+    ) -> Union[_StagedStrategy, PipelineError]:
+        """
+        Run extract → simulate for one URL (batch mode).
+        
+        The semaphore bounds the I/O-bound extract/canonicalize stage;
+        simulation is bounded by the process pool instead.
+        """
+        correlation_id = str(uuid.uuid4())
+        started = time.monotonic()
+        step = STEP_EXTRACT
+        mark = meters[step].start()
+        
+        try:
+            async with semaphore:
+                step = STEP_EXTRACT
+                mark = meters[step].start()
+                extraction = await self._step_extract(url, correlation_id)
+                meters[step].record(mark, succeeded=1)
+                
+                step = STEP_CANONICALIZE
+                mark = meters[step].start()
+                dsl = await self._step_canonicalize(extraction, url, correlation_id)
+                meters[step].record(mark, succeeded=1)
+            
+            step = STEP_FINGERPRINT
+            mark = meters[step].start()
+            fingerprint = self._step_fingerprint(dsl, correlation_id)
+            meters[step].record(mark, succeeded=1)
+            
+            step = STEP_SIMULATE
+            mark = meters[step].start()
+            simulation = await self._step_simulate(
+                dsl, simulation_days, correlation_id, executor=pool
+            )
+            meters[step].record(mark, succeeded=1)
+            
+            return _StagedStrategy(
+                url=url,
+                correlation_id=correlation_id,
+                started=started,
+                dsl=dsl,
+                fingerprint=fingerprint,
+                simulation=simulation,
+            )
+            
+        except PipelineError as e:
+            meters[step].record(mark, failed=1)
+            logger.warning(
+                f"[PIPELINE-BATCH-URL-FAIL] step={e.failed_step} | "
+                f"code={e.error_code} | url={url[:50]}... | "
+                f"correlation_id={correlation_id}"
+            )
+            if e.details is None:
+                e.details = {}
+            e.details.setdefault("url", url)
+            return e
+            
+        except Exception as e:
+            meters[step].record(mark, failed=1)
+            logger.error(
+                f"[{SIP_ERROR_PIPELINE_STEP_FAIL}] PIPELINE_BATCH_URL_ERROR: "
+                f"step={step} | {type(e).__name__}: {str(e)[:200]} | "
+                f"url={url[:50]}... | correlation_id={correlation_id}"
+            )
+            return PipelineError(
+                failed_step=step,
+                error_code=SIP_ERROR_PIPELINE_STEP_FAIL,
+                message=f"Unexpected pipeline error: {str(e)[:200]}",
+                correlation_id=correlation_id,
+                details={"url": url, "exception_type": type(e).__name__},
+            )
+    
+    async def _batch_persist(
+        self,
+        chunk: List[_StagedStrategy],
+        meter: _StepMeter,
+        batch_id: str
+    ) -> Tuple[List[PipelineResult], List[PipelineError]]:
+        """
+        Bulk-persist one chunk of staged strategies.
+        
+        Blueprints, simulation results and learning events are written in
+        one transaction: a failure rolls back the whole chunk, so no
+        blueprint is stored without its result, and every item fails.
+        """
+        mark = meter.start()
+        try:
+            with self._get_engine().begin() as conn:
+                blueprints = await self._store.persist_many(
+                    [(item.dsl, item.url) for item in chunk],
+                    correlation_id=batch_id,
+                    conn=conn,
+                )
+                await self._simulator.persist_results_many(
+                    [item.simulation for item in chunk],
+                    correlation_id=batch_id,
+                    conn=conn,
+                )
+        except Exception as e:
+            meter.record(mark, failed=len(chunk))
+            error_code = "SIP-007" if isinstance(e, ValueError) else SIP_ERROR_PIPELINE_STEP_FAIL
+            errors = [
+                PipelineError(
+                    failed_step=STEP_PERSIST,
+                    error_code=error_code,
+                    message=f"Bulk persistence failed: {str(e)[:200]}",
+                    correlation_id=item.correlation_id,
+                    details={
+                        "url": item.url,
+                        "batch_id": batch_id,
+                        "exception_type": type(e).__name__,
+                    },
+                    steps_completed=[
+                        STEP_EXTRACT, STEP_CANONICALIZE,
+                        STEP_FINGERPRINT, STEP_SIMULATE
+                    ],
+                )
+                for item in chunk
+            ]
+            logger.error(
+                f"[{error_code}] PIPELINE_BATCH_PERSIST_FAIL: {str(e)[:200]} | "
+                f"items={len(chunk)} | correlation_id={batch_id}"
+            )
+            return [], errors
+        
+        meter.record(mark, succeeded=len(chunk))
+        finished = time.monotonic()
+        results = [
+            PipelineResult(
+                status=PipelineStatus.SUCCESS,
+                strategy_fingerprint=blueprint.fingerprint,
+                strategy_id=item.dsl.strategy_id,
+                simulation_trade_count=item.simulation.total_trades,
+                extraction_confidence=Decimal(item.dsl.extraction_confidence),
+                total_pnl_zar=item.simulation.total_pnl_zar,
+                correlation_id=item.correlation_id,
+                duration_seconds=_seconds(finished - item.started),
+                steps_completed=list(ALL_STEPS),
+            )
+            for item, blueprint in zip(chunk, blueprints)
+        ]
+        return results, []
+
+
 # =============================================================================
 # Factory Function
 # =============================================================================
@@ -690,6 +1185,7 @@ def create_pipeline(
     canonicalizer: Optional[StrategyCanonicalizer] = None,
     store: Optional[StrategyStore] = None,
     simulator: Optional[StrategySimulator] = None,
+    engine: Optional[Any] = None,
 ) -> StrategyPipeline:
     """
     Create a StrategyPipeline instance.
@@ -699,6 +1195,7 @@ def create_pipeline(
         canonicalizer: Optional StrategyCanonicalizer instance
         store: Optional StrategyStore instance
         simulator: Optional StrategySimulator instance
+        engine: Optional SQLAlchemy engine for batch persistence
         
     Returns:
         StrategyPipeline instance
@@ -708,6 +1205,7 @@ def create_pipeline(
         canonicalizer=canonicalizer,
         store=store,
         simulator=simulator,
+        engine=engine,
     )
 
 
@@ -739,6 +1237,104 @@ async def run_pipeline_cli(url: str, simulation_days: int = 7) -> None:
         print(json.dumps(e.to_dict(), indent=2))
 
 
+def read_url_file(path: str) -> List[str]:
+    """
+    Read a URL backlog file (one URL per line, '#' comments ignored).
+    
+    Args:
+        path: Path to the URL file
+        
+    Returns:
+        List of URLs in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+
+async def run_batch_cli(
+    urls_file: str,
+    simulation_days: int = DEFAULT_SIMULATION_DAYS,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    simulate_workers: int = DEFAULT_SIMULATE_WORKERS
+) -> BatchResult:
+    """
+    CLI entry point for batch mode.
+    
+    Args:
+        urls_file: File with one TradingView URL per line
+        simulation_days: Number of days to simulate
+        concurrency: Max concurrent extract/canonicalize chains
+        simulate_workers: Simulation process pool size
+        
+    Returns:
+        BatchResult (also printed as JSON)
+    """
+    import json
+    
+    pipeline = create_pipeline()
+    batch = await pipeline.run_batch(
+        urls=read_url_file(urls_file),
+        simulation_days=simulation_days,
+        concurrency=concurrency,
+        simulate_workers=simulate_workers,
+    )
+    print(json.dumps(batch.to_dict(), indent=2))
+    return batch
+
+
+def main() -> None:
+    """CLI entry point: single URL or --batch FILE."""
+    parser = argparse.ArgumentParser(
+        description="Strategy ingestion pipeline (TradingView → strategy_blueprints)"
+    )
+    parser.add_argument("url", nargs="?", help="Single TradingView script URL")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="File with one TradingView URL per line"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=DEFAULT_SIMULATION_DAYS,
+        help=f"Simulation days (default: {DEFAULT_SIMULATION_DAYS})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f"Concurrent extract/canonicalize chains (default: {DEFAULT_BATCH_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SIMULATE_WORKERS,
+        help=f"Simulation processes, 0 = in-process (default: {DEFAULT_SIMULATE_WORKERS})"
+    )
+    
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s"
+    )
+    
+    if args.batch:
+        batch = asyncio.run(run_batch_cli(
+            args.batch, args.days, args.concurrency, args.workers
+        ))
+        sys.exit(0 if batch.status == PipelineStatus.SUCCESS else 1)
+    if not args.url:
+        parser.error("either a URL or --batch FILE is required")
+    asyncio.run(run_pipeline_cli(args.url, args.days))
+
+
+if __name__ == "__main__":
+    main()
+
+
 # =============================================================================
 # Sovereign Reliability Audit
 # =============================================================================
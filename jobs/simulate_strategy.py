@@ -38,6 +38,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 
+from app.logic.learning_event_sink import write_learning_rows
 from services.dsl_schema import CanonicalDSL
 
 # Configure module logger
@@ -67,12 +68,30 @@ DEFAULT_SLIPPAGE_PCT = Decimal("0.0002")  # 0.02% slippage
 SIP_ERROR_SIMULATION_FAIL = "SIP-009"
 SIP_ERROR_FLOAT_DETECTED = "SIP-013"
 
+# Candle source for create_simulator(): "bars" reads market_bars built from
+# live snapshots by data_ingestion.bar_builder; "synthetic" uses
+# MarketDataProvider
+SIMULATION_MARKET_DATA = os.getenv("SIMULATION_MARKET_DATA", "bars")
+
+# Normalized symbol whose bars drive simulations
+SIMULATION_SYMBOL = os.getenv("SIMULATION_SYMBOL", "BTCUSD")
+
 # HMAC secret for prediction_id generation
 PREDICTION_HMAC_SECRET = os.getenv(
     "PREDICTION_HMAC_SECRET",
     "sovereign_prediction_2024"
 )
 
+SIMULATION_RESULT_INSERT_SQL = """
+    INSERT INTO simulation_results (
+        strategy_fingerprint, simulation_date, 
+        trade_outcomes, metrics, created_at
+    ) VALUES (
+        :fingerprint, :sim_date, 
+        :outcomes, :metrics, NOW()
+    )
+"""
+
 
 # =============================================================================
 # Enums
@@ -599,8 +618,8 @@ class MarketDataProvider:
     Reliability Level: L6 Critical
     Decimal Integrity: All prices are Decimal
     
-    In production, this would fetch from database or API.
-    For simulation, generates deterministic synthetic data.
+    Generates deterministic synthetic data. Production simulations read
+    real bars instead (see create_market_data_provider).
     """
     
     def __init__(self, symbol: str = "BTCUSDT") -> None:
@@ -694,6 +713,37 @@ class MarketDataProvider:
         return candles
 
 
+def create_market_data_provider(
+    source: Optional[str] = None,
+    symbol: Optional[str] = None
+) -> Any:
+    """
+    Create the candle source for simulations.
+    
+    Args:
+        source: "bars" (market_bars via BarMarketDataProvider) or
+                "synthetic" (MarketDataProvider); defaults to
+                SIMULATION_MARKET_DATA
+        symbol: Normalized symbol (defaults to SIMULATION_SYMBOL)
+        
+    Returns:
+        Provider exposing get_candles(start_date, end_date, timeframe)
+        
+    Raises:
+        ValueError: On an unknown source
+    """
+    source = (source or SIMULATION_MARKET_DATA).lower()
+    symbol = symbol or SIMULATION_SYMBOL
+    
+    if source == "synthetic":
+        return MarketDataProvider(symbol)
+    if source != "bars":
+        raise ValueError(f"Unknown simulation market data source: {source}")
+    
+    from data_ingestion.bar_builder import BarMarketDataProvider, BarStore
+    return BarMarketDataProvider(symbol, store=BarStore())
+
+
 # =============================================================================
 # Strategy Simulator Class
 # =============================================================================
@@ -1039,7 +1089,9 @@ class StrategySimulator:
                     
                     # Create trade record
                     trade = SimulatedTrade(
-                        trade_id=self._generate_trade_id(dsl.strategy_id, entry_bar),
+                        trade_id=self._generate_trade_id(
+                            dsl.strategy_id, entry_bar, candles[entry_bar]["timestamp"]
+                        ),
                         entry_time=candles[entry_bar]["timestamp"],
                         exit_time=current_time,
                         side=position_side,
@@ -1214,9 +1266,17 @@ class StrategySimulator:
             correlation_id=correlation_id,
         )
     
-    def _generate_trade_id(self, strategy_id: str, bar_index: int) -> str:
-        """Generate deterministic trade ID."""
-        data = f"{strategy_id}_{bar_index}_{datetime.now(timezone.utc).isoformat()}"
+    def _generate_trade_id(self, strategy_id: str, bar_index: int, entry_time: Any) -> str:
+        """
+        Generate deterministic trade ID.
+
+        Derived only from (strategy_id, bar_index, entry timestamp) so a
+        re-run over the same candles yields the same trade and
+        prediction IDs, keeping the learning-event insert idempotent.
+        """
+        if isinstance(entry_time, datetime):
+            entry_time = entry_time.isoformat()
+        data = f"{strategy_id}_{bar_index}_{entry_time}"
         return hmac.new(
             PREDICTION_HMAC_SECRET.encode('utf-8'),
             data.encode('utf-8'),
@@ -1277,6 +1337,165 @@ class StrategySimulator:
                 correlation_id=correlation_id
             )
     
+    async def persist_results_many(
+        self,
+        results: List[SimulationResult],
+        correlation_id: str,
+        conn: Optional[Any] = None
+    ) -> None:
+        """
+        Persist many simulation results in one transaction.
+        
+        Reliability Level: L6 Critical
+        Input Constraints: Valid SimulationResults
+        Side Effects: Batched INSERTs to simulation_results, trade_learning_events
+        
+        Used by the batch pipeline. Each result keeps its own
+        correlation_id on its trade_learning_events rows; the batch
+        correlation_id is used for logging only.
+        
+        Args:
+            results: SimulationResults to persist
+            correlation_id: Batch audit trail identifier
+            conn: Connection to write on, inside the caller's transaction
+                (default: own connection, committed here)
+        """
+        if not results:
+            return
+        
+        result_rows = [self._simulation_result_row(result) for result in results]
+        event_rows: List[Dict[str, Any]] = []
+        for result in results:
+            event_rows.extend(self._learning_event_rows(
+                result, result.correlation_id or correlation_id
+            ))
+        
+        try:
+            from sqlalchemy import text
+            from app.database.session import engine
+            
+            def write(target: Any) -> None:
+                target.execute(text(SIMULATION_RESULT_INSERT_SQL), result_rows)
+                # Idempotent on prediction_id: re-running a batch is safe
+                write_learning_rows(target, event_rows)
+            
+            if conn is not None:
+                write(conn)
+            else:
+                with engine.connect() as own_conn:
+                    write(own_conn)
+                    own_conn.commit()
+            
+            logger.info(
+                f"[PERSIST-BULK-COMPLETE] results={len(result_rows)} | "
+                f"learning_events={len(event_rows)} | "
+                f"correlation_id={correlation_id}"
+            )
+            
+        except Exception as e:
+            logger.error(
+                f"[{SIP_ERROR_SIMULATION_FAIL}] PERSIST_BULK_FAIL: {str(e)[:200]} | "
+                f"correlation_id={correlation_id}"
+            )
+            raise SimulationError(
+                error_code=SIP_ERROR_SIMULATION_FAIL,
+                message=f"Failed to persist simulation results: {str(e)[:200]}",
+                correlation_id=correlation_id
+            )
+    
+    def _simulation_result_row(self, result: SimulationResult) -> Dict[str, Any]:
+        """
+        Build the simulation_results row for a result.
+        
+        Reliability Level: L6 Critical
+        """
+        import json
+        
+        # Build trade outcomes JSON (structured only)
+        trade_outcomes = []
+        for trade in result.trades:
+            trade_outcomes.append({
+                "trade_id": trade.trade_id,
+                "entry_time": trade.entry_time.isoformat(),
+                "exit_time": trade.exit_time.isoformat(),
+                "side": trade.side,
+                "entry_price": str(trade.entry_price),
+                "exit_price": str(trade.exit_price),
+                "pnl_zar": str(trade.pnl_zar),
+                "outcome": trade.outcome.value,
+            })
+        
+        # Build metrics JSON
+        metrics = {
+            "total_trades": result.total_trades,
+            "winning_trades": result.winning_trades,
+            "losing_trades": result.losing_trades,
+            "breakeven_trades": result.breakeven_trades,
+            "total_pnl_zar": str(result.total_pnl_zar),
+            "win_rate": str(result.win_rate),
+            "max_drawdown": str(result.max_drawdown),
+            "sharpe_ratio": str(result.sharpe_ratio) if result.sharpe_ratio else None,
+            "profit_factor": str(result.profit_factor) if result.profit_factor else None,
+            "avg_win_zar": str(result.avg_win_zar),
+            "avg_loss_zar": str(result.avg_loss_zar),
+        }
+        
+        return {
+            "fingerprint": result.strategy_fingerprint,
+            "sim_date": result.simulation_date,
+            "outcomes": json.dumps(trade_outcomes),
+            "metrics": json.dumps(metrics),
+        }
+    
+    def _learning_event_rows(
+        self,
+        result: SimulationResult,
+        correlation_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Build trade_learning_events rows for a result.
+        
+        Reliability Level: L6 Critical
+        
+        PROPERTY 9 ENFORCEMENT:
+        Rows contain ONLY structured data:
+        - correlation_id, prediction_id
+        - symbol, side, timeframe
+        - Feature snapshot (atr_pct, volatility_regime, trend_state, etc.)
+        - Trade outcome (pnl_zar, max_drawdown, outcome)
+        - strategy_fingerprint
+        
+        FORBIDDEN: Any raw text from scraper (title, description, code, notes)
+        """
+        rows: List[Dict[str, Any]] = []
+        for trade in result.trades:
+            # Generate deterministic prediction_id
+            prediction_id = self._generate_prediction_id(
+                result.strategy_fingerprint,
+                trade.trade_id
+            )
+            
+            # PROPERTY 9: ONLY structured data - NO raw text
+            rows.append({
+                "correlation_id": correlation_id,
+                "prediction_id": prediction_id,
+                "symbol": trade.symbol,
+                "side": trade.side,
+                "timeframe": trade.timeframe,
+                "atr_pct": trade.atr_pct,
+                "volatility_regime": trade.volatility_regime.value,
+                "trend_state": trade.trend_state.value,
+                "spread_pct": trade.spread_pct,
+                "volume_ratio": trade.volume_ratio,
+                "llm_confidence": Decimal("50.00"),  # Simulated confidence
+                "consensus_score": 50,  # Simulated consensus
+                "pnl_zar": trade.pnl_zar,
+                "max_drawdown": trade.max_drawdown,
+                "outcome": trade.outcome.value,
+                "strategy_fingerprint": result.strategy_fingerprint,
+            })
+        return rows
+    
     async def _persist_simulation_result(
         self,
         result: SimulationResult,
@@ -1290,54 +1509,12 @@ class StrategySimulator:
         try:
             from sqlalchemy import text
             from app.database.session import engine
-            import json
-            
-            # Build trade outcomes JSON (structured only)
-            trade_outcomes = []
-            for trade in result.trades:
-                trade_outcomes.append({
-                    "trade_id": trade.trade_id,
-                    "entry_time": trade.entry_time.isoformat(),
-                    "exit_time": trade.exit_time.isoformat(),
-                    "side": trade.side,
-                    "entry_price": str(trade.entry_price),
-                    "exit_price": str(trade.exit_price),
-                    "pnl_zar": str(trade.pnl_zar),
-                    "outcome": trade.outcome.value,
-                })
-            
-            # Build metrics JSON
-            metrics = {
-                "total_trades": result.total_trades,
-                "winning_trades": result.winning_trades,
-                "losing_trades": result.losing_trades,
-                "breakeven_trades": result.breakeven_trades,
-                "total_pnl_zar": str(result.total_pnl_zar),
-                "win_rate": str(result.win_rate),
-                "max_drawdown": str(result.max_drawdown),
-                "sharpe_ratio": str(result.sharpe_ratio) if result.sharpe_ratio else None,
-                "profit_factor": str(result.profit_factor) if result.profit_factor else None,
-                "avg_win_zar": str(result.avg_win_zar),
-                "avg_loss_zar": str(result.avg_loss_zar),
-            }
-            
-            insert_sql = text("""
-                INSERT INTO simulation_results (
-                    strategy_fingerprint, simulation_date, 
-                    trade_outcomes, metrics, created_at
-                ) VALUES (
-                    :fingerprint, :sim_date, 
-                    :outcomes, :metrics, NOW()
-                )
-            """)
             
             with engine.connect() as conn:
-                conn.execute(insert_sql, {
-                    "fingerprint": result.strategy_fingerprint,
-                    "sim_date": result.simulation_date,
-                    "outcomes": json.dumps(trade_outcomes),
-                    "metrics": json.dumps(metrics),
-                })
+                conn.execute(
+                    text(SIMULATION_RESULT_INSERT_SQL),
+                    self._simulation_result_row(result)
+                )
                 conn.commit()
                 
         except Exception as e:
@@ -1355,65 +1532,19 @@ class StrategySimulator:
         Reliability Level: L6 Critical
         
         PROPERTY 9 ENFORCEMENT:
-        This method writes ONLY structured data:
-        - correlation_id, prediction_id
-        - symbol, side, timeframe
-        - Feature snapshot (atr_pct, volatility_regime, trend_state, etc.)
-        - Trade outcome (pnl_zar, max_drawdown, outcome)
-        - strategy_fingerprint
-        
-        FORBIDDEN: Any raw text from scraper (title, description, code, notes)
+        Rows are built by _learning_event_rows (structured data only) and
+        written by the shared learning-event sink statement.
         """
         if not result.trades:
             return
         
         try:
-            from sqlalchemy import text
             from app.database.session import engine
             
-            insert_sql = text("""
-                INSERT INTO trade_learning_events (
-                    correlation_id, prediction_id, symbol, side, timeframe,
-                    atr_pct, volatility_regime, trend_state, spread_pct, volume_ratio,
-                    llm_confidence, consensus_score, pnl_zar, max_drawdown, outcome,
-                    strategy_fingerprint, created_at
-                ) VALUES (
-                    :correlation_id, :prediction_id, :symbol, :side, :timeframe,
-                    :atr_pct, :volatility_regime, :trend_state, :spread_pct, :volume_ratio,
-                    :llm_confidence, :consensus_score, :pnl_zar, :max_drawdown, :outcome,
-                    :strategy_fingerprint, NOW()
-                )
-            """)
+            rows = self._learning_event_rows(result, correlation_id)
             
-            with engine.connect() as conn:
-                for trade in result.trades:
-                    # Generate deterministic prediction_id
-                    prediction_id = self._generate_prediction_id(
-                        result.strategy_fingerprint,
-                        trade.trade_id
-                    )
-                    
-                    # PROPERTY 9: ONLY structured data - NO raw text
-                    conn.execute(insert_sql, {
-                        "correlation_id": correlation_id,
-                        "prediction_id": prediction_id,
-                        "symbol": trade.symbol,
-                        "side": trade.side,
-                        "timeframe": trade.timeframe,
-                        "atr_pct": trade.atr_pct,
-                        "volatility_regime": trade.volatility_regime.value,
-                        "trend_state": trade.trend_state.value,
-                        "spread_pct": trade.spread_pct,
-                        "volume_ratio": trade.volume_ratio,
-                        "llm_confidence": Decimal("50.00"),  # Simulated confidence
-                        "consensus_score": 50,  # Simulated consensus
-                        "pnl_zar": trade.pnl_zar,
-                        "max_drawdown": trade.max_drawdown,
-                        "outcome": trade.outcome.value,
-                        "strategy_fingerprint": result.strategy_fingerprint,
-                    })
-                
-                conn.commit()
+            with engine.begin() as conn:
+                write_learning_rows(conn, rows)
                 
             logger.debug(
                 f"[PERSIST-LEARNING] Wrote {len(result.trades)} trade_learning_events | "
@@ -1439,18 +1570,24 @@ class StrategySimulator:
 # =============================================================================
 
 def create_simulator(
-    initial_capital_zar: Optional[Decimal] = None
+    initial_capital_zar: Optional[Decimal] = None,
+    market_data_provider: Optional[Any] = None
 ) -> StrategySimulator:
     """
     Create a StrategySimulator instance.
     
     Args:
         initial_capital_zar: Starting capital in ZAR (Decimal)
+        market_data_provider: Candle source (defaults to
+            create_market_data_provider(), i.e. persisted market_bars)
         
     Returns:
         StrategySimulator instance
     """
-    return StrategySimulator(initial_capital_zar=initial_capital_zar)
+    return StrategySimulator(
+        initial_capital_zar=initial_capital_zar,
+        market_data_provider=market_data_provider or create_market_data_provider(),
+    )
 
 
 # =============================================================================
@@ -0,0 +1,143 @@
+"""
+============================================================================
+Project Autonomous Alpha v1.8.0
+Sentiment Keyword Matcher Benchmark
+============================================================================
+
+Reliability Level: STANDARD (Diagnostic tool)
+Input Constraints: None (corpus is generated, seeded)
+Side Effects: CPU only, prints a report
+
+PURPOSE
+-------
+Compares the precompiled single-pass KEYWORD_MATCHER against the previous
+per-keyword re.findall loop over a large synthetic news corpus, checks
+that both produce identical counts, and reports throughput.
+
+USAGE
+-----
+    python scripts/benchmark_sentiment_matcher.py
+    python scripts/benchmark_sentiment_matcher.py --snippets 50000 --assets 40
+
+============================================================================
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.sentiment_harvester import (  # noqa: E402
+    KEYWORD_MATCHER,
+    NEGATIVE_KEYWORDS,
+    POSITIVE_KEYWORDS,
+    SentimentHarvester,
+    SourceType,
+    TextSnippet,
+)
+
+FILLER_WORDS = (
+    "the price of gold moved as traders watched central bank guidance "
+    "while analysts said volumes were thin ahead of the weekly close and "
+    "miners reported output figures for the quarter"
+).split()
+
+
+def legacy_count(text: str) -> Tuple[int, int]:
+    """Per-keyword findall loop used before KEYWORD_MATCHER."""
+    text_lower = text.lower()
+    positive_count = 0
+    negative_count = 0
+    for keyword in POSITIVE_KEYWORDS:
+        positive_count += len(re.findall(
+            r'\b' + re.escape(keyword) + r'\b', text_lower
+        ))
+    for keyword in NEGATIVE_KEYWORDS:
+        negative_count += len(re.findall(
+            r'\b' + re.escape(keyword) + r'\b', text_lower
+        ))
+    return positive_count, negative_count
+
+
+def build_corpus(snippet_count: int, seed: int) -> List[str]:
+    """Headline-sized snippets, roughly one keyword per eight words."""
+    rng = random.Random(seed)
+    keywords = sorted(POSITIVE_KEYWORDS | NEGATIVE_KEYWORDS)
+    corpus = []
+    for _ in range(snippet_count):
+        words = []
+        for _ in range(rng.randint(12, 40)):
+            if rng.random() < 0.125:
+                words.append(rng.choice(keywords).upper() if rng.random() < 0.2
+                             else rng.choice(keywords))
+            else:
+                words.append(rng.choice(FILLER_WORDS))
+        corpus.append(" ".join(words) + rng.choice([".", "!", "?", ""]))
+    return corpus
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sentiment keyword matching")
+    parser.add_argument("--snippets", type=int, default=20000)
+    parser.add_argument("--assets", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.snippets, args.seed)
+    chars = sum(len(t) for t in corpus)
+    print(f"Corpus: {len(corpus):,} snippets, {chars / 1e6:.1f} MB")
+
+    started = time.perf_counter()
+    legacy = [legacy_count(t) for t in corpus]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matched = [KEYWORD_MATCHER.count(t) for t in corpus]
+    matcher_seconds = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(legacy, matched) if a != b)
+
+    by_asset = {}  # type: Dict[str, List[TextSnippet]]
+    for i, text in enumerate(corpus):
+        by_asset.setdefault(f"ASSET{i % args.assets}", []).append(
+            TextSnippet(text=text, source=SourceType.NEWS)
+        )
+    harvester = SentimentHarvester()
+    started = time.perf_counter()
+    harvester.calculate_sentiment_batch(by_asset, correlation_id="benchmark")
+    batch_seconds = time.perf_counter() - started
+
+    rows = [
+        ("Legacy per-keyword findall", f"{legacy_seconds:8.3f}s "
+         f"({len(corpus) / legacy_seconds:,.0f} snippets/s)"),
+        ("Single-pass matcher", f"{matcher_seconds:8.3f}s "
+         f"({len(corpus) / matcher_seconds:,.0f} snippets/s)"),
+        (f"Batch scoring ({args.assets} assets)", f"{batch_seconds:8.3f}s"),
+        ("Speedup", f"{legacy_seconds / matcher_seconds:8.1f}x"),
+        ("Count mismatches", f"{mismatches}"),
+    ]
+    for label, value in rows:
+        print(f"{label:<28}: {value}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# =============================================================================
+# Sovereign Reliability Audit
+# =============================================================================
+# Mock/Placeholder Check: [CLEAN - seeded synthetic corpus, no network]
+# NAS 3.8 Compatibility: [Verified - typing.Dict/List/Tuple]
+# GitHub Data Sanitization: [Safe for Public]
+# Confidence Score: [96/100]
+# =============================================================================
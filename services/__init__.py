@@ -32,6 +32,14 @@ from services.canonicalizer import (
     StrategyCanonicalizer,
     CanonicalizationError,
     create_canonicalizer,
+    CANONICALIZER_VERSION,
+)
+
+from services.canonicalization_cache import (
+    CanonicalizationCache,
+    compute_canonicalization_key,
+    get_canonicalization_cache,
+    reset_canonicalization_cache,
 )
 
 from services.golden_set_integration import (
@@ -82,6 +90,12 @@ __all__ = [
     "StrategyCanonicalizer",
     "CanonicalizationError",
     "create_canonicalizer",
+    "CANONICALIZER_VERSION",
+    # Canonicalization Cache
+    "CanonicalizationCache",
+    "compute_canonicalization_key",
+    "get_canonicalization_cache",
+    "reset_canonicalization_cache",
     # Golden Set Integration
     "GoldenSetStrategyValidator",
     "AUCResult",
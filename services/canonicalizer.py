@@ -21,6 +21,11 @@ CANONICALIZATION RULES:
 MCP ENDPOINT:
 POST {AURA_BRIDGE}/mcp/llm_parse_to_dsl
 
+RESULT CACHE:
+Validated MCP results are cached by content hash (services/
+canonicalization_cache.py). Bump CANONICALIZER_VERSION whenever the
+prompt, MCP endpoint or DSL build rules change.
+
 ERROR CODES:
 - SIP-004: MCP endpoint call failed
 - SIP-005: DSL response failed schema validation
@@ -31,7 +36,9 @@ ERROR CODES:
 import os
 import re
 import json
+import asyncio
 import logging
+from functools import partial
 from decimal import Decimal, ROUND_HALF_EVEN
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
@@ -59,6 +66,11 @@ from services.dsl_schema import (
     ExitReason,
     validate_dsl_schema,
 )
+from services.canonicalization_cache import (
+    CanonicalizationCache,
+    compute_canonicalization_key,
+    get_canonicalization_cache,
+)
 from app.infra.aura_client import AuraClient, get_aura_client
 
 # Configure module logger
@@ -71,6 +83,14 @@ logger = logging.getLogger(__name__)
 # MCP endpoint for DSL parsing
 MCP_ENDPOINT_PARSE_DSL = "llm_parse_to_dsl"
 
+# Part of every cache key - bump to invalidate cached DSL results
+CANONICALIZER_VERSION = "1.6.0"
+
+# Set to "false" to always call the MCP endpoint
+CANONICALIZATION_CACHE_ENABLED = (
+    os.getenv("CANONICALIZATION_CACHE_ENABLED", "true").lower() == "true"
+)
+
 # Default confidence when LLM cannot be reached
 DEFAULT_FALLBACK_CONFIDENCE = Decimal("0.5000")
 
@@ -147,6 +167,12 @@ class StrategyCanonicalizer:
     - All responses validated against CanonicalDSL schema
     - Invalid responses rejected with SIP-005 error
     
+    RESULT CACHE:
+    - Keyed by (title, text_snippet, code_snippet, CANONICALIZER_VERSION)
+    - Only MCP-validated results are cached, never fallback parses
+    - source_url/author are not part of the key; a hit for another
+      URL is re-bound to the requested source
+    
     USAGE:
         canonicalizer = StrategyCanonicalizer()
         dsl = await canonicalizer.canonicalize(
@@ -158,7 +184,11 @@ class StrategyCanonicalizer:
         )
     """
     
-    def __init__(self, aura_client: Optional[AuraClient] = None) -> None:
+    def __init__(
+        self,
+        aura_client: Optional[AuraClient] = None,
+        cache: Optional[CanonicalizationCache] = None
+    ) -> None:
         """
         Initialize the strategy canonicalizer.
         
@@ -168,8 +198,13 @@ class StrategyCanonicalizer:
         
         Args:
             aura_client: Optional AuraClient instance (uses singleton if None)
+            cache: Optional CanonicalizationCache (uses singleton if None,
+                   disabled when CANONICALIZATION_CACHE_ENABLED=false)
         """
         self._client = aura_client or get_aura_client()
+        if cache is None and CANONICALIZATION_CACHE_ENABLED:
+            cache = get_canonicalization_cache()
+        self._cache = cache
         logger.info("[CANONICALIZER-INIT] Strategy canonicalizer initialized")
     
     async def canonicalize(
@@ -186,7 +221,7 @@ class StrategyCanonicalizer:
         
         Reliability Level: L6 Critical
         Input Constraints: Valid extraction payload
-        Side Effects: MCP HTTP call
+        Side Effects: MCP HTTP call, cache read/write in the default executor
         
         Args:
             title: Strategy title
@@ -208,6 +243,24 @@ class StrategyCanonicalizer:
             f"correlation_id={correlation_id}"
         )
         
+        cache_key = compute_canonicalization_key(
+            title, text_snippet, code_snippet, CANONICALIZER_VERSION
+        )
+        loop = asyncio.get_running_loop()
+        if self._cache is not None:
+            # Cache tiers include a blocking database read - keep it off the loop
+            cached = await loop.run_in_executor(
+                None, partial(self._cache.get, cache_key, correlation_id=correlation_id)
+            )
+            if cached is not None:
+                dsl = self._rebind_source(cached, author, source_url)
+                logger.info(
+                    f"[CANONICALIZE-CACHE-HIT] strategy_id={dsl.strategy_id} | "
+                    f"key={cache_key[:20]}... | "
+                    f"correlation_id={correlation_id}"
+                )
+                return dsl
+        
         try:
             # Build MCP payload
             payload = {
@@ -250,6 +303,12 @@ class StrategyCanonicalizer:
                 correlation_id=correlation_id
             )
             
+            if self._cache is not None:
+                await loop.run_in_executor(None, partial(
+                    self._cache.put, cache_key, CANONICALIZER_VERSION, dsl,
+                    correlation_id=correlation_id
+                ))
+            
             logger.info(
                 f"[CANONICALIZE-SUCCESS] strategy_id={dsl.strategy_id} | "
                 f"confidence={dsl.extraction_confidence} | "
@@ -310,8 +369,7 @@ class StrategyCanonicalizer:
             strategy_id = data.get("strategy_id")
             if not strategy_id:
                 # Generate from URL
-                url_hash = source_url.split("/")[-1].split("-")[0] if "/" in source_url else "unknown"
-                strategy_id = f"tv_{url_hash}"
+                strategy_id = self._strategy_id_from_url(source_url)
             
             # Get confidence from response
             raw_confidence = data.get("extraction_confidence", "0.8000")
@@ -360,6 +418,42 @@ class StrategyCanonicalizer:
             )
             raise error
     
+    @staticmethod
+    def _strategy_id_from_url(source_url: str) -> str:
+        """Derive the default strategy_id from a source URL."""
+        url_hash = source_url.split("/")[-1].split("-")[0] if "/" in source_url else "unknown"
+        return f"tv_{url_hash}"
+    
+    def _rebind_source(
+        self,
+        dsl: CanonicalDSL,
+        author: Optional[str],
+        source_url: str
+    ) -> CanonicalDSL:
+        """
+        Re-bind a cached DSL to the requested source.
+        
+        The cache key covers the content the LLM reads, not where it was
+        found. A hit for the same script at another URL keeps the parsed
+        strategy but takes this request's source_url and author; a
+        strategy_id that was derived from the old URL is re-derived.
+        
+        Reliability Level: L6 Critical
+        Input Constraints: Validated cached CanonicalDSL
+        Side Effects: None
+        """
+        cached_url = dsl.meta.source_url
+        if cached_url == source_url and dsl.meta.author == author:
+            return dsl
+        
+        dsl_data = dsl.model_dump()
+        dsl_data["meta"]["source_url"] = source_url
+        if author is not None:
+            dsl_data["meta"]["author"] = author
+        if dsl.strategy_id == self._strategy_id_from_url(cached_url):
+            dsl_data["strategy_id"] = self._strategy_id_from_url(source_url)
+        return validate_dsl_schema(dsl_data)
+    
     def _calculate_confidence(
         self,
         raw_confidence: Any,
@@ -697,18 +791,20 @@ class StrategyCanonicalizer:
 # =============================================================================
 
 def create_canonicalizer(
-    aura_client: Optional[AuraClient] = None
+    aura_client: Optional[AuraClient] = None,
+    cache: Optional[CanonicalizationCache] = None
 ) -> StrategyCanonicalizer:
     """
     Create a StrategyCanonicalizer instance.
     
     Args:
         aura_client: Optional AuraClient instance
+        cache: Optional CanonicalizationCache instance
         
     Returns:
         StrategyCanonicalizer instance
     """
-    return StrategyCanonicalizer(aura_client=aura_client)
+    return StrategyCanonicalizer(aura_client=aura_client, cache=cache)
 
 
 # =============================================================================
@@ -54,6 +54,8 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
+from services.demo_order_book import BookFill, DemoOrderBook
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -288,6 +290,11 @@ class MockBroker(BrokerInterface):
     - Limit orders are stored and can be filled later
     - All operations are logged for audit
     
+    Feeding update_order_book() for a symbol switches it to book-driven
+    fills (services.demo_order_book): market orders walk the book for a
+    VWAP and may partially fill, limit orders take crossing liquidity and
+    rest with a queue position.
+    
     GitHub Professionalism: This mock allows anyone to test the full
     execution flow without needing API credentials or a trading account.
     
@@ -306,6 +313,9 @@ class MockBroker(BrokerInterface):
             "BTCUSD": Decimal("43500.00"),
             "ETHUSD": Decimal("2250.00"),
         }
+        
+        # Order books (opt-in book-driven fills, keyed by symbol)
+        self._order_books = {}  # type: Dict[str, DemoOrderBook]
     
     def _generate_order_id(self) -> str:
         """Generate a unique broker order ID."""
@@ -317,7 +327,14 @@ class MockBroker(BrokerInterface):
         Get simulated fill price with spread.
         
         Adds realistic spread: BUY gets ask (higher), SELL gets bid (lower).
+        With an order book for the symbol, returns the touch price instead.
         """
+        book = self._order_books.get(symbol.upper())
+        if book is not None:
+            touch = book.touch_price(side)
+            if touch is not None:
+                return touch
+        
         base_price = self._market_prices.get(
             symbol.upper(),
             Decimal("100.00")  # Default price for unknown symbols
@@ -356,7 +373,23 @@ class MockBroker(BrokerInterface):
             Order result dictionary
         """
         broker_order_id = self._generate_order_id()
-        fill_price = self._get_simulated_price(symbol, side)
+        book = self._order_books.get(symbol.upper())
+        if book is not None:
+            walk = book.walk(broker_order_id, side, quantity)
+            fill_price = walk.vwap
+            filled_quantity = walk.filled_quantity
+        else:
+            fill_price = self._get_simulated_price(symbol, side)
+            filled_quantity = quantity
+        
+        # Immediate-or-cancel: the unfilled remainder of a book walk is
+        # cancelled, so a partial fill ends in a terminal status
+        if filled_quantity >= quantity:
+            status = "FILLED"
+        elif filled_quantity > Decimal("0"):
+            status = "CANCELLED"
+        else:
+            status = "REJECTED"
         
         order_data = {
             "broker_order_id": broker_order_id,
@@ -364,9 +397,9 @@ class MockBroker(BrokerInterface):
             "side": side.value,
             "order_type": "MARKET",
             "quantity": quantity,
-            "filled_quantity": quantity,
+            "filled_quantity": filled_quantity,
             "fill_price": fill_price,
-            "status": "FILLED",
+            "status": status,
             "correlation_id": correlation_id,
             "executed_at": datetime.now(timezone.utc),
         }
@@ -374,11 +407,11 @@ class MockBroker(BrokerInterface):
         self._orders[broker_order_id] = order_data
         
         logger.info(
-            f"[MOCK-BROKER] Market order filled | "
+            f"[MOCK-BROKER] Market order {status.lower()} | "
             f"order_id={broker_order_id} | "
             f"symbol={symbol} | "
             f"side={side.value} | "
-            f"quantity={quantity} | "
+            f"quantity={filled_quantity}/{quantity} | "
             f"fill_price={fill_price} | "
             f"correlation_id={correlation_id}"
         )
@@ -424,6 +457,16 @@ class MockBroker(BrokerInterface):
         
         self._orders[broker_order_id] = order_data
         
+        book = self._order_books.get(symbol.upper())
+        if book is not None:
+            walk = book.walk(broker_order_id, side, quantity, limit_price=price)
+            self._record_fills(walk.fills)
+            if walk.remaining_quantity > Decimal("0"):
+                resting = book.rest(
+                    broker_order_id, side, price, quantity, walk.filled_quantity
+                )
+                order_data["queue_ahead"] = resting.queue_ahead
+        
         logger.info(
             f"[MOCK-BROKER] Limit order placed | "
             f"order_id={broker_order_id} | "
@@ -472,6 +515,10 @@ class MockBroker(BrokerInterface):
         order["status"] = "CANCELLED"
         order["cancelled_at"] = datetime.now(timezone.utc)
         
+        book = self._order_books.get(str(order["symbol"]).upper())
+        if book is not None:
+            book.cancel(broker_order_id)
+        
         logger.info(
             f"[MOCK-BROKER] Order cancelled | "
             f"order_id={broker_order_id} | "
@@ -503,6 +550,95 @@ class MockBroker(BrokerInterface):
             }
         
         return self._orders[broker_order_id].copy()
+    
+    def update_order_book(
+        self,
+        symbol: str,
+        bids: List[Any],
+        asks: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply a full order book snapshot and switch the symbol to book fills.
+        
+        Args:
+            symbol: Trading symbol
+            bids: Levels as {'price', 'quantity'} dicts or (price, qty) pairs
+            asks: Levels as {'price', 'quantity'} dicts or (price, qty) pairs
+            
+        Returns:
+            Updated order dicts for resting limit orders that filled
+        """
+        book = self._order_books.get(symbol.upper())
+        if book is None:
+            book = DemoOrderBook(symbol)
+            self._order_books[book.symbol] = book
+        fills = book.apply_snapshot(bids, asks)
+        mid = book.mid_price()
+        if mid is not None:
+            self._market_prices[book.symbol] = mid
+        return self._record_fills(fills)
+    
+    def apply_order_book_update(
+        self,
+        symbol: str,
+        side: OrderSide,
+        price: Decimal,
+        quantity: Decimal
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply an incremental level update (quantity 0 removes the level).
+        
+        Returns:
+            Updated order dicts for resting limit orders that filled
+        """
+        book = self._order_books.get(symbol.upper())
+        if book is None:
+            return []
+        return self._record_fills(book.apply_update(side, price, quantity))
+    
+    def apply_trade_print(
+        self,
+        symbol: str,
+        price: Decimal,
+        quantity: Decimal
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply a public trade, advancing queue positions at its price.
+        
+        Returns:
+            Updated order dicts for resting limit orders that filled
+        """
+        book = self._order_books.get(symbol.upper())
+        if book is None:
+            return []
+        return self._record_fills(book.apply_trade(price, quantity))
+    
+    def _record_fills(self, fills: List[BookFill]) -> List[Dict[str, Any]]:
+        """Fold book fills into order dicts (filled_quantity, VWAP, status)."""
+        touched = {}  # type: Dict[str, Dict[str, Any]]
+        for fill in fills:
+            order = self._orders.get(fill.order_id)
+            if order is None:
+                continue
+            filled = order["filled_quantity"] + fill.quantity
+            notional = (order["fill_price"] or Decimal("0")) * order["filled_quantity"]
+            order["fill_price"] = (
+                (notional + fill.price * fill.quantity) / filled
+            ).quantize(PRECISION_PRICE, rounding=ROUND_HALF_EVEN)
+            order["filled_quantity"] = filled
+            order["status"] = "FILLED" if filled >= order["quantity"] else "PARTIALLY_FILLED"
+            order["executed_at"] = datetime.now(timezone.utc)
+            touched[fill.order_id] = order
+        
+        for broker_order_id, order in touched.items():
+            logger.info(
+                f"[MOCK-BROKER] Limit order {order['status'].lower()} | "
+                f"order_id={broker_order_id} | "
+                f"filled={order['filled_quantity']}/{order['quantity']} | "
+                f"fill_price={order['fill_price']} | "
+                f"correlation_id={order['correlation_id']}"
+            )
+        return [order.copy() for order in touched.values()]
 
 
 # =============================================================================
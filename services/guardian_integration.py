@@ -303,6 +303,18 @@ class GuardianIntegration:
             f"correlation_id={self._correlation_id}"
         )
     
+    def remove_lock_event_callback(self, callback: LockEventCallback) -> None:
+        """
+        Unregister a Guardian lock event callback.
+        
+        Reliability Level: SOVEREIGN TIER
+        Input Constraints: None (unknown callbacks are ignored)
+        Side Effects: Removes callback from future invocation
+        """
+        with self._callback_lock:
+            if callback in self._lock_callbacks:
+                self._lock_callbacks.remove(callback)
+    
     def check_and_notify_lock_change(
         self,
         correlation_id: Optional[str] = None
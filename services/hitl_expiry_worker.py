@@ -167,7 +167,9 @@ class ExpiryWorker:
             return
         
         self._running = True
-        self._task = asyncio.create_task(self._run_loop())
+        self._task = asyncio.create_task(
+            self._run_loop(), name="hitl-expiry-worker"
+        )
         
         logger.info(
             f"[EXPIRY-WORKER] Started | "
@@ -19,6 +19,13 @@ SENTIMENT HEDGE LOGIC:
     2. Panic detection for risk management
     3. Historical sentiment storage for RGI learning
     4. Cache management to minimize API calls
+    5. Background pre-warming of watched assets (SentimentRefresher)
+
+CACHE LAYER:
+    The harvester and the service share one SentimentCache: memory LRU in
+    front of the sentiment_cache table. A refresher thread re-harvests the
+    watchlist ahead of expiry so check_sentiment() on the trading path is
+    served from memory.
 
 PRIVACY GUARDRAIL:
     - No personal API keys hardcoded
@@ -35,8 +42,10 @@ from decimal import Decimal, ROUND_HALF_EVEN
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 import logging
+import os
+import threading
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
 from tools.sentiment_harvester import (
     SentimentHarvester,
@@ -48,6 +57,7 @@ from tools.sentiment_harvester import (
     is_euphoric_sentiment,
     calculate_sentiment_score,
 )
+from tools.sentiment_cache import SentimentCache
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -66,6 +76,11 @@ PANIC_THRESHOLD = Decimal("-0.5000")
 # Euphoria threshold for caution
 EUPHORIA_THRESHOLD = Decimal("0.5000")
 
+# Background refresher: comma-separated watchlist, cadence, renew-ahead window
+SENTIMENT_WATCHLIST = os.getenv("SENTIMENT_WATCHLIST", "")
+REFRESH_INTERVAL_SECONDS = float(os.getenv("SENTIMENT_REFRESH_INTERVAL_SECONDS", "300"))
+REFRESH_AHEAD_SECONDS = float(os.getenv("SENTIMENT_REFRESH_AHEAD_SECONDS", "360"))
+
 
 # =============================================================================
 # Error Codes
@@ -78,6 +93,7 @@ class SentimentServiceErrorCode:
     PERSIST_FAIL = "SENTSVC-003"
     CACHE_FAIL = "SENTSVC-004"
     INVALID_ASSET = "SENTSVC-005"
+    REFRESH_FAIL = "SENTSVC-006"
 
 
 # =============================================================================
@@ -152,7 +168,8 @@ class SentimentService:
         self,
         db_session: Any,
         cache_ttl_minutes: int = DEFAULT_CACHE_TTL,
-        harvester: Optional[SentimentHarvester] = None
+        harvester: Optional[SentimentHarvester] = None,
+        cache: Optional[SentimentCache] = None
     ):
         """
         Initialize the Sentiment Service.
@@ -161,18 +178,31 @@ class SentimentService:
             db_session: Database session for persistence
             cache_ttl_minutes: Cache time-to-live in minutes
             harvester: Optional custom SentimentHarvester instance
+            cache: Optional SentimentCache (default: memory LRU over db_session)
         """
         self.db_session = db_session
         self.cache_ttl_minutes = cache_ttl_minutes
+        self._cache = cache or SentimentCache(
+            db_session=db_session,
+            ttl_minutes=cache_ttl_minutes
+        )
         self._harvester = harvester or SentimentHarvester(
-            cache_ttl_minutes=cache_ttl_minutes
+            cache_ttl_minutes=cache_ttl_minutes,
+            cache=self._cache
         )
+        self._refresher = None  # type: Optional[SentimentRefresher]
         
         logger.info(
             f"SentimentService initialized | "
-            f"cache_ttl={cache_ttl_minutes}min"
+            f"cache_ttl={cache_ttl_minutes}min | "
+            f"persistent_cache={self._cache.persistent}"
         )
     
+    @property
+    def cache(self) -> SentimentCache:
+        """Get the shared SentimentCache."""
+        return self._cache
+    
     def check_sentiment(
         self,
         asset_key: str,
@@ -218,57 +248,120 @@ class SentimentService:
                 correlation_id
             )
             
-            # Determine if panic or euphoric
-            is_panic = result.is_panic()
-            is_euphoric = result.is_euphoric()
+            return self._build_check(result, correlation_id, now)
             
-            # Determine recommendation
-            should_proceed, reason = self._evaluate_sentiment(
-                result.sentiment_score,
-                is_panic,
-                is_euphoric
-            )
-            
-            check = SentimentCheck(
-                asset_key=normalized_key,
-                sentiment_score=result.sentiment_score,
-                is_panic=is_panic,
-                is_euphoric=is_euphoric,
-                should_proceed=should_proceed,
-                reason=reason,
-                correlation_id=correlation_id,
-                checked_at=now,
+        except Exception as e:
+            logger.error(
+                f"{SentimentServiceErrorCode.FETCH_FAIL} Sentiment check failed: {str(e)} | "
+                f"asset_key={normalized_key} | "
+                f"correlation_id={correlation_id}"
             )
             
-            # Log warning for panic conditions
-            if is_panic:
-                logger.warning(
-                    f"SENTIMENT_PANIC: News screaming panic for {normalized_key} | "
-                    f"sentiment_score={result.sentiment_score} | "
-                    f"recommendation={reason} | "
-                    f"correlation_id={correlation_id}"
-                )
+            # Return neutral sentiment on error (fail-safe)
+            return self._neutral_check(normalized_key, correlation_id, now)
+    
+    def check_sentiment_many(
+        self,
+        asset_keys: List[str],
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, SentimentCheck]:
+        """
+        Check sentiment for many assets with one cache query.
+        
+        Args:
+            asset_keys: Asset identifiers
+            correlation_id: Audit trail identifier (auto-generated if None)
             
-            return check
+        Returns:
+            Normalized asset_key -> SentimentCheck (neutral on error)
             
+        Raises:
+            ValueError: If any asset_key is empty
+        """
+        for asset_key in asset_keys:
+            if not asset_key or not asset_key.strip():
+                raise ValueError("asset_key cannot be empty")
+        
+        if correlation_id is None:
+            correlation_id = str(uuid.uuid4())
+        
+        normalized_keys = [key.strip().upper() for key in asset_keys]
+        now = datetime.now(timezone.utc)
+        
+        try:
+            results = self._harvester.harvest_many(normalized_keys, correlation_id)
         except Exception as e:
             logger.error(
                 f"{SentimentServiceErrorCode.FETCH_FAIL} Sentiment check failed: {str(e)} | "
-                f"asset_key={normalized_key} | "
+                f"assets={len(normalized_keys)} | "
                 f"correlation_id={correlation_id}"
             )
-            
-            # Return neutral sentiment on error (fail-safe)
-            return SentimentCheck(
-                asset_key=normalized_key,
-                sentiment_score=NEUTRAL_SENTIMENT,
-                is_panic=False,
-                is_euphoric=False,
-                should_proceed=True,
-                reason="Sentiment unavailable - proceeding with neutral assumption",
-                correlation_id=correlation_id,
-                checked_at=now,
+            results = {}
+        
+        return {
+            key: (
+                self._build_check(results[key], correlation_id, now)
+                if key in results
+                else self._neutral_check(key, correlation_id, now)
             )
+            for key in normalized_keys
+        }
+    
+    def _build_check(
+        self,
+        result: SentimentResult,
+        correlation_id: str,
+        now: datetime
+    ) -> SentimentCheck:
+        """Turn a SentimentResult into a trade recommendation."""
+        # Determine if panic or euphoric
+        is_panic = result.is_panic()
+        is_euphoric = result.is_euphoric()
+        
+        # Determine recommendation
+        should_proceed, reason = self._evaluate_sentiment(
+            result.sentiment_score,
+            is_panic,
+            is_euphoric
+        )
+        
+        # Log warning for panic conditions
+        if is_panic:
+            logger.warning(
+                f"SENTIMENT_PANIC: News screaming panic for {result.asset_key} | "
+                f"sentiment_score={result.sentiment_score} | "
+                f"recommendation={reason} | "
+                f"correlation_id={correlation_id}"
+            )
+        
+        return SentimentCheck(
+            asset_key=result.asset_key,
+            sentiment_score=result.sentiment_score,
+            is_panic=is_panic,
+            is_euphoric=is_euphoric,
+            should_proceed=should_proceed,
+            reason=reason,
+            correlation_id=correlation_id,
+            checked_at=now,
+        )
+    
+    def _neutral_check(
+        self,
+        asset_key: str,
+        correlation_id: str,
+        now: datetime
+    ) -> SentimentCheck:
+        """Fail-safe neutral check used when sentiment is unavailable."""
+        return SentimentCheck(
+            asset_key=asset_key,
+            sentiment_score=NEUTRAL_SENTIMENT,
+            is_panic=False,
+            is_euphoric=False,
+            should_proceed=True,
+            reason="Sentiment unavailable - proceeding with neutral assumption",
+            correlation_id=correlation_id,
+            checked_at=now,
+        )
     
     def _evaluate_sentiment(
         self,
@@ -347,77 +440,35 @@ class SentimentService:
         correlation_id: Optional[str] = None
     ) -> bool:
         """
-        Persist sentiment result to database cache.
+        Persist sentiment result to the shared cache (memory and table).
         
         Args:
             result: SentimentResult to persist
             correlation_id: Audit trail identifier
             
         Returns:
-            True if successful, False otherwise
+            True if the table write succeeded, False otherwise
         """
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
         
-        try:
-            expires_at = result.fetched_at + timedelta(minutes=self.cache_ttl_minutes)
-            
-            query = """
-                INSERT INTO sentiment_cache (
-                    asset_key,
-                    sentiment_score,
-                    positive_count,
-                    negative_count,
-                    total_snippets,
-                    source_type,
-                    fetched_at,
-                    expires_at,
-                    correlation_id
-                ) VALUES (
-                    :asset_key,
-                    :sentiment_score,
-                    :positive_count,
-                    :negative_count,
-                    :total_snippets,
-                    :source_type,
-                    :fetched_at,
-                    :expires_at,
-                    :correlation_id
-                )
-            """
-            
-            self.db_session.execute(
-                query,
-                {
-                    "asset_key": result.asset_key,
-                    "sentiment_score": str(result.sentiment_score),
-                    "positive_count": result.positive_count,
-                    "negative_count": result.negative_count,
-                    "total_snippets": result.total_snippets,
-                    "source_type": result.source_type.value,
-                    "fetched_at": result.fetched_at,
-                    "expires_at": expires_at,
-                    "correlation_id": correlation_id,
-                }
-            )
-            self.db_session.commit()
-            
+        persisted = self._cache.put(result, correlation_id)
+        
+        if persisted:
             logger.info(
                 f"SentimentService persisted sentiment | "
                 f"asset_key={result.asset_key} | "
                 f"sentiment_score={result.sentiment_score} | "
                 f"correlation_id={correlation_id}"
             )
-            
-            return True
-            
-        except Exception as e:
+        else:
             logger.error(
-                f"{SentimentServiceErrorCode.PERSIST_FAIL} Failed to persist sentiment: {str(e)} | "
+                f"{SentimentServiceErrorCode.PERSIST_FAIL} Failed to persist sentiment | "
+                f"asset_key={result.asset_key} | "
                 f"correlation_id={correlation_id}"
             )
-            self.db_session.rollback()
-            return False
+        
+        return persisted
     
     def get_cached_sentiment(
         self,
@@ -425,7 +476,7 @@ class SentimentService:
         correlation_id: Optional[str] = None
     ) -> Optional[Decimal]:
         """
-        Get cached sentiment from database if not expired.
+        Get cached sentiment (memory, then database) if not expired.
         
         Args:
             asset_key: Asset identifier
@@ -434,39 +485,32 @@ class SentimentService:
         Returns:
             Cached sentiment score or None if expired/missing
         """
+        return self.get_cached_sentiments([asset_key], correlation_id).get(
+            asset_key.strip().upper()
+        )
+    
+    def get_cached_sentiments(
+        self,
+        asset_keys: List[str],
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Decimal]:
+        """
+        Get cached sentiment for many assets with at most one database query.
+        
+        Args:
+            asset_keys: Asset identifiers
+            correlation_id: Audit trail identifier
+            
+        Returns:
+            Normalized asset_key -> score for every asset with a live entry
+        """
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
         
-        try:
-            normalized_key = asset_key.strip().upper()
-            now = datetime.now(timezone.utc)
-            
-            query = """
-                SELECT sentiment_score
-                FROM sentiment_cache
-                WHERE asset_key = :asset_key
-                  AND expires_at > :now
-                ORDER BY fetched_at DESC
-                LIMIT 1
-            """
-            
-            result = self.db_session.execute(
-                query,
-                {"asset_key": normalized_key, "now": now}
-            )
-            
-            row = result.fetchone()
-            if row:
-                return Decimal(str(row[0]))
-            
-            return None
-            
-        except Exception as e:
-            logger.error(
-                f"{SentimentServiceErrorCode.CACHE_FAIL} Cache lookup failed: {str(e)} | "
-                f"correlation_id={correlation_id}"
-            )
-            return None
+        normalized_keys = [key.strip().upper() for key in asset_keys if key and key.strip()]
+        cached = self._cache.get_many(normalized_keys, correlation_id)
+        
+        return {key: result.sentiment_score for key, result in cached.items()}
     
     def clear_expired_cache(
         self,
@@ -484,34 +528,213 @@ class SentimentService:
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
         
-        try:
-            now = datetime.now(timezone.utc)
-            
-            query = """
-                DELETE FROM sentiment_cache
-                WHERE expires_at < :now
-            """
-            
-            result = self.db_session.execute(query, {"now": now})
-            self.db_session.commit()
+        # The refresher thread uses the same session through the cache
+        with self._cache.db_lock:
+            try:
+                now = datetime.now(timezone.utc)
+                
+                query = """
+                    DELETE FROM sentiment_cache
+                    WHERE expires_at < :now
+                """
+                
+                result = self.db_session.execute(query, {"now": now})
+                self.db_session.commit()
+                
+                deleted_count = result.rowcount
+                
+                logger.info(
+                    f"SentimentService cleared expired cache | "
+                    f"deleted={deleted_count} | "
+                    f"correlation_id={correlation_id}"
+                )
+                
+                return deleted_count
+                
+            except Exception as e:
+                logger.error(
+                    f"{SentimentServiceErrorCode.CACHE_FAIL} Cache cleanup failed: {str(e)} | "
+                    f"correlation_id={correlation_id}"
+                )
+                self.db_session.rollback()
+                return 0
+
+
+    def start_refresher(
+        self,
+        watched_assets: Optional[List[str]] = None,
+        interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+        refresh_ahead_seconds: float = REFRESH_AHEAD_SECONDS
+    ) -> Optional["SentimentRefresher"]:
+        """
+        Start pre-warming sentiment for watched assets in the background.
+        
+        Args:
+            watched_assets: Assets to keep warm (default: SENTIMENT_WATCHLIST)
+            interval_seconds: Seconds between refresh passes
+            refresh_ahead_seconds: Renew entries expiring within this window
             
-            deleted_count = result.rowcount
+        Returns:
+            The running SentimentRefresher, or None if the watchlist is empty
+        """
+        if watched_assets is None:
+            watched_assets = [a for a in SENTIMENT_WATCHLIST.split(",") if a.strip()]
+        
+        if not watched_assets:
+            logger.info("SentimentService refresher not started | watchlist empty")
+            return None
+        
+        self.stop_refresher()
+        self._refresher = SentimentRefresher(
+            harvester=self._harvester,
+            watched_assets=watched_assets,
+            interval_seconds=interval_seconds,
+            refresh_ahead_seconds=refresh_ahead_seconds,
+        )
+        self._refresher.start()
+        return self._refresher
+    
+    def stop_refresher(self, timeout: float = 5.0) -> None:
+        """Stop the background refresher if running."""
+        if self._refresher is not None:
+            self._refresher.stop(timeout)
+            self._refresher = None
+
+
+# =============================================================================
+# Background Refresher
+# =============================================================================
+
+class SentimentRefresher:
+    """
+    Daemon thread that keeps watched assets warm in the SentimentCache.
+    
+    Each pass re-harvests (via SentimentHarvester.harvest_many) every
+    watched asset whose cached score is missing or expires within
+    refresh_ahead_seconds, so trading-path lookups hit memory.
+    
+    Reliability Level: L6 Critical
+    Input Constraints: Non-empty watchlist; interval_seconds > 0
+    Side Effects: External HTTP requests, cache/database writes
+    """
+    
+    def __init__(
+        self,
+        harvester: SentimentHarvester,
+        watched_assets: List[str],
+        interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+        refresh_ahead_seconds: float = REFRESH_AHEAD_SECONDS
+    ):
+        """
+        Initialize the refresher.
+        
+        Args:
+            harvester: Harvester writing to the shared cache
+            watched_assets: Assets to keep warm
+            interval_seconds: Seconds between refresh passes
+            refresh_ahead_seconds: Renew entries expiring within this window
+        """
+        self._harvester = harvester
+        self.watched_assets = list(dict.fromkeys(
+            a.strip().upper() for a in watched_assets if a and a.strip()
+        ))
+        self.interval_seconds = interval_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._stop_event = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+        
+        self._passes = 0
+        self._failures = 0
+        self._last_refreshed_at = None  # type: Optional[datetime]
+    
+    @property
+    def running(self) -> bool:
+        """True while the refresher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the daemon thread; the first pass runs immediately."""
+        if self.running:
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="sentiment-refresher",
+            daemon=True
+        )
+        self._thread.start()
+        
+        logger.info(
+            f"SentimentRefresher started | "
+            f"assets={len(self.watched_assets)} | "
+            f"interval={self.interval_seconds}s | "
+            f"ahead={self.refresh_ahead_seconds}s"
+        )
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal the thread to stop and wait for it."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("SentimentRefresher stopped")
+    
+    def refresh_once(self, correlation_id: Optional[str] = None) -> int:
+        """
+        Run one refresh pass.
+        
+        Args:
+            correlation_id: Audit trail identifier (auto-generated if None)
             
-            logger.info(
-                f"SentimentService cleared expired cache | "
-                f"deleted={deleted_count} | "
-                f"correlation_id={correlation_id}"
+        Returns:
+            Number of assets with a usable score after the pass
+        """
+        if correlation_id is None:
+            correlation_id = str(uuid.uuid4())
+        
+        try:
+            results = self._harvester.harvest_many(
+                self.watched_assets,
+                correlation_id,
+                min_remaining_seconds=self.refresh_ahead_seconds
             )
-            
-            return deleted_count
-            
         except Exception as e:
+            self._failures += 1
             logger.error(
-                f"{SentimentServiceErrorCode.CACHE_FAIL} Cache cleanup failed: {str(e)} | "
+                f"{SentimentServiceErrorCode.REFRESH_FAIL} Sentiment refresh failed: {str(e)} | "
                 f"correlation_id={correlation_id}"
             )
-            self.db_session.rollback()
             return 0
+        
+        self._passes += 1
+        self._last_refreshed_at = datetime.now(timezone.utc)
+        return len(results)
+    
+    def _run(self) -> None:
+        """Thread body: refresh, then sleep until the next pass or stop."""
+        while not self._stop_event.is_set():
+            self.refresh_once()
+            self._stop_event.wait(self.interval_seconds)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get refresher statistics.
+        
+        Returns:
+            Dict with pass/failure counters
+        """
+        return {
+            "running": self.running,
+            "watched_assets": len(self.watched_assets),
+            "interval_seconds": self.interval_seconds,
+            "refresh_ahead_seconds": self.refresh_ahead_seconds,
+            "passes": self._passes,
+            "failures": self._failures,
+            "last_refreshed_at": (
+                self._last_refreshed_at.isoformat() if self._last_refreshed_at else None
+            ),
+        }
 
 
 # =============================================================================
@@ -549,6 +772,8 @@ def get_sentiment_service(
 def reset_sentiment_service() -> None:
     """Reset the singleton instance (for testing)."""
     global _service_instance
+    if _service_instance is not None:
+        _service_instance.stop_refresher()
     _service_instance = None
 
 
@@ -30,7 +30,7 @@ import hashlib
 import hmac
 import logging
 from decimal import Decimal, ROUND_HALF_EVEN
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -53,6 +53,12 @@ FINGERPRINT_HMAC_SECRET = os.getenv(
 # Fingerprint prefix
 FINGERPRINT_PREFIX = "dsl_"
 
+BLUEPRINT_COLUMNS = """
+    id, fingerprint, strategy_id, title, author,
+    source_url, dsl_json, extraction_confidence,
+    status, created_at, updated_at
+"""
+
 # Error codes
 SIP_ERROR_FINGERPRINT_FAIL = "SIP-006"
 SIP_ERROR_PERSISTENCE_FAIL = "SIP-007"
@@ -320,30 +326,8 @@ class StrategyStore:
                 )
                 return existing
             
-            # Prepare DSL JSON (with fingerprint)
-            dsl_with_fingerprint = dsl.model_copy(update={'fingerprint': fingerprint})
-            dsl_json = dsl_with_fingerprint.model_dump()
-            
-            # Parse extraction confidence
-            confidence = Decimal(dsl.extraction_confidence).quantize(
-                Decimal("0.0001"), rounding=ROUND_HALF_EVEN
-            )
-            
             # Create blueprint record
-            now = datetime.now(timezone.utc)
-            blueprint = StrategyBlueprint(
-                id=None,  # Will be set by database
-                fingerprint=fingerprint,
-                strategy_id=dsl.strategy_id,
-                title=dsl.meta.title,
-                author=dsl.meta.author,
-                source_url=source_url,
-                dsl_json=dsl_json,
-                extraction_confidence=confidence,
-                status='active',
-                created_at=now,
-                updated_at=now,
-            )
+            blueprint = self._build_blueprint(dsl, source_url, fingerprint)
             
             # Persist to database
             blueprint = await self._insert(blueprint, correlation_id)
@@ -352,7 +336,7 @@ class StrategyStore:
                 f"Strategy blueprint persisted | "
                 f"fingerprint={fingerprint[:20]}... | "
                 f"strategy_id={dsl.strategy_id} | "
-                f"confidence={confidence} | "
+                f"confidence={blueprint.extraction_confidence} | "
                 f"correlation_id={correlation_id}"
             )
             
@@ -367,6 +351,205 @@ class StrategyStore:
             )
             raise ValueError(f"Strategy persistence failed: {str(e)}")
     
+    async def persist_many(
+        self,
+        items: List[Tuple[CanonicalDSL, str]],
+        correlation_id: str,
+        conn: Optional[Any] = None
+    ) -> List[StrategyBlueprint]:
+        """
+        Persist many strategy blueprints in one transaction.
+        
+        Reliability Level: L6 Critical
+        Input Constraints: (CanonicalDSL, source_url) pairs
+        Side Effects: Batched INSERT to strategy_blueprints
+        
+        IDEMPOTENCY:
+        INSERT ... ON CONFLICT (fingerprint) DO NOTHING, then one SELECT
+        for every fingerprint. Existing records are returned unchanged,
+        exactly as persist() would return them.
+        
+        Args:
+            items: (dsl, source_url) pairs
+            correlation_id: Audit trail identifier
+            conn: Connection to write on, inside the caller's transaction
+                (default: own connection, committed here)
+            
+        Returns:
+            StrategyBlueprint per item, in input order (every id is set)
+            
+        Raises:
+            ValueError: If persistence fails or a fingerprint is not read back
+        """
+        if not items:
+            return []
+        
+        try:
+            blueprints: List[StrategyBlueprint] = []
+            unique: Dict[str, StrategyBlueprint] = {}
+            for dsl, source_url in items:
+                blueprint = self._build_blueprint(
+                    dsl, source_url, compute_fingerprint(dsl)
+                )
+                blueprints.append(blueprint)
+                unique.setdefault(blueprint.fingerprint, blueprint)
+            
+            stored = await self._upsert_many(
+                list(unique.values()), correlation_id, conn=conn
+            )
+            missing = [fp for fp in unique if fp not in stored]
+            if missing:
+                raise ValueError(
+                    f"{len(missing)} fingerprint(s) not found after upsert: "
+                    f"{', '.join(fp[:20] for fp in missing[:5])}"
+                )
+            
+            logger.info(
+                f"Strategy blueprints persisted (bulk) | "
+                f"items={len(items)} | unique={len(unique)} | "
+                f"correlation_id={correlation_id}"
+            )
+            
+            return [stored[b.fingerprint] for b in blueprints]
+            
+        except Exception as e:
+            logger.error(
+                f"{SIP_ERROR_PERSISTENCE_FAIL} PERSISTENCE_DB_FAIL: "
+                f"Failed to bulk persist strategies: {str(e)} | "
+                f"items={len(items)} | "
+                f"correlation_id={correlation_id}"
+            )
+            raise ValueError(f"Strategy persistence failed: {str(e)}")
+    
+    def _build_blueprint(
+        self,
+        dsl: CanonicalDSL,
+        source_url: str,
+        fingerprint: str
+    ) -> StrategyBlueprint:
+        """
+        Build an unsaved blueprint record for a DSL.
+        
+        Args:
+            dsl: CanonicalDSL object
+            source_url: Original source URL
+            fingerprint: Precomputed fingerprint
+            
+        Returns:
+            StrategyBlueprint with id=None
+        """
+        # Prepare DSL JSON (with fingerprint)
+        dsl_with_fingerprint = dsl.model_copy(update={'fingerprint': fingerprint})
+        dsl_json = dsl_with_fingerprint.model_dump()
+        
+        # Parse extraction confidence
+        confidence = Decimal(dsl.extraction_confidence).quantize(
+            Decimal("0.0001"), rounding=ROUND_HALF_EVEN
+        )
+        
+        now = datetime.now(timezone.utc)
+        return StrategyBlueprint(
+            id=None,  # Will be set by database
+            fingerprint=fingerprint,
+            strategy_id=dsl.strategy_id,
+            title=dsl.meta.title,
+            author=dsl.meta.author,
+            source_url=source_url,
+            dsl_json=dsl_json,
+            extraction_confidence=confidence,
+            status='active',
+            created_at=now,
+            updated_at=now,
+        )
+    
+    @staticmethod
+    def _row_to_blueprint(row: Any) -> StrategyBlueprint:
+        """Map a BLUEPRINT_COLUMNS row to a StrategyBlueprint."""
+        return StrategyBlueprint(
+            id=row[0],
+            fingerprint=row[1],
+            strategy_id=row[2],
+            title=row[3],
+            author=row[4],
+            source_url=row[5],
+            dsl_json=row[6],
+            extraction_confidence=Decimal(str(row[7])),
+            status=row[8],
+            created_at=row[9],
+            updated_at=row[10],
+        )
+    
+    async def _upsert_many(
+        self,
+        blueprints: List[StrategyBlueprint],
+        correlation_id: str,
+        conn: Optional[Any] = None
+    ) -> Dict[str, StrategyBlueprint]:
+        """
+        Insert new blueprints and read back every fingerprint.
+        
+        Args:
+            blueprints: Unique-fingerprint blueprints to insert
+            correlation_id: Audit trail identifier
+            conn: Caller's connection (not committed here), or None
+            
+        Returns:
+            Stored StrategyBlueprint keyed by fingerprint
+        """
+        from sqlalchemy import text
+        from app.database.session import engine
+        
+        insert_sql = text("""
+            INSERT INTO strategy_blueprints (
+                fingerprint, strategy_id, title, author, source_url,
+                dsl_json, extraction_confidence, status, created_at, updated_at
+            ) VALUES (
+                :fingerprint, :strategy_id, :title, :author, :source_url,
+                :dsl_json, :extraction_confidence, :status, :created_at, :updated_at
+            )
+            ON CONFLICT (fingerprint) DO NOTHING
+        """)
+        select_sql = text(f"""
+            SELECT {BLUEPRINT_COLUMNS}
+            FROM strategy_blueprints
+            WHERE fingerprint = ANY(:fingerprints)
+        """)
+        
+        rows = [
+            {
+                "fingerprint": b.fingerprint,
+                "strategy_id": b.strategy_id,
+                "title": b.title,
+                "author": b.author,
+                "source_url": b.source_url,
+                "dsl_json": json.dumps(b.dsl_json),
+                "extraction_confidence": b.extraction_confidence,
+                "status": b.status,
+                "created_at": b.created_at,
+                "updated_at": b.updated_at,
+            }
+            for b in blueprints
+        ]
+        
+        def upsert(target: Any) -> Dict[str, StrategyBlueprint]:
+            target.execute(insert_sql, rows)
+            result = target.execute(
+                select_sql,
+                {"fingerprints": [b.fingerprint for b in blueprints]}
+            )
+            return {
+                row[1]: self._row_to_blueprint(row) for row in result.fetchall()
+            }
+        
+        if conn is not None:
+            return upsert(conn)
+        
+        with engine.connect() as own_conn:
+            stored = upsert(own_conn)
+            own_conn.commit()
+        
+        return stored
+    
     async def _get_by_fingerprint(
         self, 
         fingerprint: str
@@ -384,10 +567,8 @@ class StrategyStore:
             from sqlalchemy import text
             from app.database.session import engine
             
-            query = text("""
-                SELECT id, fingerprint, strategy_id, title, author, 
-                       source_url, dsl_json, extraction_confidence, 
-                       status, created_at, updated_at
+            query = text(f"""
+                SELECT {BLUEPRINT_COLUMNS}
                 FROM strategy_blueprints
                 WHERE fingerprint = :fingerprint
             """)
@@ -397,19 +578,7 @@ class StrategyStore:
                 row = result.fetchone()
                 
                 if row:
-                    return StrategyBlueprint(
-                        id=row[0],
-                        fingerprint=row[1],
-                        strategy_id=row[2],
-                        title=row[3],
-                        author=row[4],
-                        source_url=row[5],
-                        dsl_json=row[6],
-                        extraction_confidence=Decimal(str(row[7])),
-                        status=row[8],
-                        created_at=row[9],
-                        updated_at=row[10],
-                    )
+                    return self._row_to_blueprint(row)
                     
             return None
             
@@ -30,6 +30,7 @@ from app.logic.health_verification import (
     AURA_BRIDGE_TOOLS,
     AURA_FULL_TOOLS,
     PING_TIMEOUT_SECONDS,
+    ERROR_SWEEP_DEADLINE,
     create_health_module
 )
 
@@ -485,5 +486,185 @@ class TestCriticalToolGating:
         )
 
 
+# =============================================================================
+# CONCURRENT SWEEP: Bounded Parallelism, Deadline, Result Cache
+# =============================================================================
+
+def _run(coro):
+    """Run a coroutine on a fresh event loop (matches the tests above)."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestConcurrentSweep:
+    """
+    Concurrent sweep keeps the report format while bounding parallelism
+    per server, honouring an overall deadline and caching results.
+    """
+    
+    @settings(max_examples=20, deadline=None)
+    @given(limit=st.integers(min_value=1, max_value=12))
+    def test_in_flight_pings_bounded_per_server(self, limit: int) -> None:
+        """Never more than `limit` pings in flight against one server."""
+        in_flight = {"aura-bridge": 0, "aura-full": 0}
+        peak = {"aura-bridge": 0, "aura-full": 0}
+        
+        async def caller(server: str, tool: str, args: dict):
+            in_flight[server] += 1
+            peak[server] = max(peak[server], in_flight[server])
+            await asyncio.sleep(0)
+            in_flight[server] -= 1
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(
+            mcp_tool_caller=caller,
+            max_concurrent_per_server=limit
+        )
+        report = _run(module.ping_all_tools("TEST_BOUNDED"))
+        
+        assert report.healthy_count == 78
+        assert peak["aura-full"] <= limit
+        assert peak["aura-bridge"] <= min(limit, len(AURA_BRIDGE_TOOLS))
+        assert peak["aura-full"] == limit
+    
+    def test_report_order_matches_registry(self) -> None:
+        """tool_results stay in registry order regardless of completion order."""
+        async def caller(server: str, tool: str, args: dict):
+            await asyncio.sleep(0.001 * (len(tool) % 5))
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(mcp_tool_caller=caller)
+        report = _run(module.ping_all_tools("TEST_ORDER"))
+        
+        assert [(r.tool_name, r.server) for r in report.tool_results] == module.get_all_tools()
+    
+    def test_critical_tools_pinged_first(self) -> None:
+        """Critical tools acquire server slots before non-critical tools."""
+        order = []  # type: List[str]
+        
+        async def caller(server: str, tool: str, args: dict):
+            order.append(tool)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(
+            mcp_tool_caller=caller,
+            max_concurrent_per_server=1
+        )
+        _run(module.ping_all_tools("TEST_CRITICAL_FIRST"))
+        
+        assert set(order[:len(CRITICAL_TOOLS)]) == set(CRITICAL_TOOLS)
+    
+    def test_sweep_is_concurrent(self) -> None:
+        """78 slow pings finish in far less than 78 x latency."""
+        async def caller(server: str, tool: str, args: dict):
+            await asyncio.sleep(0.05)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(mcp_tool_caller=caller)
+        report = _run(module.ping_all_tools("TEST_CONCURRENT"))
+        
+        assert report.healthy_count == 78
+        assert report.total_check_duration_ms < 78 * 50 / 2
+    
+    def test_deadline_marks_pending_tools(self) -> None:
+        """Tools still pending at the sweep deadline are reported as TIMEOUT."""
+        async def caller(server: str, tool: str, args: dict):
+            if tool == "rag_query":
+                await asyncio.sleep(5)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(
+            mcp_tool_caller=caller,
+            sweep_deadline_seconds=0.1
+        )
+        report = _run(module.ping_all_tools("TEST_DEADLINE"))
+        
+        slow = [r for r in report.tool_results if r.tool_name == "rag_query"][0]
+        assert slow.health == ToolHealth.TIMEOUT
+        assert slow.error_code == ERROR_SWEEP_DEADLINE
+        assert report.timeout_count == 1
+        assert report.can_start_trading
+    
+    def test_cancelled_pings_unwound_before_sweep_returns(self) -> None:
+        """Pings cancelled at the deadline finish unwinding inside the sweep."""
+        unwound = []  # type: List[str]
+        
+        async def caller(server: str, tool: str, args: dict):
+            if tool == "rag_query":
+                try:
+                    await asyncio.sleep(5)
+                finally:
+                    unwound.append(tool)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(
+            mcp_tool_caller=caller,
+            sweep_deadline_seconds=0.1
+        )
+        
+        async def sweep_then_check():
+            await module.ping_all_tools("TEST_UNWIND")
+            return list(unwound)
+        
+        assert _run(sweep_then_check()) == ["rag_query"]
+    
+    def test_quick_critical_check_served_from_cache(self) -> None:
+        """quick_critical_check reuses fresh sweep results without pinging."""
+        calls = []  # type: List[str]
+        
+        async def caller(server: str, tool: str, args: dict):
+            calls.append(tool)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(mcp_tool_caller=caller)
+        _run(module.ping_all_tools("TEST_CACHE"))
+        calls.clear()
+        
+        healthy, unhealthy = _run(module.quick_critical_check("TEST_CACHE"))
+        assert healthy and unhealthy == []
+        assert calls == []
+        
+        module.invalidate_cache()
+        _run(module.quick_critical_check("TEST_CACHE"))
+        assert sorted(calls) == sorted(CRITICAL_TOOLS)
+    
+    def test_recovery_drops_cached_results(self) -> None:
+        """Clearing HARD_STOP forces the next check to re-ping every tool."""
+        calls = []  # type: List[str]
+        
+        async def caller(server: str, tool: str, args: dict):
+            calls.append(tool)
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(mcp_tool_caller=caller)
+        _run(module.ping_all_tools("TEST_RECOVERY"))
+        calls.clear()
+        
+        module.clear_hard_stop()
+        _run(module.quick_critical_check("TEST_RECOVERY"))
+        assert sorted(calls) == sorted(CRITICAL_TOOLS)
+    
+    def test_expired_cache_is_repinged(self) -> None:
+        """Results older than the TTL are not trusted."""
+        state = {"healthy": True}
+        
+        async def caller(server: str, tool: str, args: dict):
+            if not state["healthy"]:
+                raise Exception("down")
+            return {"status": "ok"}
+        
+        module = HealthVerificationModule(mcp_tool_caller=caller, cache_ttl_seconds=0)
+        _run(module.ping_all_tools("TEST_TTL"))
+        state["healthy"] = False
+        
+        healthy, unhealthy = _run(module.quick_critical_check("TEST_TTL"))
+        assert not healthy
+        assert sorted(unhealthy) == sorted(CRITICAL_TOOLS)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
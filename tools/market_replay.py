@@ -0,0 +1,825 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+Project Autonomous Alpha v1.8.0
+Market Replay Harness - Deterministic End-to-End Latency Benchmark
+============================================================================
+
+Reliability Level: STANDARD (Diagnostic tool - never run against production)
+Input Constraints: JSONL recording of webhook payloads and MarketSnapshot ticks
+Side Effects: HTTP load against the target app, local stand-in HTTP server,
+              writes a JSON latency report
+
+PURPOSE
+-------
+Replays a recorded stream of TradingView webhook payloads and MarketSnapshot
+ticks into a running app at 1x/10x/100x speed and reports per-stage latency
+percentiles (p50/p95/p99) that can be diffed between commits, so hot-path
+regressions are caught before production.
+
+RECORDING FORMAT (one JSON object per line)
+-------------------------------------------
+    {"t": 0.125, "kind": "webhook", "payload": {SignalIn fields}}
+    {"t": 0.130, "kind": "tick",    "payload": {MarketSnapshot.to_dict()}}
+
+    t is seconds from the start of the recording. Events are replayed in
+    (t, line) order; webhook signal_ids are prefixed with the run id so a
+    recording can be replayed repeatedly against the same database.
+
+STAND-INS
+---------
+The harness hosts one local HTTP server replacing every external service.
+Point the app at it before starting it:
+
+    VALR_BASE_URL=http://127.0.0.1:9100         (ticker/orderbook from ticks)
+    AURA_BRIDGE_URL=http://127.0.0.1:9100       (POST /mcp/* -> success)
+    OLLAMA_BASE_URL=http://127.0.0.1:9100       (debate verdicts)
+    USE_LOCAL_OLLAMA=true
+    DISCORD_WEBHOOK_URL=http://127.0.0.1:9100/discord/webhook
+
+Each stand-in answers after a configurable fixed latency, so upstream
+latency is held constant and only the app's own time varies.
+
+The live VALR clients honour VALR_BASE_URL only when it points at a
+loopback host (bind the stand-ins to 127.0.0.1); in-process callers can
+pass base_url=standins.url to VALRClient / VALRLink instead.
+
+STAGES
+------
+Per-stage timings come from the webhook response's stage_ms (hmac, parse,
+insert, gating, risk, risk_persist, debate, debate_persist, notify), plus
+total (app processing_ms), round_trip (client observed) and schedule_lag
+(how late the harness fired events; a growing lag means the harness, not
+the app, is the bottleneck).
+
+USAGE
+-----
+    python -m tools.market_replay synth --signals 500 --ticks 5000 --out rec.jsonl
+    python -m tools.market_replay run rec.jsonl --base-url http://localhost:8080 \\
+        --speed 10 --out report.json
+    python -m tools.market_replay diff baseline.json report.json --threshold 10
+    python -m tools.market_replay standins --port 9100
+
+Exit codes: 0 = ok, 1 = regression found (diff) or replay errors, 2 = bad args
+
+============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_EVEN
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.security import SECRET_KEY_ENV_VAR, compute_hmac_signature  # noqa: E402
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+EVENT_WEBHOOK = "webhook"
+EVENT_TICK = "tick"
+
+DEFAULT_STANDIN_HOST = "127.0.0.1"
+DEFAULT_STANDIN_PORT = 9100
+DEFAULT_WEBHOOK_PATH = "/webhook/tradingview"
+DEFAULT_MAX_IN_FLIGHT = 64
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+DEFAULT_APP_WAIT_SECONDS = 60.0
+
+# Regression gate for `diff`
+DEFAULT_REGRESSION_THRESHOLD_PCT = 10.0
+DEFAULT_REGRESSION_FLOOR_MS = 0.5
+
+PERCENTILES = (50, 95, 99)
+
+# Report order; unknown stages reported by the app are appended after these
+STAGE_ORDER = (
+    "hmac", "parse", "insert", "gating", "risk", "risk_persist",
+    "debate", "debate_persist", "notify", "total", "round_trip", "schedule_lag",
+)
+
+SYNTH_SYMBOLS = {
+    "BTCZAR": Decimal("1250000"),
+    "ETHZAR": Decimal("65000"),
+}
+
+SIGNATURE_HEADER = "X-TradingView-Signature"
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+@dataclass(frozen=True)
+class ReplayEvent:
+    """One recorded webhook or tick, offset from the start of the recording."""
+    offset_seconds: float
+    kind: str
+    payload: Dict[str, Any]
+    seq: int = 0
+
+
+def load_recording(path: str) -> List[ReplayEvent]:
+    """
+    Load a JSONL recording in deterministic (t, line) order.
+
+    Raises:
+        ValueError: On an unknown event kind or malformed line
+    """
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.get("kind")
+            if kind not in (EVENT_WEBHOOK, EVENT_TICK):
+                raise ValueError(f"line {line_number}: unknown event kind {kind!r}")
+            events.append(ReplayEvent(
+                offset_seconds=float(record["t"]),
+                kind=kind,
+                payload=record["payload"],
+                seq=line_number,
+            ))
+    events.sort(key=lambda e: (e.offset_seconds, e.seq))
+    return events
+
+
+def write_recording(path: str, events: List[ReplayEvent]) -> None:
+    """Write events as a JSONL recording."""
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(
+                {"t": round(event.offset_seconds, 6), "kind": event.kind, "payload": event.payload},
+                separators=(",", ":"),
+            ) + "\n")
+
+
+def synthesize_recording(
+    signals: int,
+    ticks: int,
+    duration_seconds: float,
+    seed: int = 7
+) -> List[ReplayEvent]:
+    """
+    Build a seeded synthetic recording: a random walk per symbol sampled as
+    MarketSnapshot ticks, with webhook signals priced off the latest tick.
+
+    Identical arguments always produce identical events.
+    """
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    symbols = sorted(SYNTH_SYMBOLS)
+    prices = dict(SYNTH_SYMBOLS)
+    quantum = Decimal("0.01")
+
+    timeline = sorted(
+        [(rng.uniform(0, duration_seconds), EVENT_TICK) for _ in range(ticks)]
+        + [(rng.uniform(0, duration_seconds), EVENT_WEBHOOK) for _ in range(signals)]
+    )
+
+    events = []
+    for seq, (offset, kind) in enumerate(timeline):
+        symbol = rng.choice(symbols)
+        if kind == EVENT_TICK:
+            step = Decimal(str(round(rng.gauss(0, 0.0005), 6)))
+            prices[symbol] = (prices[symbol] * (1 + step)).quantize(quantum, ROUND_HALF_EVEN)
+            half_spread = (prices[symbol] * Decimal("0.0005")).quantize(quantum, ROUND_HALF_EVEN)
+            bid, ask = prices[symbol] - half_spread, prices[symbol] + half_spread
+            payload = {
+                "symbol": symbol,
+                "bid": str(bid),
+                "ask": str(ask),
+                "mid": str(prices[symbol]),
+                "spread": str(ask - bid),
+                "volume_24h": None,
+                "timestamp": (start + timedelta(seconds=offset)).isoformat(),
+                "provider": "MOCK",
+                "asset_class": "CRYPTO",
+                "quality": "REALTIME",
+                "correlation_id": f"replay-tick-{seq:06d}",
+            }
+        else:
+            payload = {
+                "signal_id": f"SIG-{seq:06d}",
+                "symbol": symbol,
+                "side": rng.choice(["BUY", "SELL"]),
+                "price": str(prices[symbol]),
+                "quantity": str(Decimal(rng.randint(1, 50)) / Decimal("1000")),
+            }
+        events.append(ReplayEvent(offset_seconds=offset, kind=kind, payload=payload, seq=seq))
+    return events
+
+
+# =============================================================================
+# Latency Statistics
+# =============================================================================
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 for no samples)."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, -(-len(sorted_samples) * pct // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+class LatencyRecorder:
+    """Collects millisecond samples per stage."""
+
+    def __init__(self) -> None:
+        self.samples = {}  # type: Dict[str, List[float]]
+
+    def record(self, stage: str, milliseconds: float) -> None:
+        self.samples.setdefault(stage, []).append(float(milliseconds))
+
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count, mean, p50/p95/p99 and max in milliseconds."""
+        known = [s for s in STAGE_ORDER if s in self.samples]
+        extra = sorted(s for s in self.samples if s not in STAGE_ORDER)
+        summary = {}
+        for stage in known + extra:
+            ordered = sorted(self.samples[stage])
+            row = {"count": len(ordered), "mean": round(sum(ordered) / len(ordered), 3)}
+            for pct in PERCENTILES:
+                row[f"p{pct}"] = round(percentile(ordered, pct), 3)
+            row["max"] = round(ordered[-1], 3)
+            summary[stage] = row
+        return summary
+
+
+# =============================================================================
+# Stand-in Services
+# =============================================================================
+
+class StandInServices:
+    """
+    Local HTTP stand-in for VALR, Aura MCP, Ollama and Discord.
+
+    Reliability Level: STANDARD
+    Input Constraints: Free local port (0 picks one)
+    Side Effects: Background HTTP server thread
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_STANDIN_HOST,
+        port: int = DEFAULT_STANDIN_PORT,
+        latency_ms: Optional[Dict[str, float]] = None,
+        verdict: str = "APPROVED"
+    ) -> None:
+        """
+        Args:
+            host: Bind address
+            port: Bind port (0 = ephemeral)
+            latency_ms: Fixed response latency per service
+                        ('valr', 'aura', 'ollama', 'discord')
+            verdict: Debate verdict returned by the Ollama stand-in
+        """
+        self.latency_ms = latency_ms or {}
+        self.verdict = verdict
+        self.requests = {}  # type: Dict[str, int]
+        self._tickers = {}  # type: Dict[str, Dict[str, str]]
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def environment(self) -> Dict[str, str]:
+        """Environment the app needs to talk to these stand-ins."""
+        return {
+            "VALR_BASE_URL": self.url,
+            "AURA_BRIDGE_URL": self.url,
+            "OLLAMA_BASE_URL": self.url,
+            "USE_LOCAL_OLLAMA": "true",
+            "DISCORD_WEBHOOK_URL": f"{self.url}/discord/webhook",
+        }
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="replay-standins", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def apply_tick(self, payload: Dict[str, Any]) -> None:
+        """Make a MarketSnapshot tick the current VALR ticker for its symbol."""
+        with self._lock:
+            self._tickers[str(payload["symbol"]).upper()] = {
+                "bid": str(payload["bid"]),
+                "ask": str(payload["ask"]),
+                "mid": str(payload.get("mid") or payload["bid"]),
+                "volume": str(payload.get("volume_24h") or "0"),
+            }
+
+    def ticker(self, symbol: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            return self._tickers.get(symbol.upper())
+
+    def _count(self, service: str) -> None:
+        with self._lock:
+            self.requests[service] = self.requests.get(service, 0) + 1
+
+    def _respond(self, service: str, path: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Route a request to a canned response."""
+        parts = path.strip("/").split("/")
+        if path.startswith("/v1/public/") and len(parts) >= 4:
+            ticker = self.ticker(parts[2])
+            if ticker is None:
+                return 404, {"message": f"no ticks replayed for {parts[2]}"}
+            if parts[3] == "orderbook":
+                return 200, {
+                    "Bids": [{"price": ticker["bid"], "quantity": "1"}],
+                    "Asks": [{"price": ticker["ask"], "quantity": "1"}],
+                }
+            return 200, {
+                "currencyPair": parts[2].upper(),
+                "bidPrice": ticker["bid"],
+                "askPrice": ticker["ask"],
+                "lastTradedPrice": ticker["mid"],
+                "baseVolume": ticker["volume"],
+            }
+        if service == "valr":
+            return 200, {}
+        if service == "aura":
+            return 200, {"success": True, "endpoint": parts[-1]}
+        if service == "ollama":
+            return 200, {"response": f"Replay stand-in. VERDICT: {self.verdict}"}
+        if service == "discord":
+            return 204, None
+        return 404, {"message": "unknown stand-in route"}
+
+    def _handler_class(self) -> Any:
+        standins = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if self.path.startswith("/v1/"):
+                    service = "valr"
+                elif self.path.startswith("/mcp/"):
+                    service = "aura"
+                elif self.path.startswith("/api/"):
+                    service = "ollama"
+                elif self.path.startswith("/discord/"):
+                    service = "discord"
+                else:
+                    service = "unknown"
+                standins._count(service)
+                delay = standins.latency_ms.get(service, 0.0)
+                if delay:
+                    time.sleep(delay / 1000.0)
+                status, body = standins._respond(service, self.path.split("?")[0])
+                data = json.dumps(body).encode("utf-8") if body is not None else b""
+                self.send_response(status)
+                if body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _serve
+            do_POST = _serve
+            do_PUT = _serve
+            do_DELETE = _serve
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return Handler
+
+
+# =============================================================================
+# Replayer
+# =============================================================================
+
+@dataclass
+class ReplayOutcome:
+    """Aggregate result of one replay run."""
+    latency: LatencyRecorder = field(default_factory=LatencyRecorder)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    webhooks: int = 0
+    ticks: int = 0
+    wall_seconds: float = 0.0
+
+
+class MarketReplayer:
+    """
+    Open-loop replay of a recording into a running app.
+
+    Events fire at offset / speed regardless of how fast the app answers
+    (in-flight webhooks are bounded by max_in_flight), so queueing inside
+    the app shows up in the latencies instead of slowing the replay.
+
+    Reliability Level: STANDARD
+    Input Constraints: Secret matching the app's SOVEREIGN_SECRET
+    Side Effects: HTTP requests to the app, stand-in ticker updates
+    """
+
+    def __init__(
+        self,
+        events: List[ReplayEvent],
+        base_url: str,
+        secret: str,
+        speed: float = 1.0,
+        run_id: Optional[str] = None,
+        standins: Optional[StandInServices] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        webhook_path: str = DEFAULT_WEBHOOK_PATH,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.events = events
+        self.base_url = base_url.rstrip("/")
+        self.secret = secret
+        self.speed = speed
+        self.run_id = run_id or datetime.now(timezone.utc).strftime("R%Y%m%d%H%M%S")
+        self.standins = standins
+        self.max_in_flight = max_in_flight
+        self.webhook_path = webhook_path
+        self._client = client
+
+    def signed_body(self, payload: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Rewrite signal_id with the run id and sign the exact bytes sent."""
+        payload = dict(payload)
+        payload["signal_id"] = f"{self.run_id}-{payload['signal_id']}"
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return body, compute_hmac_signature(body, self.secret)
+
+    async def run(self) -> ReplayOutcome:
+        """Replay every event and collect latencies."""
+        outcome = ReplayOutcome()
+        client = self._client or httpx.AsyncClient(timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        tasks = []
+        started = time.perf_counter()
+        try:
+            for event in self.events:
+                target = started + event.offset_seconds / self.speed
+                delay = target - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if event.kind == EVENT_TICK:
+                    outcome.ticks += 1
+                    if self.standins is not None:
+                        self.standins.apply_tick(event.payload)
+                    continue
+                await semaphore.acquire()
+                outcome.latency.record(
+                    "schedule_lag", max(0.0, (time.perf_counter() - target) * 1000)
+                )
+                outcome.webhooks += 1
+                tasks.append(asyncio.ensure_future(
+                    self._send(client, event, semaphore, outcome)
+                ))
+            await asyncio.gather(*tasks)
+        finally:
+            if self._client is None:
+                await client.aclose()
+        outcome.wall_seconds = time.perf_counter() - started
+        return outcome
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        event: ReplayEvent,
+        semaphore: asyncio.Semaphore,
+        outcome: ReplayOutcome
+    ) -> None:
+        body, signature = self.signed_body(event.payload)
+        sent = time.perf_counter()
+        try:
+            response = await client.post(
+                f"{self.base_url}{self.webhook_path}",
+                content=body,
+                headers={"Content-Type": "application/json", SIGNATURE_HEADER: signature},
+            )
+        except Exception as e:
+            outcome.statuses["error"] = outcome.statuses.get("error", 0) + 1
+            outcome.errors.append(f"{event.payload.get('signal_id')}: {str(e)[:120]}")
+            return
+        finally:
+            semaphore.release()
+
+        outcome.latency.record("round_trip", (time.perf_counter() - sent) * 1000)
+        status_key = str(response.status_code)
+        outcome.statuses[status_key] = outcome.statuses.get(status_key, 0) + 1
+        if response.status_code != 200:
+            outcome.errors.append(f"{event.payload.get('signal_id')}: HTTP {status_key}")
+            return
+        data = response.json()
+        for stage, milliseconds in (data.get("stage_ms") or {}).items():
+            outcome.latency.record(stage, milliseconds)
+        if data.get("processing_ms") is not None:
+            outcome.latency.record("total", data["processing_ms"])
+
+
+# =============================================================================
+# Reports
+# =============================================================================
+
+def build_report(outcome: ReplayOutcome, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-serializable report for one run."""
+    return {
+        "meta": dict(meta, **{
+            "webhooks": outcome.webhooks,
+            "ticks": outcome.ticks,
+            "wall_seconds": round(outcome.wall_seconds, 3),
+            "achieved_rps": round(outcome.webhooks / outcome.wall_seconds, 2)
+            if outcome.wall_seconds else 0.0,
+        }),
+        "statuses": dict(sorted(outcome.statuses.items())),
+        "stages": outcome.latency.summarize(),
+        "errors": outcome.errors[:20],
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Fixed-width table of the per-stage percentiles."""
+    meta = report["meta"]
+    lines = [
+        f"Replay {meta.get('run_id')} | speed={meta.get('speed')}x | "
+        f"webhooks={meta['webhooks']} | ticks={meta['ticks']} | "
+        f"wall={meta['wall_seconds']}s | {meta['achieved_rps']} req/s",
+        f"Statuses: {report['statuses']}",
+        f"{'stage':<16}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)",
+    ]
+    for stage, row in report["stages"].items():
+        lines.append(
+            f"{stage:<16}{row['count']:>8}{row['p50']:>10.3f}"
+            f"{row['p95']:>10.3f}{row['p99']:>10.3f}{row['max']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def diff_reports(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    threshold_pct: float = DEFAULT_REGRESSION_THRESHOLD_PCT,
+    floor_ms: float = DEFAULT_REGRESSION_FLOOR_MS
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Compare percentiles stage by stage.
+
+    A regression is a percentile that grew by more than threshold_pct
+    percent AND by more than floor_ms (so sub-millisecond noise on fast
+    stages is not flagged).
+
+    Returns:
+        (rows, regressions) - one row per stage/percentile present in both
+        reports, and a human-readable line per regression
+    """
+    rows = []
+    regressions = []
+    for stage, base_row in baseline["stages"].items():
+        new_row = candidate["stages"].get(stage)
+        if new_row is None:
+            continue
+        for pct in PERCENTILES:
+            key = f"p{pct}"
+            before, after = base_row[key], new_row[key]
+            delta_ms = after - before
+            delta_pct = (delta_ms / before * 100) if before else 0.0
+            regressed = delta_ms > floor_ms and (before == 0 or delta_pct > threshold_pct)
+            rows.append({
+                "stage": stage, "percentile": key, "baseline_ms": before,
+                "candidate_ms": after, "delta_ms": round(delta_ms, 3),
+                "delta_pct": round(delta_pct, 1), "regressed": regressed,
+            })
+            if regressed:
+                regressions.append(
+                    f"{stage} {key}: {before:.3f}ms -> {after:.3f}ms (+{delta_pct:.1f}%)"
+                )
+    return rows, regressions
+
+
+def format_diff(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'stage':<16}{'pct':>5}{'base':>11}{'new':>11}{'delta':>11}{'%':>8}"]
+    for row in rows:
+        flag = "  << REGRESSION" if row["regressed"] else ""
+        lines.append(
+            f"{row['stage']:<16}{row['percentile']:>5}{row['baseline_ms']:>11.3f}"
+            f"{row['candidate_ms']:>11.3f}{row['delta_ms']:>+11.3f}{row['delta_pct']:>+8.1f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _parse_latencies(values: List[str]) -> Dict[str, float]:
+    """'ollama=250' style --standin-latency arguments."""
+    latencies = {}
+    for value in values or []:
+        service, _, milliseconds = value.partition("=")
+        latencies[service.strip()] = float(milliseconds)
+    return latencies
+
+
+async def _wait_for_app(base_url: str, timeout_seconds: float) -> bool:
+    deadline = time.monotonic() + timeout_seconds
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(f"{base_url.rstrip('/')}/health")
+                if response.status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    return False
+
+
+def _git_commit() -> Optional[str]:
+    head = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".git", "HEAD")
+    try:
+        with open(head) as f:
+            ref = f.read().strip()
+        if ref.startswith("ref: "):
+            with open(os.path.join(os.path.dirname(head), ref[5:])) as f:
+                return f.read().strip()[:12]
+        return ref[:12]
+    except OSError:
+        return None
+
+
+def _cmd_synth(args: argparse.Namespace) -> int:
+    events = synthesize_recording(args.signals, args.ticks, args.duration, args.seed)
+    write_recording(args.out, events)
+    print(f"Wrote {len(events)} events to {args.out}")
+    return 0
+
+
+def _cmd_standins(args: argparse.Namespace) -> int:
+    standins = StandInServices(
+        port=args.port, latency_ms=_parse_latencies(args.standin_latency)
+    )
+    standins.start()
+    for key, value in standins.environment().items():
+        print(f"{key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        standins.stop()
+    return 0
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    secret = os.getenv(SECRET_KEY_ENV_VAR)
+    if not secret:
+        print(f"{SECRET_KEY_ENV_VAR} must be set to the app's webhook secret", file=sys.stderr)
+        return 2
+
+    events = load_recording(args.recording)
+    standins = None
+    if not args.no_standins:
+        standins = StandInServices(
+            port=args.standin_port, latency_ms=_parse_latencies(args.standin_latency)
+        )
+        standins.start()
+        print("Stand-ins up; start the app with:")
+        for key, value in standins.environment().items():
+            print(f"  {key}={value}")
+
+    try:
+        if not asyncio.run(_wait_for_app(args.base_url, args.app_wait)):
+            print(f"App at {args.base_url} did not become healthy", file=sys.stderr)
+            return 1
+        replayer = MarketReplayer(
+            events, args.base_url, secret, speed=args.speed, run_id=args.run_id,
+            standins=standins, max_in_flight=args.max_in_flight,
+        )
+        outcome = asyncio.run(replayer.run())
+    finally:
+        if standins is not None:
+            standins.stop()
+
+    report = build_report(outcome, {
+        "run_id": replayer.run_id,
+        "recording": os.path.basename(args.recording),
+        "speed": args.speed,
+        "commit": _git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "standin_requests": dict(standins.requests) if standins else {},
+    })
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(format_report(report))
+    print(f"Report written to {args.out}")
+    return 1 if outcome.errors else 0
+
+
+def _cmd_diff(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+    rows, regressions = diff_reports(baseline, candidate, args.threshold, args.floor_ms)
+    print(format_diff(rows))
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the replay harness CLI.
+
+    Returns:
+        Exit code (0 = ok, 1 = regression/replay errors, 2 = invalid args)
+    """
+    parser = argparse.ArgumentParser(
+        description="Deterministic market replay and latency benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    synth = sub.add_parser("synth", help="Write a seeded synthetic recording")
+    synth.add_argument("--signals", type=int, default=500)
+    synth.add_argument("--ticks", type=int, default=5000)
+    synth.add_argument("--duration", type=float, default=300.0, help="Recording length (s)")
+    synth.add_argument("--seed", type=int, default=7)
+    synth.add_argument("--out", required=True)
+    synth.set_defaults(func=_cmd_synth)
+
+    run = sub.add_parser("run", help="Replay a recording against a running app")
+    run.add_argument("recording")
+    run.add_argument("--base-url", default="http://localhost:8080")
+    run.add_argument("--speed", type=float, default=1.0, help="1, 10, 100 ...")
+    run.add_argument("--run-id", default=None)
+    run.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    run.add_argument("--standin-port", type=int, default=DEFAULT_STANDIN_PORT)
+    run.add_argument("--standin-latency", action="append", metavar="SERVICE=MS",
+                     help="Fixed stand-in latency, e.g. ollama=250 (repeatable)")
+    run.add_argument("--no-standins", action="store_true",
+                     help="Do not host stand-ins (ticks are then not served)")
+    run.add_argument("--app-wait", type=float, default=DEFAULT_APP_WAIT_SECONDS)
+    run.add_argument("--out", default="replay_report.json")
+    run.set_defaults(func=_cmd_run)
+
+    diff = sub.add_parser("diff", help="Compare two reports; exit 1 on regression")
+    diff.add_argument("baseline")
+    diff.add_argument("candidate")
+    diff.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD_PCT,
+                      help="Percent growth that counts as a regression")
+    diff.add_argument("--floor-ms", type=float, default=DEFAULT_REGRESSION_FLOOR_MS,
+                      help="Ignore growth smaller than this many ms")
+    diff.set_defaults(func=_cmd_diff)
+
+    standins = sub.add_parser("standins", help="Only host the stand-in services")
+    standins.add_argument("--port", type=int, default=DEFAULT_STANDIN_PORT)
+    standins.add_argument("--standin-latency", action="append", metavar="SERVICE=MS")
+    standins.set_defaults(func=_cmd_standins)
+
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 2 if e.code else 0
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# =============================================================================
+# Sovereign Reliability Audit
+# =============================================================================
+#
+# [Reliability Audit]
+# Mock/Placeholder Check: [CLEAN - stand-ins are the harness's purpose]
+# NAS 3.8 Compatibility: [Verified - typing.Dict/List/Optional/Tuple]
+# GitHub Data Sanitization: [Safe for Public - secret read from env]
+# Decimal Integrity: [Verified - synthetic prices built with Decimal]
+# Determinism: [Verified - seeded synthesis, (t, line) replay order]
+# Confidence Score: [92/100]
+#
+# =============================================================================
@@ -25,18 +25,22 @@ PRIVACY GUARDRAIL:
 Key Constraints:
 - Property 13: Decimal-only math for score calculations
 - Sentiment score bounded to [-1.0000, +1.0000]
-- Cache results to minimize external API calls
+- Cache results to minimize external API calls (tools.sentiment_cache)
+- News and ideas are fetched concurrently with per-source timeouts
+- Keywords matched in a single precompiled pass (KEYWORD_MATCHER)
 """
 
 from decimal import Decimal, ROUND_HALF_EVEN, InvalidOperation
 from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
 import logging
 import os
 import re
+import threading
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -55,9 +59,20 @@ NEUTRAL_SENTIMENT = Decimal("0.0000")
 # Cache TTL in minutes
 CACHE_TTL_MINUTES = 15
 
+# TTL in seconds for results computed while a source fetch failed, so a
+# transient outage does not pin a neutral score for the full cache TTL
+NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv("SENTIMENT_NEGATIVE_TTL_SECONDS", "60"))
+
 # Minimum snippets required for valid sentiment
 MIN_SNIPPETS_FOR_SENTIMENT = 3
 
+# Per-source fetch timeouts in seconds (queue wait and run time each)
+NEWS_FETCH_TIMEOUT_SECONDS = float(os.getenv("SENTIMENT_NEWS_TIMEOUT_SECONDS", "5"))
+IDEAS_FETCH_TIMEOUT_SECONDS = float(os.getenv("SENTIMENT_IDEAS_TIMEOUT_SECONDS", "5"))
+
+# Source fetch worker threads per harvester
+DEFAULT_FETCH_WORKERS = int(os.getenv("SENTIMENT_FETCH_WORKERS", "8"))
+
 
 # =============================================================================
 # Keyword Dictionaries
@@ -147,6 +162,98 @@ POSITIVE_KEYWORDS = frozenset([
 ])
 
 
+# =============================================================================
+# Keyword Matcher
+# =============================================================================
+
+class KeywordMatcher:
+    """
+    Precompiled single-pass positive/negative keyword counter.
+    
+    All keywords are compiled into one alternation regex (longest first)
+    inside a lookahead, so each snippet is scanned once for both
+    polarities. Counts equal the per-keyword
+    len(re.findall(r'\b' + re.escape(keyword) + r'\b', text)) sums:
+    a keyword that is a whole-word prefix of a longer one (e.g. "bull" in
+    "bull market") is credited through the longer match.
+    
+    Reliability Level: L6 Critical
+    Input Constraints: Lowercase keywords starting with a word character
+    Side Effects: None
+    """
+    
+    def __init__(self, positive: Any, negative: Any) -> None:
+        positive = frozenset(positive)
+        negative = frozenset(negative)
+        keywords = sorted(positive | negative, key=lambda k: (-len(k), k))
+        
+        # keyword -> (positive, negative) credited when it matches,
+        # including shorter keywords that match at the same position
+        self._weights = {}  # type: Dict[str, Tuple[int, int]]
+        for keyword in keywords:
+            pos = neg = 0
+            for other in keywords:
+                if other == keyword or self._is_word_prefix(other, keyword):
+                    pos += other in positive
+                    neg += other in negative
+            self._weights[keyword] = (pos, neg)
+        
+        alternation = "|".join(re.escape(k) for k in keywords)
+        self._pattern = re.compile(r"\b(?=(" + alternation + r")\b)")
+    
+    @staticmethod
+    def _is_word_prefix(short: str, long: str) -> bool:
+        """True if short matches at the start of long on a word boundary."""
+        if len(short) >= len(long) or not long.startswith(short):
+            return False
+        return _is_word_char(short[-1]) != _is_word_char(long[len(short)])
+    
+    def count(self, text: str) -> Tuple[int, int]:
+        """
+        Count keyword hits in one text.
+        
+        Args:
+            text: Text to scan (case-insensitive)
+            
+        Returns:
+            Tuple of (positive_count, negative_count)
+        """
+        positive_count = 0
+        negative_count = 0
+        weights = self._weights
+        
+        for keyword in self._pattern.findall(text.lower()):
+            pos, neg = weights[keyword]
+            positive_count += pos
+            negative_count += neg
+        
+        return positive_count, negative_count
+    
+    def count_many(self, texts: List[str]) -> Tuple[int, int]:
+        """
+        Count keyword hits across many texts in one scan.
+        
+        Texts are joined with newlines; no keyword spans a newline, so the
+        result equals the sum of count() over each text.
+        
+        Args:
+            texts: Texts to scan
+            
+        Returns:
+            Tuple of (positive_count, negative_count)
+        """
+        return self.count("\n".join(texts))
+
+
+def _is_word_char(char: str) -> bool:
+    """Regex \\w semantics for a single character."""
+    return char.isalnum() or char == "_"
+
+
+# Built once at import - shared by every SentimentHarvester
+KEYWORD_MATCHER = KeywordMatcher(POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS)
+
+
 # =============================================================================
 # Error Codes
 # =============================================================================
@@ -254,7 +361,10 @@ class SentimentHarvester:
     def __init__(
         self,
         cache_ttl_minutes: int = CACHE_TTL_MINUTES,
-        min_snippets: int = MIN_SNIPPETS_FOR_SENTIMENT
+        min_snippets: int = MIN_SNIPPETS_FOR_SENTIMENT,
+        cache: Optional[Any] = None,
+        source_timeouts: Optional[Dict[SourceType, float]] = None,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS
     ):
         """
         Initialize the Sentiment Harvester.
@@ -262,10 +372,32 @@ class SentimentHarvester:
         Args:
             cache_ttl_minutes: Cache time-to-live in minutes
             min_snippets: Minimum snippets required for valid sentiment
+            cache: Shared SentimentCache (default: private memory-only cache)
+            source_timeouts: Per-source fetch timeout in seconds
+            fetch_workers: Worker threads for concurrent source fetches
         """
+        # Local import: tools.sentiment_cache imports this module
+        from tools.sentiment_cache import SentimentCache
+        
         self.cache_ttl_minutes = cache_ttl_minutes
         self.min_snippets = min_snippets
-        self._cache = {}  # type: Dict[str, Tuple[SentimentResult, datetime]]
+        self._cache = cache if cache is not None else SentimentCache(
+            ttl_minutes=cache_ttl_minutes
+        )
+        self._source_timeouts = {
+            SourceType.NEWS: NEWS_FETCH_TIMEOUT_SECONDS,
+            SourceType.IDEAS: IDEAS_FETCH_TIMEOUT_SECONDS,
+        }  # type: Dict[SourceType, float]
+        if source_timeouts:
+            self._source_timeouts.update(source_timeouts)
+        self._fetch_workers = fetch_workers
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def cache(self) -> Any:
+        """Get the SentimentCache this harvester reads and writes."""
+        return self._cache
     
     def harvest_sentiment(
         self,
@@ -306,8 +438,8 @@ class SentimentHarvester:
             f"correlation_id={correlation_id}"
         )
         
-        # Check cache first
-        cached = self._get_from_cache(normalized_key)
+        # Check cache first (memory, then shared table)
+        cached = self._cache.get(normalized_key, correlation_id)
         if cached is not None:
             logger.info(
                 f"SentimentHarvester cache hit | "
@@ -318,7 +450,7 @@ class SentimentHarvester:
             return cached
         
         # Fetch snippets from sources
-        snippets = self._fetch_snippets(normalized_key, correlation_id)
+        snippets, failed_sources = self._fetch_snippets(normalized_key, correlation_id)
         
         # Calculate sentiment from snippets
         result = self._calculate_sentiment(
@@ -327,8 +459,8 @@ class SentimentHarvester:
             correlation_id
         )
         
-        # Cache the result
-        self._add_to_cache(normalized_key, result)
+        # Cache the result (briefly if a source failed)
+        self._cache_result(normalized_key, result, failed_sources, correlation_id)
         
         # Log panic warning if applicable
         if result.is_panic():
@@ -341,6 +473,96 @@ class SentimentHarvester:
         
         return result
     
+    def harvest_many(
+        self,
+        asset_keys: List[str],
+        correlation_id: Optional[str] = None,
+        min_remaining_seconds: float = 0
+    ) -> Dict[str, SentimentResult]:
+        """
+        Harvest sentiment for many assets at once.
+        
+        Cached scores are read with one SentimentCache.get_many call; all
+        sources of all uncached assets are then fetched concurrently.
+        
+        Args:
+            asset_keys: Asset identifiers
+            correlation_id: Audit trail identifier (auto-generated if None)
+            min_remaining_seconds: Re-harvest entries expiring sooner than
+                this (the background refresher renews ahead of expiry)
+            
+        Returns:
+            Normalized asset_key -> SentimentResult
+            
+        Raises:
+            ValueError: If any asset_key is empty
+        """
+        if correlation_id is None:
+            correlation_id = str(uuid.uuid4())
+        
+        keys = []  # type: List[str]
+        for asset_key in asset_keys:
+            if not asset_key or not asset_key.strip():
+                raise ValueError("asset_key cannot be empty")
+            keys.append(self._normalize_asset_key(asset_key))
+        keys = list(dict.fromkeys(keys))
+        
+        results = self._cache.get_many(keys, correlation_id, min_remaining_seconds)
+        missing = [key for key in keys if key not in results]
+        
+        if missing:
+            # Submit every source of every asset before waiting on any
+            pending = [
+                (key, self._submit_source_fetches(key, correlation_id))
+                for key in missing
+            ]
+            for key, fetches in pending:
+                snippets, failed_sources = self._collect_snippets(
+                    key, fetches, correlation_id
+                )
+                result = self._calculate_sentiment(key, snippets, correlation_id)
+                self._cache_result(key, result, failed_sources, correlation_id)
+                results[key] = result
+        
+        logger.info(
+            f"SentimentHarvester harvested many | "
+            f"assets={len(keys)} | "
+            f"cached={len(keys) - len(missing)} | "
+            f"fetched={len(missing)} | "
+            f"correlation_id={correlation_id}"
+        )
+        
+        return results
+    
+    def close(self) -> None:
+        """Shut down the fetch worker pool (running fetches finish)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+    
+    def _cache_result(
+        self,
+        asset_key: str,
+        result: SentimentResult,
+        failed_sources: List[SourceType],
+        correlation_id: str
+    ) -> None:
+        """
+        Store a harvested result.
+        
+        A result computed while any source failed is cached in memory for
+        NEGATIVE_CACHE_TTL_SECONDS only (and never written to the shared
+        table), so the next harvest after the outage retries the source.
+        """
+        if failed_sources:
+            self._cache.put(
+                result, correlation_id, asset_key=asset_key,
+                ttl_seconds=NEGATIVE_CACHE_TTL_SECONDS
+            )
+        else:
+            self._cache.put(result, correlation_id, asset_key=asset_key)
+    
     def _normalize_asset_key(self, asset_key: str) -> str:
         """
         Normalize asset key to uppercase, stripped.
@@ -357,7 +579,7 @@ class SentimentHarvester:
         self,
         asset_key: str,
         correlation_id: str
-    ) -> List[TextSnippet]:
+    ) -> Tuple[List[TextSnippet], List[SourceType]]:
         """
         Fetch text snippets from news and ideas sources.
         
@@ -372,27 +594,109 @@ class SentimentHarvester:
             correlation_id: Audit trail identifier
             
         Returns:
-            List of TextSnippet objects
+            (TextSnippet list, sources that timed out or failed)
         """
-        snippets = []  # type: List[TextSnippet]
+        fetches = self._submit_source_fetches(asset_key, correlation_id)
+        return self._collect_snippets(asset_key, fetches, correlation_id)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the source fetch worker pool."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._fetch_workers,
+                    thread_name_prefix="sentiment-fetch"
+                )
+            return self._executor
+    
+    def _submit_source_fetches(
+        self,
+        asset_key: str,
+        correlation_id: str
+    ) -> Dict[SourceType, Tuple[Future, threading.Event]]:
+        """
+        Start news and ideas fetches for one asset on the worker pool.
+        
+        Returns:
+            SourceType -> (future, started event)
+        """
+        executor = self._get_executor()
+        fetchers = (
+            (SourceType.NEWS, self._fetch_news_snippets),
+            (SourceType.IDEAS, self._fetch_ideas_snippets),
+        )
+        fetches = {}  # type: Dict[SourceType, Tuple[Future, threading.Event]]
+        
+        for source, fetcher in fetchers:
+            started = threading.Event()
+            
+            def run(fetcher=fetcher, started=started) -> List[TextSnippet]:
+                started.set()
+                return fetcher(asset_key, correlation_id)
+            
+            fetches[source] = (executor.submit(run), started)
         
-        # Fetch news snippets
-        news_snippets = self._fetch_news_snippets(asset_key, correlation_id)
-        snippets.extend(news_snippets)
+        return fetches
+    
+    def _collect_snippets(
+        self,
+        asset_key: str,
+        fetches: Dict[SourceType, Tuple[Future, threading.Event]],
+        correlation_id: str
+    ) -> Tuple[List[TextSnippet], List[SourceType]]:
+        """
+        Wait for submitted source fetches, each within its own timeout.
         
-        # Fetch ideas snippets
-        ideas_snippets = self._fetch_ideas_snippets(asset_key, correlation_id)
-        snippets.extend(ideas_snippets)
+        A source that times out or raises contributes no snippets; the
+        other source is still used.
+        
+        Returns:
+            (combined TextSnippet list, sources that timed out or failed)
+        """
+        counts = {}  # type: Dict[SourceType, int]
+        snippets = []  # type: List[TextSnippet]
+        failed_sources = []  # type: List[SourceType]
+        
+        for source, (future, started) in fetches.items():
+            timeout = self._source_timeouts[source]
+            try:
+                # Queue wait and run time are each bounded by the timeout
+                started.wait(timeout)
+                source_snippets = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(
+                    f"{SentimentErrorCode.FETCH_FAIL} Source fetch timed out | "
+                    f"source={source.value} | "
+                    f"timeout={timeout}s | "
+                    f"asset_key={asset_key} | "
+                    f"correlation_id={correlation_id}"
+                )
+                failed_sources.append(source)
+                source_snippets = []
+            except Exception as e:
+                logger.warning(
+                    f"{SentimentErrorCode.FETCH_FAIL} Source fetch failed: {str(e)} | "
+                    f"source={source.value} | "
+                    f"asset_key={asset_key} | "
+                    f"correlation_id={correlation_id}"
+                )
+                failed_sources.append(source)
+                source_snippets = []
+            
+            counts[source] = len(source_snippets)
+            snippets.extend(source_snippets)
         
         logger.info(
             f"SentimentHarvester fetched snippets | "
             f"asset_key={asset_key} | "
-            f"news_count={len(news_snippets)} | "
-            f"ideas_count={len(ideas_snippets)} | "
+            f"news_count={counts.get(SourceType.NEWS, 0)} | "
+            f"ideas_count={counts.get(SourceType.IDEAS, 0)} | "
+            f"failed_sources={len(failed_sources)} | "
             f"correlation_id={correlation_id}"
         )
         
-        return snippets
+        return snippets, failed_sources
     
     def _fetch_news_snippets(
         self,
@@ -483,26 +787,10 @@ class SentimentHarvester:
                 correlation_id=correlation_id,
             )
         
-        # Count keywords across all snippets
-        positive_count = 0
-        negative_count = 0
-        
-        for snippet in snippets:
-            text_lower = snippet.text.lower()
-            
-            # Count positive keywords
-            for keyword in POSITIVE_KEYWORDS:
-                positive_count += len(re.findall(
-                    r'\b' + re.escape(keyword) + r'\b',
-                    text_lower
-                ))
-            
-            # Count negative keywords
-            for keyword in NEGATIVE_KEYWORDS:
-                negative_count += len(re.findall(
-                    r'\b' + re.escape(keyword) + r'\b',
-                    text_lower
-                ))
+        # Count keywords across all snippets (single pass)
+        positive_count, negative_count = KEYWORD_MATCHER.count_many(
+            [snippet.text for snippet in snippets]
+        )
         
         # Calculate sentiment score using Decimal-only math
         sentiment_score = self._compute_score(
@@ -618,18 +906,7 @@ class SentimentHarvester:
         Returns:
             Cached SentimentResult or None if expired/missing
         """
-        if asset_key not in self._cache:
-            return None
-        
-        result, cached_at = self._cache[asset_key]
-        expiry = cached_at + timedelta(minutes=self.cache_ttl_minutes)
-        
-        if datetime.now(timezone.utc) > expiry:
-            # Cache expired
-            del self._cache[asset_key]
-            return None
-        
-        return result
+        return self._cache.get(asset_key)
     
     def _add_to_cache(self, asset_key: str, result: SentimentResult) -> None:
         """
@@ -639,7 +916,7 @@ class SentimentHarvester:
             asset_key: Normalized asset identifier
             result: SentimentResult to cache
         """
-        self._cache[asset_key] = (result, datetime.now(timezone.utc))
+        self._cache.put(result, asset_key=asset_key)
     
     def clear_cache(self) -> None:
         """Clear all cached sentiment results."""
@@ -666,24 +943,44 @@ class SentimentHarvester:
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
         
-        text_lower = text.lower()
+        return KEYWORD_MATCHER.count(text)
+    
+    def calculate_sentiment_batch(
+        self,
+        snippets_by_asset: Dict[str, List[TextSnippet]],
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, SentimentResult]:
+        """
+        Score many assets' snippets in one call.
         
-        positive_count = 0
-        negative_count = 0
+        Each asset's snippets are scanned once by the shared matcher.
+        Results are not cached; harvest_sentiment owns the cache.
         
-        for keyword in POSITIVE_KEYWORDS:
-            positive_count += len(re.findall(
-                r'\b' + re.escape(keyword) + r'\b',
-                text_lower
-            ))
+        Args:
+            snippets_by_asset: asset_key -> snippets
+            correlation_id: Audit trail identifier (auto-generated if None)
+            
+        Returns:
+            Normalized asset_key -> SentimentResult
+            
+        Raises:
+            ValueError: If any asset_key is empty
+        """
+        if correlation_id is None:
+            correlation_id = str(uuid.uuid4())
         
-        for keyword in NEGATIVE_KEYWORDS:
-            negative_count += len(re.findall(
-                r'\b' + re.escape(keyword) + r'\b',
-                text_lower
-            ))
+        results = {}  # type: Dict[str, SentimentResult]
+        for asset_key, snippets in snippets_by_asset.items():
+            if not asset_key or not asset_key.strip():
+                raise ValueError("asset_key cannot be empty")
+            normalized_key = self._normalize_asset_key(asset_key)
+            results[normalized_key] = self._calculate_sentiment(
+                normalized_key,
+                snippets,
+                correlation_id
+            )
         
-        return positive_count, negative_count
+        return results
 
 
 # =============================================================================
@@ -6,7 +6,7 @@ TradingView Strategy Extractor - Cold Path Tool
 
 Reliability Level: L6 Critical (Mission-Critical)
 Input Constraints: Valid TradingView script URL
-Side Effects: HTTP fetch, file write to /data/tv_extracted/
+Side Effects: HTTP fetch, file write to /data/tv_extracted/ and the page cache
 
 COLD PATH ONLY:
 This tool runs exclusively on Cold Path worker nodes.
@@ -18,6 +18,12 @@ EXTRACTION RULES:
 - Enforces 8000-character limit on text_snippet (Property 7)
 - Rejects extraction if both code and text are missing (Property 8)
 
+PAGE CACHE:
+- Fetched HTML is kept on disk with its ETag / Last-Modified validators
+- Re-fetches send If-None-Match / If-Modified-Since; a 304 reuses the
+  cached body, so re-running a URL backlog costs one round-trip per page
+  and no re-download
+
 ERROR CODES:
 - SIP-001: Network error during fetch
 - SIP-002: Request timeout
@@ -31,11 +37,13 @@ import json
 import hashlib
 import logging
 import re
+import threading
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 # Configure module logger
@@ -57,6 +65,16 @@ MAX_TEXT_SNIPPET_LENGTH = 8000
 # Output directory for extracted snapshots
 DEFAULT_OUTPUT_DIR = os.getenv("TV_EXTRACT_OUT", "data/tv_extracted")
 
+# On-disk page cache for conditional requests
+# (unset = <output_dir>/page_cache, empty string disables)
+DEFAULT_PAGE_CACHE_DIR = os.getenv("TV_PAGE_CACHE_DIR")
+
+# Page cache subdirectory of the output directory
+PAGE_CACHE_SUBDIR = "page_cache"
+
+# HTTP connection pool size (concurrent batch extraction)
+DEFAULT_POOL_SIZE = 16
+
 # Error codes
 SIP_ERROR_NETWORK_FAIL = "SIP-001"
 SIP_ERROR_TIMEOUT = "SIP-002"
@@ -154,6 +172,109 @@ class RawExtraction:
     html_length: int = 0
 
 
+# =============================================================================
+# Page Cache
+# =============================================================================
+
+@dataclass
+class CachedPage:
+    """
+    Cached page body with HTTP validators.
+    
+    Internal use only - not exposed to callers.
+    """
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class PageCache:
+    """
+    On-disk HTML cache keyed by URL hash.
+    
+    Reliability Level: L6 Critical
+    Input Constraints: Writable cache directory
+    Side Effects: File reads/writes in cache directory
+    
+    Each URL maps to <sha1>.html plus <sha1>.meta.json holding the
+    ETag / Last-Modified validators. Writes go through a temp file and
+    os.replace so concurrent readers never see a torn page.
+    """
+    
+    def __init__(self, cache_dir: str) -> None:
+        """
+        Initialize the page cache.
+        
+        Args:
+            cache_dir: Directory for cached pages (created if missing)
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _paths(self, url: str) -> Tuple[str, str]:
+        """Return (body_path, meta_path) for a URL."""
+        url_hash = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self._cache_dir, url_hash)
+        return f"{base}.html", f"{base}.meta.json"
+    
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Load a cached page (None if absent or unreadable).
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            CachedPage or None
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'r', encoding='utf-8') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CachedPage(
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+    
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """
+        Store a page body with its validators.
+        
+        Args:
+            url: Page URL
+            body: HTML body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._atomic_write(body_path, body)
+        self._atomic_write(meta_path, json.dumps(meta, indent=2))
+    
+    def _atomic_write(self, path: str, content: str) -> None:
+        """Write via temp file + os.replace."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
 # =============================================================================
 # TradingView Extractor Class
 # =============================================================================
@@ -181,18 +302,24 @@ class TVExtractor:
     def __init__(
         self,
         output_dir: Optional[str] = None,
-        timeout: int = DEFAULT_TIMEOUT_SECONDS
+        timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        page_cache_dir: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE
     ) -> None:
         """
         Initialize the TradingView extractor.
         
         Reliability Level: L6 Critical
         Input Constraints: Valid output directory path
-        Side Effects: Creates output directory if not exists
+        Side Effects: Creates output and page cache directories if not exist
         
         Args:
             output_dir: Directory for saving JSON snapshots
             timeout: Request timeout in seconds
+            page_cache_dir: Directory for the conditional-request page cache
+                            (defaults to TV_PAGE_CACHE_DIR or
+                            <output_dir>/page_cache; "" disables)
+            pool_size: HTTP connection pool size for concurrent extraction
         """
         self._output_dir = output_dir or DEFAULT_OUTPUT_DIR
         self._timeout = timeout
@@ -202,13 +329,30 @@ class TVExtractor:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
         })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        if page_cache_dir is None:
+            page_cache_dir = DEFAULT_PAGE_CACHE_DIR
+        if page_cache_dir is None:
+            page_cache_dir = os.path.join(self._output_dir, PAGE_CACHE_SUBDIR)
+        self._page_cache: Optional[PageCache] = (
+            PageCache(page_cache_dir) if page_cache_dir else None
+        )
+        self._stats_lock = threading.Lock()
+        self._fetch_stats: Dict[str, int] = {
+            "fetched": 0,
+            "not_modified": 0,
+            "uncached": 0,
+        }
         
         # Ensure output directory exists
         os.makedirs(self._output_dir, exist_ok=True)
         
         logger.info(
             f"[TV-EXTRACTOR-INIT] output_dir={self._output_dir} "
-            f"timeout={timeout}s"
+            f"timeout={timeout}s page_cache={page_cache_dir or 'disabled'}"
         )
     
     def extract(
@@ -309,11 +453,11 @@ class TVExtractor:
     
     def _fetch_page(self, url: str, correlation_id: str) -> str:
         """
-        Fetch page content from URL.
+        Fetch page content from URL (conditional GET against page cache).
         
         Reliability Level: L6 Critical
         Input Constraints: Valid HTTP(S) URL
-        Side Effects: HTTP GET request
+        Side Effects: HTTP GET request, page cache write
         
         Args:
             url: URL to fetch
@@ -327,13 +471,39 @@ class TVExtractor:
         """
         logger.debug(f"[TV-FETCH] Fetching {url[:80]}...")
         
+        cached = self._page_cache.get(url) if self._page_cache else None
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        
         response = self._session.get(
             url,
             timeout=self._timeout,
-            allow_redirects=True
+            allow_redirects=True,
+            headers=headers or None
         )
+        
+        if response.status_code == 304 and cached is not None:
+            self._count_fetch("not_modified")
+            logger.debug(
+                f"[TV-FETCH-NOT-MODIFIED] Using cached page | "
+                f"correlation_id={correlation_id}"
+            )
+            return cached.body
+        
         response.raise_for_status()
         
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self._page_cache and (etag or last_modified):
+            self._page_cache.put(url, response.text, etag, last_modified)
+            self._count_fetch("fetched")
+        else:
+            self._count_fetch("uncached")
+        
         logger.debug(
             f"[TV-FETCH-OK] status={response.status_code} | "
             f"content_length={len(response.text)} | "
@@ -342,6 +512,21 @@ class TVExtractor:
         
         return response.text
     
+    def _count_fetch(self, outcome: str) -> None:
+        """Increment a fetch outcome counter."""
+        with self._stats_lock:
+            self._fetch_stats[outcome] += 1
+    
+    def get_fetch_statistics(self) -> Dict[str, int]:
+        """
+        Get page fetch counters.
+        
+        Returns:
+            Dict with fetched / not_modified / uncached counts
+        """
+        with self._stats_lock:
+            return dict(self._fetch_stats)
+    
     def _extract_sections(self, html: str) -> RawExtraction:
         """
         Parse HTML and extract relevant sections.
@@ -655,7 +840,8 @@ class TVExtractor:
 
 def create_tv_extractor(
     output_dir: Optional[str] = None,
-    timeout: int = DEFAULT_TIMEOUT_SECONDS
+    timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    page_cache_dir: Optional[str] = None
 ) -> TVExtractor:
     """
     Create a TVExtractor instance.
@@ -663,11 +849,16 @@ def create_tv_extractor(
     Args:
         output_dir: Directory for saving JSON snapshots
         timeout: Request timeout in seconds
+        page_cache_dir: Directory for the conditional-request page cache
         
     Returns:
         TVExtractor instance
     """
-    return TVExtractor(output_dir=output_dir, timeout=timeout)
+    return TVExtractor(
+        output_dir=output_dir,
+        timeout=timeout,
+        page_cache_dir=page_cache_dir,
+    )
 
 
 # =============================================================================